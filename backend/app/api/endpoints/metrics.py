@@ -0,0 +1,59 @@
+# [>] ProofCore Backend - Metrics API Endpoints
+# Operational metrics for LLM providers
+
+from fastapi import APIRouter, Depends
+
+from app import schemas
+from app.core.config import settings
+from app.core.security import api_key_auth
+from app.services.llm.budget import llm_budget
+from app.services.llm.cache import llm_response_cache
+from app.services.llm.circuit_breaker import provider_breakers
+from app.services.llm.rate_limit import provider_limiters
+from app.services.llm.routing import provider_router
+from app.services.llm.similarity import step_similarity_index
+from app.services.llm.singleflight import llm_singleflight
+from app.services.scheduler import tenant_id_for_key
+
+router = APIRouter()
+
+
+@router.get(
+    "/llm",
+    response_model=schemas.LLMMetrics,
+    summary="Get LLM provider metrics",
+    description="Per-provider concurrency, rate limit queueing, circuit breaker state, routing, response cache, request coalescing and near-duplicate step statistics for this process, and LLM budget usage."
+)
+async def get_llm_metrics(
+    api_key: str = Depends(api_key_auth)
+):
+    """
+    Get LLM provider metrics.
+
+    **Returns**:
+    - **providers**: Limits, in-flight and queued calls, and local queue
+      wait times per provider (only providers called since start-up)
+    - **breakers**: Circuit state per provider (closed, open, half_open),
+      consecutive failures and calls skipped while open
+    - **routing**: Latency, cost, agreement and success-rate averages per
+      provider, and how many routed steps were escalated
+    - **cache**: Response cache hit/miss counters (null if disabled)
+    - **coalescing**: Calls in flight, and how many callers joined an
+      identical call instead of making their own (null if disabled)
+    - **similarity**: Scored steps indexed, and lookups that reused a
+      near-duplicate step's score (null if disabled)
+    - **budget**: Today's global and (calling tenant's) budget usage,
+      limits and state: ok, degrade or exhausted (null if disabled)
+
+    **Authentication**:
+    - Requires valid API key in X-API-Key header
+    """
+    return schemas.LLMMetrics(
+        providers=provider_limiters.get_stats(),
+        breakers=provider_breakers.get_stats(),
+        routing=provider_router.get_stats(),
+        cache=llm_response_cache.get_stats() if settings.LLM_CACHE_ENABLED else None,
+        coalescing=llm_singleflight.get_stats() if settings.LLM_COALESCE_ENABLED else None,
+        similarity=step_similarity_index.get_stats() if settings.LLM_SIMILARITY_ENABLED else None,
+        budget=await llm_budget.get_stats(tenant_id_for_key(api_key)) if settings.LLM_BUDGET_ENABLED else None,
+    )
@@ -1,14 +1,19 @@
 # [>] ProofCore Backend - Proof API Endpoints
 # RESTful API for proof submission and verification
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, status
+import uuid
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional, Tuple
 
 from app import schemas, crud
 from app.db.session import get_db_session
+from app.core.config import settings
 from app.core.security import api_key_auth
-from app.services.verification import run_proof_verification
+from app.services.notify import notify_proof_queued
+from app.services.scheduler import tenant_id_for_key
+from app.services.verification_queue import verification_queue, QueueFullError
 
 router = APIRouter()
 
@@ -18,11 +23,13 @@ router = APIRouter()
     response_model=schemas.ProofResponse,
     status_code=status.HTTP_202_ACCEPTED,
     summary="Submit a new proof for verification",
-    description="Submit a mathematical proof for verification. Returns immediately with proof ID and 'pending' status. Verification runs in background."
+    description="Submit a mathematical proof for verification. Returns immediately with proof ID and 'pending' status. Verification runs in background.",
+    responses={429: {"model": schemas.ErrorResponse, "description": "Verification queue is full; retry after the Retry-After delay"}}
 )
 async def submit_proof(
     proof_in: schemas.ProofCreate,
     background_tasks: BackgroundTasks,
+    response: Response,
     db: AsyncSession = Depends(get_db_session),
     api_key: str = Depends(api_key_auth)
 ):
@@ -30,33 +37,266 @@ async def submit_proof(
     Submit a new proof for verification.
 
     **Flow**:
-    1. Creates proof record in database with 'pending' status
-    2. Returns immediately with proof ID (HTTP 202 Accepted)
-    3. Starts background verification task
-    4. Client can poll GET /proofs/{id} to check status
+    1. Checks admission limits (queue depth, oldest queued proof)
+    2. Creates proof record in database with 'pending' status
+    3. Returns immediately with proof ID (HTTP 202 Accepted)
+    4. Queues the proof for background verification (in-process queue, or
+       NOTIFY to worker nodes when VERIFICATION_MODE=worker)
+    5. Client can poll GET /proofs/{id} to check status
 
     **Args**:
     - **domain**: Mathematical domain (algebra, topology, logic)
     - **steps**: List of proof steps with claims and equations
+    - **priority**: 'interactive' (default) or 'bulk'
+
+    **Scheduling**:
+    - Interactive proofs run ahead of bulk proofs (bulk keeps a reserved share)
+    - Proofs are shared fairly across API keys
+    - Within one API key, smaller proofs (fewer/simpler steps) run first
 
     **Returns**:
     - Proof entity with ID and 'pending' status
     - No result field (verification not started yet)
+    - X-Queue-Depth / X-Queue-Wait-Estimate headers describing the backlog
+
+    **Errors**:
+    - 429: Queue is over its depth or age limit; honor the Retry-After header
+
+    **Authentication**:
+    - Requires valid API key in X-API-Key header
+    """
+    # 1. Reject early (before creating anything) if the system is behind
+    await _check_admission(db)
+
+    # 2. Create proof record in database
+    db_proof = await crud.proof.create_with_steps(
+        db=db,
+        obj_in=proof_in,
+        tenant=tenant_id_for_key(api_key)
+    )
+
+    # 3. Queue verification
+    await _queue_proof(db, background_tasks, db_proof)
+
+    await _set_queue_headers(response, db)
+    return db_proof
+
+
+@router.post(
+    "/batch",
+    response_model=schemas.ProofBatchResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit many proofs in one request",
+    description="Submit up to BATCH_MAX_PROOFS proofs in one transaction. Returns proof IDs and a batch ID for aggregate polling.",
+    responses={
+        413: {"model": schemas.ErrorResponse, "description": "Batch larger than BATCH_MAX_PROOFS"},
+        429: {"model": schemas.ErrorResponse, "description": "Verification queue cannot take the whole batch; retry after the Retry-After delay"}
+    }
+)
+async def submit_proof_batch(
+    batch_in: schemas.ProofBatchCreate,
+    background_tasks: BackgroundTasks,
+    response: Response,
+    db: AsyncSession = Depends(get_db_session),
+    api_key: str = Depends(api_key_auth)
+):
+    """
+    Submit a batch of proofs for verification.
+
+    **Flow**:
+    1. Checks admission limits for the whole batch (all or nothing)
+    2. Inserts all proofs and steps with multi-row INSERT ... RETURNING in one transaction
+    3. Queues every proof for background verification as one unit
+    4. Client polls GET /proofs/batch/{batch_id} for aggregate status
+
+    **Args**:
+    - **proofs**: List of proofs (same shape as POST /proofs)
+    - **priority**: Lane for every proof in the batch (default 'bulk')
+
+    **Returns**:
+    - **batch_id**: ID for GET /proofs/batch/{batch_id}
+    - **proof_ids**: Per-item proof IDs in submission order
+
+    **Errors**:
+    - 413: More than BATCH_MAX_PROOFS proofs
+    - 429: Queue cannot take the whole batch; honor the Retry-After header
+
+    **Authentication**:
+    - Requires valid API key in X-API-Key header
+    """
+    count = len(batch_in.proofs)
+    if count > settings.BATCH_MAX_PROOFS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch of {count} proofs exceeds the limit of {settings.BATCH_MAX_PROOFS}"
+        )
+
+    # 1. Admit the whole batch or none of it
+    await _check_admission(db, count)
+
+    # 2. Insert proofs and steps in one transaction
+    batch_id = uuid.uuid4().hex
+    tenant = tenant_id_for_key(api_key)
+    created = await crud.proof.create_batch(
+        db=db,
+        obj_in=batch_in.proofs,
+        batch_id=batch_id,
+        priority=batch_in.priority,
+        tenant=tenant
+    )
+    proof_ids = [proof_id for proof_id, _ in created]
+
+    # 3. Queue as one unit: one NOTIFY (workers keep claiming until the
+    #    backlog is empty) or one drain task for the in-process queue
+    if settings.VERIFICATION_MODE == "worker":
+        await notify_proof_queued(db, proof_ids[0])
+    else:
+        for proof_id, cost in created:
+            verification_queue.enqueue(
+                proof_id=proof_id,
+                db_url=db.bind.url,
+                priority=batch_in.priority,
+                tenant=tenant,
+                cost=cost
+            )
+        background_tasks.add_task(verification_queue.drain)
+
+    await _set_queue_headers(response, db)
+    return schemas.ProofBatchResponse(batch_id=batch_id, count=count, proof_ids=proof_ids)
+
+
+@router.get(
+    "/batch/{batch_id}",
+    response_model=schemas.ProofBatchStatus,
+    summary="Get aggregate batch status",
+    description="Counts per status and result aggregates for a batch submitted via POST /proofs/batch."
+)
+async def get_proof_batch(
+    batch_id: str,
+    db: AsyncSession = Depends(get_db_session),
+    api_key: str = Depends(api_key_auth)
+):
+    """
+    Get aggregate status of a proof batch.
+
+    **Returns**:
+    - Counts of pending / processing / completed / failed proofs
+    - **valid** and **average_lii** over completed proofs
+    - **done**: True once no proof is pending or processing
+
+    **Errors**:
+    - 404: Batch not found
 
     **Authentication**:
     - Requires valid API key in X-API-Key header
     """
-    # 1. Create proof record in database
-    db_proof = await crud.proof.create_with_steps(db=db, obj_in=proof_in)
+    batch_status = await crud.proof.get_batch_status(db=db, batch_id=batch_id)
 
-    # 2. Schedule background verification task
-    background_tasks.add_task(
-        run_proof_verification,
+    if batch_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Batch {batch_id} not found"
+        )
+
+    return schemas.ProofBatchStatus(**batch_status)
+
+
+@router.get(
+    "/queue",
+    response_model=schemas.QueueStatus,
+    summary="Get verification queue status",
+    description="Current queue depth and wait estimates, so clients can pace submissions before hitting 429."
+)
+async def get_queue_status(
+    db: AsyncSession = Depends(get_db_session),
+    api_key: str = Depends(api_key_auth)
+):
+    """
+    Get verification queue status.
+
+    **Returns**:
+    - **depth**: Proofs waiting to start verification
+    - **running**: Proofs currently being verified
+    - **estimated_wait_seconds**: Expected wait for a proof submitted now
+    - **accepting**: False when POST /proofs would currently return 429
+
+    With VERIFICATION_MODE=worker the figures describe the pending and
+    processing proofs in the database, across all worker nodes.
+
+    **Authentication**:
+    - Requires valid API key in X-API-Key header
+    """
+    return schemas.QueueStatus(**await _queue_stats(db))
+
+
+def _wait_since(oldest: Optional[datetime]) -> float:
+    """Seconds since the oldest pending proof was created (0 if none)"""
+    if oldest is None:
+        return 0.0
+    if oldest.tzinfo is None:
+        oldest = oldest.replace(tzinfo=timezone.utc)
+    return max(0.0, (datetime.now(timezone.utc) - oldest).total_seconds())
+
+
+async def _db_backlog(db: AsyncSession) -> Tuple[int, float]:
+    """Depth and oldest wait (seconds) of pending proofs in the database"""
+    depth, oldest = await crud.proof.get_pending_backlog(db)
+    return depth, _wait_since(oldest)
+
+
+async def _queue_stats(db: AsyncSession) -> dict:
+    """Queue statistics: the in-process queue, or the database backlog in worker mode"""
+    if settings.VERIFICATION_MODE != "worker":
+        return verification_queue.get_stats()
+    snapshot = await crud.proof.get_queue_snapshot(db)
+    return verification_queue.backlog_stats(
+        depth=snapshot["depth"],
+        oldest_wait=_wait_since(snapshot["oldest"]),
+        running=snapshot["running"],
+        lanes=snapshot["lanes"],
+        durations=snapshot["durations"]
+    )
+
+
+async def _check_admission(db: AsyncSession, count: int = 1) -> None:
+    """Translate a full queue into HTTP 429 with a computed Retry-After"""
+    try:
+        if settings.VERIFICATION_MODE == "worker":
+            depth, oldest_wait = await _db_backlog(db)
+            verification_queue.check_backlog(depth, oldest_wait, count)
+        else:
+            verification_queue.check_admission(count)
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=e.reason,
+            headers={"Retry-After": str(e.retry_after)},
+        )
+
+
+async def _queue_proof(db: AsyncSession, background_tasks: BackgroundTasks, db_proof) -> None:
+    """Hand a pending proof to the verification workers"""
+    # Worker mode: the pending row is the queue entry; wake a worker
+    if settings.VERIFICATION_MODE == "worker":
+        await notify_proof_queued(db, db_proof.id)
+        return
+
+    # Inline mode: queue verification and let a background task drain the queue
+    verification_queue.enqueue(
         proof_id=db_proof.id,
-        db_url=db.bind.url  # Pass DB URL for background task to create its own session
+        db_url=db.bind.url,  # Pass DB URL for background task to create its own session
+        priority=db_proof.priority,
+        tenant=db_proof.tenant,
+        cost=db_proof.expected_cost
     )
+    background_tasks.add_task(verification_queue.drain)
 
-    return db_proof
+
+async def _set_queue_headers(response: Response, db: AsyncSession) -> None:
+    """Expose backlog information on accepted submissions"""
+    stats = await _queue_stats(db)
+    response.headers["X-Queue-Depth"] = str(stats["depth"])
+    response.headers["X-Queue-Wait-Estimate"] = str(round(stats["estimated_wait_seconds"], 1))
 
 
 @router.get(
@@ -198,6 +438,150 @@ async def delete_proof(
     return None
 
 
+@router.post(
+    "/{proof_id}/revalidate",
+    response_model=schemas.ProofResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Re-run verification on an existing proof",
+    description="Re-verify a completed or failed proof, reusing stored verdicts for unchanged steps.",
+    responses={
+        404: {"model": schemas.ErrorResponse, "description": "Proof not found"},
+        409: {"model": schemas.ErrorResponse, "description": "Proof is already pending or processing"},
+        429: {"model": schemas.ErrorResponse, "description": "Verification queue is full; retry after the Retry-After delay"}
+    }
+)
+async def revalidate_proof(
+    proof_id: int,
+    background_tasks: BackgroundTasks,
+    response: Response,
+    force: bool = False,
+    db: AsyncSession = Depends(get_db_session),
+    api_key: str = Depends(api_key_auth)
+):
+    """
+    Re-run verification on an existing proof.
+
+    **Incremental**:
+    - Each stored step verdict records the step's content hash and the
+      symbolic / semantic engine versions that produced it
+    - Symbolic and semantic verdicts are reused independently when both
+      are unchanged; only affected steps are re-verified
+    - Hybrid scores, LII and feedback are always recomputed, so a weight
+      or threshold change costs no SymPy or LLM calls
+    - After a provider/model rollout only semantic evaluation re-runs
+
+    **Query Parameters**:
+    - **force**: Discard stored verdicts and re-verify every step
+
+    **Returns**:
+    - Proof entity with 'pending' status (previous result kept until replaced)
+
+    **Errors**:
+    - 404: Proof not found
+    - 409: Proof is already pending or processing
+    - 429: Queue is full; honor the Retry-After header
+
+    **Authentication**:
+    - Requires valid API key in X-API-Key header
+    """
+    db_proof = await crud.proof.get(db=db, id=proof_id)
+    if not db_proof:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Proof with ID {proof_id} not found"
+        )
+
+    await _check_admission(db)
+
+    if not await crud.proof.request_revalidation(db, proof_id=proof_id, force=force):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Proof {proof_id} is already queued or being verified"
+        )
+
+    db.expire_all()  # Reload the status (and result, if discarded) changed above
+    db_proof = await crud.proof.get(db=db, id=proof_id)
+    await _queue_proof(db, background_tasks, db_proof)
+
+    await _set_queue_headers(response, db)
+    return db_proof
+
+
+@router.patch(
+    "/{proof_id}/steps",
+    response_model=schemas.ProofResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Edit proof steps and re-verify the affected ones",
+    description="Edit individual steps of a completed or failed proof. Only edited steps and steps depending on them are re-verified.",
+    responses={
+        404: {"model": schemas.ErrorResponse, "description": "Proof not found"},
+        409: {"model": schemas.ErrorResponse, "description": "Proof is already pending or processing"},
+        422: {"model": schemas.ErrorResponse, "description": "Edit refers to a step the proof does not have"},
+        429: {"model": schemas.ErrorResponse, "description": "Verification queue is full; retry after the Retry-After delay"}
+    }
+)
+async def edit_proof_steps(
+    proof_id: int,
+    steps_in: schemas.ProofStepsUpdate,
+    background_tasks: BackgroundTasks,
+    response: Response,
+    db: AsyncSession = Depends(get_db_session),
+    api_key: str = Depends(api_key_auth)
+):
+    """
+    Edit steps of an existing proof.
+
+    **Partial re-verification**:
+    - Edited steps are re-verified
+    - Steps that depend on an edited step (directly or through other
+      steps' `dependencies`) are re-verified
+    - All other steps keep their stored verdicts; LII, confidence and
+      feedback are recomputed from the per-step results
+
+    **Args**:
+    - **steps**: Edits by `step_index`; omitted fields are unchanged
+
+    **Returns**:
+    - Proof entity with 'pending' status; `status_detail` lists the
+      steps being re-verified
+
+    **Errors**:
+    - 404: Proof not found
+    - 409: Proof is already pending or processing
+    - 422: Unknown step index
+    - 429: Queue is full; honor the Retry-After header
+
+    **Authentication**:
+    - Requires valid API key in X-API-Key header
+    """
+    db_proof = await crud.proof.get(db=db, id=proof_id)
+    if not db_proof:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Proof with ID {proof_id} not found"
+        )
+
+    await _check_admission(db)
+
+    try:
+        stale = await crud.proof.edit_steps(db, proof_id=proof_id, edits=steps_in.steps)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+    if stale is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Proof {proof_id} is already queued or being verified"
+        )
+
+    db.expire_all()  # Reload the edited steps and status
+    db_proof = await crud.proof.get(db=db, id=proof_id)
+    await _queue_proof(db, background_tasks, db_proof)
+
+    await _set_queue_headers(response, db)
+    return db_proof
+
+
 # [T] Future endpoints for v3.8.0+
 
 # @router.patch("/{proof_id}/status")
@@ -209,8 +593,3 @@ async def delete_proof(
 # async def get_proof_feedback(...):
 #     """Get detailed feedback for a proof"""
 #     pass
-
-# @router.post("/{proof_id}/revalidate")
-# async def revalidate_proof(...):
-#     """Re-run verification on existing proof"""
-#     pass
@@ -2,7 +2,7 @@
 # Aggregates all API endpoints
 
 from fastapi import APIRouter
-from app.api.endpoints import proofs, config
+from app.api.endpoints import proofs, config, metrics
 
 api_router = APIRouter()
 
@@ -21,6 +21,13 @@ api_router.include_router(
     tags=["proofs"]
 )
 
+# Include operational metrics with /metrics prefix
+api_router.include_router(
+    metrics.router,
+    prefix="/metrics",
+    tags=["metrics"]
+)
+
 # [T] Future endpoint groups for v3.8.0+
 # from app.api.endpoints import users, analytics, admin
 # api_router.include_router(users.router, prefix="/users", tags=["users"])
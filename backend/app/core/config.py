@@ -1,9 +1,13 @@
 # [*] ProofCore Backend - Configuration Management
 # Pydantic settings for environment variables
 
+from pathlib import Path
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Optional, Union
+from typing import Dict, Literal, Optional, Union
+
+# [+] Global backend directory (relative file paths in settings resolve against it)
+BACKEND_DIR = Path(__file__).resolve().parents[2]
 
 
 class Settings(BaseSettings):
@@ -52,9 +56,119 @@ class Settings(BaseSettings):
     ANTHROPIC_API_KEY: Optional[str] = None
     GOOGLE_API_KEY: Optional[str] = None
 
+    # Provider API endpoints (default: the public APIs; e.g. scripts/fake_llm_server.py for load tests)
+    OPENAI_BASE_URL: Optional[str] = Field(default=None, description="OpenAI-compatible API base URL, including /v1")
+    ANTHROPIC_BASE_URL: Optional[str] = Field(default=None, description="Anthropic API base URL")
+    GOOGLE_BASE_URL: Optional[str] = Field(default=None, description="Gemini API endpoint (uses the REST transport)")
+
     # LLM Configuration
     LLM_TIMEOUT: int = Field(default=30, description="LLM API timeout in seconds")
-    LLM_MAX_RETRIES: int = Field(default=3, description="Maximum retry attempts for LLM calls")
+    LLM_MAX_RETRIES: int = Field(default=3, ge=0, description="Retries per provider call, with jittered exponential backoff")
+
+    LLM_BATCH_SIZES: Dict[str, int] = Field(
+        default_factory=dict,
+        description='Steps per semantic-evaluation prompt per provider, e.g. {"openai": 8, "anthropic": 5}; unset = 1 (one call per step)'
+    )
+
+    LLM_PROMPT_CACHING: bool = Field(
+        default=True,
+        description="Mark the stable prompt prefix for provider-side prompt caching (Anthropic cache_control; OpenAI and Gemini cache prefixes automatically)"
+    )
+
+    LLM_LOCAL_PROVIDER: Literal["off", "fallback", "always"] = Field(
+        default="fallback",
+        description="Offline heuristic provider: off, fallback (only when no API provider is configured) or always (alongside API providers; first tier under adaptive routing)"
+    )
+
+    # [=] LLM HTTP Client Settings (one pool per process, shared by all providers)
+    LLM_HTTP_MAX_CONNECTIONS: int = Field(default=100, ge=1, description="Max open connections to LLM APIs")
+    LLM_HTTP_MAX_KEEPALIVE: int = Field(default=20, ge=0, description="Idle connections kept open for reuse")
+    LLM_HTTP_KEEPALIVE_SECONDS: float = Field(default=60.0, gt=0, description="How long an idle connection is kept")
+    LLM_HTTP2: bool = Field(default=True, description="Use HTTP/2 when the h2 package is installed (httpx[http2])")
+
+    # [=] LLM Circuit Breaker Settings
+    LLM_BREAKER_FAILURE_THRESHOLD: int = Field(default=5, ge=1, description="Consecutive failures that open a provider's circuit")
+    LLM_BREAKER_RESET_SECONDS: float = Field(default=30.0, gt=0, description="Seconds a circuit stays open before one probe call is allowed")
+    LLM_RETRY_BASE_SECONDS: float = Field(default=0.5, gt=0, description="First retry backoff step (doubles per attempt, full jitter)")
+    LLM_RETRY_MAX_SECONDS: float = Field(default=20.0, gt=0, description="Longest retry backoff (a provider's Retry-After may exceed it)")
+
+    # [=] LLM Streaming Settings
+    LLM_STREAMING: bool = Field(default=False, description="Stream semantic evaluations and parse the score as it arrives")
+    LLM_STREAM_REASONING: bool = Field(default=False, description="Keep streaming after the score to collect reasoning (otherwise the stream is cancelled)")
+
+    # [=] LLM Two-Phase Evaluation Settings
+    LLM_TWO_PHASE: bool = Field(default=False, description="Score steps with a compact score-only call first and ask for reasoning only where needed")
+    LLM_SCORE_ONLY_MAX_TOKENS: int = Field(default=16, ge=1, le=4096, description="Completion budget for score-only calls")
+    LLM_REASONING_BELOW: float = Field(default=70.0, ge=0, le=100, description="First-pass scores below this get a second evaluation with reasoning (as do providers disagreeing by more than LLM_QUORUM_TOLERANCE)")
+
+    # [=] LLM Rate Limit Settings (per provider, per process)
+    LLM_DEFAULT_CONCURRENCY: int = Field(default=4, ge=1, description="In-flight calls per provider unless LLM_CONCURRENCY overrides it")
+    LLM_CONCURRENCY: Dict[str, int] = Field(
+        default_factory=dict,
+        description='In-flight calls per provider, e.g. {"openai": 8, "google": 2}'
+    )
+    LLM_REQUESTS_PER_MINUTE: Dict[str, int] = Field(
+        default_factory=dict,
+        description='Request budget per provider, e.g. {"openai": 500}; unset = no request limit'
+    )
+    LLM_TOKENS_PER_MINUTE: Dict[str, int] = Field(
+        default_factory=dict,
+        description='Token budget (prompt + max completion) per provider, e.g. {"openai": 200000}; unset = no token limit'
+    )
+
+    # [=] LLM Consensus Settings
+    LLM_QUORUM: int = Field(default=0, ge=0, description="Agreeing responses after which slower providers are cancelled; 0 = wait for every provider")
+    LLM_QUORUM_TOLERANCE: float = Field(default=10.0, ge=0, description="Max score spread (points out of 100) for quorum responses to count as agreeing")
+
+    # [=] LLM Routing Settings
+    LLM_ROUTING_MODE: Literal["all", "adaptive"] = Field(
+        default="all",
+        description="'all': every provider scores every step; 'adaptive': one provider first, more only for contentious steps"
+    )
+    LLM_ROUTING_PREFER: Literal["cost", "latency"] = Field(default="cost", description="What ranks the first-choice provider in adaptive routing")
+    LLM_ROUTING_CONFIDENT_ABOVE: float = Field(default=85.0, ge=0, le=100, description="Single-provider scores at or above this are accepted without escalation")
+    LLM_ROUTING_CONFIDENT_BELOW: float = Field(default=30.0, ge=0, le=100, description="Single-provider scores at or below this are accepted without escalation")
+
+    # [=] LLM Response Cache Settings
+    LLM_CACHE_ENABLED: bool = Field(default=True, description="Reuse stored provider responses for identical prompts")
+    LLM_CACHE_PATH: str = Field(
+        default=str(BACKEND_DIR / "llm_cache.sqlite3"),
+        description="SQLite file shared by all worker processes on a host (relative paths resolve against backend/)"
+    )
+    LLM_CACHE_TTL_SECONDS: float = Field(default=7 * 24 * 3600, gt=0, description="Age after which a cached response is ignored")
+    LLM_CACHE_MAX_ENTRIES: int = Field(default=100_000, ge=1, description="Entries kept before least-recently-used ones are evicted")
+    LLM_COALESCE_ENABLED: bool = Field(default=True, description="Concurrent identical provider calls in a process share one request")
+
+    @field_validator("LLM_CACHE_PATH")
+    @classmethod
+    def resolve_cache_path(cls, v):
+        """Anchor relative cache paths to backend/ so every process shares one file"""
+        if v == ":memory:" or Path(v).is_absolute():
+            return v
+        return str(BACKEND_DIR / v)
+
+    # [=] Near-Duplicate Step Settings
+    LLM_SIMILARITY_ENABLED: bool = Field(default=False, description="Reuse the semantic score of a near-duplicate step scored earlier in this process")
+    LLM_SIMILARITY_THRESHOLD: float = Field(default=0.8, ge=0, le=1, description="Minimum Jaccard similarity of normalized claim and reasoning text for reuse")
+    LLM_SIMILARITY_MAX_ENTRIES: int = Field(default=50_000, ge=1, description="Scored steps kept in the similarity index before least-recently-used ones are evicted")
+
+    # [=] LLM Budget Settings (per UTC day; unset limits are not enforced)
+    LLM_BUDGET_ENABLED: bool = Field(default=False, description="Reserve and enforce token/cost budgets for provider calls")
+    LLM_BUDGET_STORE: Literal["database", "memory"] = Field(
+        default="database",
+        description="'database': usage shared by every process via DATABASE_URL; 'memory': per process"
+    )
+    LLM_DAILY_TOKEN_LIMIT: Optional[int] = Field(default=None, ge=0, description="Tokens per day across all tenants")
+    LLM_DAILY_COST_LIMIT: Optional[float] = Field(default=None, ge=0, description="USD per day across all tenants")
+    LLM_TENANT_DAILY_TOKEN_LIMIT: Optional[int] = Field(default=None, ge=0, description="Tokens per day per tenant")
+    LLM_TENANT_DAILY_COST_LIMIT: Optional[float] = Field(default=None, ge=0, description="USD per day per tenant")
+    LLM_TENANT_DAILY_COST_LIMITS: Dict[str, float] = Field(default_factory=dict, description="Per-tenant USD/day overrides, e.g. {\"3f0c9a7e5b2d\": 25.0}")
+    LLM_BUDGET_DEGRADE_AT: float = Field(default=0.8, ge=0, le=1, description="Share of a limit after which each provider's cheapest model is used")
+
+    # [=] Bulk Evaluation Settings (provider batch APIs, see scripts/bulk_evaluate.py)
+    LLM_BULK_MAX_REQUESTS: int = Field(default=10_000, ge=1, description="Prompts per submitted batch job")
+    LLM_BULK_POLL_SECONDS: float = Field(default=60.0, gt=0, description="Seconds between batch job status checks")
+    LLM_BULK_TIMEOUT_SECONDS: float = Field(default=24 * 3600, gt=0, description="Seconds to wait for a batch job before giving up")
 
     # [=] Verification Settings
     SYMBOLIC_WEIGHT: float = Field(default=0.7, description="Weight for symbolic verification (0-1)")
@@ -62,9 +176,31 @@ class Settings(BaseSettings):
     PASS_THRESHOLD: float = Field(default=70.0, description="Minimum score to pass (0-100)")
 
     # [=] Performance Settings
-    WORKER_TIMEOUT: int = Field(default=300, description="Background worker timeout in seconds")
+    WORKER_TIMEOUT: int = Field(default=300, description="Per-proof verification deadline in seconds")
+    SYMBOLIC_TIMEOUT: float = Field(default=10.0, gt=0, description="Max seconds for a single SymPy equation check")
     MAX_CONCURRENT_VERIFICATIONS: int = Field(default=5, description="Max parallel proof verifications")
 
+    # [=] Admission Control Settings
+    QUEUE_MAX_DEPTH: int = Field(default=500, ge=1, description="Max proofs waiting for verification before POST /proofs returns 429")
+    QUEUE_MAX_WAIT_SECONDS: float = Field(default=120.0, gt=0, description="Max age of the oldest queued proof before POST /proofs returns 429")
+    BATCH_MAX_PROOFS: int = Field(default=500, ge=1, description="Max proofs accepted by one POST /proofs/batch request")
+
+    # [=] Worker Settings
+    VERIFICATION_MODE: Literal["inline", "worker"] = Field(
+        default="inline",
+        description="'inline': API process verifies proofs; 'worker': separate worker nodes claim them from the database"
+    )
+    PROOF_QUEUE_CHANNEL: str = Field(default="proofcore_proof_queue", description="Postgres NOTIFY channel for queued proofs")
+    WORKER_POLL_INTERVAL_SECONDS: float = Field(default=30.0, gt=0, description="Fallback poll period for idle workers (LISTEN wakes them sooner)")
+
+    # [=] Stale Job Reaper Settings
+    REAPER_INTERVAL_SECONDS: float = Field(default=60.0, gt=0, description="How often to scan for proofs stuck in 'processing'")
+    REAPER_GRACE_SECONDS: float = Field(default=30.0, ge=0, description="Slack after a proof's deadline before it is reaped")
+    MAX_VERIFICATION_ATTEMPTS: int = Field(default=2, ge=1, description="Attempts before a stale proof is marked failed instead of requeued")
+
+    # [=] Scheduling Settings
+    SCHEDULER_BULK_SHARE: float = Field(default=0.2, ge=0, le=1, description="Share of dispatches reserved for bulk proofs while interactive proofs are waiting")
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
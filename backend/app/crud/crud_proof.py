@@ -1,13 +1,17 @@
 # [L] ProofCore Backend - CRUD Operations
 # Database operations for proof entities
 
-from typing import List, Optional
-from sqlalchemy import select, update
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+from sqlalchemy import select, insert, update, delete, or_, and_, func, case
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.config import settings
 from app.models.proof import Proof, ProofStep, ProofResult, ProofStatus
-from app.schemas.proof import ProofCreate, ProofStepCreate
+from app.schemas.proof import ProofCreate, ProofStepCreate, ProofStepUpdate
+from app.services.scheduler import estimate_job_cost
+from app.services.step_graph import downstream_steps
 
 
 class CRUDProof:
@@ -17,7 +21,8 @@ class CRUDProof:
         self,
         db: AsyncSession,
         *,
-        obj_in: ProofCreate
+        obj_in: ProofCreate,
+        tenant: str = "default"
     ) -> Proof:
         """
         Create a new proof with its steps.
@@ -25,14 +30,18 @@ class CRUDProof:
         Args:
             db: Database session
             obj_in: ProofCreate schema with domain and steps
+            tenant: Submitting tenant for fair queueing
 
         Returns:
             Proof: Created proof entity with steps
         """
-        # Create proof entity
+        # Create proof entity (expected cost drives shortest-job-first scheduling)
         db_proof = Proof(
             domain=obj_in.domain,
-            status=ProofStatus.PENDING
+            status=ProofStatus.PENDING,
+            priority=obj_in.priority,
+            tenant=tenant,
+            expected_cost=estimate_job_cost(obj_in.steps)
         )
         db.add(db_proof)
         await db.flush()  # Get proof ID without committing
@@ -55,10 +64,123 @@ class CRUDProof:
         result = await db.execute(
             select(Proof)
             .where(Proof.id == db_proof.id)
-            .options(selectinload(Proof.steps))
+            .options(
+                selectinload(Proof.steps),
+                selectinload(Proof.result)
+            )
         )
         return result.scalar_one()
 
+    async def create_batch(
+        self,
+        db: AsyncSession,
+        *,
+        obj_in: List[ProofCreate],
+        batch_id: str,
+        priority: str = "bulk",
+        tenant: str = "default"
+    ) -> List[Tuple[int, float]]:
+        """
+        Create many proofs with their steps in one transaction.
+
+        Uses two multi-row INSERT ... RETURNING statements (proofs, then
+        steps) instead of a flush/commit/refresh/re-select per proof.
+
+        Args:
+            db: Database session
+            obj_in: ProofCreate schemas in submission order
+            batch_id: Batch identifier stored on every proof
+            priority: Scheduling lane for every proof
+            tenant: Submitting tenant for fair queueing
+
+        Returns:
+            List[Tuple[int, float]]: (proof ID, expected cost) in submission order
+        """
+        now = datetime.now(timezone.utc)
+        result = await db.execute(
+            insert(Proof).returning(Proof.id, Proof.expected_cost, sort_by_parameter_order=True),
+            [
+                {
+                    "domain": proof_in.domain,
+                    "status": ProofStatus.PENDING,
+                    "priority": priority,
+                    "tenant": tenant,
+                    "expected_cost": estimate_job_cost(proof_in.steps),
+                    "batch_id": batch_id,
+                    "created_at": now,
+                    "status_changed_at": now,
+                }
+                for proof_in in obj_in
+            ]
+        )
+        created = [(row.id, row.expected_cost) for row in result]
+
+        await db.execute(
+            insert(ProofStep),
+            [
+                {
+                    "proof_id": proof_id,
+                    "step_index": idx,
+                    "claim": step_data.claim,
+                    "equation": step_data.equation,
+                    "dependencies": step_data.dependencies or [],
+                }
+                for (proof_id, _), proof_in in zip(created, obj_in)
+                for idx, step_data in enumerate(proof_in.steps)
+            ]
+        )
+        await db.commit()
+        return created
+
+    async def get_batch_status(
+        self,
+        db: AsyncSession,
+        *,
+        batch_id: str
+    ) -> Optional[dict]:
+        """
+        Aggregate the status of every proof in a batch.
+
+        Args:
+            db: Database session
+            batch_id: Batch identifier
+
+        Returns:
+            Optional[dict]: Counts per status plus aggregates over the results
+            of completed proofs, or None if unknown
+        """
+        result = await db.execute(
+            select(Proof.status, func.count(Proof.id))
+            .where(Proof.batch_id == batch_id)
+            .group_by(Proof.status)
+        )
+        counts = {status.value: count for status, count in result.all()}
+        if not counts:
+            return None
+
+        result = await db.execute(
+            select(
+                func.count(ProofResult.id).filter(ProofResult.is_valid.is_(True)),
+                func.avg(ProofResult.lii_score)
+            )
+            .join(Proof, Proof.id == ProofResult.proof_id)
+            .where(Proof.batch_id == batch_id)
+            # Proofs being revalidated or failed may still carry an old result
+            .where(Proof.status == ProofStatus.COMPLETED)
+        )
+        valid, average_lii = result.one()
+
+        total = sum(counts.values())
+        finished = counts.get(ProofStatus.COMPLETED.value, 0) + counts.get(ProofStatus.FAILED.value, 0)
+        return {
+            "batch_id": batch_id,
+            "total": total,
+            **counts,
+            "valid": valid or 0,
+            "average_lii": round(average_lii, 2) if average_lii is not None else None,
+            "done": finished == total,
+        }
+
     async def get(
         self,
         db: AsyncSession,
@@ -120,22 +242,448 @@ class CRUDProof:
         db: AsyncSession,
         *,
         proof_id: int,
-        status: str
+        status: str,
+        detail: Optional[str] = None,
+        timeout_seconds: Optional[float] = None
     ) -> None:
         """
-        Update proof status.
+        Update proof status and record the transition time.
 
         Args:
             db: Database session
             proof_id: Proof ID
             status: New status (pending, processing, completed, failed)
+            detail: Optional reason for the transition
+            timeout_seconds: Verification budget; sets deadline_at when
+                             entering 'processing'
+        """
+        now = datetime.now(timezone.utc)
+        values = {"status": status, "status_changed_at": now, "status_detail": detail}
+
+        if status == ProofStatus.PROCESSING:
+            values["started_at"] = now
+            values["finished_at"] = None
+            values["attempts"] = Proof.attempts + 1
+            if timeout_seconds is not None:
+                values["deadline_at"] = now + timedelta(seconds=timeout_seconds)
+        elif status in (ProofStatus.COMPLETED, ProofStatus.FAILED):
+            values["finished_at"] = now
+
+        await db.execute(
+            update(Proof)
+            .where(Proof.id == proof_id)
+            .values(**values)
+        )
+        await db.commit()
+
+    async def claim_next_pending(
+        self,
+        db: AsyncSession,
+        *,
+        timeout_seconds: float
+    ) -> Optional[int]:
+        """
+        Atomically claim the next pending proof for this worker.
+
+        Uses SELECT ... FOR UPDATE SKIP LOCKED on Postgres so concurrent
+        workers on different nodes never claim the same proof.
+
+        The order follows FairShareScheduler: interactive proofs before
+        bulk ones, except that bulk goes first whenever its share of the
+        claims made since the oldest pending proof was submitted has
+        dropped below SCHEDULER_BULK_SHARE; then fair sharing across
+        tenants, then shortest expected job first within a tenant. A pending proof's virtual start is the
+        expected cost its tenant has been served in the lane since the
+        oldest pending proof was submitted, plus the tenant's cheaper
+        pending proofs; the lowest virtual start is claimed, so a tenant
+        with a deep backlog cannot starve the others.
+
+        Args:
+            db: Database session
+            timeout_seconds: Verification budget (sets deadline_at)
+
+        Returns:
+            Optional[int]: Claimed proof ID, or None if nothing is pending
         """
+        pending = Proof.status == ProofStatus.PENDING
+        job_order = (Proof.expected_cost, Proof.created_at, Proof.id)
+        backlog_start = select(func.min(Proof.created_at)).where(pending).scalar_subquery()
+        served = (
+            select(
+                Proof.priority.label("priority"),
+                Proof.tenant.label("tenant"),
+                func.sum(Proof.expected_cost).label("cost")
+            )
+            .where(Proof.started_at >= backlog_start)
+            .group_by(Proof.priority, Proof.tenant)
+            .subquery()
+        )
+        # Bulk lane's reserved share of claims (started_at) over the backlog
+        claims = await db.execute(
+            select(func.count(Proof.id), func.count(Proof.id).filter(Proof.priority == "bulk"))
+            .where(Proof.started_at >= backlog_start)
+        )
+        total_claims, bulk_claims = claims.one()
+        share = settings.SCHEDULER_BULK_SHARE
+        bulk_first = share > 0 and bulk_claims + 1 <= share * (total_claims + 1) + 1e-9
+
+        # Window functions cannot be combined with FOR UPDATE, so rank in a
+        # subquery and lock only the proofs row
+        ranked = (
+            select(
+                Proof.id.label("id"),
+                case((Proof.priority == "bulk", 1), else_=0).label("lane"),
+                (
+                    func.coalesce(served.c.cost, 0.0)
+                    + func.sum(Proof.expected_cost).over(
+                        partition_by=(Proof.priority, Proof.tenant), order_by=job_order
+                    )
+                    - Proof.expected_cost
+                ).label("virtual_start")
+            )
+            .outerjoin(served, and_(served.c.priority == Proof.priority, served.c.tenant == Proof.tenant))
+            .where(pending)
+            .subquery()
+        )
+        result = await db.execute(
+            select(Proof.id)
+            .join(ranked, ranked.c.id == Proof.id)
+            .where(pending)
+            .order_by(ranked.c.lane.desc() if bulk_first else ranked.c.lane, ranked.c.virtual_start, *job_order)
+            .limit(1)
+            .with_for_update(skip_locked=True, of=Proof)
+        )
+        proof_id = result.scalar_one_or_none()
+        if proof_id is None:
+            await db.rollback()
+            return None
+
+        now = datetime.now(timezone.utc)
         await db.execute(
             update(Proof)
             .where(Proof.id == proof_id)
-            .values(status=status)
+            .values(
+                status=ProofStatus.PROCESSING,
+                status_changed_at=now,
+                status_detail=None,
+                started_at=now,
+                finished_at=None,
+                deadline_at=now + timedelta(seconds=timeout_seconds),
+                attempts=Proof.attempts + 1
+            )
+        )
+        await db.commit()
+        return proof_id
+
+    async def get_pending_backlog(
+        self,
+        db: AsyncSession
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        Get the size and age of the database-backed pending backlog.
+
+        Args:
+            db: Database session
+
+        Returns:
+            tuple: (pending count, oldest pending created_at or None)
+        """
+        result = await db.execute(
+            select(func.count(Proof.id), func.min(Proof.created_at))
+            .where(Proof.status == ProofStatus.PENDING)
+        )
+        count, oldest = result.one()
+        return count or 0, oldest
+
+    async def get_queue_snapshot(
+        self,
+        db: AsyncSession,
+        *,
+        recent: int = 50
+    ) -> dict:
+        """
+        Describe the database-backed queue (GET /proofs/queue in worker mode).
+
+        Args:
+            db: Database session
+            recent: Number of recently completed proofs to time
+
+        Returns:
+            dict: "depth" and "oldest" (as get_pending_backlog), pending
+            count per priority lane ("lanes"), proofs being verified by
+            any worker ("running") and the durations in seconds of the
+            `recent` most recently completed verifications ("durations")
+        """
+        depth, oldest = await self.get_pending_backlog(db)
+
+        lanes = await db.execute(
+            select(Proof.priority, func.count(Proof.id))
+            .where(Proof.status == ProofStatus.PENDING)
+            .group_by(Proof.priority)
+        )
+        running = await db.execute(
+            select(func.count(Proof.id)).where(Proof.status == ProofStatus.PROCESSING)
+        )
+        finished = await db.execute(
+            select(Proof.started_at, Proof.finished_at)
+            .where(Proof.status == ProofStatus.COMPLETED)
+            .where(Proof.started_at.is_not(None), Proof.finished_at.is_not(None))
+            .order_by(Proof.finished_at.desc())
+            .limit(recent)
+        )
+        return {
+            "depth": depth,
+            "oldest": oldest,
+            "lanes": {priority: count for priority, count in lanes.all()},
+            "running": running.scalar() or 0,
+            "durations": [
+                max(0.0, (finished_at - started_at).total_seconds())
+                for started_at, finished_at in finished.all()
+            ],
+        }
+
+    async def get_pending(
+        self,
+        db: AsyncSession
+    ) -> List[Proof]:
+        """
+        List every pending proof, oldest first.
+
+        Args:
+            db: Database session
+
+        Returns:
+            List[Proof]: Pending proofs (without relationships loaded)
+        """
+        result = await db.execute(
+            select(Proof)
+            .where(Proof.status == ProofStatus.PENDING)
+            .order_by(Proof.created_at, Proof.id)
+        )
+        return list(result.scalars().all())
+
+    async def get_stale_processing(
+        self,
+        db: AsyncSession,
+        *,
+        grace_seconds: float,
+        stale_after_seconds: float
+    ) -> List[Proof]:
+        """
+        Find proofs stuck in 'processing'.
+
+        A proof is stale when its deadline passed more than `grace_seconds`
+        ago, or (for rows without a deadline) when it entered 'processing'
+        more than `stale_after_seconds` ago.
+
+        Args:
+            db: Database session
+            grace_seconds: Slack after deadline_at before a proof is reaped
+            stale_after_seconds: Age limit for proofs without deadline_at
+
+        Returns:
+            List[Proof]: Stale proofs (without relationships loaded)
+        """
+        now = datetime.now(timezone.utc)
+        result = await db.execute(
+            select(Proof)
+            .where(Proof.status == ProofStatus.PROCESSING)
+            .where(or_(
+                Proof.deadline_at < now - timedelta(seconds=grace_seconds),
+                and_(
+                    Proof.deadline_at.is_(None),
+                    Proof.status_changed_at < now - timedelta(seconds=stale_after_seconds)
+                )
+            ))
+            .order_by(Proof.status_changed_at)
+        )
+        return list(result.scalars().all())
+
+    async def transition_if_processing(
+        self,
+        db: AsyncSession,
+        *,
+        proof_id: int,
+        status: str,
+        detail: Optional[str] = None
+    ) -> bool:
+        """
+        Move a proof out of 'processing' only if it is still there.
+
+        The conditional update makes reaping safe when several nodes run a
+        reaper: exactly one of them wins each transition.
+
+        Args:
+            db: Database session
+            proof_id: Proof ID
+            status: Target status (pending to requeue, failed to give up)
+            detail: Reason for the transition
+
+        Returns:
+            bool: True if this call performed the transition
+        """
+        now = datetime.now(timezone.utc)
+        values = {"status": status, "status_changed_at": now, "status_detail": detail}
+        if status == ProofStatus.FAILED:
+            values["finished_at"] = now
+        else:
+            values["deadline_at"] = None
+
+        result = await db.execute(
+            update(Proof)
+            .where(Proof.id == proof_id)
+            .where(Proof.status == ProofStatus.PROCESSING)
+            .values(**values)
+        )
+        await db.commit()
+        return result.rowcount == 1
+
+    async def request_revalidation(
+        self,
+        db: AsyncSession,
+        *,
+        proof_id: int,
+        force: bool = False
+    ) -> bool:
+        """
+        Move a finished proof back to 'pending' for re-verification.
+
+        Only completed or failed proofs can be revalidated; the conditional
+        update makes concurrent requests safe (one of them wins). The stored
+        result is kept so unchanged step verdicts can be reused, unless
+        `force` asks for a full re-run.
+
+        Args:
+            db: Database session
+            proof_id: Proof ID
+            force: Discard the stored result so every step is re-verified
+
+        Returns:
+            bool: True if the proof was queued for revalidation
+        """
+        now = datetime.now(timezone.utc)
+        result = await db.execute(
+            update(Proof)
+            .where(Proof.id == proof_id)
+            .where(Proof.status.in_([ProofStatus.COMPLETED, ProofStatus.FAILED]))
+            .values(
+                status=ProofStatus.PENDING,
+                status_changed_at=now,
+                status_detail="Full revalidation requested" if force else "Revalidation requested",
+                finished_at=None,
+                deadline_at=None,
+                attempts=0
+            )
+        )
+        if result.rowcount == 1 and force:
+            await db.execute(delete(ProofResult).where(ProofResult.proof_id == proof_id))
+        await db.commit()
+        return result.rowcount == 1
+
+    async def edit_steps(
+        self,
+        db: AsyncSession,
+        *,
+        proof_id: int,
+        edits: List[ProofStepUpdate]
+    ) -> Optional[List[int]]:
+        """
+        Edit steps of a finished proof and queue it for partial re-verification.
+
+        In one transaction: moves the proof back to 'pending' (only from
+        completed/failed), applies the edits, and drops the stored verdicts
+        of the edited steps and of every step downstream of them through
+        dependencies. Re-verification then reuses all other step verdicts
+        (see BackendProofEngine.evaluate).
+
+        Args:
+            db: Database session
+            proof_id: Proof ID
+            edits: Step edits (fields left unset are unchanged)
+
+        Returns:
+            Optional[List[int]]: Sorted indices of steps to re-verify, or
+            None if the proof is pending or processing
+
+        Raises:
+            ValueError: If the proof does not exist or an edit refers to a
+                        step index the proof does not have
+        """
+        db_proof = await self.get(db, id=proof_id)
+        if db_proof is None:
+            raise ValueError(f"Proof {proof_id} not found")
+        steps = {step.step_index: step for step in db_proof.steps}
+        unknown = sorted({edit.step_index for edit in edits} - steps.keys())
+        if unknown:
+            raise ValueError(f"Proof {proof_id} has no step(s) {unknown}")
+
+        result = await db.execute(
+            update(Proof)
+            .where(Proof.id == proof_id)
+            .where(Proof.status.in_([ProofStatus.COMPLETED, ProofStatus.FAILED]))
+            .values(
+                status=ProofStatus.PENDING,
+                status_changed_at=datetime.now(timezone.utc),
+                finished_at=None,
+                deadline_at=None,
+                attempts=0
+            )
         )
+        if result.rowcount != 1:
+            await db.rollback()
+            return None
+
+        for edit in edits:
+            for field, value in edit.model_dump(exclude_unset=True, exclude={"step_index"}).items():
+                setattr(steps[edit.step_index], field, value if field != "dependencies" else value or [])
+
+        stale = downstream_steps(db_proof.steps, {edit.step_index for edit in edits})
+        if db_proof.result is not None:
+            # Assign a new list so the JSON column change is detected
+            db_proof.result.step_results = [
+                step_result for step_result in db_proof.result.step_results
+                if step_result.get("step_index") not in stale
+            ]
+
+        db_proof.expected_cost = estimate_job_cost(db_proof.steps)
+        db_proof.status_detail = f"Steps edited; re-verifying steps {sorted(stale)}"[:255]
         await db.commit()
+        return sorted(stale)
+
+    async def save_result(
+        self,
+        db: AsyncSession,
+        *,
+        proof_id: int,
+        obj_in: dict
+    ) -> ProofResult:
+        """
+        Create or replace the verification result for a proof.
+
+        Args:
+            db: Database session
+            proof_id: Proof ID
+            obj_in: Dictionary with result data
+
+        Returns:
+            ProofResult: Stored result entity
+        """
+        result = await db.execute(
+            select(ProofResult).where(ProofResult.proof_id == proof_id)
+        )
+        db_result = result.scalar_one_or_none()
+        if db_result is None:
+            return await self.create_result(db, proof_id=proof_id, obj_in=obj_in)
+
+        db_result.is_valid = obj_in["is_valid"]
+        db_result.lii_score = obj_in["lii_score"]
+        db_result.confidence_interval = obj_in["confidence_interval"]
+        db_result.coherence_score = obj_in["coherence_score"]
+        db_result.step_results = obj_in["step_results"]
+        db_result.feedback = obj_in["feedback"]
+        await db.commit()
+        await db.refresh(db_result)
+        return db_result
 
     async def create_result(
         self,
@@ -0,0 +1,4 @@
+from app.models.proof import Proof, ProofStep, ProofResult, ProofStatus
+from app.models.budget import LLMBudgetUsage
+
+__all__ = ["Proof", "ProofStep", "ProofResult", "ProofStatus", "LLMBudgetUsage"]
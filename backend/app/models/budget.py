@@ -0,0 +1,30 @@
+# [*] ProofCore Backend - LLM Budget Models
+# Shared token and cost counters for LLM budget enforcement
+
+from sqlalchemy import String, Float, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class LLMBudgetUsage(Base):
+    """
+    LLM usage charged against one budget in one period.
+
+    Rows are updated in place with conditional UPDATEs, so every API and
+    worker process sharing the database enforces the same limits.
+
+    Attributes:
+        period: Budget period (UTC date, e.g. '2025-01-31')
+        scope: 'global' or 'tenant:<tenant id>'
+        tokens: Tokens reserved or spent (reservations are reconciled to actual usage)
+        cost: Cost in USD reserved or spent
+    """
+    __tablename__ = "llm_budget_usage"
+
+    period: Mapped[str] = mapped_column(String(10), primary_key=True)
+    scope: Mapped[str] = mapped_column(String(80), primary_key=True)
+    tokens: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    cost: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<LLMBudgetUsage(period='{self.period}', scope='{self.scope}', tokens={self.tokens}, cost={self.cost:.4f})>"
@@ -4,7 +4,7 @@
 import enum
 from datetime import datetime
 from typing import List, Optional
-from sqlalchemy import String, Float, DateTime, Text, ForeignKey, JSON, Boolean, Integer, Enum
+from sqlalchemy import String, Float, DateTime, Text, ForeignKey, JSON, Boolean, Integer, Enum, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -27,10 +27,23 @@ class Proof(Base):
         created_at: Timestamp of proof submission
         domain: Mathematical domain (algebra, topology, logic, etc.)
         status: Current processing status
+        priority: Scheduling lane (interactive or bulk)
+        tenant: Submitting tenant (hashed API key) for fair queueing
+        expected_cost: Expected verification cost (step count + equation complexity)
+        batch_id: Batch the proof was submitted in (POST /proofs/batch), if any
+        status_changed_at: Timestamp of the last status transition
+        started_at: When the current (or last) verification attempt started
+        finished_at: When verification completed or failed
+        deadline_at: When the current verification attempt must finish
+        attempts: Number of verification attempts started
+        status_detail: Reason for the last transition (e.g. failure cause)
         steps: List of proof steps (one-to-many relationship)
         result: Verification result (one-to-one relationship)
     """
     __tablename__ = "proofs"
+    __table_args__ = (
+        Index("ix_proofs_status_changed_at", "status", "status_changed_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True, autoincrement=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -44,6 +57,22 @@ class Proof(Base):
         default=ProofStatus.PENDING,
         nullable=False
     )
+    priority: Mapped[str] = mapped_column(String(20), default="interactive", nullable=False)
+    tenant: Mapped[str] = mapped_column(String(64), default="default", index=True, nullable=False)
+    expected_cost: Mapped[float] = mapped_column(Float, default=1.0, nullable=False)
+    batch_id: Mapped[Optional[str]] = mapped_column(String(32), index=True, nullable=True)
+
+    # Status transition tracking (used by the stale-job reaper)
+    status_changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    deadline_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    status_detail: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # Relationships
     steps: Mapped[List["ProofStep"]] = relationship(
@@ -0,0 +1,40 @@
+from app.schemas.proof import (
+    ProofStepCreate,
+    ProofCreate,
+    ProofBatchCreate,
+    ProofStepUpdate,
+    ProofStepsUpdate,
+    ProofStepResponse,
+    ProofResultResponse,
+    ProofResponse,
+    ProofListResponse,
+    ProofBatchResponse,
+    ProofBatchStatus,
+    QueueStatus,
+    ErrorResponse,
+)
+from app.schemas.config import VerificationConfig, ApplicationConfig
+from app.schemas.metrics import ProviderRateLimitStats, CircuitBreakerStats, ProviderRoutingStats, LLMRoutingStats, LLMMetrics
+
+__all__ = [
+    "ProofStepCreate",
+    "ProofCreate",
+    "ProofBatchCreate",
+    "ProofStepUpdate",
+    "ProofStepsUpdate",
+    "ProofStepResponse",
+    "ProofResultResponse",
+    "ProofResponse",
+    "ProofListResponse",
+    "ProofBatchResponse",
+    "ProofBatchStatus",
+    "QueueStatus",
+    "ErrorResponse",
+    "VerificationConfig",
+    "ApplicationConfig",
+    "ProviderRateLimitStats",
+    "CircuitBreakerStats",
+    "ProviderRoutingStats",
+    "LLMRoutingStats",
+    "LLMMetrics",
+]
@@ -0,0 +1,111 @@
+# [*] Metrics Schemas
+# Data models for operational metrics endpoints
+
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ProviderRateLimitStats(BaseModel):
+    """Local rate limiting state for one LLM provider (this process)"""
+    concurrency: int = Field(..., description="Maximum in-flight calls")
+    requests_per_minute: Optional[float] = Field(None, description="Request budget, or null if unlimited")
+    tokens_per_minute: Optional[float] = Field(None, description="Token budget, or null if unlimited")
+    in_flight: int = Field(..., description="Calls currently waiting on the provider")
+    waiting: int = Field(..., description="Calls queued locally for a slot or rate budget")
+    calls: int = Field(..., description="Calls admitted since start-up")
+    delayed_calls: int = Field(..., description="Calls that had to wait before being sent")
+    average_wait_ms: float = Field(..., description="Mean local queue wait per call")
+    max_wait_ms: float = Field(..., description="Longest local queue wait")
+
+
+class ProviderRoutingStats(BaseModel):
+    """Live statistics used for adaptive routing (EWMA)"""
+    latency_ms: Optional[float] = Field(None, description="Response latency, or null before the first fresh response")
+    cost: Optional[float] = Field(None, description="Cost per call in USD, or null before the first fresh response")
+    deviation: Optional[float] = Field(None, description="Distance from the other providers' median score, in points")
+    success_rate: float = Field(..., description="Share of recent calls that succeeded")
+    calls: int = Field(..., description="Fresh calls observed")
+    failures: int = Field(..., description="Failed calls observed")
+
+
+class LLMRoutingStats(BaseModel):
+    """Adaptive routing counters"""
+    routed: int = Field(..., description="Steps routed to a single first-choice provider")
+    escalated: int = Field(..., description="Routed steps that needed more providers")
+    providers: Dict[str, ProviderRoutingStats] = Field(default_factory=dict, description="Statistics per provider")
+
+
+class CircuitBreakerStats(BaseModel):
+    """Circuit breaker state for one LLM provider"""
+    state: str = Field(..., description="closed, open or half_open")
+    consecutive_failures: int = Field(..., description="Failed calls since the last success")
+    times_opened: int = Field(..., description="Times the circuit has opened since start-up")
+    rejected: int = Field(..., description="Calls skipped because the circuit was open")
+    retry_in_seconds: float = Field(..., description="Time until the next probe call (0 unless open)")
+
+
+class LLMMetrics(BaseModel):
+    """LLM provider metrics for this process"""
+    providers: Dict[str, ProviderRateLimitStats] = Field(default_factory=dict, description="Rate limiting per provider")
+    breakers: Dict[str, CircuitBreakerStats] = Field(default_factory=dict, description="Circuit breaker state per provider")
+    routing: Optional[LLMRoutingStats] = Field(None, description="Provider statistics and routing counters")
+    cache: Optional[Dict[str, float]] = Field(None, description="Response cache hits, misses and hit rate (null if disabled)")
+    coalescing: Optional[Dict[str, float]] = Field(None, description="Identical concurrent calls that shared one request (null if disabled)")
+    similarity: Optional[Dict[str, float]] = Field(None, description="Near-duplicate step index size, hits and misses (null if disabled)")
+    budget: Optional[Dict[str, Any]] = Field(None, description="Today's global and caller-tenant LLM budget usage and state (null if disabled)")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "providers": {
+                    "openai": {
+                        "concurrency": 8,
+                        "requests_per_minute": 500,
+                        "tokens_per_minute": 200000,
+                        "in_flight": 3,
+                        "waiting": 0,
+                        "calls": 1240,
+                        "delayed_calls": 37,
+                        "average_wait_ms": 12.4,
+                        "max_wait_ms": 2310.0
+                    }
+                },
+                "breakers": {
+                    "openai": {
+                        "state": "closed",
+                        "consecutive_failures": 0,
+                        "times_opened": 1,
+                        "rejected": 48,
+                        "retry_in_seconds": 0.0
+                    }
+                },
+                "routing": {
+                    "routed": 980,
+                    "escalated": 212,
+                    "providers": {
+                        "openai": {
+                            "latency_ms": 1830.2,
+                            "cost": 0.0041,
+                            "deviation": 6.3,
+                            "success_rate": 0.998,
+                            "calls": 1240,
+                            "failures": 2
+                        }
+                    }
+                },
+                "cache": {"hits": 410, "misses": 830, "hit_rate": 0.331},
+                "coalescing": {"in_flight": 4, "leaders": 830, "coalesced": 96, "coalesce_rate": 0.104},
+                "similarity": {"entries": 2210, "hits": 318, "misses": 902, "hit_rate": 0.261},
+                "budget": {
+                    "period": "2025-01-31",
+                    "state": "ok",
+                    "refused": 0,
+                    "degraded": 0,
+                    "budgets": {
+                        "global": {"tokens": 1830000, "cost": 6.41, "token_limit": None, "cost_limit": 20.0}
+                    }
+                }
+            }
+        }
+    )
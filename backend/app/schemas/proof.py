@@ -1,8 +1,8 @@
 # [*] ProofCore Backend - Pydantic Schemas
 # API request/response data models with validation
 
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 
 
@@ -29,11 +29,16 @@ class ProofCreate(BaseModel):
     """Schema for submitting a new proof for verification"""
     domain: str = Field(..., min_length=1, description="Mathematical domain (algebra, topology, logic)")
     steps: List[ProofStepCreate] = Field(..., min_items=1, description="List of proof steps")
+    priority: Literal["interactive", "bulk"] = Field(
+        "interactive",
+        description="Scheduling lane: 'interactive' for user-facing submissions, 'bulk' for benchmark runs"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
                 "domain": "algebra",
+                "priority": "interactive",
                 "steps": [
                     {
                         "claim": "Start with the equation x + 5 = 10",
@@ -50,6 +55,58 @@ class ProofCreate(BaseModel):
     )
 
 
+class ProofStepUpdate(BaseModel):
+    """Schema for editing one step of an existing proof (omitted fields are unchanged)"""
+    step_index: int = Field(..., ge=0, description="Index of the step to edit")
+    claim: Optional[str] = Field(None, min_length=1, description="New claim")
+    equation: Optional[Dict[str, str]] = Field(None, description="New equation (null removes it)")
+    dependencies: Optional[List[str]] = Field(None, description="New dependency list")
+
+    @field_validator("claim")
+    @classmethod
+    def claim_not_null(cls, v: Optional[str]) -> str:
+        """A step always has a claim; omit the field to keep the current one"""
+        if v is None:
+            raise ValueError("claim cannot be null")
+        return v
+
+
+class ProofStepsUpdate(BaseModel):
+    """Schema for editing steps of an existing proof"""
+    steps: List[ProofStepUpdate] = Field(..., min_length=1, description="Step edits")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "steps": [
+                    {"step_index": 1, "claim": "Subtract 5 from both sides", "equation": {"lhs": "x", "rhs": "5"}}
+                ]
+            }
+        }
+    )
+
+
+class ProofBatchCreate(BaseModel):
+    """Schema for submitting many proofs in one request"""
+    proofs: List[ProofCreate] = Field(..., min_length=1, description="Proofs to verify (up to BATCH_MAX_PROOFS)")
+    priority: Literal["interactive", "bulk"] = Field(
+        "bulk",
+        description="Scheduling lane applied to every proof in the batch (overrides per-proof priority)"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "priority": "bulk",
+                "proofs": [
+                    {"domain": "algebra", "steps": [{"claim": "x + 0 = x", "equation": {"lhs": "x + 0", "rhs": "x"}}]},
+                    {"domain": "algebra", "steps": [{"claim": "2x = x + x", "equation": {"lhs": "2*x", "rhs": "x + x"}}]}
+                ]
+            }
+        }
+    )
+
+
 # [=] Response Schemas (Output to client)
 
 class ProofStepResponse(ProofStepCreate):
@@ -96,6 +153,13 @@ class ProofResponse(BaseModel):
     created_at: datetime
     domain: str
     status: str = Field(..., description="Processing status (pending, processing, completed, failed)")
+    priority: str = Field("interactive", description="Scheduling lane (interactive, bulk)")
+    batch_id: Optional[str] = Field(None, description="Batch ID if submitted via POST /proofs/batch")
+    status_changed_at: Optional[datetime] = Field(None, description="Time of the last status transition")
+    started_at: Optional[datetime] = Field(None, description="Start of the current or last verification attempt")
+    finished_at: Optional[datetime] = Field(None, description="When verification completed or failed")
+    attempts: int = Field(0, description="Verification attempts started")
+    status_detail: Optional[str] = Field(None, description="Reason for the last status transition")
     steps: List[ProofStepResponse]
     result: Optional[ProofResultResponse] = Field(None, description="Available when status is 'completed'")
 
@@ -140,6 +204,85 @@ class ProofListResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class QueueStatus(BaseModel):
+    """Schema for verification queue status (admission control)"""
+    depth: int = Field(..., description="Proofs waiting to start verification")
+    running: int = Field(..., description="Proofs currently being verified")
+    max_depth: int = Field(..., description="Queue depth above which submissions are rejected")
+    max_concurrent: int = Field(..., description="Maximum parallel verifications")
+    oldest_wait_seconds: float = Field(..., description="Age of the oldest waiting proof")
+    max_wait_seconds: float = Field(..., description="Oldest-proof age above which submissions are rejected")
+    estimated_wait_seconds: float = Field(..., description="Estimated wait before a new proof starts")
+    average_job_seconds: float = Field(..., description="Moving average of verification duration")
+    accepting: bool = Field(..., description="Whether new submissions are currently admitted")
+    lanes: Dict[str, int] = Field(default_factory=dict, description="Waiting proofs per priority lane")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "depth": 12,
+                "running": 5,
+                "max_depth": 500,
+                "max_concurrent": 5,
+                "oldest_wait_seconds": 8.4,
+                "max_wait_seconds": 120.0,
+                "estimated_wait_seconds": 15.6,
+                "average_job_seconds": 5.2,
+                "accepting": True,
+                "lanes": {"interactive": 2, "bulk": 10}
+            }
+        }
+    )
+
+
+class ProofBatchResponse(BaseModel):
+    """Schema for an accepted batch submission"""
+    batch_id: str = Field(..., description="Batch ID for GET /proofs/batch/{batch_id}")
+    count: int = Field(..., description="Number of proofs accepted")
+    proof_ids: List[int] = Field(..., description="Proof IDs in submission order")
+    status: str = Field("pending", description="Status of every proof at submission")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "batch_id": "3f0c9a7e5b2d4c61a8e9f01234567890",
+                "count": 2,
+                "proof_ids": [101, 102],
+                "status": "pending"
+            }
+        }
+    )
+
+
+class ProofBatchStatus(BaseModel):
+    """Schema for aggregate status of a batch"""
+    batch_id: str = Field(..., description="Batch ID")
+    total: int = Field(..., description="Proofs in the batch")
+    pending: int = Field(0, description="Proofs waiting to start")
+    processing: int = Field(0, description="Proofs being verified")
+    completed: int = Field(0, description="Proofs with a result")
+    failed: int = Field(0, description="Proofs whose verification failed")
+    valid: int = Field(0, description="Completed proofs judged valid")
+    average_lii: Optional[float] = Field(None, description="Mean LII score over completed proofs")
+    done: bool = Field(..., description="True once every proof is completed or failed")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "batch_id": "3f0c9a7e5b2d4c61a8e9f01234567890",
+                "total": 2,
+                "pending": 0,
+                "processing": 1,
+                "completed": 1,
+                "failed": 0,
+                "valid": 1,
+                "average_lii": 91.5,
+                "done": False
+            }
+        }
+    )
+
+
 class ErrorResponse(BaseModel):
     """Standard error response schema"""
     detail: str = Field(..., description="Error message")
@@ -0,0 +1,104 @@
+# [B] ProofCore Backend - Deadline Propagation
+# Per-proof time budget shared by symbolic jobs and LLM provider calls
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(Exception):
+    """Raised when the proof-level deadline has expired"""
+    pass
+
+
+class Deadline:
+    """
+    Absolute deadline for one unit of work (normally one proof).
+
+    The deadline is installed in a context variable by deadline_scope(),
+    so every coroutine and task spawned while verifying the proof sees
+    the same budget without it being passed through each call.
+    """
+
+    def __init__(self, seconds: float):
+        """
+        Create a deadline `seconds` from now.
+
+        Args:
+            seconds: Time budget in seconds
+        """
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left before expiry (never negative)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed"""
+        return time.monotonic() >= self.expires_at
+
+    def __repr__(self) -> str:
+        return f"<Deadline(seconds={self.seconds}, remaining={self.remaining():.1f})>"
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("proof_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Get the deadline of the proof being verified in this context, if any"""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Deadline) -> Iterator[Deadline]:
+    """
+    Install a deadline for the duration of the block.
+
+    Usage:
+        with deadline_scope(Deadline(settings.WORKER_TIMEOUT)):
+            await engine.evaluate(proof)
+    """
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+async def with_deadline(awaitable: Awaitable[T], cap: Optional[float] = None) -> T:
+    """
+    Await `awaitable`, cancelling it when the current deadline or `cap` expires.
+
+    Args:
+        awaitable: Coroutine or future to await
+        cap: Per-call timeout in seconds, applied on top of the proof deadline
+
+    Returns:
+        Result of the awaitable
+
+    Raises:
+        DeadlineExceeded: If the proof deadline expired (caller should give up)
+        asyncio.TimeoutError: If only the per-call cap expired (caller may degrade)
+    """
+    deadline = current_deadline()
+    if deadline is not None and deadline.expired:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceeded(f"Deadline of {deadline.seconds}s already expired")
+
+    timeouts = [t for t in (cap, deadline.remaining() if deadline else None) if t is not None]
+    if not timeouts:
+        return await awaitable
+
+    try:
+        return await asyncio.wait_for(awaitable, timeout=min(timeouts))
+    except asyncio.TimeoutError:
+        if deadline is not None and deadline.expired:
+            raise DeadlineExceeded(f"Deadline of {deadline.seconds}s expired") from None
+        raise
@@ -2,8 +2,84 @@
 # Common interfaces and DTOs for all LLM providers
 
 from pydantic import BaseModel, Field
-from typing import Optional, Any
+from typing import Any, AsyncIterator, Optional
 from abc import ABC, abstractmethod
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+
+class RateLimitedError(ConnectionError):
+    """Raised by providers on HTTP 429 / quota errors; carries the provider's Retry-After"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ProviderRequestError(ConnectionError):
+    """Raised by providers when the request itself was rejected (HTTP 4xx other than 408/429); not retried"""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+def http_status(error: Exception) -> Optional[int]:
+    """
+    Read the HTTP status of a failed request from an SDK error, if any.
+
+    Understands `status_code` (OpenAI, Anthropic), the status of an
+    attached response, and the integer `code` of google.api_core errors.
+
+    Args:
+        error: Exception raised by a provider SDK
+
+    Returns:
+        Optional[int]: HTTP status, or None for timeouts and connection errors
+    """
+    for status in (
+        getattr(error, "status_code", None),
+        getattr(getattr(error, "response", None), "status_code", None),
+        getattr(error, "code", None),
+    ):
+        if isinstance(status, int) and not isinstance(status, bool):
+            return status
+    return None
+
+
+def is_retryable_status(status: Optional[int]) -> bool:
+    """Whether a request that failed with this HTTP status may succeed on retry (429, 5xx, timeouts)"""
+    return status is None or status in (408, 429) or status >= 500
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Read the Retry-After delay from an SDK error's HTTP response, if any.
+
+    Understands `retry-after-ms`, `retry-after` in seconds and
+    `retry-after` as an HTTP date.
+
+    Args:
+        error: Exception raised by a provider SDK
+
+    Returns:
+        Optional[float]: Delay in seconds, or None if the provider sent none
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return max(0.0, float(headers["retry-after-ms"]) / 1000)
+        value = headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
 
 
 class LLMUsage(BaseModel):
@@ -11,6 +87,9 @@ class LLMUsage(BaseModel):
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
+    # Subsets of prompt_tokens served from / written to the provider's prompt cache
+    cached_tokens: int = 0
+    cache_write_tokens: int = 0
 
 
 class LLMResponse(BaseModel):
@@ -23,16 +102,34 @@ class LLMResponse(BaseModel):
     usage: LLMUsage = Field(..., description="Token usage statistics")
     cost: float = Field(..., ge=0, description="API call cost in USD")
     duration_ms: int = Field(..., ge=0, description="Response time in milliseconds")
+    cached: bool = Field(False, description="Served from the response cache (no tokens spent)")
 
     model_config = {"from_attributes": True}
 
 
+class LLMCompletion(BaseModel):
+    """Unparsed completion from a provider (text plus accounting)"""
+    provider: str = Field(..., description="Provider name (openai, anthropic, google)")
+    model: str = Field(..., description="Model identifier")
+    text: str = Field("", description="Completion text")
+    usage: LLMUsage = Field(default_factory=LLMUsage, description="Token usage statistics")
+    cost: float = Field(0.0, ge=0, description="API call cost in USD")
+    duration_ms: int = Field(0, ge=0, description="Response time in milliseconds")
+
+
 class EvaluationOptions(BaseModel):
     """Configuration options for LLM evaluation"""
     model: Optional[str] = Field(None, description="Override default model")
     temperature: float = Field(0.3, ge=0, le=2, description="Sampling temperature")
     max_tokens: int = Field(500, ge=1, le=4096, description="Maximum completion tokens")
     json_mode: bool = Field(True, description="Request JSON format response")
+    stream: bool = Field(False, description="Stream the completion and parse the score as it arrives")
+    include_reasoning: bool = Field(True, description="Ask for reasoning with the score; False = compact score-only answer (streams stop at the score)")
+
+    @property
+    def score_only(self) -> bool:
+        """Whether the call asks for the score alone (and a stream stops once it arrives)"""
+        return not self.include_reasoning
 
 
 class ParsedResponse(BaseModel):
@@ -45,11 +142,71 @@ class BaseLLMProvider(ABC):
     """
     Abstract base class for all LLM providers.
 
-    All provider implementations must inherit from this class
-    and implement the evaluate() method.
+    All provider implementations must inherit from this class and
+    implement complete() (one chat completion) and _parse_response().
+    evaluate() builds on both.
     """
 
+    provider_name: str = "unknown"
+    default_model: str = "unknown"
+    supports_streaming: bool = False
+    # Whether responses are stored in the shared response cache
+    cacheable: bool = True
+    # Whether calls are charged against LLM budgets
+    metered: bool = True
+
     @abstractmethod
+    async def complete(
+        self,
+        prompt: str,
+        options: EvaluationOptions,
+        system_message: Optional[str] = None
+    ) -> LLMCompletion:
+        """
+        Run one completion with the provider.
+
+        Args:
+            prompt: User prompt
+            options: Configuration for the call
+            system_message: System instruction (default: single-step evaluator)
+
+        Returns:
+            LLMCompletion: Completion text with usage, cost and timing
+
+        Raises:
+            ConnectionError: If API call fails
+        """
+        pass
+
+    async def stream(
+        self,
+        prompt: str,
+        options: EvaluationOptions,
+        system_message: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream one completion as text deltas.
+
+        Providers with supports_streaming override this; closing their
+        iterator early (aclose) must end the request, so the provider stops
+        generating tokens. Other providers yield the whole completion as a
+        single chunk, which saves nothing, so callers stream only when
+        supports_streaming is set.
+
+        Args:
+            prompt: User prompt
+            options: Configuration for the call
+            system_message: System instruction (default: single-step evaluator)
+
+        Returns:
+            AsyncIterator[str]: Completion text in arrival order
+
+        Raises:
+            ConnectionError: If API call fails
+        """
+        completion = await self.complete(prompt, options, system_message)
+        yield completion.text
+
     async def evaluate(self, prompt: str, options: EvaluationOptions) -> LLMResponse:
         """
         Evaluate a proof step with the LLM.
@@ -64,7 +221,18 @@ class BaseLLMProvider(ABC):
         Raises:
             ConnectionError: If API call fails
         """
-        pass
+        completion = await self.complete(prompt, options)
+        parsed = self._parse_response(completion.text)
+        return LLMResponse(
+            provider=completion.provider,
+            model=completion.model,
+            score=parsed.score,
+            reasoning=parsed.reasoning,
+            raw_response=completion.text,
+            usage=completion.usage,
+            cost=completion.cost,
+            duration_ms=completion.duration_ms,
+        )
 
     @abstractmethod
     def _parse_response(self, response: str) -> ParsedResponse:
@@ -0,0 +1,292 @@
+# [*] ProofCore Backend - Provider Batch Jobs
+# OpenAI Batch and Anthropic Message Batches for offline bulk evaluation
+
+import asyncio
+import json
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import httpx
+
+from app.core.config import settings
+from app.services.llm.base import EvaluationOptions, LLMCompletion, LLMUsage
+from app.services.llm.clients import provider_clients
+from app.services.llm.cost_tracker import CostTracker
+from app.services.llm.prompts import system_message_for
+from app.services.llm.providers.anthropic import request_content
+
+
+class BatchRequest:
+    """One prompt in a batch job"""
+
+    def __init__(self, custom_id: str, prompt: str, model: str, options: EvaluationOptions,
+                 system_message: Optional[str] = None):
+        self.custom_id = custom_id
+        self.prompt = prompt
+        self.model = model
+        self.options = options
+        self.system_message = system_message
+
+
+# Per-request outcome: a completion, or the provider's error message
+BatchResult = Union[LLMCompletion, str]
+
+
+class BatchJobClient(ABC):
+    """
+    Submit, poll and collect one provider's batch jobs over HTTP.
+
+    Batch endpoints are called directly on the shared httpx pool rather
+    than through the SDKs, so the same code runs against the providers
+    and against scripts/fake_llm_server.py. Subclasses implement the
+    wire format.
+    """
+
+    provider_name = "unknown"
+    # Requests per job accepted by the provider
+    max_requests = 50_000
+
+    def __init__(self, base_url: str, api_key: str, http: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize the client.
+
+        Args:
+            base_url: Provider API base URL
+            api_key: Provider API key
+            http: HTTP client (default: the shared provider pool)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.http = http if http is not None else provider_clients.http_client()
+        self.cost_tracker = CostTracker(provider=self.provider_name)
+
+    @abstractmethod
+    async def submit(self, requests: Sequence[BatchRequest]) -> str:
+        """Create a batch job; returns its ID"""
+        pass
+
+    @abstractmethod
+    async def poll(self, job_id: str) -> Tuple[bool, dict]:
+        """Job state: (finished, provider job object)"""
+        pass
+
+    @abstractmethod
+    async def results(self, job: dict, models: Dict[str, str]) -> Dict[str, BatchResult]:
+        """
+        Per-request outcomes of a finished job, by custom_id.
+
+        Args:
+            job: Provider job object
+            models: Requested model per custom_id (completions are reported
+                and priced under it, like direct calls)
+        """
+        pass
+
+    async def run(
+        self,
+        requests: Sequence[BatchRequest],
+        poll_interval: Optional[float] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, BatchResult]:
+        """
+        Submit a job, wait for it to finish and collect its results.
+
+        Args:
+            requests: Prompts (at most max_requests)
+            poll_interval: Seconds between status checks (default: LLM_BULK_POLL_SECONDS)
+            timeout: Seconds to wait before giving up (default: LLM_BULK_TIMEOUT_SECONDS)
+
+        Returns:
+            Dict[str, BatchResult]: Outcome per custom_id (requests the
+            provider did not run are missing)
+
+        Raises:
+            ConnectionError: If the job cannot be submitted or read
+            TimeoutError: If the job did not finish in time
+        """
+        poll_interval = settings.LLM_BULK_POLL_SECONDS if poll_interval is None else poll_interval
+        timeout = settings.LLM_BULK_TIMEOUT_SECONDS if timeout is None else timeout
+        job_id = await self.submit(requests)
+        print(f"[>] {self.provider_name} batch {job_id} submitted ({len(requests)} requests)")
+
+        started = time.monotonic()
+        while True:
+            finished, job = await self.poll(job_id)
+            if finished:
+                break
+            if time.monotonic() - started > timeout:
+                raise TimeoutError(f"{self.provider_name} batch {job_id} did not finish within {timeout:.0f}s")
+            await asyncio.sleep(poll_interval)
+
+        results = await self.results(job, {r.custom_id: r.model for r in requests})
+        print(f"[+] {self.provider_name} batch {job_id} finished: {len(results)}/{len(requests)} results")
+        return results
+
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Call an endpoint (a path under base_url, or an absolute URL the provider returned)"""
+        url = path if path.startswith(("http://", "https://")) else f"{self.base_url}{path}"
+        try:
+            response = await self.http.request(method, url, headers=self._headers(), **kwargs)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise ConnectionError(f"{self.provider_name} batch API request failed: {e}") from e
+        return response
+
+    @abstractmethod
+    def _headers(self) -> dict:
+        """Authentication and version headers for every request"""
+        pass
+
+    def _completion(self, model: str, text: str, usage: LLMUsage) -> LLMCompletion:
+        """Completion priced at the provider's batch discount"""
+        cost = (self.cost_tracker.estimate(model, usage) or 0.0) * CostTracker.BATCH_MULTIPLIER.get(self.provider_name, 1.0)
+        return LLMCompletion(provider=self.provider_name, model=model, text=text, usage=usage, cost=cost)
+
+
+def _jsonl(text: str) -> List[dict]:
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+class OpenAIBatchJobs(BatchJobClient):
+    """OpenAI Batch API: JSONL file upload, /batches, output file download"""
+
+    provider_name = "openai"
+    max_requests = 50_000
+
+    def _headers(self) -> dict:
+        return {"Authorization": f"Bearer {self.api_key}"}
+
+    @staticmethod
+    def request_line(request: BatchRequest) -> dict:
+        """One line of the batch input file (a /v1/chat/completions request)"""
+        body = {
+            "model": request.model,
+            "messages": [
+                {"role": "system", "content": request.system_message or system_message_for(request.options)},
+                {"role": "user", "content": request.prompt},
+            ],
+            "temperature": request.options.temperature,
+            "max_tokens": request.options.max_tokens,
+        }
+        if request.options.json_mode:
+            body["response_format"] = {"type": "json_object"}
+        return {"custom_id": request.custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body}
+
+    async def submit(self, requests: Sequence[BatchRequest]) -> str:
+        content = "\n".join(json.dumps(self.request_line(r)) for r in requests) + "\n"
+        upload = await self._request(
+            "POST", "/files",
+            data={"purpose": "batch"},
+            files={"file": ("proofcore-batch.jsonl", content.encode("utf-8"), "application/jsonl")},
+        )
+        job = await self._request("POST", "/batches", json={
+            "input_file_id": upload.json()["id"],
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h",
+        })
+        return job.json()["id"]
+
+    async def poll(self, job_id: str) -> Tuple[bool, dict]:
+        job = (await self._request("GET", f"/batches/{job_id}")).json()
+        return job["status"] in ("completed", "failed", "expired", "cancelled"), job
+
+    async def results(self, job: dict, models: Dict[str, str]) -> Dict[str, BatchResult]:
+        results: Dict[str, BatchResult] = {}
+        if job.get("error_file_id"):
+            for line in _jsonl((await self._request("GET", f"/files/{job['error_file_id']}/content")).text):
+                results[line["custom_id"]] = str(line.get("error") or (line.get("response") or {}).get("body") or "request failed")
+        if not job.get("output_file_id"):
+            return results
+
+        for line in _jsonl((await self._request("GET", f"/files/{job['output_file_id']}/content")).text):
+            response = line.get("response") or {}
+            if line.get("error") or response.get("status_code") != 200:
+                results[line["custom_id"]] = str(line.get("error") or response.get("body"))
+                continue
+            body = response["body"]
+            usage_dict = body.get("usage") or {}
+            usage = LLMUsage(
+                prompt_tokens=usage_dict.get("prompt_tokens") or 0,
+                completion_tokens=usage_dict.get("completion_tokens") or 0,
+                total_tokens=usage_dict.get("total_tokens") or 0,
+                cached_tokens=(usage_dict.get("prompt_tokens_details") or {}).get("cached_tokens") or 0,
+            )
+            text = body["choices"][0]["message"].get("content") or ""
+            results[line["custom_id"]] = self._completion(models.get(line["custom_id"], body.get("model", "")), text, usage)
+        return results
+
+
+class AnthropicMessageBatches(BatchJobClient):
+    """Anthropic Message Batches API: inline requests, JSONL results"""
+
+    provider_name = "anthropic"
+    max_requests = 100_000
+
+    def _headers(self) -> dict:
+        return {"x-api-key": self.api_key, "anthropic-version": "2023-06-01"}
+
+    @staticmethod
+    def request_entry(request: BatchRequest) -> dict:
+        """One request of the batch (Messages API parameters, with prompt caching)"""
+        system, messages = request_content(request.prompt, request.options, request.system_message)
+        return {
+            "custom_id": request.custom_id,
+            "params": {
+                "model": request.model,
+                "max_tokens": request.options.max_tokens,
+                "temperature": request.options.temperature,
+                "system": system,
+                "messages": messages,
+            },
+        }
+
+    async def submit(self, requests: Sequence[BatchRequest]) -> str:
+        job = await self._request("POST", "/v1/messages/batches", json={
+            "requests": [self.request_entry(r) for r in requests]
+        })
+        return job.json()["id"]
+
+    async def poll(self, job_id: str) -> Tuple[bool, dict]:
+        job = (await self._request("GET", f"/v1/messages/batches/{job_id}")).json()
+        return job["processing_status"] == "ended", job
+
+    async def results(self, job: dict, models: Dict[str, str]) -> Dict[str, BatchResult]:
+        results_url = job.get("results_url") or f"/v1/messages/batches/{job['id']}/results"
+        results: Dict[str, BatchResult] = {}
+        for line in _jsonl((await self._request("GET", results_url)).text):
+            result = line.get("result") or {}
+            if result.get("type") != "succeeded":
+                results[line["custom_id"]] = str(result.get("error") or result.get("type", "request failed"))
+                continue
+            message = result["message"]
+            usage_dict = message.get("usage") or {}
+            cache_read = usage_dict.get("cache_read_input_tokens") or 0
+            cache_write = usage_dict.get("cache_creation_input_tokens") or 0
+            prompt_tokens = (usage_dict.get("input_tokens") or 0) + cache_read + cache_write
+            completion_tokens = usage_dict.get("output_tokens") or 0
+            usage = LLMUsage(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+                cached_tokens=cache_read,
+                cache_write_tokens=cache_write,
+            )
+            text = "".join(block.get("text", "") for block in message.get("content", []) if block.get("type") == "text")
+            results[line["custom_id"]] = self._completion(models.get(line["custom_id"], message.get("model", "")), text, usage)
+        return results
+
+
+def batch_job_client(provider_name: str, http: Optional[httpx.AsyncClient] = None) -> Optional[BatchJobClient]:
+    """
+    Batch client for a provider, if it has a batch API and a key is configured.
+
+    Args:
+        provider_name: 'openai' or 'anthropic' (others return None)
+        http: HTTP client (default: the shared provider pool)
+    """
+    if provider_name == "openai" and settings.OPENAI_API_KEY:
+        return OpenAIBatchJobs(settings.OPENAI_BASE_URL or "https://api.openai.com/v1", settings.OPENAI_API_KEY, http)
+    if provider_name == "anthropic" and settings.ANTHROPIC_API_KEY:
+        return AnthropicMessageBatches(settings.ANTHROPIC_BASE_URL or "https://api.anthropic.com", settings.ANTHROPIC_API_KEY, http)
+    return None
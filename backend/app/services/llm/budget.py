@@ -0,0 +1,346 @@
+# [*] ProofCore Backend - LLM Budget Enforcement
+# Daily and per-tenant token/cost limits shared by every process
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.core.config import settings
+from app.models.budget import LLMBudgetUsage
+from app.services.llm.cost_tracker import CostTracker
+
+
+class BudgetExceededError(ConnectionError):
+    """Raised instead of calling a provider when a budget has no room left"""
+
+    def __init__(self, scope: str):
+        super().__init__(f"LLM budget exhausted for {scope}")
+        self.scope = scope
+
+
+# [=] Tenant context
+
+_current_tenant: ContextVar[str] = ContextVar("llm_tenant", default="default")
+
+
+def current_tenant() -> str:
+    """Get the tenant whose proof is being verified in this context"""
+    return _current_tenant.get()
+
+
+@contextmanager
+def tenant_scope(tenant: Optional[str]) -> Iterator[str]:
+    """
+    Charge LLM usage in the block to `tenant`.
+
+    Usage:
+        with tenant_scope(proof.tenant):
+            await engine.evaluate(proof)
+    """
+    token = _current_tenant.set(tenant or "default")
+    try:
+        yield _current_tenant.get()
+    finally:
+        _current_tenant.reset(token)
+
+
+def cheapest_model(provider_name: str) -> Optional[str]:
+    """Lowest-priced model of a provider in CostTracker.PRICING"""
+    models = CostTracker.PRICING.get(provider_name)
+    if not models:
+        return None
+    return min(models, key=lambda model: models[model]["input"] + models[model]["output"])
+
+
+# [=] Usage stores
+
+class MemoryBudgetStore:
+    """Usage counters for one process (tests and single-process deployments)"""
+
+    def __init__(self):
+        self._usage: Dict[Tuple[str, str], List[float]] = {}
+        self._lock = asyncio.Lock()
+
+    async def try_add(
+        self, period: str, scope: str, tokens: int, cost: float,
+        token_limit: Optional[int], cost_limit: Optional[float]
+    ) -> bool:
+        """Add usage if it stays within both limits; True if added"""
+        async with self._lock:
+            used = self._usage.setdefault((period, scope), [0, 0.0])
+            if token_limit is not None and used[0] + tokens > token_limit:
+                return False
+            if cost_limit is not None and used[1] + cost > cost_limit:
+                return False
+            used[0] += tokens
+            used[1] += cost
+            return True
+
+    async def add(self, period: str, scope: str, tokens: int, cost: float) -> None:
+        """Add usage unconditionally (negative values release a reservation)"""
+        async with self._lock:
+            used = self._usage.setdefault((period, scope), [0, 0.0])
+            used[0] = max(0, used[0] + tokens)
+            used[1] = max(0.0, used[1] + cost)
+
+    async def usage(self, period: str, scope: str) -> Tuple[int, float]:
+        """Tokens and cost used so far"""
+        tokens, cost = self._usage.get((period, scope), (0, 0.0))
+        return int(tokens), cost
+
+
+class DatabaseBudgetStore:
+    """
+    Usage counters in the llm_budget_usage table.
+
+    Each reservation is one conditional UPDATE that only succeeds while
+    the row stays within its limits, so concurrent API and worker
+    processes on any node cannot overspend a budget between them.
+    """
+
+    def __init__(self, database_url: Optional[str] = None):
+        """
+        Initialize the store (the engine is created on first use).
+
+        Args:
+            database_url: Async database URL (default: DATABASE_URL)
+        """
+        self.database_url = database_url or settings.DATABASE_URL
+        self._engine: Optional[AsyncEngine] = None
+
+    @property
+    def engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self._engine = create_async_engine(self.database_url, echo=False)
+        return self._engine
+
+    async def _ensure_row(self, conn, period: str, scope: str) -> None:
+        if self.engine.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        await conn.execute(
+            insert(LLMBudgetUsage)
+            .values(period=period, scope=scope, tokens=0, cost=0.0)
+            .on_conflict_do_nothing()
+        )
+
+    async def try_add(
+        self, period: str, scope: str, tokens: int, cost: float,
+        token_limit: Optional[int], cost_limit: Optional[float]
+    ) -> bool:
+        """Add usage if it stays within both limits; True if added"""
+        statement = (
+            update(LLMBudgetUsage)
+            .where(LLMBudgetUsage.period == period, LLMBudgetUsage.scope == scope)
+            .values(tokens=LLMBudgetUsage.tokens + tokens, cost=LLMBudgetUsage.cost + cost)
+        )
+        if token_limit is not None:
+            statement = statement.where(LLMBudgetUsage.tokens + tokens <= token_limit)
+        if cost_limit is not None:
+            statement = statement.where(LLMBudgetUsage.cost + cost <= cost_limit)
+
+        async with self.engine.begin() as conn:
+            await self._ensure_row(conn, period, scope)
+            result = await conn.execute(statement)
+            return result.rowcount == 1
+
+    async def add(self, period: str, scope: str, tokens: int, cost: float) -> None:
+        """Add usage unconditionally (negative values release a reservation)"""
+        async with self.engine.begin() as conn:
+            await self._ensure_row(conn, period, scope)
+            await conn.execute(
+                update(LLMBudgetUsage)
+                .where(LLMBudgetUsage.period == period, LLMBudgetUsage.scope == scope)
+                .values(tokens=LLMBudgetUsage.tokens + tokens, cost=LLMBudgetUsage.cost + cost)
+            )
+
+    async def usage(self, period: str, scope: str) -> Tuple[int, float]:
+        """Tokens and cost used so far"""
+        async with self.engine.connect() as conn:
+            row = (await conn.execute(
+                select(LLMBudgetUsage.tokens, LLMBudgetUsage.cost)
+                .where(LLMBudgetUsage.period == period, LLMBudgetUsage.scope == scope)
+            )).first()
+        return (int(row[0]), float(row[1])) if row else (0, 0.0)
+
+    async def aclose(self) -> None:
+        """Dispose of the engine"""
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
+
+# [=] Budget service
+
+class BudgetReservation:
+    """Usage reserved for one provider call, to be settled or released"""
+
+    def __init__(self, period: str, scopes: List[str], tokens: int, cost: float):
+        self.period = period
+        self.scopes = scopes
+        self.tokens = tokens
+        self.cost = cost
+
+
+class LLMBudget:
+    """
+    Daily token and cost limits, globally and per tenant.
+
+    Every metered provider call reserves its estimated tokens and cost
+    before it is made (reserve) and is reconciled with the usage the
+    provider reports afterwards (settle), or released if it failed. A
+    reservation that would cross a limit is refused, so concurrent calls
+    cannot overspend it together.
+
+    Rather than failing when money runs low, the adapter degrades:
+    - 'degrade' (LLM_BUDGET_DEGRADE_AT of a limit used): each provider's
+      cheapest model is used
+    - 'exhausted' (a limit reached): only the local heuristic tier scores
+
+    Usage is kept per UTC day in a store: the database (shared by all
+    processes on all nodes) or process memory (LLM_BUDGET_STORE).
+    """
+
+    # Seconds a budget state is reused before the store is read again
+    STATE_TTL = 2.0
+
+    def __init__(self, store=None):
+        """
+        Initialize the budget service.
+
+        Args:
+            store: Usage store (default: per LLM_BUDGET_STORE)
+        """
+        if store is None:
+            store = DatabaseBudgetStore() if settings.LLM_BUDGET_STORE == "database" else MemoryBudgetStore()
+        self.store = store
+        self._states: Dict[Tuple[str, str], Tuple[float, str]] = {}
+        self.refused = 0
+        self.degraded = 0
+
+    @staticmethod
+    def period() -> str:
+        """Current budget period (UTC date)"""
+        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    @staticmethod
+    def _limits(scope: str) -> Tuple[Optional[int], Optional[float]]:
+        if scope == "global":
+            return settings.LLM_DAILY_TOKEN_LIMIT, settings.LLM_DAILY_COST_LIMIT
+        tenant = scope.split(":", 1)[1]
+        return (
+            settings.LLM_TENANT_DAILY_TOKEN_LIMIT,
+            settings.LLM_TENANT_DAILY_COST_LIMITS.get(tenant, settings.LLM_TENANT_DAILY_COST_LIMIT),
+        )
+
+    def _scopes(self, tenant: Optional[str] = None) -> List[str]:
+        """Scopes with at least one limit configured"""
+        scopes = ["global", f"tenant:{tenant or current_tenant()}"]
+        return [scope for scope in scopes if any(limit is not None for limit in self._limits(scope))]
+
+    def enabled(self) -> bool:
+        """Whether budgets are enforced"""
+        return settings.LLM_BUDGET_ENABLED
+
+    async def state(self, tenant: Optional[str] = None) -> str:
+        """
+        Budget state for the tenant: 'ok', 'degrade' or 'exhausted'.
+
+        Args:
+            tenant: Tenant (default: current_tenant())
+
+        Returns:
+            str: State of the most-used of the global and tenant budgets
+        """
+        if not self.enabled():
+            return "ok"
+        tenant = tenant or current_tenant()
+        period = self.period()
+        cached = self._states.get((period, tenant))
+        if cached is not None and time.monotonic() - cached[0] < self.STATE_TTL:
+            return cached[1]
+
+        used = 0.0
+        for scope in self._scopes(tenant):
+            tokens, cost = await self.store.usage(period, scope)
+            token_limit, cost_limit = self._limits(scope)
+            if token_limit is not None:
+                used = max(used, tokens / token_limit if token_limit else 1.0)
+            if cost_limit is not None:
+                used = max(used, cost / cost_limit if cost_limit else 1.0)
+
+        state = "exhausted" if used >= 1.0 else "degrade" if used >= settings.LLM_BUDGET_DEGRADE_AT else "ok"
+        self._states[(period, tenant)] = (time.monotonic(), state)
+        return state
+
+    async def reserve(self, tokens: int, cost: float) -> Optional[BudgetReservation]:
+        """
+        Reserve estimated usage for one call against every applicable budget.
+
+        Args:
+            tokens: Estimated prompt + completion tokens
+            cost: Estimated cost in USD
+
+        Returns:
+            Optional[BudgetReservation]: Reservation, or None if budgets are disabled
+
+        Raises:
+            BudgetExceededError: If a budget cannot fit the call
+        """
+        if not self.enabled():
+            return None
+        period = self.period()
+        reserved: List[str] = []
+        for scope in self._scopes():
+            token_limit, cost_limit = self._limits(scope)
+            if not await self.store.try_add(period, scope, tokens, cost, token_limit, cost_limit):
+                for done in reserved:
+                    await self.store.add(period, done, -tokens, -cost)
+                self.refused += 1
+                self._states[(period, current_tenant())] = (time.monotonic(), "exhausted")
+                raise BudgetExceededError(scope)
+            reserved.append(scope)
+        return BudgetReservation(period, reserved, tokens, cost)
+
+    async def settle(self, reservation: Optional[BudgetReservation], tokens: int, cost: float) -> None:
+        """Replace a reservation with the usage the provider reported"""
+        if reservation is None:
+            return
+        for scope in reservation.scopes:
+            await self.store.add(reservation.period, scope, tokens - reservation.tokens, cost - reservation.cost)
+
+    async def release(self, reservation: Optional[BudgetReservation]) -> None:
+        """Return a reservation whose call failed"""
+        await self.settle(reservation, 0, 0.0)
+
+    async def get_stats(self, tenant: Optional[str] = None) -> dict:
+        """Usage, limits and state of the global and tenant budgets today"""
+        period = self.period()
+        budgets = {}
+        for scope in ["global", f"tenant:{tenant or current_tenant()}"]:
+            tokens, cost = await self.store.usage(period, scope)
+            token_limit, cost_limit = self._limits(scope)
+            budgets[scope] = {
+                "tokens": tokens,
+                "cost": round(cost, 4),
+                "token_limit": token_limit,
+                "cost_limit": cost_limit,
+            }
+        return {
+            "period": period,
+            "state": await self.state(tenant),
+            "refused": self.refused,
+            "degraded": self.degraded,
+            "budgets": budgets,
+        }
+
+
+# [+] Global budget service (the usage store is shared across processes)
+llm_budget = LLMBudget()
@@ -0,0 +1,217 @@
+# [*] ProofCore Backend - LLM Response Cache
+# Persistent SQLite cache of provider responses, shared across worker processes
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from app.core.config import settings
+from app.services.llm.base import EvaluationOptions, LLMResponse, LLMUsage
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_llm_responses_last_access ON llm_responses (last_access);
+"""
+
+
+def cache_key(provider: str, model: str, prompt: str, options: EvaluationOptions, batch: bool = False) -> str:
+    """
+    Build the cache key for one provider call.
+
+    Args:
+        provider: Provider name
+        model: Model actually used (options.model or the provider default)
+        prompt: Evaluation prompt
+        options: Sampling options that affect the response
+        batch: Whether the response was split out of a multi-step prompt
+
+    Returns:
+        str: SHA-256 hex digest of the key fields
+    """
+    prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    fields = [provider, model, prompt_hash, options.temperature, options.max_tokens, options.json_mode]
+    if options.score_only:
+        # Score-only streamed responses carry no reasoning; keep them apart
+        fields.append("score-only")
+    if batch:
+        # A step scored inside a batch prompt is not what the single-step prompt returns
+        fields.append("batch")
+    material = json.dumps(fields)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed cache of LLMResponse objects.
+
+    The database runs in WAL mode, so every API and worker process on a
+    host can share one file: readers never block writers, and a response
+    paid for by one process is free for all the others. Entries expire
+    after `ttl_seconds`; beyond `max_entries` the least recently used
+    entries are evicted.
+
+    Calls run in a thread so SQLite I/O never blocks the event loop.
+    """
+
+    # Run eviction every N writes instead of counting rows on each one
+    EVICT_EVERY = 64
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        """
+        Initialize the cache (the database is opened on first use).
+
+        Args:
+            path: SQLite file (default: LLM_CACHE_PATH; ":memory:" for a private cache)
+            ttl_seconds: Entry lifetime (default: LLM_CACHE_TTL_SECONDS)
+            max_entries: LRU size limit (default: LLM_CACHE_MAX_ENTRIES)
+        """
+        self.path = path or settings.LLM_CACHE_PATH
+        self.ttl_seconds = ttl_seconds or settings.LLM_CACHE_TTL_SECONDS
+        self.max_entries = max_entries or settings.LLM_CACHE_MAX_ENTRIES
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    # [=] Synchronous operations (run in a worker thread)
+
+    def _get_sync(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT response, created_at FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl_seconds:
+                conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE llm_responses SET last_access = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def _put_sync(self, key: str, payload: str) -> None:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, response, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, payload, now, now),
+            )
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY == 0:
+                self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then least recently used ones over the limit"""
+        conn.execute("DELETE FROM llm_responses WHERE created_at < ?", (now - self.ttl_seconds,))
+        (count,) = conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+        if count > self.max_entries:
+            conn.execute(
+                "DELETE FROM llm_responses WHERE key IN "
+                "(SELECT key FROM llm_responses ORDER BY last_access LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    # [=] Async API
+
+    async def get(self, key: str) -> Optional[LLMResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from cache_key()
+
+        Returns:
+            Optional[LLMResponse]: Cached response marked cached=True with zero
+            cost and usage, or None on a miss
+        """
+        started = time.perf_counter()
+        try:
+            payload = await asyncio.to_thread(self._get_sync, key)
+        except sqlite3.Error as e:
+            print(f"[W] LLM cache read failed: {e}")
+            payload = None
+
+        if payload is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        data = json.loads(payload)
+        data.update(
+            raw_response=None,
+            usage=LLMUsage(),
+            cost=0.0,
+            duration_ms=int((time.perf_counter() - started) * 1000),
+            cached=True,
+        )
+        return LLMResponse(**data)
+
+    async def put(self, key: str, response: LLMResponse) -> None:
+        """
+        Store a fresh provider response (raw SDK payload is not kept).
+
+        Args:
+            key: Key from cache_key()
+            response: Response to cache
+        """
+        payload = response.model_dump_json(exclude={"raw_response", "cached"})
+        try:
+            await asyncio.to_thread(self._put_sync, key, payload)
+        except sqlite3.Error as e:
+            print(f"[W] LLM cache write failed: {e}")
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._lock:
+            self._connect().execute("DELETE FROM llm_responses")
+
+    def get_stats(self) -> dict:
+        """Hit/miss counters for this process"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# [+] Global cache instance
+llm_response_cache = LLMResponseCache()
@@ -0,0 +1,185 @@
+# [B] ProofCore Backend - LLM Provider Circuit Breakers
+# Skip failing providers immediately; retry with jittered exponential backoff
+
+import random
+import time
+from enum import Enum
+from typing import Callable, Dict, Optional
+
+from app.core.config import settings
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states"""
+    CLOSED = "closed"        # Calls flow normally
+    OPEN = "open"            # Calls are rejected without contacting the provider
+    HALF_OPEN = "half_open"  # One probe call decides whether to close again
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of calling a provider whose circuit is open"""
+
+    def __init__(self, provider_name: str, retry_in: float):
+        super().__init__(f"{provider_name} circuit open; next probe in {retry_in:.1f}s")
+        self.provider_name = provider_name
+        self.retry_in = retry_in
+
+
+def backoff_delay(
+    attempt: int,
+    base: Optional[float] = None,
+    cap: Optional[float] = None,
+    retry_after: Optional[float] = None,
+) -> float:
+    """
+    Delay before retry number `attempt` (0-based).
+
+    Uses "full jitter" (uniform between 0 and base * 2**attempt, capped),
+    so callers that failed together do not retry together. A provider's
+    Retry-After takes precedence, plus up to `base` seconds of jitter.
+
+    Args:
+        attempt: Retries already made
+        base: First backoff step (default: LLM_RETRY_BASE_SECONDS)
+        cap: Longest backoff (default: LLM_RETRY_MAX_SECONDS)
+        retry_after: Delay requested by the provider, in seconds
+
+    Returns:
+        float: Seconds to sleep
+    """
+    base = settings.LLM_RETRY_BASE_SECONDS if base is None else base
+    cap = settings.LLM_RETRY_MAX_SECONDS if cap is None else cap
+    if retry_after is not None:
+        return retry_after + random.uniform(0, base)
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    Per-provider circuit breaker.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    calls fail immediately with CircuitOpenError for `reset_seconds` (or
+    longer if the provider sent a longer Retry-After). The circuit then
+    goes half-open and lets a single probe call through: success closes
+    it, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: Optional[int] = None,
+        reset_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a closed breaker.
+
+        Args:
+            name: Provider name
+            failure_threshold: Consecutive failures that open the circuit (default: LLM_BREAKER_FAILURE_THRESHOLD)
+            reset_seconds: Open period before a probe (default: LLM_BREAKER_RESET_SECONDS)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold or settings.LLM_BREAKER_FAILURE_THRESHOLD
+        self.reset_seconds = settings.LLM_BREAKER_RESET_SECONDS if reset_seconds is None else reset_seconds
+        self._clock = clock
+
+        self._state = CircuitState.CLOSED
+        self._opened_until = 0.0
+        self._probe_in_flight = False
+        self.consecutive_failures = 0
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an expired open period reads as half-open)"""
+        if self._state == CircuitState.OPEN and self._clock() >= self._opened_until:
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 if not open)"""
+        return max(0.0, self._opened_until - self._clock()) if self.state == CircuitState.OPEN else 0.0
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may be made now.
+
+        In half-open state only one probe is admitted at a time; a
+        rejected call is counted in `rejected`.
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call"""
+        if self._state != CircuitState.CLOSED:
+            print(f"[+] {self.name} circuit closed")
+        self._state = CircuitState.CLOSED
+        self._probe_in_flight = False
+        self.consecutive_failures = 0
+
+    def record_failure(self, retry_after: Optional[float] = None) -> None:
+        """
+        Count a failed call, opening the circuit at the threshold.
+
+        Args:
+            retry_after: Provider-requested delay; extends the open period
+        """
+        self.consecutive_failures += 1
+        probe_failed = self._probe_in_flight
+        self._probe_in_flight = False
+        if probe_failed or self.consecutive_failures >= self.failure_threshold:
+            self._open(max(self.reset_seconds, retry_after or 0.0))
+
+    def release(self) -> None:
+        """Give up an admitted call without an outcome (e.g. cancelled)"""
+        self._probe_in_flight = False
+
+    def _open(self, seconds: float) -> None:
+        if self._state != CircuitState.OPEN:
+            self.times_opened += 1
+            print(f"[W] {self.name} circuit open for {seconds:.0f}s after "
+                  f"{self.consecutive_failures} consecutive failure(s)")
+        self._state = CircuitState.OPEN
+        self._opened_until = self._clock() + seconds
+
+    def get_stats(self) -> dict:
+        """State and counters for the metrics endpoint"""
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "retry_in_seconds": round(self.retry_in(), 1),
+        }
+
+
+class CircuitBreakers:
+    """Process-wide registry of provider circuit breakers"""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, provider_name: str) -> CircuitBreaker:
+        """Get (or create) the breaker for a provider"""
+        if provider_name not in self._breakers:
+            self._breakers[provider_name] = CircuitBreaker(provider_name)
+        return self._breakers[provider_name]
+
+    def get_stats(self) -> Dict[str, dict]:
+        """Stats for every provider that has been called"""
+        return {name: breaker.get_stats() for name, breaker in sorted(self._breakers.items())}
+
+
+# [+] Global breaker registry
+provider_breakers = CircuitBreakers()
@@ -0,0 +1,90 @@
+# [B] ProofCore Backend - Shared LLM Provider Clients
+# Process-wide SDK clients over one keep-alive HTTP connection pool
+
+import importlib.util
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import httpx
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+def http2_available() -> bool:
+    """Whether httpx can negotiate HTTP/2 (requires the h2 package: httpx[http2])"""
+    return importlib.util.find_spec("h2") is not None
+
+
+def build_http_client() -> httpx.AsyncClient:
+    """
+    Build the pooled HTTP client shared by the OpenAI and Anthropic SDKs.
+
+    Connections are kept alive for LLM_HTTP_KEEPALIVE_SECONDS, so TLS
+    handshakes are paid once per connection rather than once per proof.
+    HTTP/2 (one multiplexed connection per host) is used when LLM_HTTP2
+    is set and h2 is installed.
+    """
+    http2 = settings.LLM_HTTP2 and http2_available()
+    if settings.LLM_HTTP2 and not http2:
+        print("[W] LLM_HTTP2 is set but h2 is not installed (pip install 'httpx[http2]'); using HTTP/1.1")
+
+    return httpx.AsyncClient(
+        http2=http2,
+        timeout=httpx.Timeout(settings.LLM_TIMEOUT, connect=10.0),
+        limits=httpx.Limits(
+            max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_SECONDS,
+        ),
+    )
+
+
+class ProviderClients:
+    """
+    Registry of process-wide provider SDK clients.
+
+    Providers are constructed per LLMAdapter (one per proof), but the SDK
+    clients they use are built once here and shared, together with one
+    httpx connection pool. Clients are created on first use and closed
+    by aclose() at shutdown.
+    """
+
+    def __init__(self):
+        self._http: Optional[httpx.AsyncClient] = None
+        self._clients: Dict[str, Any] = {}
+
+    def http_client(self) -> httpx.AsyncClient:
+        """Get (or create) the shared HTTP client"""
+        if self._http is None or self._http.is_closed:
+            self._http = build_http_client()
+        return self._http
+
+    def get(self, key: str, factory: Callable[[], T]) -> T:
+        """
+        Get the client registered under `key`, building it on first use.
+
+        Args:
+            key: Client identity (e.g. 'openai', 'google:gemini-1.5-pro')
+            factory: Builds the client; should pass http_client() to the SDK
+
+        Returns:
+            The shared client
+        """
+        if key not in self._clients:
+            self._clients[key] = factory()
+        return self._clients[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._clients
+
+    async def aclose(self) -> None:
+        """Close the shared connection pool and forget all clients"""
+        self._clients.clear()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+
+# [+] Global client registry
+provider_clients = ProviderClients()
@@ -2,7 +2,7 @@
 # Track and calculate API costs for different LLM providers
 
 from app.services.llm.base import LLMUsage
-from typing import Dict
+from typing import Dict, Optional
 
 
 class CostTracker:
@@ -11,6 +11,12 @@ class CostTracker:
 
     Pricing is per 1,000 tokens (as of 2025-01-01).
     Update pricing regularly as providers change rates.
+
+    Prompt tokens served from a provider's prompt cache are billed at a
+    discount, and Anthropic charges a premium for writing them
+    (CACHE_READ_MULTIPLIER / CACHE_WRITE_MULTIPLIER of the input rate).
+    Requests run through a provider batch API are billed at
+    BATCH_MULTIPLIER of the regular price.
     """
 
     # Pricing in USD per 1,000 tokens
@@ -32,9 +38,19 @@ class CostTracker:
             "gemini-1.5-pro": {"input": 0.00125, "output": 0.005},
             "gemini-1.5-flash": {"input": 0.000075, "output": 0.0003},
             "gemini-pro": {"input": 0.0005, "output": 0.0015},
+        },
+        "local": {
+            "heuristic-v1": {"input": 0.0, "output": 0.0},
         }
     }
 
+    # Fraction of the input rate charged for cached / cache-writing prompt tokens
+    CACHE_READ_MULTIPLIER: Dict[str, float] = {"openai": 0.5, "anthropic": 0.1, "google": 0.25}
+    CACHE_WRITE_MULTIPLIER: Dict[str, float] = {"anthropic": 1.25}
+
+    # Fraction of the regular price charged for batch API requests
+    BATCH_MULTIPLIER: Dict[str, float] = {"openai": 0.5, "anthropic": 0.5}
+
     def __init__(self, provider: str):
         """
         Initialize cost tracker for a specific provider.
@@ -45,6 +61,8 @@ class CostTracker:
         self.provider = provider.lower()
         self.total_cost = 0.0
         self.call_count = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
 
     def calculate(self, model: str, usage: LLMUsage) -> float:
         """
@@ -60,22 +78,44 @@ class CostTracker:
         Note:
             Returns 0.0 if model pricing not found (unknown model)
         """
-        rates = self.PRICING.get(self.provider, {}).get(model)
-        if not rates:
+        cost = self.estimate(model, usage)
+        if cost is None:
             print(f"[W] No pricing data for {self.provider}/{model}, cost = $0.00")
             return 0.0
 
-        # Calculate cost based on token usage
-        input_cost = (usage.prompt_tokens / 1000) * rates["input"]
-        output_cost = (usage.completion_tokens / 1000) * rates["output"]
-        cost = input_cost + output_cost
-
         # Track cumulative cost
         self.total_cost += cost
         self.call_count += 1
+        self.prompt_tokens += usage.prompt_tokens
+        self.cached_tokens += usage.cached_tokens
 
         return cost
 
+    def estimate(self, model: str, usage: LLMUsage) -> Optional[float]:
+        """
+        Price a call without recording it.
+
+        Args:
+            model: Model identifier
+            usage: Token usage statistics
+
+        Returns:
+            Optional[float]: Cost in USD, or None if model pricing is unknown
+        """
+        rates = self.PRICING.get(self.provider, {}).get(model)
+        if not rates:
+            return None
+
+        uncached = max(0, usage.prompt_tokens - usage.cached_tokens - usage.cache_write_tokens)
+        input_tokens = (
+            uncached
+            + usage.cached_tokens * self.CACHE_READ_MULTIPLIER.get(self.provider, 1.0)
+            + usage.cache_write_tokens * self.CACHE_WRITE_MULTIPLIER.get(self.provider, 1.0)
+        )
+        input_cost = (input_tokens / 1000) * rates["input"]
+        output_cost = (usage.completion_tokens / 1000) * rates["output"]
+        return input_cost + output_cost
+
     def get_total_cost(self) -> float:
         """Get cumulative cost for all calls"""
         return self.total_cost
@@ -92,22 +132,17 @@ class CostTracker:
             "provider": self.provider,
             "total_cost": round(self.total_cost, 4),
             "call_count": self.call_count,
-            "average_cost": round(self.get_average_cost(), 4)
+            "average_cost": round(self.get_average_cost(), 4),
+            "cached_tokens": self.cached_tokens,
+            "prompt_cache_hit_rate": round(self.cached_tokens / self.prompt_tokens, 3) if self.prompt_tokens else 0.0
         }
 
     def reset(self):
         """Reset cost tracking"""
         self.total_cost = 0.0
         self.call_count = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
 
 
-# [T] Future enhancement: Add cost budgets and alerts
-# class CostBudget:
-#     def __init__(self, daily_limit: float = 10.0):
-#         self.daily_limit = daily_limit
-#         self.current_spending = 0.0
-#
-#     def check_budget(self, cost: float) -> bool:
-#         if self.current_spending + cost > self.daily_limit:
-#             raise BudgetExceededError(f"Daily budget ${self.daily_limit} exceeded")
-#         return True
+# Daily and per-tenant budgets shared across processes: see app.services.llm.budget
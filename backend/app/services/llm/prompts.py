@@ -0,0 +1,207 @@
+# [*] ProofCore Backend - Semantic Evaluation Prompts
+# System messages and prompt builders for single-step and batched evaluation
+
+import json
+import re
+from typing import List, Optional, Sequence, Tuple
+
+from app.services.llm.base import EvaluationOptions, ParsedResponse
+
+
+# [=] System messages
+
+SYSTEM_MESSAGE = (
+    "You are a mathematical proof evaluator. Analyze the provided proof step "
+    "and provide a score from 0-100 based on logical soundness and correctness. "
+    "Respond in JSON format with 'score' (integer 0-100) and 'reasoning' (string) fields, "
+    "with 'score' first."
+)
+
+SCORE_ONLY_SYSTEM_MESSAGE = (
+    "You are a mathematical proof evaluator. Score the provided proof step from 0-100 "
+    "based on logical soundness and correctness. Respond with only a JSON object of the "
+    "form {\"score\": <integer 0-100>} and nothing else."
+)
+
+BATCH_SYSTEM_MESSAGE = (
+    "You are a mathematical proof evaluator. Analyze each of the provided proof steps "
+    "independently and score each from 0-100 based on logical soundness and correctness. "
+    "Respond in JSON format with a 'results' array containing one object per step, "
+    "in the order given, each with 'step' (the step number shown), 'score' (integer 0-100) "
+    "and 'reasoning' (string) fields."
+)
+
+_RUBRIC = """Provide a score from 0-100 where:
+- 0-30: Major logical errors or incorrect reasoning
+- 31-60: Some issues but partially correct
+- 61-85: Mostly correct with minor issues
+- 86-100: Logically sound and correct"""
+
+
+def system_message_for(options: EvaluationOptions) -> str:
+    """Single-step system message: compact score-only, or score with reasoning"""
+    return SCORE_ONLY_SYSTEM_MESSAGE if options.score_only else SYSTEM_MESSAGE
+
+
+# [=] Stable prompt prefixes
+# Instructions, rubric and answer format come first and are identical for
+# every call of a kind; step content follows VARIABLE_SECTION at the end.
+# Provider prompt caches can then reuse everything before it.
+
+VARIABLE_SECTION = "## Proof material"
+
+_STEP_PREFIX = f"""Evaluate the proof step given at the end of this message.
+
+Assess the logical soundness and correctness of the step. Consider:
+1. Does the reasoning justify the claim?
+2. Is the equation correctly derived?
+3. Are there any logical gaps or errors?
+4. Is the step appropriate for its stated domain?
+
+{_RUBRIC}
+"""
+
+_RESPOND_WITH_REASONING = """Respond in JSON format with:
+- "score": integer from 0-100
+- "reasoning": brief explanation of your evaluation
+"""
+
+_RESPOND_SCORE_ONLY = """Respond in JSON format with only:
+- "score": integer from 0-100
+"""
+
+_BATCH_PREFIX = f"""Evaluate each of the proof steps given at the end of this message.
+Score every step on its own merits.
+
+For each step assess whether the reasoning justifies the claim, whether the
+equation is correctly derived, and whether there are logical gaps or errors.
+
+{_RUBRIC}
+
+Respond in JSON format with:
+- "results": array with one entry per step, in the order given, each having
+  "step" (step number), "score" (integer 0-100) and "reasoning" (brief explanation)
+"""
+
+
+def split_cacheable_prefix(prompt: str) -> Tuple[str, str]:
+    """
+    Split a prompt into its stable prefix and its per-call suffix.
+
+    Args:
+        prompt: Prompt from build_step_prompt or build_batch_prompt
+
+    Returns:
+        Tuple[str, str]: (prefix, suffix); the prefix is '' for prompts
+        without a VARIABLE_SECTION
+    """
+    index = prompt.find(VARIABLE_SECTION)
+    if index <= 0:
+        return "", prompt
+    return prompt[:index], prompt[index:]
+
+
+# [=] Prompt builders
+
+def _step_fields(step) -> str:
+    return (
+        f"**Claim**: {step.claim}\n"
+        f"**Equation**: {step.equation}\n"
+        f"**Reasoning**: {getattr(step, 'reasoning', None)}"
+    )
+
+
+def build_step_prompt(step, domain: str, include_reasoning: bool = True) -> str:
+    """
+    Build the evaluation prompt for a single proof step.
+
+    Args:
+        step: ProofStep entity
+        domain: Mathematical domain
+        include_reasoning: Ask for reasoning (False = score only, for a
+            first pass with a small max_tokens)
+
+    Returns:
+        str: Stable instructions followed by the step
+    """
+    respond = _RESPOND_WITH_REASONING if include_reasoning else _RESPOND_SCORE_ONLY
+    return f"""{_STEP_PREFIX}
+{respond}
+{VARIABLE_SECTION}
+
+**Domain**: {domain}
+{_step_fields(step)}
+"""
+
+
+def build_batch_prompt(steps: Sequence, domain: str) -> str:
+    """
+    Build one prompt that evaluates several proof steps.
+
+    Steps are numbered by step_index so the response can be matched back
+    even if the model reorders them.
+
+    Args:
+        steps: ProofStep entities
+        domain: Mathematical domain
+
+    Returns:
+        str: Stable instructions followed by the steps
+    """
+    blocks = "\n\n".join(f"### Step {step.step_index}\n{_step_fields(step)}" for step in steps)
+    return f"""{_BATCH_PREFIX}
+{VARIABLE_SECTION}
+
+**Domain**: {domain}
+**Steps**: {len(steps)}
+
+{blocks}
+"""
+
+
+# [=] Batch response parsing
+
+_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+def parse_batch_response(text: str, step_indices: Sequence[int]) -> Optional[List[ParsedResponse]]:
+    """
+    Parse a batched evaluation into one result per step.
+
+    Accepts {"results": [...]} or a bare JSON array. Entries are matched by
+    their "step" number when present, otherwise by position.
+
+    Args:
+        text: Raw model output
+        step_indices: step_index of each step in the prompt, in order
+
+    Returns:
+        Optional[List[ParsedResponse]]: Results in step_indices order, or None if
+        the response is malformed (caller falls back to single-step calls)
+    """
+    try:
+        data = json.loads(_FENCE.sub("", text.strip()))
+    except (json.JSONDecodeError, AttributeError):
+        return None
+
+    entries = data.get("results") if isinstance(data, dict) else data
+    if not isinstance(entries, list) or len(entries) != len(step_indices):
+        return None
+
+    by_step = {}
+    for position, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            return None
+        score = entry.get("score")
+        if isinstance(score, bool) or not isinstance(score, int) or not 0 <= score <= 100:
+            return None
+        step = entry.get("step", step_indices[position])
+        try:
+            step = int(step)
+        except (TypeError, ValueError):
+            return None
+        by_step[step] = ParsedResponse(score=score, reasoning=str(entry.get("reasoning") or "No reasoning provided"))
+
+    if set(by_step) != set(step_indices):
+        return None
+    return [by_step[index] for index in step_indices]
@@ -0,0 +1,57 @@
+# [>] ProofCore Backend - LLM Provider Registry
+# API providers by name, imported on first use of a configured provider
+
+import importlib
+from typing import Dict, List, NamedTuple
+
+from app.core.config import settings
+
+
+class ProviderSpec(NamedTuple):
+    """Where an API provider lives and which setting enables it"""
+    module: str
+    class_name: str
+    api_key_setting: str
+    label: str
+
+
+# Fallback order: OpenAI, then Anthropic, then Google (the local tier is added by LLMAdapter)
+PROVIDERS: Dict[str, ProviderSpec] = {
+    "openai": ProviderSpec("app.services.llm.providers.openai", "OpenAIProvider", "OPENAI_API_KEY", "OpenAI"),
+    "anthropic": ProviderSpec("app.services.llm.providers.anthropic", "AnthropicProvider", "ANTHROPIC_API_KEY", "Anthropic"),
+    "google": ProviderSpec("app.services.llm.providers.google", "GoogleAIProvider", "GOOGLE_API_KEY", "Google AI"),
+}
+
+
+def register_provider(name: str, spec: ProviderSpec) -> None:
+    """Register (or replace) an API provider by name"""
+    PROVIDERS[name] = spec
+
+
+def configured_providers() -> List[str]:
+    """Registered providers whose API key is set"""
+    return [name for name, spec in PROVIDERS.items() if getattr(settings, spec.api_key_setting, None)]
+
+
+def create_provider(name: str):
+    """
+    Instantiate a provider by name.
+
+    The provider module (and, in its constructor, the provider SDK) is
+    imported here, so processes that never use a provider never pay for
+    its SDK.
+
+    Args:
+        name: Registered provider name
+
+    Returns:
+        BaseLLMProvider: The provider
+
+    Raises:
+        KeyError: If no provider is registered under `name`
+        ValueError: If the SDK is not installed or the API key is not set
+    """
+    spec = PROVIDERS[name]
+    provider_class = getattr(importlib.import_module(spec.module), spec.class_name)
+    return provider_class()
+
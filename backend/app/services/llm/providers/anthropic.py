@@ -4,26 +4,61 @@
 import time
 import json
 import re
-from typing import Optional
-
-try:
-    from anthropic import AsyncAnthropic
-    from anthropic import RateLimitError as AnthropicRateLimitError
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
-    AsyncAnthropic = None
-    AnthropicRateLimitError = Exception
+from typing import Any, AsyncIterator, List, Optional, Tuple
 
 from app.core.config import settings
 from app.services.llm.base import (
     BaseLLMProvider,
-    LLMResponse,
+    LLMCompletion,
+    ProviderRequestError,
+    RateLimitedError,
+    retry_after_seconds,
+    http_status,
+    is_retryable_status,
     EvaluationOptions,
     ParsedResponse,
     LLMUsage
 )
+from app.services.llm.clients import provider_clients
 from app.services.llm.cost_tracker import CostTracker
+from app.services.llm.prompts import split_cacheable_prefix, system_message_for
+
+
+def _sdk():
+    """The anthropic SDK, imported on first use (it is slow to import)"""
+    try:
+        import anthropic
+    except ImportError as e:
+        raise ValueError("anthropic library not installed. Run: pip install anthropic>=0.8.1") from e
+    return anthropic
+
+
+def request_content(
+    prompt: str,
+    options: EvaluationOptions,
+    system_message: Optional[str]
+) -> Tuple[Any, List[dict]]:
+    """
+    System and messages for a Messages API request, with a prompt-cache breakpoint.
+
+    With LLM_PROMPT_CACHING the breakpoint (cache_control) closes the
+    stable prefix: the system message plus the prompt's instructions
+    up to VARIABLE_SECTION. Only the step content after it is billed
+    and processed in full on later calls. Shared by direct calls and
+    Message Batches (see app.services.llm.batch_jobs).
+    """
+    system = system_message or system_message_for(options)
+    if not settings.LLM_PROMPT_CACHING:
+        return system, [{"role": "user", "content": prompt}]
+
+    breakpoint = {"type": "ephemeral"}
+    prefix, suffix = split_cacheable_prefix(prompt)
+    if not prefix:
+        return [{"type": "text", "text": system, "cache_control": breakpoint}], [{"role": "user", "content": prompt}]
+    return [{"type": "text", "text": system}], [{"role": "user", "content": [
+        {"type": "text", "text": prefix, "cache_control": breakpoint},
+        {"type": "text", "text": suffix},
+    ]}]
 
 
 class AnthropicProvider(BaseLLMProvider):
@@ -33,6 +68,9 @@ class AnthropicProvider(BaseLLMProvider):
     Supports: Claude 3.5 Sonnet, Claude 3 Opus, Claude 3 Haiku
     """
 
+    provider_name = "anthropic"
+    supports_streaming = True
+
     def __init__(self):
         """
         Initialize Anthropic client.
@@ -40,30 +78,38 @@ class AnthropicProvider(BaseLLMProvider):
         Raises:
             ValueError: If ANTHROPIC_API_KEY not set or anthropic library not installed
         """
-        if not ANTHROPIC_AVAILABLE:
-            raise ValueError("anthropic library not installed. Run: pip install anthropic>=0.8.1")
-
         if not settings.ANTHROPIC_API_KEY:
             raise ValueError("ANTHROPIC_API_KEY is not set in environment")
 
-        self.client = AsyncAnthropic(
+        anthropic = _sdk()
+
+        # One SDK client per process over the shared keep-alive pool
+        self.client = provider_clients.get("anthropic", lambda: anthropic.AsyncAnthropic(
             api_key=settings.ANTHROPIC_API_KEY,
+            base_url=settings.ANTHROPIC_BASE_URL,
             timeout=settings.LLM_TIMEOUT,
-            max_retries=settings.LLM_MAX_RETRIES
-        )
+            max_retries=0,  # LLMAdapter retries with backoff behind its circuit breaker
+            http_client=provider_clients.http_client()
+        ))
         self.cost_tracker = CostTracker(provider="anthropic")
         self.default_model = "claude-3-5-sonnet-20240620"
 
-    async def evaluate(self, prompt: str, options: EvaluationOptions) -> LLMResponse:
+    async def complete(
+        self,
+        prompt: str,
+        options: EvaluationOptions,
+        system_message: Optional[str] = None
+    ) -> LLMCompletion:
         """
-        Evaluate proof with Anthropic Claude model.
+        Run one completion with an Anthropic Claude model.
 
         Args:
-            prompt: Evaluation prompt with proof context
+            prompt: User prompt
             options: Configuration options
+            system_message: System instruction (default: single-step evaluator)
 
         Returns:
-            LLMResponse: Standardized response
+            LLMCompletion: Completion text with usage, cost and timing
 
         Raises:
             ConnectionError: If API call fails
@@ -72,58 +118,89 @@ class AnthropicProvider(BaseLLMProvider):
         model = options.model or self.default_model
 
         try:
-            # System message for consistent evaluation
-            system_message = (
-                "You are a mathematical proof evaluator. Analyze the provided proof step "
-                "and provide a score from 0-100 based on logical soundness and correctness. "
-                "Respond in JSON format with 'score' (integer 0-100) and 'reasoning' (string) fields."
-            )
-
             # Create message with Claude's Messages API
+            system, messages = self._request_content(prompt, options, system_message)
             message = await self.client.messages.create(
                 model=model,
                 max_tokens=options.max_tokens,
                 temperature=options.temperature,
-                system=system_message,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+                system=system,
+                messages=messages
             )
 
             # Extract response data
             raw_response = message.content[0].text if message.content else ''
 
-            # Build usage statistics
+            # Build usage statistics (input_tokens excludes prompt-cache reads and writes)
+            cache_read = getattr(message.usage, "cache_read_input_tokens", None) or 0
+            cache_write = getattr(message.usage, "cache_creation_input_tokens", None) or 0
+            prompt_tokens = message.usage.input_tokens + cache_read + cache_write
             usage = LLMUsage(
-                prompt_tokens=message.usage.input_tokens,
+                prompt_tokens=prompt_tokens,
                 completion_tokens=message.usage.output_tokens,
-                total_tokens=message.usage.input_tokens + message.usage.output_tokens
+                total_tokens=prompt_tokens + message.usage.output_tokens,
+                cached_tokens=cache_read,
+                cache_write_tokens=cache_write
             )
 
-            # Calculate cost
-            cost = self.cost_tracker.calculate(model, usage)
-
-            # Parse response
-            parsed = self._parse_response(raw_response)
-
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            return LLMResponse(
+            return LLMCompletion(
                 provider="anthropic",
                 model=model,
-                score=parsed.score,
-                reasoning=parsed.reasoning,
-                raw_response=raw_response,
+                text=raw_response,
                 usage=usage,
-                cost=cost,
-                duration_ms=duration_ms,
+                cost=self.cost_tracker.calculate(model, usage),
+                duration_ms=int((time.time() - start_time) * 1000),
             )
 
-        except AnthropicRateLimitError as e:
-            error_msg = str(e)
-            raise ConnectionError(f"Anthropic rate limit exceeded: {error_msg}") from e
         except Exception as e:
-            raise ConnectionError(f"Anthropic API request failed: {str(e)}") from e
+            raise self._request_error(e) from e
+
+    async def stream(
+        self,
+        prompt: str,
+        options: EvaluationOptions,
+        system_message: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream one message as text deltas.
+
+        Closing the iterator exits the SDK stream context, which closes the
+        HTTP response and stops generation.
+
+        Raises:
+            ConnectionError: If API call fails
+        """
+        system, messages = self._request_content(prompt, options, system_message)
+        try:
+            async with self.client.messages.stream(
+                model=options.model or self.default_model,
+                max_tokens=options.max_tokens,
+                temperature=options.temperature,
+                system=system,
+                messages=messages
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        except Exception as e:
+            raise self._request_error(e) from e
+
+    def _request_content(
+        self,
+        prompt: str,
+        options: EvaluationOptions,
+        system_message: Optional[str]
+    ) -> Tuple[Any, List[dict]]:
+        """System and messages for a request (see request_content)"""
+        return request_content(prompt, options, system_message)
+
+    def _request_error(self, e: Exception) -> ConnectionError:
+        """Translate an SDK exception into the adapter's error types"""
+        if isinstance(e, _sdk().RateLimitError):
+            return RateLimitedError(f"Anthropic rate limit exceeded: {str(e)}", retry_after=retry_after_seconds(e))
+        status = http_status(e)
+        if not is_retryable_status(status):
+            return ProviderRequestError(f"Anthropic API rejected the request ({status}): {str(e)}", status)
+        return ConnectionError(f"Anthropic API request failed: {str(e)}")
 
     def _parse_response(self, response: str) -> ParsedResponse:
         """
@@ -4,24 +4,32 @@
 import time
 import json
 import re
-from typing import Optional
-
-try:
-    import google.generativeai as genai
-    GOOGLE_AVAILABLE = True
-except ImportError:
-    GOOGLE_AVAILABLE = False
-    genai = None
+from typing import AsyncIterator, Optional
 
 from app.core.config import settings
 from app.services.llm.base import (
     BaseLLMProvider,
-    LLMResponse,
+    LLMCompletion,
+    ProviderRequestError,
+    RateLimitedError,
+    http_status,
+    is_retryable_status,
     EvaluationOptions,
     ParsedResponse,
     LLMUsage
 )
+from app.services.llm.clients import provider_clients
 from app.services.llm.cost_tracker import CostTracker
+from app.services.llm.prompts import system_message_for
+
+
+def _sdk():
+    """The google-generativeai SDK, imported on first use (it is slow to import)"""
+    try:
+        import google.generativeai as genai
+    except ImportError as e:
+        raise ValueError("google-generativeai library not installed. Run: pip install google-generativeai>=0.3.2") from e
+    return genai
 
 
 class GoogleAIProvider(BaseLLMProvider):
@@ -31,6 +39,9 @@ class GoogleAIProvider(BaseLLMProvider):
     Supports: Gemini 1.5 Pro, Gemini 1.5 Flash, Gemini Pro
     """
 
+    provider_name = "google"
+    supports_streaming = True
+
     def __init__(self):
         """
         Initialize Google AI client.
@@ -38,26 +49,44 @@ class GoogleAIProvider(BaseLLMProvider):
         Raises:
             ValueError: If GOOGLE_API_KEY not set or google-generativeai library not installed
         """
-        if not GOOGLE_AVAILABLE:
-            raise ValueError("google-generativeai library not installed. Run: pip install google-generativeai>=0.3.2")
-
         if not settings.GOOGLE_API_KEY:
             raise ValueError("GOOGLE_API_KEY is not set in environment")
 
-        genai.configure(api_key=settings.GOOGLE_API_KEY)
+        genai = _sdk()
+
+        # configure() sets up the SDK's process-wide client; do it once
+        def configure():
+            if settings.GOOGLE_BASE_URL:
+                # Custom endpoints (e.g. the fake load-test server) are plain HTTP/REST
+                genai.configure(
+                    api_key=settings.GOOGLE_API_KEY,
+                    transport="rest",
+                    client_options={"api_endpoint": settings.GOOGLE_BASE_URL}
+                )
+            else:
+                genai.configure(api_key=settings.GOOGLE_API_KEY)
+            return genai
+
+        provider_clients.get("google", configure)
         self.cost_tracker = CostTracker(provider="google")
         self.default_model = "gemini-1.5-pro"
 
-    async def evaluate(self, prompt: str, options: EvaluationOptions) -> LLMResponse:
+    async def complete(
+        self,
+        prompt: str,
+        options: EvaluationOptions,
+        system_message: Optional[str] = None
+    ) -> LLMCompletion:
         """
-        Evaluate proof with Google Gemini model.
+        Run one completion with a Google Gemini model.
 
         Args:
-            prompt: Evaluation prompt with proof context
+            prompt: User prompt
             options: Configuration options
+            system_message: System instruction (default: single-step evaluator)
 
         Returns:
-            LLMResponse: Standardized response
+            LLMCompletion: Completion text with usage, cost and timing
 
         Raises:
             ConnectionError: If API call fails
@@ -66,66 +95,89 @@ class GoogleAIProvider(BaseLLMProvider):
         model_name = options.model or self.default_model
 
         try:
-            # Configure model
-            generation_config = {
-                "temperature": options.temperature,
-                "max_output_tokens": options.max_tokens,
-            }
-
-            if options.json_mode:
-                generation_config["response_mime_type"] = "application/json"
-
-            model = genai.GenerativeModel(
-                model_name=model_name,
-                generation_config=generation_config
-            )
-
             # System instruction (prepend to prompt for Gemini)
-            system_instruction = (
-                "You are a mathematical proof evaluator. Analyze the provided proof step "
-                "and provide a score from 0-100 based on logical soundness and correctness. "
-                "Respond in JSON format with 'score' (integer 0-100) and 'reasoning' (string) fields."
-            )
-
-            full_prompt = f"{system_instruction}\n\n{prompt}"
+            full_prompt = f"{system_message or system_message_for(options)}\n\n{prompt}"
 
             # Generate content
-            response = await model.generate_content_async(full_prompt)
+            response = await self._model(model_name).generate_content_async(
+                full_prompt, generation_config=self._generation_config(options)
+            )
 
             # Extract response data
             raw_response = response.text if response.text else ''
 
-            # Build usage statistics (Gemini provides token counts)
+            # Build usage statistics (Gemini provides token counts, including implicit cache hits)
             usage = LLMUsage(
                 prompt_tokens=response.usage_metadata.prompt_token_count if hasattr(response, 'usage_metadata') else 0,
                 completion_tokens=response.usage_metadata.candidates_token_count if hasattr(response, 'usage_metadata') else 0,
-                total_tokens=response.usage_metadata.total_token_count if hasattr(response, 'usage_metadata') else 0
+                total_tokens=response.usage_metadata.total_token_count if hasattr(response, 'usage_metadata') else 0,
+                cached_tokens=getattr(getattr(response, 'usage_metadata', None), 'cached_content_token_count', 0) or 0
             )
 
-            # Calculate cost
-            cost = self.cost_tracker.calculate(model_name, usage)
-
-            # Parse response
-            parsed = self._parse_response(raw_response)
-
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            return LLMResponse(
+            return LLMCompletion(
                 provider="google",
                 model=model_name,
-                score=parsed.score,
-                reasoning=parsed.reasoning,
-                raw_response=raw_response,
+                text=raw_response,
                 usage=usage,
-                cost=cost,
-                duration_ms=duration_ms,
+                cost=self.cost_tracker.calculate(model_name, usage),
+                duration_ms=int((time.time() - start_time) * 1000),
             )
 
         except Exception as e:
-            # Google AI exceptions are varied, catch all
-            if "quota" in str(e).lower() or "rate" in str(e).lower():
-                raise ConnectionError(f"Google AI rate limit exceeded: {str(e)}") from e
-            raise ConnectionError(f"Google AI API request failed: {str(e)}") from e
+            raise self._request_error(e) from e
+
+    async def stream(
+        self,
+        prompt: str,
+        options: EvaluationOptions,
+        system_message: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream one completion as text chunks.
+
+        Closing the iterator stops reading the response stream.
+
+        Raises:
+            ConnectionError: If API call fails
+        """
+        full_prompt = f"{system_message or system_message_for(options)}\n\n{prompt}"
+        try:
+            response = await self._model(options.model or self.default_model).generate_content_async(
+                full_prompt, generation_config=self._generation_config(options), stream=True
+            )
+            async for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            raise self._request_error(e) from e
+
+    def _model(self, model_name: str):
+        """Shared GenerativeModel for a model name (options go per request)"""
+        return provider_clients.get(
+            f"google:{model_name}",
+            lambda: _sdk().GenerativeModel(model_name=model_name)
+        )
+
+    def _generation_config(self, options: EvaluationOptions) -> dict:
+        """Gemini generation config for the evaluation options"""
+        generation_config = {
+            "temperature": options.temperature,
+            "max_output_tokens": options.max_tokens,
+        }
+        if options.json_mode:
+            generation_config["response_mime_type"] = "application/json"
+        return generation_config
+
+    def _request_error(self, e: Exception) -> ConnectionError:
+        """Translate an SDK exception into the adapter's error types"""
+        # Google AI exceptions are varied: classify by HTTP status, or by message if there is none
+        status = http_status(e)
+        message = str(e).lower()
+        if status == 429 or (status is None and ("quota" in message or "rate" in message)):
+            return RateLimitedError(f"Google AI rate limit exceeded: {str(e)}")
+        if not is_retryable_status(status):
+            return ProviderRequestError(f"Google AI API rejected the request ({status}): {str(e)}", status)
+        return ConnectionError(f"Google AI API request failed: {str(e)}")
 
     def _parse_response(self, response: str) -> ParsedResponse:
         """
@@ -0,0 +1,203 @@
+# [>] ProofCore Backend - Local Heuristic Provider
+# Offline, deterministic semantic scoring with no API calls
+
+import json
+import re
+import time
+from typing import List, Optional, Tuple
+
+from app.services.llm.base import (
+    BaseLLMProvider,
+    LLMCompletion,
+    EvaluationOptions,
+    ParsedResponse,
+    LLMUsage
+)
+from app.services.llm.cost_tracker import CostTracker
+from app.services.llm.prompts import BATCH_SYSTEM_MESSAGE, system_message_for
+
+# Fields of the prompts built by build_step_prompt / build_batch_prompt
+_DOMAIN = re.compile(r"^\*\*Domain\*\*: ?(.+)$", re.MULTILINE)
+_STEP_HEADER = re.compile(r"^### Step (\d+)\s*$", re.MULTILINE)
+_FIELD = re.compile(r"^\*\*(Claim|Equation|Reasoning)\*\*: ?(.*)$", re.MULTILINE)
+
+# Operations that make an algebraic step degenerate
+_DEGENERATE_ALGEBRA = ("0/0", "1/0", "**0", "0**")
+_GEOMETRY_TERMS = ("angle", "parallel", "perpendicular", "congruent", "similar", "triangle")
+_LOGIC_TERMS = ("and", "or", "not", "implies", "iff", "therefore", "contradiction")
+_FLOW_TERMS = ("then", "since", "because", "hence", "therefore", "thus")
+
+
+def heuristic_score(claim: str, equation: str, reasoning: str, domain: str) -> Tuple[int, str]:
+    """
+    Score a proof step with deterministic text heuristics.
+
+    Combines the domain rules of the offline demo (degenerate algebra,
+    geometric and logical vocabulary) with the completeness and
+    logical-flow checks of the benchmark evaluator. The result is a
+    plausibility signal, not a proof check: it spots empty, circular or
+    degenerate steps, and cannot confirm that a derivation is right.
+
+    Args:
+        claim: Step claim
+        equation: Step equation as text
+        reasoning: Step reasoning ('' or 'None' if absent)
+        domain: Mathematical domain
+
+    Returns:
+        Tuple[int, str]: Score (0-100) and the rules that moved it
+    """
+    reasoning = "" if reasoning in (None, "None") else reasoning
+    reasoning_lower = reasoning.lower()
+    reasoning_words = set(re.findall(r"[a-z0-9]+", reasoning_lower))
+    score = 50
+    notes: List[str] = []
+
+    domain = domain.strip().lower()
+    if domain == "algebra":
+        if any(bad in equation.replace(" ", "") for bad in _DEGENERATE_ALGEBRA):
+            score -= 30
+            notes.append("degenerate algebraic operation")
+        else:
+            score += 10
+            notes.append("no degenerate operations")
+    elif domain == "geometry":
+        if any(term in reasoning_lower for term in _GEOMETRY_TERMS):
+            score += 15
+            notes.append("geometric justification")
+    elif domain == "logic":
+        if reasoning_words & set(_LOGIC_TERMS):
+            score += 15
+            notes.append("logical connectives")
+
+    if len(reasoning.strip()) > 20:
+        score += 10
+        notes.append("reasoning given")
+    elif not reasoning.strip():
+        score -= 10
+        notes.append("no reasoning")
+
+    if set(re.findall(r"[a-z0-9]+", claim.lower())) & reasoning_words:
+        score += 10
+        notes.append("reasoning addresses the claim")
+
+    if sum(reasoning_lower.count(term) for term in _FLOW_TERMS) >= 2:
+        score += 5
+        notes.append("clear logical flow")
+
+    score = max(0, min(score, 100))
+    explanation = "Heuristic: " + (", ".join(notes) if notes else "no signals") + " (offline estimate)"
+    return score, explanation
+
+
+def _fields(block: str) -> dict:
+    return {name.lower(): value.strip() for name, value in _FIELD.findall(block)}
+
+
+class LocalHeuristicProvider(BaseLLMProvider):
+    """
+    Offline semantic provider that scores steps with heuristic_score().
+
+    Needs no API key or network: air-gapped deployments get real (if
+    coarse) semantic scores instead of a flat neutral one. Calls are free
+    and take microseconds, so under adaptive routing it is ranked first
+    and remote providers are consulted only for the steps it cannot
+    decide (LLM_LOCAL_PROVIDER=always).
+    """
+
+    provider_name = "local"
+    # Cheaper to recompute than to look up in the shared response cache
+    cacheable = False
+    # Free, so never limited by LLM budgets (it is the tier budgets fall back to)
+    metered = False
+
+    def __init__(self):
+        """Initialize the provider (no client or credentials needed)"""
+        self.cost_tracker = CostTracker(provider="local")
+        self.default_model = "heuristic-v1"
+
+    async def complete(
+        self,
+        prompt: str,
+        options: EvaluationOptions,
+        system_message: Optional[str] = None
+    ) -> LLMCompletion:
+        """
+        Score the steps in a semantic-evaluation prompt.
+
+        Reads the fields written by build_step_prompt, or every step of a
+        build_batch_prompt prompt when called with BATCH_SYSTEM_MESSAGE,
+        and answers in the JSON format the prompt asks for. Text in any
+        other format is scored as reasoning.
+
+        Args:
+            prompt: Evaluation prompt
+            options: Configuration options (sampling options are ignored)
+            system_message: System instruction (selects batch output)
+
+        Returns:
+            LLMCompletion: JSON completion with zero cost
+        """
+        start_time = time.time()
+        model = options.model or self.default_model
+        match = _DOMAIN.search(prompt)
+        domain = match.group(1) if match else ""
+
+        if system_message == BATCH_SYSTEM_MESSAGE:
+            headers = list(_STEP_HEADER.finditer(prompt))
+            results = []
+            for i, header in enumerate(headers):
+                end = headers[i + 1].start() if i + 1 < len(headers) else len(prompt)
+                fields = _fields(prompt[header.end():end])
+                score, reasoning = heuristic_score(
+                    fields.get("claim", ""), fields.get("equation", ""), fields.get("reasoning", ""), domain
+                )
+                results.append({"step": int(header.group(1)), "score": score, "reasoning": reasoning})
+            text = json.dumps({"results": results})
+        else:
+            fields = _fields(prompt)
+            if not fields:
+                fields = {"reasoning": prompt}
+            score, reasoning = heuristic_score(
+                fields.get("claim", ""), fields.get("equation", ""), fields.get("reasoning", ""), domain
+            )
+            answer = {"score": score} if options.score_only else {"score": score, "reasoning": reasoning}
+            text = json.dumps(answer)
+
+        # Nominal token counts keep rate-limit and usage accounting consistent
+        prompt_tokens = (len(system_message or system_message_for(options)) + len(prompt)) // 4
+        completion_tokens = len(text) // 4
+        usage = LLMUsage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens
+        )
+
+        return LLMCompletion(
+            provider="local",
+            model=model,
+            text=text,
+            usage=usage,
+            cost=self.cost_tracker.calculate(model, usage),
+            duration_ms=int((time.time() - start_time) * 1000),
+        )
+
+    def _parse_response(self, response: str) -> ParsedResponse:
+        """
+        Parse the provider's own JSON output.
+
+        Args:
+            response: Raw response text
+
+        Returns:
+            ParsedResponse: Parsed score and reasoning
+        """
+        try:
+            data = json.loads(response)
+            return ParsedResponse(score=data["score"], reasoning=data.get("reasoning", "Score only (reasoning not requested)"))
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return ParsedResponse(reasoning="Unable to parse response")
+
+    def get_cost_stats(self) -> dict:
+        """Get cost tracking statistics"""
+        return self.cost_tracker.get_stats()
@@ -4,26 +4,33 @@
 import time
 import json
 import re
-from typing import Optional
-
-try:
-    from openai import AsyncOpenAI
-    from openai import RateLimitError as OpenAIRateLimitError
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    AsyncOpenAI = None
-    OpenAIRateLimitError = Exception
+from typing import AsyncIterator, Optional
 
 from app.core.config import settings
 from app.services.llm.base import (
     BaseLLMProvider,
-    LLMResponse,
+    LLMCompletion,
+    ProviderRequestError,
+    RateLimitedError,
+    retry_after_seconds,
+    http_status,
+    is_retryable_status,
     EvaluationOptions,
     ParsedResponse,
     LLMUsage
 )
+from app.services.llm.clients import provider_clients
 from app.services.llm.cost_tracker import CostTracker
+from app.services.llm.prompts import system_message_for
+
+
+def _sdk():
+    """The openai SDK, imported on first use (it is slow to import)"""
+    try:
+        import openai
+    except ImportError as e:
+        raise ValueError("openai library not installed. Run: pip install openai>=1.10.0") from e
+    return openai
 
 
 class OpenAIProvider(BaseLLMProvider):
@@ -33,6 +40,9 @@ class OpenAIProvider(BaseLLMProvider):
     Supports: GPT-4o, GPT-4 Turbo, GPT-3.5 Turbo
     """
 
+    provider_name = "openai"
+    supports_streaming = True
+
     def __init__(self):
         """
         Initialize OpenAI client.
@@ -40,30 +50,38 @@ class OpenAIProvider(BaseLLMProvider):
         Raises:
             ValueError: If OPENAI_API_KEY not set or openai library not installed
         """
-        if not OPENAI_AVAILABLE:
-            raise ValueError("openai library not installed. Run: pip install openai>=1.10.0")
-
         if not settings.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY is not set in environment")
 
-        self.client = AsyncOpenAI(
+        openai = _sdk()
+
+        # One SDK client per process over the shared keep-alive pool
+        self.client = provider_clients.get("openai", lambda: openai.AsyncOpenAI(
             api_key=settings.OPENAI_API_KEY,
+            base_url=settings.OPENAI_BASE_URL,
             timeout=settings.LLM_TIMEOUT,
-            max_retries=settings.LLM_MAX_RETRIES
-        )
+            max_retries=0,  # LLMAdapter retries with backoff behind its circuit breaker
+            http_client=provider_clients.http_client()
+        ))
         self.cost_tracker = CostTracker(provider="openai")
         self.default_model = "gpt-4o-2024-05-13"
 
-    async def evaluate(self, prompt: str, options: EvaluationOptions) -> LLMResponse:
+    async def complete(
+        self,
+        prompt: str,
+        options: EvaluationOptions,
+        system_message: Optional[str] = None
+    ) -> LLMCompletion:
         """
-        Evaluate proof with OpenAI GPT model.
+        Run one chat completion with an OpenAI GPT model.
 
         Args:
-            prompt: Evaluation prompt with proof context
+            prompt: User prompt
             options: Configuration options
+            system_message: System instruction (default: single-step evaluator)
 
         Returns:
-            LLMResponse: Standardized response
+            LLMCompletion: Completion text with usage, cost and timing
 
         Raises:
             ConnectionError: If API call fails
@@ -72,18 +90,11 @@ class OpenAIProvider(BaseLLMProvider):
         model = options.model or self.default_model
 
         try:
-            # System message for consistent evaluation
-            system_message = (
-                "You are a mathematical proof evaluator. Analyze the provided proof step "
-                "and provide a score from 0-100 based on logical soundness and correctness. "
-                "Respond in JSON format with 'score' (integer 0-100) and 'reasoning' (string) fields."
-            )
-
             # Create chat completion
             completion = await self.client.chat.completions.create(
                 model=model,
                 messages=[
-                    {"role": "system", "content": system_message},
+                    {"role": "system", "content": system_message or system_message_for(options)},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=options.temperature,
@@ -94,32 +105,73 @@ class OpenAIProvider(BaseLLMProvider):
             # Extract response data
             raw_response = completion.choices[0].message.content or ''
             usage_dict = completion.usage.model_dump() if hasattr(completion.usage, 'model_dump') else completion.usage.dict()
-            usage = LLMUsage(**usage_dict)
-
-            # Calculate cost
-            cost = self.cost_tracker.calculate(model, usage)
-
-            # Parse response
-            parsed = self._parse_response(raw_response)
-
-            duration_ms = int((time.time() - start_time) * 1000)
+            details = usage_dict.get("prompt_tokens_details") or {}
+            usage = LLMUsage(
+                prompt_tokens=usage_dict.get("prompt_tokens") or 0,
+                completion_tokens=usage_dict.get("completion_tokens") or 0,
+                total_tokens=usage_dict.get("total_tokens") or 0,
+                cached_tokens=details.get("cached_tokens") or 0  # Automatic prefix caching
+            )
 
-            return LLMResponse(
+            return LLMCompletion(
                 provider="openai",
                 model=model,
-                score=parsed.score,
-                reasoning=parsed.reasoning,
-                raw_response=raw_response,
+                text=raw_response,
                 usage=usage,
-                cost=cost,
-                duration_ms=duration_ms,
+                cost=self.cost_tracker.calculate(model, usage),
+                duration_ms=int((time.time() - start_time) * 1000),
             )
 
-        except OpenAIRateLimitError as e:
-            error_msg = str(e) if hasattr(e, 'message') else str(e)
-            raise ConnectionError(f"OpenAI rate limit exceeded: {error_msg}") from e
         except Exception as e:
-            raise ConnectionError(f"OpenAI API request failed: {str(e)}") from e
+            raise self._request_error(e) from e
+
+    async def stream(
+        self,
+        prompt: str,
+        options: EvaluationOptions,
+        system_message: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream one chat completion as text deltas.
+
+        Closing the iterator closes the HTTP response, which stops generation.
+
+        Raises:
+            ConnectionError: If API call fails
+        """
+        try:
+            stream = await self.client.chat.completions.create(
+                model=options.model or self.default_model,
+                messages=[
+                    {"role": "system", "content": system_message or system_message_for(options)},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=options.temperature,
+                max_tokens=options.max_tokens,
+                response_format={"type": "json_object"} if options.json_mode else None,
+                stream=True,
+            )
+        except Exception as e:
+            raise self._request_error(e) from e
+
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise self._request_error(e) from e
+        finally:
+            await stream.close()
+
+    def _request_error(self, e: Exception) -> ConnectionError:
+        """Translate an SDK exception into the adapter's error types"""
+        if isinstance(e, _sdk().RateLimitError):
+            error_msg = str(e) if hasattr(e, 'message') else str(e)
+            return RateLimitedError(f"OpenAI rate limit exceeded: {error_msg}", retry_after=retry_after_seconds(e))
+        status = http_status(e)
+        if not is_retryable_status(status):
+            return ProviderRequestError(f"OpenAI API rejected the request ({status}): {str(e)}", status)
+        return ConnectionError(f"OpenAI API request failed: {str(e)}")
 
     def _parse_response(self, response: str) -> ParsedResponse:
         """
@@ -0,0 +1,241 @@
+# [B] ProofCore Backend - LLM Provider Rate Limiting
+# Per-provider concurrency slots and token buckets, shared by the whole process
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Optional
+
+from app.core.config import settings
+
+
+def estimate_tokens(prompt: str, max_tokens: int) -> int:
+    """
+    Estimate the tokens a call will consume before it is made.
+
+    Uses ~4 characters per prompt token plus the full completion budget,
+    so the estimate errs high; settle() refunds the difference once the
+    provider reports actual usage.
+    """
+    return len(prompt) // 4 + max_tokens
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at `per_minute / 60` per second.
+
+    reserve() debits immediately and returns how long the caller must
+    wait before its reservation is covered. The balance may go negative,
+    so later callers queue behind earlier ones without any locking (the
+    event loop runs reserve() atomically).
+    """
+
+    def __init__(
+        self,
+        per_minute: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a full bucket.
+
+        Args:
+            per_minute: Refill rate
+            capacity: Maximum burst (default: one minute's worth)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.per_minute = per_minute
+        self.capacity = capacity or per_minute
+        self._rate = per_minute / 60.0
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    @property
+    def available(self) -> float:
+        """Current balance (negative while callers are queued)"""
+        self._refill()
+        return self._tokens
+
+    def reserve(self, amount: float) -> float:
+        """
+        Debit `amount` and return the delay in seconds before it is covered.
+
+        Amounts above capacity are clamped, so one oversized call waits
+        for a full bucket instead of forever.
+        """
+        self._refill()
+        self._tokens -= min(amount, self.capacity)
+        return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+    def refund(self, amount: float) -> None:
+        """Return unused tokens (negative amounts debit extra usage)"""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + amount)
+
+
+class RateLimitGrant:
+    """Permission for one call, returned by ProviderLimiter.acquire()"""
+
+    def __init__(self, limiter: "ProviderLimiter", estimated_tokens: int, wait_seconds: float):
+        self.limiter = limiter
+        self.estimated_tokens = estimated_tokens
+        self.wait_seconds = wait_seconds
+
+    def settle(self, actual_tokens: int) -> None:
+        """Correct the token bucket once the provider reports real usage"""
+        if self.limiter.tokens is not None and actual_tokens > 0:
+            self.limiter.tokens.refund(self.estimated_tokens - actual_tokens)
+
+
+class ProviderLimiter:
+    """
+    Local admission for calls to one LLM provider.
+
+    A call first takes one of `concurrency` slots, then reserves one
+    request and its estimated tokens from the per-minute buckets and
+    sleeps until they are covered. Bursts therefore queue here instead
+    of failing remotely with 429s (and SDK retry storms). Time spent
+    waiting is recorded for the /metrics/llm endpoint.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        concurrency: int,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Provider name
+            concurrency: Maximum in-flight calls
+            requests_per_minute: Request budget (0 = unlimited)
+            tokens_per_minute: Token budget (0 = unlimited)
+        """
+        self.name = name
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+
+        self.waiting = 0
+        self.in_flight = 0
+        self.calls = 0
+        self.delayed_calls = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    @asynccontextmanager
+    async def acquire(self, estimated_tokens: int = 0) -> AsyncIterator[RateLimitGrant]:
+        """
+        Wait for a slot and rate budget, and hold the slot for the block.
+
+        Usage:
+            async with limiter.acquire(estimate_tokens(prompt, 512)) as grant:
+                response = await provider.evaluate(prompt, options)
+                grant.settle(response.usage.total_tokens)
+
+        Cancellation while waiting (e.g. the proof deadline expiring)
+        returns the reserved budget.
+        """
+        started = time.monotonic()
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+            try:
+                await self._reserve(estimated_tokens)
+            except BaseException:
+                self._semaphore.release()
+                raise
+        finally:
+            self.waiting -= 1
+
+        wait_seconds = time.monotonic() - started
+        self._record_wait(wait_seconds)
+        self.in_flight += 1
+        try:
+            yield RateLimitGrant(self, estimated_tokens, wait_seconds)
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    async def _reserve(self, estimated_tokens: int) -> None:
+        """Reserve one request and the estimated tokens, sleeping until both are covered"""
+        delay = 0.0
+        if self.requests is not None:
+            delay = max(delay, self.requests.reserve(1))
+        if self.tokens is not None:
+            delay = max(delay, self.tokens.reserve(estimated_tokens))
+        if delay <= 0:
+            return
+        try:
+            await asyncio.sleep(delay)
+        except BaseException:
+            if self.requests is not None:
+                self.requests.refund(1)
+            if self.tokens is not None:
+                self.tokens.refund(min(estimated_tokens, self.tokens.capacity))
+            raise
+
+    def _record_wait(self, wait_seconds: float) -> None:
+        self.calls += 1
+        if wait_seconds >= 0.001:
+            self.delayed_calls += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def get_stats(self) -> dict:
+        """Limits, current load and queue-wait metrics"""
+        return {
+            "concurrency": self.concurrency,
+            "requests_per_minute": self.requests.per_minute if self.requests else None,
+            "tokens_per_minute": self.tokens.per_minute if self.tokens else None,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "calls": self.calls,
+            "delayed_calls": self.delayed_calls,
+            "average_wait_ms": round(self.total_wait_seconds / self.calls * 1000, 2) if self.calls else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+        }
+
+
+class ProviderLimiters:
+    """
+    Process-wide registry of provider limiters.
+
+    Every LLMAdapter (one per verification engine) draws from the same
+    limiter for a provider, so limits hold across concurrent proofs.
+    Limiters are created on first use from the LLM_* rate limit settings.
+    """
+
+    def __init__(self):
+        self._limiters: Dict[str, ProviderLimiter] = {}
+
+    def get(self, provider_name: str) -> ProviderLimiter:
+        """Get (or create) the limiter for a provider"""
+        limiter = self._limiters.get(provider_name)
+        if limiter is None:
+            limiter = ProviderLimiter(
+                provider_name,
+                concurrency=settings.LLM_CONCURRENCY.get(provider_name, settings.LLM_DEFAULT_CONCURRENCY),
+                requests_per_minute=settings.LLM_REQUESTS_PER_MINUTE.get(provider_name, 0),
+                tokens_per_minute=settings.LLM_TOKENS_PER_MINUTE.get(provider_name, 0),
+            )
+            self._limiters[provider_name] = limiter
+        return limiter
+
+    def get_stats(self) -> Dict[str, dict]:
+        """Stats for every provider that has been called"""
+        return {name: limiter.get_stats() for name, limiter in sorted(self._limiters.items())}
+
+
+# [+] Global limiter registry
+provider_limiters = ProviderLimiters()
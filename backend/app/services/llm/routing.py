@@ -0,0 +1,195 @@
+# [B] ProofCore Backend - Adaptive LLM Routing
+# Live per-provider latency, cost and agreement statistics for choosing providers
+
+import math
+import statistics
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from app.core.config import settings
+from app.services.llm.base import LLMResponse, LLMUsage
+
+
+class ProviderStats:
+    """
+    Exponentially weighted statistics for one provider.
+
+    latency_ms and cost track fresh (non-cached) responses. success_rate
+    drops on failed calls. deviation is the mean absolute distance, in
+    score points, from the consensus of the other providers, measured
+    whenever a step was evaluated by several providers.
+    """
+
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.latency_ms: Optional[float] = None
+        self.cost: Optional[float] = None
+        self.deviation: Optional[float] = None
+        self.success_rate = 1.0
+        self.calls = 0
+        self.failures = 0
+
+    def _ewma(self, current: Optional[float], sample: float) -> float:
+        if current is None:
+            return sample
+        return self.alpha * sample + (1 - self.alpha) * current
+
+    def record_response(self, latency_ms: float, cost: float) -> None:
+        self.calls += 1
+        self.latency_ms = self._ewma(self.latency_ms, latency_ms)
+        self.cost = self._ewma(self.cost, cost)
+        self.success_rate = self._ewma(self.success_rate, 1.0)
+
+    def record_failure(self) -> None:
+        self.calls += 1
+        self.failures += 1
+        self.success_rate = self._ewma(self.success_rate, 0.0)
+
+    def record_deviation(self, points: float) -> None:
+        self.deviation = self._ewma(self.deviation, points)
+
+    def to_dict(self) -> dict:
+        return {
+            "latency_ms": round(self.latency_ms, 1) if self.latency_ms is not None else None,
+            "cost": round(self.cost, 6) if self.cost is not None else None,
+            "deviation": round(self.deviation, 2) if self.deviation is not None else None,
+            "success_rate": round(self.success_rate, 3),
+            "calls": self.calls,
+            "failures": self.failures,
+        }
+
+
+class ProviderRouter:
+    """
+    Chooses which providers evaluate a step (LLM_ROUTING_MODE=adaptive).
+
+    Providers are ranked reliable-first, then by expected cost or latency
+    (LLM_ROUTING_PREFER). Before a provider has been observed, its cost is
+    estimated from CostTracker pricing for a typical step. The adapter
+    asks the top provider first and escalates to the others only when its
+    score is not clearly pass or fail, or the provider is unreliable.
+    Every AUDIT_EVERY-th step is escalated regardless, so agreement
+    statistics stay current for providers that are usually trusted alone.
+
+    The router is process-wide: statistics from every proof feed the
+    same estimates.
+    """
+
+    # Smoothing factor for all EWMA statistics
+    EWMA_ALPHA = 0.2
+    # Providers below this success rate are ranked after reliable ones
+    MIN_SUCCESS_RATE = 0.8
+    # Providers further than this from consensus (points) are not trusted alone
+    MAX_DEVIATION = 15.0
+    # Escalate one routed step in this many to refresh agreement statistics
+    AUDIT_EVERY = 20
+    # Usage assumed when pricing a provider that has not been called yet
+    PRIOR_USAGE = LLMUsage(prompt_tokens=400, completion_tokens=150, total_tokens=550)
+
+    def __init__(self, prefer: Optional[str] = None):
+        """
+        Initialize the router.
+
+        Args:
+            prefer: 'cost' or 'latency' (default: LLM_ROUTING_PREFER)
+        """
+        self.prefer = prefer
+        self._stats: Dict[str, ProviderStats] = {}
+        self.routed = 0
+        self.escalated = 0
+
+    def stats(self, provider_name: str) -> ProviderStats:
+        """Get (or create) the statistics for a provider"""
+        if provider_name not in self._stats:
+            self._stats[provider_name] = ProviderStats(self.EWMA_ALPHA)
+        return self._stats[provider_name]
+
+    def is_reliable(self, provider_name: str) -> bool:
+        """Whether a provider answers reliably and agrees with its peers"""
+        stats = self.stats(provider_name)
+        if stats.success_rate < self.MIN_SUCCESS_RATE:
+            return False
+        return stats.deviation is None or stats.deviation <= self.MAX_DEVIATION
+
+    def expected_cost(self, provider_name: str, service) -> float:
+        """Observed cost per call, or a CostTracker estimate before the first call"""
+        stats = self.stats(provider_name)
+        if stats.cost is not None:
+            return stats.cost
+        tracker = getattr(service, "cost_tracker", None)
+        model = getattr(service, "default_model", None)
+        if tracker is None or model is None:
+            return math.inf
+        estimate = tracker.estimate(model, self.PRIOR_USAGE)
+        return math.inf if estimate is None else estimate
+
+    def rank(self, services: Mapping[str, object]) -> List[str]:
+        """
+        Order providers from first choice to last.
+
+        Args:
+            services: Provider instances by name
+
+        Returns:
+            List[str]: Provider names, best first
+        """
+        prefer = self.prefer or settings.LLM_ROUTING_PREFER
+
+        def key(name: str):
+            latency = self.stats(name).latency_ms
+            latency = math.inf if latency is None else latency
+            cost = self.expected_cost(name, services[name])
+            primary, secondary = (cost, latency) if prefer == "cost" else (latency, cost)
+            return (not self.is_reliable(name), primary, secondary, name)
+
+        return sorted(services, key=key)
+
+    def should_escalate(self, provider_name: str, response: LLMResponse) -> bool:
+        """
+        Decide whether a single provider's answer needs a second opinion.
+
+        Escalates when the score is contentious (between
+        LLM_ROUTING_CONFIDENT_BELOW and LLM_ROUTING_CONFIDENT_ABOVE), the
+        provider is unreliable, or the step is picked for an audit.
+        """
+        self.routed += 1
+        contentious = settings.LLM_ROUTING_CONFIDENT_BELOW < response.score < settings.LLM_ROUTING_CONFIDENT_ABOVE
+        audit = self.routed % self.AUDIT_EVERY == 0
+        escalate = contentious or audit or not self.is_reliable(provider_name)
+        if escalate:
+            self.escalated += 1
+        return escalate
+
+    def record_response(self, provider_name: str, response: LLMResponse) -> None:
+        """Record latency and cost of a fresh provider response"""
+        if not response.cached:
+            self.stats(provider_name).record_response(response.duration_ms, response.cost)
+
+    def record_failure(self, provider_name: str) -> None:
+        """Record a failed provider call"""
+        self.stats(provider_name).record_failure()
+
+    def record_consensus(self, responses: Sequence[LLMResponse], provider_names: Sequence[str]) -> None:
+        """
+        Record each provider's distance from the median of the others.
+
+        Args:
+            responses: Responses to one prompt from two or more providers
+            provider_names: Adapter provider name for each response
+        """
+        if len(responses) < 2:
+            return
+        for i, (name, response) in enumerate(zip(provider_names, responses)):
+            others = [r.score for j, r in enumerate(responses) if j != i]
+            self.stats(name).record_deviation(abs(response.score - statistics.median(others)))
+
+    def get_stats(self) -> dict:
+        """Routing counters and per-provider statistics"""
+        return {
+            "routed": self.routed,
+            "escalated": self.escalated,
+            "providers": {name: stats.to_dict() for name, stats in sorted(self._stats.items())},
+        }
+
+
+# [+] Global router instance
+provider_router = ProviderRouter()
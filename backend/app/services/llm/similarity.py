@@ -0,0 +1,243 @@
+# [*] ProofCore Backend - Near-Duplicate Step Index
+# MinHash LSH over normalized step text, for reusing semantic scores
+
+import hashlib
+import random
+import re
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from app.core.config import settings
+
+# Words that do not change what a step claims
+_STOP_WORDS = frozenset({
+    "a", "an", "the", "of", "on", "from", "to", "in", "at", "by", "with", "we", "it",
+    "is", "are", "be", "this", "that", "so", "now", "then", "and", "which", "gives", "get",
+})
+# Identifiers in equations that are not variables
+_FUNCTIONS = frozenset({
+    "sin", "cos", "tan", "cot", "sec", "csc", "asin", "acos", "atan", "sinh", "cosh", "tanh",
+    "log", "ln", "exp", "sqrt", "abs", "pi", "e", "i", "oo", "diff", "integrate", "limit", "sum",
+})
+_SUFFIXES = ("ing", "ed", "es", "s")
+_WORD = re.compile(r"[a-z]+|\d+(?:\.\d+)?")
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z_0-9]*")
+
+# MinHash signature: BANDS x ROWS values (candidate threshold ~ (1/BANDS)^(1/ROWS) = 0.59)
+BANDS = 8
+ROWS = 4
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20250101)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(BANDS * ROWS)]
+
+
+def _stem(word: str) -> str:
+    for suffix in _SUFFIXES:
+        if len(word) > len(suffix) + 3 and word.endswith(suffix):
+            return word[:-len(suffix)]
+    return word
+
+
+def canonical_equation(equation) -> Tuple[str, Dict[str, str]]:
+    """
+    Whitespace-free equation text with variables renamed in order of appearance.
+
+    Args:
+        equation: Step equation ({"lhs": ..., "rhs": ...} or text)
+
+    Returns:
+        Tuple[str, Dict[str, str]]: Canonical text (e.g. 'v0+5=10') and the
+        variable renaming, to be applied to the step's text as well
+    """
+    if isinstance(equation, dict):
+        text = f"{equation.get('lhs', '')}={equation.get('rhs', '')}"
+    else:
+        text = str(equation or "")
+    names: Dict[str, str] = {}
+
+    def rename(match: re.Match) -> str:
+        name = match.group(0)
+        if name.lower() in _FUNCTIONS:
+            return name.lower()
+        return names.setdefault(name, f"v{len(names)}")
+
+    return re.sub(r"\s+", "", _IDENTIFIER.sub(rename, text)), names
+
+
+def shingles(text: str, variables: Optional[Dict[str, str]] = None) -> FrozenSet[str]:
+    """
+    Word unigrams and bigrams of normalized text.
+
+    Lower-cases, drops stop words, strips common suffixes ('subtracting'
+    and 'subtract' match) and renames the equation's variables, so
+    rewording, whitespace and variable names matter little.
+
+    Args:
+        text: Claim and reasoning text
+        variables: Renaming from canonical_equation()
+
+    Returns:
+        FrozenSet[str]: Shingle set (empty for text with no words)
+    """
+    variables = {name.lower(): canonical for name, canonical in (variables or {}).items()}
+    words = []
+    for word in _WORD.findall(text.lower()):
+        if word in variables:
+            words.append(variables[word])
+        elif word not in _STOP_WORDS:
+            words.append(_stem(word))
+    return frozenset(words + [f"{a} {b}" for a, b in zip(words, words[1:])])
+
+
+def minhash(features: FrozenSet[str]) -> List[int]:
+    """MinHash signature of a non-empty feature set"""
+    hashes = [int.from_bytes(hashlib.blake2b(f.encode("utf-8"), digest_size=8).digest(), "big") for f in features]
+    return [min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two sets (0.0 if both are empty)"""
+    union = len(a | b)
+    return len(a & b) / union if union else 0.0
+
+
+class _Entry:
+    """One scored step"""
+
+    def __init__(self, namespace: str, features: FrozenSet[str], score: float, buckets: List[Tuple]):
+        self.namespace = namespace
+        self.features = features
+        self.score = score
+        self.buckets = buckets
+
+
+class StepSimilarityIndex:
+    """
+    In-memory LSH index of scored steps, for reusing semantic scores.
+
+    Steps are indexed under a namespace (domain, canonical equation and
+    semantic engine version), so only steps with the same equation up to
+    variable names, scored by the same providers and prompt, are compared.
+    Within it, the claim and reasoning text are compared: MinHash
+    banding finds candidates in constant time, and the best candidate is
+    accepted if its exact shingle Jaccard similarity reaches
+    LLM_SIMILARITY_THRESHOLD.
+
+    The index is local to the process and holds at most
+    LLM_SIMILARITY_MAX_ENTRIES steps (least recently used are evicted).
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Initialize an empty index.
+
+        Args:
+            max_entries: Entry limit (default: LLM_SIMILARITY_MAX_ENTRIES)
+        """
+        self.max_entries = max_entries or settings.LLM_SIMILARITY_MAX_ENTRIES
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._buckets: Dict[Tuple, Set[int]] = {}
+        self._next_id = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _features(step, domain: str, version: str) -> Tuple[str, FrozenSet[str]]:
+        equation, variables = canonical_equation(step.equation)
+        text = f"{step.claim} {getattr(step, 'reasoning', None) or ''}"
+        return f"{domain.strip().lower()}|{version}|{equation}", shingles(text, variables)
+
+    @staticmethod
+    def _bucket_keys(namespace: str, features: FrozenSet[str]) -> List[Tuple]:
+        signature = minhash(features)
+        return [
+            (namespace, band, tuple(signature[band * ROWS:(band + 1) * ROWS]))
+            for band in range(BANDS)
+        ]
+
+    def lookup(self, step, domain: str, version: str, threshold: Optional[float] = None) -> Optional[float]:
+        """
+        Score of the most similar indexed step, if it is similar enough.
+
+        Args:
+            step: ProofStep entity (claim, equation, reasoning)
+            domain: Mathematical domain
+            version: Semantic engine version the score must come from
+            threshold: Minimum Jaccard similarity (default: LLM_SIMILARITY_THRESHOLD)
+
+        Returns:
+            Optional[float]: Reusable semantic score, or None
+        """
+        threshold = settings.LLM_SIMILARITY_THRESHOLD if threshold is None else threshold
+        namespace, features = self._features(step, domain, version)
+        if not features:
+            return None
+
+        candidates: Set[int] = set()
+        for key in self._bucket_keys(namespace, features):
+            candidates |= self._buckets.get(key, set())
+
+        best_id, best_similarity = None, threshold
+        for entry_id in candidates:
+            similarity = jaccard(features, self._entries[entry_id].features)
+            if similarity >= best_similarity:
+                best_id, best_similarity = entry_id, similarity
+
+        if best_id is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(best_id)
+        return self._entries[best_id].score
+
+    def add(self, step, domain: str, version: str, score: float) -> None:
+        """
+        Index a freshly scored step.
+
+        Args:
+            step: ProofStep entity
+            domain: Mathematical domain
+            version: Semantic engine version that produced the score
+            score: Semantic score (0-100)
+        """
+        namespace, features = self._features(step, domain, version)
+        if not features:
+            return
+        entry_id, self._next_id = self._next_id, self._next_id + 1
+        buckets = self._bucket_keys(namespace, features)
+        self._entries[entry_id] = _Entry(namespace, features, score, buckets)
+        for key in buckets:
+            self._buckets.setdefault(key, set()).add(entry_id)
+
+        while len(self._entries) > self.max_entries:
+            old_id, old = self._entries.popitem(last=False)
+            for key in old.buckets:
+                bucket = self._buckets.get(key)
+                if bucket is not None:
+                    bucket.discard(old_id)
+                    if not bucket:
+                        del self._buckets[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict:
+        """Entry count and hit/miss counters for this process"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Drop all entries and counters"""
+        self._entries.clear()
+        self._buckets.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# [+] Global index (shared by all proofs in a process)
+step_similarity_index = StepSimilarityIndex()
@@ -0,0 +1,106 @@
+# [*] ProofCore Backend - In-Flight Request Coalescing
+# Concurrent identical provider calls share one request (singleflight)
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Tuple, TypeVar
+
+from app.services.deadline import DeadlineExceeded, current_deadline, with_deadline
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """One shared call and the number of callers waiting for it"""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that have the same key.
+
+    The response cache only helps once a response is stored. Proofs that
+    share steps (benchmark variants, resubmissions) verified at the same
+    time all miss it and would each pay for the same prompt. Here the
+    first caller for a key (the leader) starts the call as a task, and
+    callers arriving while it runs await that task instead.
+
+    The shared task outlives any single caller: it is cancelled only when
+    every caller has stopped waiting, so one proof hitting its deadline or
+    being cancelled does not fail the others. Each caller's wait is bound
+    by its own proof deadline. A caller that joined a call which then ran
+    out of the leader's deadline retries under its own.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry"""
+        self._flights: Dict[str, _Flight] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, call: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """
+        Run `call`, or join the call already in flight for `key`.
+
+        Args:
+            key: Identity of the call (e.g. the response cache key)
+            call: Factory for the call's coroutine (only invoked by the leader)
+
+        Returns:
+            Tuple[T, bool]: Result, and whether it came from another caller's call
+
+        Raises:
+            DeadlineExceeded: If this caller's proof deadline expired
+            Exception: Whatever the shared call raised
+        """
+        flight = self._flights.get(key)
+        if flight is not None and flight.task.get_loop() is not asyncio.get_running_loop():
+            flight = None
+        shared = flight is not None
+
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(call()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await with_deadline(asyncio.shield(flight.task)), shared
+        except DeadlineExceeded:
+            deadline = current_deadline()
+            if not shared or (deadline is not None and deadline.expired):
+                raise
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+
+        # The leader's deadline ended the shared call; this caller has time left
+        return await call(), False
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running"""
+        return len(self._flights)
+
+    def get_stats(self) -> dict:
+        """Leader and coalesced-caller counters for this process"""
+        requests = self.leaders + self.coalesced
+        return {
+            "in_flight": self.in_flight(),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "coalesce_rate": round(self.coalesced / requests, 3) if requests else 0.0,
+        }
+
+
+# [+] Global registry (coalesces across all adapters in a process)
+llm_singleflight = SingleFlight()
@@ -0,0 +1,124 @@
+# [B] ProofCore Backend - Streaming Evaluation
+# Incremental score extraction from streamed JSON, with early cancellation
+
+import re
+import time
+from typing import Optional
+
+from app.services.llm.base import BaseLLMProvider, EvaluationOptions, LLMResponse, LLMUsage
+from app.services.llm.prompts import system_message_for
+
+# "score": 87 followed by a delimiter, so a number split across chunks
+# ("score": 8 | 7) is never read early
+_SCORE_PATTERN = re.compile(r'"score"\s*:\s*"?(\d{1,3})(?:\.\d+)?"?\s*[,}\n]')
+
+SCORE_ONLY_REASONING = "Stream stopped after the score (reasoning not requested)"
+
+
+class ScoreStreamParser:
+    """
+    Accumulates streamed completion text and extracts the score early.
+
+    The score is available as soon as the `"score": N` pair is complete,
+    long before the reasoning that follows it has been generated.
+    """
+
+    def __init__(self):
+        self._parts = []
+        self.score: Optional[int] = None
+
+    @property
+    def text(self) -> str:
+        """Text received so far"""
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> Optional[int]:
+        """
+        Add a chunk of streamed text.
+
+        Args:
+            chunk: Text delta from the provider
+
+        Returns:
+            Optional[int]: The score once it has been seen (0-100), else None
+        """
+        self._parts.append(chunk)
+        if self.score is None:
+            match = _SCORE_PATTERN.search(self.text)
+            if match and 0 <= int(match.group(1)) <= 100:
+                self.score = int(match.group(1))
+        return self.score
+
+
+async def evaluate_streaming(
+    service: BaseLLMProvider,
+    prompt: str,
+    options: EvaluationOptions
+) -> LLMResponse:
+    """
+    Evaluate a step over a streamed completion.
+
+    With options.score_only the stream is closed as soon as the score has
+    been parsed, which ends the provider request and stops further output
+    tokens. Otherwise the whole completion is read and parsed as usual.
+    Token usage is estimated (~4 characters per token) because streams
+    cut short do not report it.
+
+    Args:
+        service: Provider with supports_streaming
+        prompt: Evaluation prompt
+        options: Configuration options (stream=True)
+
+    Returns:
+        LLMResponse: Response with the streamed score
+
+    Raises:
+        ConnectionError: If the stream fails (unless score-only and the score
+            had already arrived)
+    """
+    start_time = time.time()
+    model = options.model or service.default_model
+    parser = ScoreStreamParser()
+    stopped_early = False
+
+    stream = service.stream(prompt, options)
+    try:
+        async for chunk in stream:
+            parser.feed(chunk)
+            if options.score_only and parser.score is not None:
+                stopped_early = True
+                break
+    except ConnectionError:
+        # A score-only stream that fails after the score still answered the question
+        if not (options.score_only and parser.score is not None):
+            raise
+        stopped_early = True
+    finally:
+        await stream.aclose()
+
+    text = parser.text
+    if stopped_early:
+        score, reasoning = parser.score, SCORE_ONLY_REASONING
+    else:
+        parsed = service._parse_response(text)
+        score, reasoning = parsed.score, parsed.reasoning
+
+    prompt_tokens = (len(system_message_for(options)) + len(prompt)) // 4
+    completion_tokens = max(1, len(text) // 4)
+    usage = LLMUsage(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=prompt_tokens + completion_tokens
+    )
+    tracker = getattr(service, "cost_tracker", None)
+
+    return LLMResponse(
+        provider=service.provider_name,
+        model=model,
+        score=score,
+        reasoning=reasoning,
+        raw_response=text,
+        usage=usage,
+        cost=tracker.calculate(model, usage) if tracker is not None else 0.0,
+        duration_ms=int((time.time() - start_time) * 1000),
+    )
@@ -2,27 +2,53 @@
 # Manages multiple LLM providers with parallel evaluation and fallback
 
 import asyncio
-from typing import List, Dict, Optional
+from typing import Any, Awaitable, Callable, List, Dict, Optional, Sequence, Tuple, TypeVar
 import statistics
 
 from app.core.config import settings
-from app.services.llm.base import LLMResponse, EvaluationOptions
+from app.services.llm.base import LLMCompletion, LLMResponse, LLMUsage, EvaluationOptions, ProviderRequestError
+from app.services.llm.batch_jobs import BatchJobClient, BatchRequest, batch_job_client
+from app.services.llm.budget import BudgetExceededError, LLMBudget, cheapest_model, llm_budget
+from app.services.llm.cache import LLMResponseCache, cache_key, llm_response_cache
+from app.services.llm.circuit_breaker import CircuitBreakers, CircuitOpenError, CircuitState, backoff_delay, provider_breakers
+from app.services.llm.cost_tracker import CostTracker
+from app.services.llm.routing import ProviderRouter, provider_router
+from app.services.llm.singleflight import SingleFlight, llm_singleflight
+from app.services.llm.streaming import evaluate_streaming
+from app.services.llm.rate_limit import ProviderLimiters, estimate_tokens, provider_limiters
+from app.services.llm.prompts import (
+    BATCH_SYSTEM_MESSAGE,
+    build_batch_prompt,
+    build_step_prompt,
+    parse_batch_response,
+)
+# API providers are created by name; their SDKs are imported only when configured
+from app.services.llm.providers import PROVIDERS, configured_providers, create_provider
+from app.services.llm.providers.local import LocalHeuristicProvider
+from app.services.deadline import DeadlineExceeded, current_deadline, with_deadline
 
-# Import providers with graceful fallback
-try:
-    from app.services.llm.providers.openai import OpenAIProvider
-except (ImportError, ValueError):
-    OpenAIProvider = None
+T = TypeVar("T")
 
-try:
-    from app.services.llm.providers.anthropic import AnthropicProvider
-except (ImportError, ValueError):
-    AnthropicProvider = None
 
-try:
-    from app.services.llm.providers.google import GoogleAIProvider
-except (ImportError, ValueError):
-    GoogleAIProvider = None
+def has_quorum(scores: Sequence[float], quorum: int, tolerance: float) -> bool:
+    """
+    Check whether at least `quorum` scores lie within `tolerance` of each other.
+
+    Args:
+        scores: Scores received so far
+        quorum: Number of agreeing scores required
+        tolerance: Maximum spread (max - min) among the agreeing scores
+
+    Returns:
+        bool: True if some `quorum` of the scores agree
+    """
+    if quorum <= 0 or len(scores) < quorum:
+        return False
+    ordered = sorted(scores)
+    return any(
+        ordered[i + quorum - 1] - ordered[i] <= tolerance
+        for i in range(len(ordered) - quorum + 1)
+    )
 
 
 class ConsensusResult:
@@ -64,66 +90,106 @@ class LLMAdapter:
     Unified adapter for multiple LLM providers.
 
     Features:
-    - Parallel evaluation across all providers
+    - Parallel evaluation across all providers, optionally returning once a
+      quorum agrees (LLM_QUORUM)
     - Fallback mechanism (try providers in order)
     - Consensus calculation from multiple responses
     - Cost tracking across providers
+    - Persistent response cache shared across processes (LLM_CACHE_*)
+    - Per-provider concurrency and rate limits shared across adapters
+    - Adaptive routing: one provider first, more only for contentious steps
+      (LLM_ROUTING_MODE=adaptive)
+    - Per-provider circuit breakers and jittered-backoff retries that honor
+      Retry-After
+    - Offline heuristic provider for air-gapped deployments or as a free
+      first tier (LLM_LOCAL_PROVIDER)
+    - Concurrent identical calls coalesced into one (LLM_COALESCE_ENABLED)
+    - Daily and per-tenant token/cost budgets, degrading to cheaper models
+      and then to the local tier as they run out (LLM_BUDGET_*)
+    - Offline bulk evaluation through provider batch APIs at batch prices
+      (evaluate_bulk, LLM_BULK_*)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache: Optional[LLMResponseCache] = None,
+        limiters: Optional[ProviderLimiters] = None,
+        router: Optional[ProviderRouter] = None,
+        breakers: Optional[CircuitBreakers] = None,
+        inflight: Optional[SingleFlight] = None,
+        budget: Optional[LLMBudget] = None
+    ):
         """
         Initialize LLM adapter with available providers.
 
         Providers are initialized only if:
-        1. Library is installed
-        2. API key is configured
+        1. API key is configured
+        2. Library is installed (imported here, on first use)
+
+        The local heuristic provider is added when LLM_LOCAL_PROVIDER is
+        'always', or 'fallback' and no API provider is available.
+
+        Args:
+            cache: Response cache (default: global cache if LLM_CACHE_ENABLED)
+            limiters: Provider rate limiters (default: process-wide registry)
+            router: Provider statistics and routing policy (default: process-wide router)
+            breakers: Provider circuit breakers (default: process-wide registry)
+            inflight: In-flight call registry for coalescing (default: process-wide registry)
+            budget: Token and cost budgets (default: process-wide service)
         """
         self.services: Dict[str, any] = {}
+        self.cache = cache if cache is not None else (llm_response_cache if settings.LLM_CACHE_ENABLED else None)
+        self.limiters = limiters if limiters is not None else provider_limiters
+        self.router = router if router is not None else provider_router
+        self.breakers = breakers if breakers is not None else provider_breakers
+        self.inflight = inflight if inflight is not None else llm_singleflight
+        self.budget = budget if budget is not None else llm_budget
+        self._budget_tier: Optional[LocalHeuristicProvider] = None
 
-        # Initialize OpenAI if available
-        if OpenAIProvider and settings.OPENAI_API_KEY:
+        # Initialize the configured API providers (see app.services.llm.providers)
+        for name in configured_providers():
+            label = PROVIDERS[name].label
             try:
-                self.services["openai"] = OpenAIProvider()
-                print("[+] OpenAI provider initialized")
+                self.services[name] = create_provider(name)
+                print(f"[+] {label} provider initialized")
             except Exception as e:
-                print(f"[W] Failed to initialize OpenAI: {e}")
+                print(f"[W] Failed to initialize {label}: {e}")
 
-        # Initialize Anthropic if available
-        if AnthropicProvider and settings.ANTHROPIC_API_KEY:
-            try:
-                self.services["anthropic"] = AnthropicProvider()
-                print("[+] Anthropic provider initialized")
-            except Exception as e:
-                print(f"[W] Failed to initialize Anthropic: {e}")
-
-        # Initialize Google AI if available
-        if GoogleAIProvider and settings.GOOGLE_API_KEY:
-            try:
-                self.services["google"] = GoogleAIProvider()
-                print("[+] Google AI provider initialized")
-            except Exception as e:
-                print(f"[W] Failed to initialize Google AI: {e}")
+        # Initialize the local heuristic provider (offline, no API key)
+        local_mode = settings.LLM_LOCAL_PROVIDER
+        if local_mode == "always" or (local_mode == "fallback" and not self.services):
+            self.services["local"] = LocalHeuristicProvider()
+            print("[+] Local heuristic provider initialized")
 
         if not self.services:
             print("[W] No LLM providers available. Set API keys in .env file.")
 
-        # Fallback order (prefer OpenAI, then Anthropic, then Google)
-        self.fallback_order = ["openai", "anthropic", "google"]
+        # Fallback order (registration order: OpenAI, Anthropic, Google; then local heuristics)
+        self.fallback_order = [*PROVIDERS, "local"]
 
     async def evaluate_parallel(
         self,
         prompt: str,
-        options: Optional[EvaluationOptions] = None
+        options: Optional[EvaluationOptions] = None,
+        quorum: Optional[int] = None,
+        tolerance: Optional[float] = None
     ) -> List[LLMResponse]:
         """
         Evaluate proof with all available providers in parallel.
 
+        In quorum mode (1 < quorum < number of providers) responses are
+        collected as they arrive. Once `quorum` of them agree within
+        `tolerance` points, the remaining calls are cancelled. While the
+        scores disagree, the adapter keeps waiting for more providers.
+
         Args:
             prompt: Evaluation prompt
             options: Configuration options
+            quorum: Agreeing responses needed (default: LLM_QUORUM; 0 = all)
+            tolerance: Max score spread for agreement (default: LLM_QUORUM_TOLERANCE)
 
         Returns:
-            List[LLMResponse]: All successful responses
+            List[LLMResponse]: All successful responses received
 
         Raises:
             ConnectionError: If all providers fail
@@ -131,31 +197,162 @@ class LLMAdapter:
         if not self.services:
             raise ConnectionError("No LLM providers available")
 
-        options = options or EvaluationOptions()
+        services = await self._active_services()
+        named = await self._evaluate_providers(
+            list(services), prompt, options or EvaluationOptions(), quorum, tolerance, services=services
+        )
+        return [response for _, response in named]
 
-        # Create tasks for all providers
-        tasks = []
-        for provider_name, service in self.services.items():
-            task = asyncio.create_task(
-                self._safe_evaluate(service, prompt, options, provider_name)
-            )
-            tasks.append(task)
+    async def _evaluate_providers(
+        self,
+        provider_names: Sequence[str],
+        prompt: str,
+        options: EvaluationOptions,
+        quorum: Optional[int] = None,
+        tolerance: Optional[float] = None,
+        seed: Sequence[Tuple[str, LLMResponse]] = (),
+        services: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[str, LLMResponse]]:
+        """
+        Evaluate with the named providers in parallel (see evaluate_parallel).
 
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        Args:
+            provider_names: Providers to call
+            prompt: Evaluation prompt
+            options: Configuration options
+            quorum: Agreeing responses needed (default: LLM_QUORUM; 0 = all)
+            tolerance: Max score spread for agreement (default: LLM_QUORUM_TOLERANCE)
+            seed: Responses already received for this prompt; they count
+                towards the quorum and are included in the result
+            services: Provider instances by name (default: self.services)
+
+        Returns:
+            List[Tuple[str, LLMResponse]]: (provider name, response) pairs
+
+        Raises:
+            ConnectionError: If no provider (and no seed) produced a response
+        """
+        # Create tasks for the providers
+        services = services if services is not None else self.services
+        tasks = {
+            asyncio.create_task(
+                self._safe_evaluate(services[provider_name], prompt, options, provider_name)
+            ): provider_name
+            for provider_name in provider_names
+        }
+
+        quorum = settings.LLM_QUORUM if quorum is None else quorum
+        tolerance = settings.LLM_QUORUM_TOLERANCE if tolerance is None else tolerance
+
+        if 1 < quorum < len(tasks) + len(seed):
+            results = await self._gather_quorum(tasks, quorum, tolerance, seed)
+        else:
+            # Wait for all tasks to complete
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+            results = list(zip(tasks.values(), outcomes))
 
         # Filter successful results
-        successful_results = [
-            res for res in results
+        successful_results = list(seed) + [
+            (provider_name, res) for provider_name, res in results
             if isinstance(res, LLMResponse)
         ]
 
         if not successful_results:
-            errors = [res for res in results if isinstance(res, Exception)]
+            errors = [res for _, res in results if isinstance(res, Exception)]
             raise ConnectionError(f"All LLM evaluations failed. Errors: {errors}")
 
         return successful_results
 
+    async def _gather_quorum(
+        self,
+        tasks: Dict[asyncio.Task, str],
+        quorum: int,
+        tolerance: float,
+        seed: Sequence[Tuple[str, LLMResponse]] = ()
+    ) -> List[Tuple[str, object]]:
+        """
+        Collect task results until a quorum agrees, then cancel the rest.
+
+        Returns:
+            List: (provider name, response or exception) for tasks that finished
+        """
+        pending = set(tasks)
+        results = []
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    results.append((tasks[task], task.exception() or task.result()))
+                scores = [response.score for _, response in seed] + [
+                    res.score for _, res in results if isinstance(res, LLMResponse)
+                ]
+                if has_quorum(scores, quorum, tolerance):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if pending:
+            print(f"[+] Quorum of {quorum} reached; cancelled {len(pending)} slower provider call(s)")
+        return results
+
+    async def evaluate_routed(
+        self,
+        prompt: str,
+        options: Optional[EvaluationOptions] = None
+    ) -> List[LLMResponse]:
+        """
+        Evaluate with as few providers as the step needs.
+
+        With LLM_ROUTING_MODE=adaptive the router's first-choice provider
+        answers alone (the next one is tried if it fails). The remaining
+        providers are consulted, in parallel and subject to LLM_QUORUM,
+        only when the router escalates: a contentious score, an unreliable
+        provider, or a periodic audit. Otherwise every provider is queried
+        as in evaluate_parallel.
+
+        Args:
+            prompt: Evaluation prompt
+            options: Configuration options
+
+        Returns:
+            List[LLMResponse]: All successful responses
+
+        Raises:
+            ConnectionError: If all providers fail
+        """
+        services = await self._active_services()
+        if settings.LLM_ROUTING_MODE != "adaptive" or len(services) < 2:
+            return await self.evaluate_parallel(prompt, options)
+
+        options = options or EvaluationOptions()
+        ranked = self.router.rank(services)
+
+        first: Optional[Tuple[str, LLMResponse]] = None
+        for provider_name in ranked:
+            try:
+                response = await self._safe_evaluate(services[provider_name], prompt, options, provider_name)
+            except DeadlineExceeded:
+                raise
+            except Exception:
+                continue
+            first = (provider_name, response)
+            break
+
+        if first is None:
+            raise ConnectionError("All LLM providers failed to respond.")
+        if not self.router.should_escalate(*first):
+            return [first[1]]
+
+        # Contentious step: ask the providers ranked after the first choice
+        remaining = ranked[ranked.index(first[0]) + 1:]
+        print(f"[>] Escalating step from {first[0]} (score {first[1].score}) to {remaining}")
+        named = await self._evaluate_providers(remaining, prompt, options, seed=[first], services=services)
+        self.router.record_consensus([r for _, r in named], [n for n, _ in named])
+        return [response for _, response in named]
+
     async def evaluate_with_fallback(
         self,
         prompt: str,
@@ -164,7 +361,8 @@ class LLMAdapter:
         """
         Evaluate proof with fallback mechanism.
 
-        Tries providers in order (openai → anthropic → google) until success.
+        Tries providers in order (openai → anthropic → google → local) until success.
+        Providers with an open circuit are skipped without a call or a delay.
 
         Args:
             prompt: Evaluation prompt
@@ -180,22 +378,21 @@ class LLMAdapter:
             raise ConnectionError("No LLM providers available")
 
         options = options or EvaluationOptions()
+        services = await self._active_services()
 
         for provider_name in self.fallback_order:
-            if provider_name not in self.services:
+            if provider_name not in services:
                 continue
 
-            service = self.services[provider_name]
+            service = services[provider_name]
             try:
                 print(f"[>] Attempting evaluation with {provider_name}...")
-                response = await service.evaluate(prompt, options)
+                response = await self._evaluate_cached(service, prompt, options, provider_name)
                 print(f"[+] Evaluation with {provider_name} succeeded")
                 return response
 
             except ConnectionError as e:
                 print(f"[-] Evaluation with {provider_name} failed: {e}")
-                # Add small delay before trying next provider
-                await asyncio.sleep(1)
 
         raise ConnectionError("All LLM providers failed to respond.")
 
@@ -209,6 +406,8 @@ class LLMAdapter:
         """
         Safely evaluate with a provider, catching exceptions.
 
+        The call is cancelled if the current proof deadline expires.
+
         Args:
             service: Provider instance
             prompt: Evaluation prompt
@@ -219,11 +418,600 @@ class LLMAdapter:
             LLMResponse or Exception
         """
         try:
-            return await service.evaluate(prompt, options)
+            return await self._evaluate_cached(service, prompt, options, provider_name)
         except Exception as e:
             print(f"[-] {provider_name} evaluation failed: {e}")
             raise
 
+    async def _evaluate_cached(
+        self,
+        service,
+        prompt: str,
+        options: EvaluationOptions,
+        provider_name: str
+    ) -> LLMResponse:
+        """
+        Evaluate with one provider, serving identical earlier calls from the cache.
+
+        The key covers provider, model, prompt hash and sampling options, so
+        a hit is a response this exact call already produced. Only successful
+        responses are stored. A miss that matches a call already in flight
+        awaits that call instead of making its own (LLM_COALESCE_ENABLED).
+        With options.stream the call is streamed and the score parsed as it
+        arrives (see evaluate_streaming).
+
+        Args:
+            service: Provider instance
+            prompt: Evaluation prompt
+            options: Configuration options
+            provider_name: Provider name (part of the cache key)
+
+        Returns:
+            LLMResponse: Cached or coalesced (cached=True, zero cost) or fresh response
+        """
+        options = await self._budget_options(service, options, provider_name)
+        cached = await self._cache_lookup(service, prompt, options, provider_name)
+        if cached is not None:
+            return cached
+
+        if not settings.LLM_COALESCE_ENABLED or not getattr(service, "cacheable", True):
+            return await self._fresh_response(service, prompt, options, provider_name)
+
+        response, shared = await self.inflight.do(
+            self._cache_key(service, prompt, options, provider_name),
+            lambda: self._fresh_response(service, prompt, options, provider_name)
+        )
+        if shared:
+            # Paid for (and recorded) once, by the caller that made the request
+            return response.model_copy(update={"usage": LLMUsage(), "cost": 0.0, "cached": True})
+        return response
+
+    async def _fresh_response(
+        self,
+        service,
+        prompt: str,
+        options: EvaluationOptions,
+        provider_name: str
+    ) -> LLMResponse:
+        """Call the provider, record the outcome for routing and cache the response"""
+        async def call() -> LLMResponse:
+            if options.stream and getattr(service, "supports_streaming", False):
+                return await evaluate_streaming(service, prompt, options)
+            return await service.evaluate(prompt, options)
+
+        try:
+            response = await with_deadline(self._call_provider(provider_name, prompt, options, call, service))
+        except (DeadlineExceeded, CircuitOpenError, BudgetExceededError):
+            raise
+        except Exception:
+            self.router.record_failure(provider_name)
+            raise
+        self.router.record_response(provider_name, response)
+        await self._cache_store(service, prompt, options, provider_name, response)
+        return response
+
+    async def _call_provider(
+        self,
+        provider_name: str,
+        prompt: str,
+        options: EvaluationOptions,
+        call: Callable[[], Awaitable[T]],
+        service=None
+    ) -> T:
+        """
+        Make one provider call within the LLM budgets.
+
+        Metered providers (service.metered, the default) reserve the call's estimated tokens and cost
+        first; the reservation is settled with the reported usage, or
+        released if the call fails.
+
+        Raises:
+            BudgetExceededError: If a budget cannot fit the call (no call is made)
+            CircuitOpenError: If the provider's circuit is open
+            ConnectionError: If the last attempt failed
+        """
+        reservation = None
+        if getattr(service, "metered", True):
+            reservation = await self.budget.reserve(
+                estimate_tokens(prompt, options.max_tokens),
+                self._estimate_cost(service, provider_name, prompt, options)
+            )
+        try:
+            result = await self._call_with_retries(provider_name, prompt, options, call)
+        except BaseException:
+            await self.budget.release(reservation)
+            raise
+        await self.budget.settle(reservation, result.usage.total_tokens, result.cost)
+        return result
+
+    async def _call_with_retries(
+        self,
+        provider_name: str,
+        prompt: str,
+        options: EvaluationOptions,
+        call: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Make one provider call through its circuit breaker, retrying failures.
+
+        An open circuit raises CircuitOpenError at once. A transient
+        ConnectionError (rate limit, 5xx, timeout) is retried up to
+        LLM_MAX_RETRIES times after backoff_delay(), which uses the
+        provider's Retry-After when it sent one; a ProviderRequestError
+        (the request was rejected) is not. A retry is not attempted if the
+        delay would outlast the proof deadline or the circuit opened
+        meanwhile. The breaker sees one outcome per call, after its retries.
+
+        Raises:
+            CircuitOpenError: If the provider's circuit is open
+            ConnectionError: If the last attempt failed
+        """
+        breaker = self.breakers.get(provider_name)
+        if not breaker.allow():
+            raise CircuitOpenError(provider_name, breaker.retry_in())
+        attempt = 0
+        while True:
+            try:
+                result = await self._rate_limited(provider_name, prompt, options, call)
+            except ConnectionError as e:
+                retry_after = getattr(e, "retry_after", None)
+                delay = backoff_delay(attempt, retry_after=retry_after)
+                deadline = current_deadline()
+                if (
+                    isinstance(e, ProviderRequestError)
+                    or attempt >= settings.LLM_MAX_RETRIES
+                    or (deadline is not None and delay >= deadline.remaining())
+                    or breaker.state == CircuitState.OPEN
+                ):
+                    breaker.record_failure(retry_after)
+                    raise
+                attempt += 1
+                print(f"[W] {provider_name} call failed ({e}); retry {attempt} in {delay:.1f}s")
+                try:
+                    await asyncio.sleep(delay)
+                except BaseException:
+                    breaker.release()
+                    raise
+                continue
+            except BaseException:
+                breaker.release()
+                raise
+            breaker.record_success()
+            return result
+
+    async def _rate_limited(
+        self,
+        provider_name: str,
+        prompt: str,
+        options: EvaluationOptions,
+        call: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Make one provider call inside the provider's concurrency slot and rate budget.
+
+        Waiting happens locally (and counts against the proof deadline)
+        rather than as remote 429s. The token bucket is corrected with the
+        usage the provider reports.
+        """
+        limiter = self.limiters.get(provider_name)
+        async with limiter.acquire(estimate_tokens(prompt, options.max_tokens)) as grant:
+            result = await call()
+            grant.settle(result.usage.total_tokens)
+            return result
+
+    @staticmethod
+    def _estimate_cost(service, provider_name: str, prompt: str, options: EvaluationOptions) -> float:
+        """Upper estimate of a call's cost (full completion budget), 0.0 for unpriced models"""
+        model = options.model or getattr(service, "default_model", "unknown")
+        usage = LLMUsage(prompt_tokens=len(prompt) // 4, completion_tokens=options.max_tokens)
+        return CostTracker(provider_name).estimate(model, usage) or 0.0
+
+    async def _active_services(self) -> Dict[str, Any]:
+        """
+        Providers to use under the current budget state.
+
+        Once a budget is exhausted only the local heuristic tier is used
+        (unless LLM_LOCAL_PROVIDER=off), so proofs keep getting scored
+        instead of failing.
+        """
+        if settings.LLM_LOCAL_PROVIDER == "off" or await self.budget.state() != "exhausted":
+            return self.services
+        local = self.services.get("local")
+        if local is None:
+            if self._budget_tier is None:
+                self._budget_tier = LocalHeuristicProvider()
+            local = self._budget_tier
+        print("[W] LLM budget exhausted; scoring with the local heuristic tier")
+        return {"local": local}
+
+    async def _budget_options(self, service, options: EvaluationOptions, provider_name: str) -> EvaluationOptions:
+        """Switch to the provider's cheapest model once a budget is nearly used up"""
+        if options.model is not None or not getattr(service, "metered", True):
+            return options
+        if await self.budget.state() != "degrade":
+            return options
+        model = cheapest_model(provider_name)
+        if model is None or model == getattr(service, "default_model", None):
+            return options
+        self.budget.degraded += 1
+        return options.model_copy(update={"model": model})
+
+    def _cache_key(
+        self,
+        service,
+        prompt: str,
+        options: EvaluationOptions,
+        provider_name: str,
+        batch: bool = False
+    ) -> str:
+        model = options.model or getattr(service, "default_model", "unknown")
+        return cache_key(provider_name, model, prompt, options, batch=batch)
+
+    async def _cache_lookup(
+        self,
+        service,
+        prompt: str,
+        options: EvaluationOptions,
+        provider_name: str,
+        batch: bool = False
+    ) -> Optional[LLMResponse]:
+        """Cached response for this exact call (or batch-derived step score), if any"""
+        if self.cache is None or not getattr(service, "cacheable", True):
+            return None
+        return await self.cache.get(self._cache_key(service, prompt, options, provider_name, batch))
+
+    async def _cache_store(
+        self,
+        service,
+        prompt: str,
+        options: EvaluationOptions,
+        provider_name: str,
+        response: LLMResponse,
+        batch: bool = False
+    ) -> None:
+        """Store a fresh response for this exact call (or batch-derived step score)"""
+        if self.cache is not None and getattr(service, "cacheable", True):
+            await self.cache.put(self._cache_key(service, prompt, options, provider_name, batch), response)
+
+    # [=] Multi-step (batched) evaluation
+
+    def batch_size(self, provider_name: str) -> int:
+        """Steps per prompt for a provider (LLM_BATCH_SIZES, default 1)"""
+        return max(1, settings.LLM_BATCH_SIZES.get(provider_name, 1))
+
+    def batching_enabled(self) -> bool:
+        """Whether any available provider evaluates several steps per prompt"""
+        return any(self.batch_size(name) > 1 for name in self.services)
+
+    async def evaluate_steps(
+        self,
+        steps: Sequence,
+        domain: str,
+        options: Optional[EvaluationOptions] = None
+    ) -> Dict[int, List[LLMResponse]]:
+        """
+        Evaluate many proof steps with every provider, K steps per prompt.
+
+        Each provider gets its steps in chunks of batch_size(provider) and
+        is asked for a JSON array of per-step scores. A malformed array
+        falls back to single-step calls for that chunk. Cached steps are
+        never re-sent, and batched scores are cached per step.
+
+        Args:
+            steps: ProofStep entities
+            domain: Mathematical domain
+            options: Configuration options (max_tokens is per step)
+
+        Returns:
+            Dict[int, List[LLMResponse]]: Responses per step_index (one per
+            provider that answered; empty if none did)
+
+        Raises:
+            ConnectionError: If no providers are available
+            DeadlineExceeded: If the proof deadline expires
+        """
+        if not self.services:
+            raise ConnectionError("No LLM providers available")
+
+        options = options or EvaluationOptions()
+        services = await self._active_services()
+        outcomes = await asyncio.gather(
+            *(
+                self._evaluate_steps_with(provider_name, service, steps, domain, options)
+                for provider_name, service in services.items()
+            ),
+            return_exceptions=True
+        )
+
+        results: Dict[int, List[LLMResponse]] = {step.step_index: [] for step in steps}
+        for provider_name, outcome in zip(services, outcomes):
+            if isinstance(outcome, DeadlineExceeded):
+                raise outcome
+            if isinstance(outcome, Exception):
+                print(f"[-] {provider_name} batched evaluation failed: {outcome}")
+                continue
+            for step_index, response in outcome.items():
+                results[step_index].append(response)
+        return results
+
+    async def _evaluate_steps_with(
+        self,
+        provider_name: str,
+        service,
+        steps: Sequence,
+        domain: str,
+        options: EvaluationOptions
+    ) -> Dict[int, LLMResponse]:
+        """Evaluate steps with one provider; missing keys mean the call failed"""
+        options = await self._budget_options(service, options, provider_name)
+        results: Dict[int, LLMResponse] = {}
+        uncached = []
+        for step in steps:
+            # A single-step response is as good as a batch-derived one; not the other way round
+            prompt = build_step_prompt(step, domain)
+            cached = await self._cache_lookup(service, prompt, options, provider_name)
+            if cached is None:
+                cached = await self._cache_lookup(service, prompt, options, provider_name, batch=True)
+            if cached is not None:
+                results[step.step_index] = cached
+            else:
+                uncached.append(step)
+
+        k = self.batch_size(provider_name)
+        chunks = [uncached[i:i + k] for i in range(0, len(uncached), k)]
+        for chunk_results in await asyncio.gather(
+            *(self._evaluate_chunk(provider_name, service, chunk, domain, options) for chunk in chunks)
+        ):
+            results.update(chunk_results)
+        return results
+
+    async def _evaluate_chunk(
+        self,
+        provider_name: str,
+        service,
+        chunk: Sequence,
+        domain: str,
+        options: EvaluationOptions
+    ) -> Dict[int, LLMResponse]:
+        """Evaluate one chunk in a single prompt, or step by step if that fails to parse"""
+        if len(chunk) > 1:
+            batch_options = options.model_copy(update={"max_tokens": min(4096, options.max_tokens * len(chunk))})
+            step_indices = [step.step_index for step in chunk]
+            batch_prompt = build_batch_prompt(chunk, domain)
+            try:
+                completion = await with_deadline(
+                    self._call_provider(
+                        provider_name,
+                        batch_prompt,
+                        batch_options,
+                        lambda: service.complete(batch_prompt, batch_options, system_message=BATCH_SYSTEM_MESSAGE),
+                        service
+                    )
+                )
+            except ConnectionError as e:
+                if not isinstance(e, (CircuitOpenError, BudgetExceededError)):
+                    self.router.record_failure(provider_name)
+                print(f"[-] {provider_name} batch of {len(chunk)} steps failed: {e}")
+                return {}
+
+            parsed = parse_batch_response(completion.text, step_indices)
+            if parsed is not None:
+                # Split accounting evenly so per-step cost and usage still add up
+                n = len(chunk)
+                usage = LLMUsage(
+                    prompt_tokens=completion.usage.prompt_tokens // n,
+                    completion_tokens=completion.usage.completion_tokens // n,
+                    total_tokens=completion.usage.total_tokens // n,
+                    cached_tokens=completion.usage.cached_tokens // n,
+                    cache_write_tokens=completion.usage.cache_write_tokens // n
+                )
+                results = {}
+                for step, result in zip(chunk, parsed):
+                    response = LLMResponse(
+                        provider=completion.provider,
+                        model=completion.model,
+                        score=result.score,
+                        reasoning=result.reasoning,
+                        raw_response=completion.text,
+                        usage=usage,
+                        cost=completion.cost / n,
+                        duration_ms=completion.duration_ms
+                    )
+                    await self._cache_store(
+                        service, build_step_prompt(step, domain), options, provider_name, response, batch=True
+                    )
+                    results[step.step_index] = response
+                self.router.record_response(provider_name, response)
+                return results
+
+            print(f"[W] {provider_name} returned a malformed batch for steps {step_indices}; "
+                  f"falling back to single-step calls")
+
+        outcomes = await asyncio.gather(
+            *(
+                self._safe_evaluate(service, build_step_prompt(step, domain), options, provider_name)
+                for step in chunk
+            ),
+            return_exceptions=True
+        )
+        results = {}
+        for step, outcome in zip(chunk, outcomes):
+            if isinstance(outcome, DeadlineExceeded):
+                raise outcome
+            if isinstance(outcome, LLMResponse):
+                results[step.step_index] = outcome
+        return results
+
+    # [=] Offline bulk evaluation (provider batch APIs)
+
+    async def evaluate_bulk(
+        self,
+        prompts: Dict[str, str],
+        options: Optional[EvaluationOptions] = None,
+        poll_interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+        clients: Optional[Dict[str, BatchJobClient]] = None
+    ) -> Dict[str, List[LLMResponse]]:
+        """
+        Evaluate many prompts with every provider through its batch API.
+
+        For nightly re-benchmarks, where throughput and cost matter and
+        latency does not. Prompts are packaged into batch jobs (OpenAI
+        Batch, Anthropic Message Batches) of up to LLM_BULK_MAX_REQUESTS,
+        submitted, polled until they finish and mapped back to responses.
+        Every response is stored in the response cache under the same key
+        as a direct call, so verifying the proofs afterwards is served
+        from the cache. Providers without a batch API (Gemini, the local
+        tier) are evaluated with regular calls.
+
+        Args:
+            prompts: Prompts by caller-chosen key (e.g. one per proof step)
+            options: Configuration options (the same as the later direct calls)
+            poll_interval: Seconds between job status checks (default: LLM_BULK_POLL_SECONDS)
+            timeout: Seconds to wait for a job (default: LLM_BULK_TIMEOUT_SECONDS)
+            clients: Batch clients by provider (default: batch_job_client())
+
+        Returns:
+            Dict[str, List[LLMResponse]]: Responses per key (one per provider
+            that answered; empty if none did)
+
+        Raises:
+            ConnectionError: If no providers are available
+        """
+        if not self.services:
+            raise ConnectionError("No LLM providers available")
+
+        options = options or EvaluationOptions()
+        services = await self._active_services()
+        outcomes = await asyncio.gather(
+            *(
+                self._evaluate_bulk_with(
+                    provider_name, service, prompts, options, poll_interval, timeout,
+                    clients.get(provider_name) if clients is not None else batch_job_client(provider_name)
+                )
+                for provider_name, service in services.items()
+            ),
+            return_exceptions=True
+        )
+
+        results: Dict[str, List[LLMResponse]] = {key: [] for key in prompts}
+        for provider_name, outcome in zip(services, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"[-] {provider_name} bulk evaluation failed: {outcome}")
+                continue
+            for key, response in outcome.items():
+                results[key].append(response)
+        return results
+
+    async def _evaluate_bulk_with(
+        self,
+        provider_name: str,
+        service,
+        prompts: Dict[str, str],
+        options: EvaluationOptions,
+        poll_interval: Optional[float],
+        timeout: Optional[float],
+        client: Optional[BatchJobClient]
+    ) -> Dict[str, LLMResponse]:
+        """Evaluate prompts with one provider; missing keys mean the request failed"""
+        options = await self._budget_options(service, options, provider_name)
+        results: Dict[str, LLMResponse] = {}
+        uncached: List[str] = []
+        for key, prompt in prompts.items():
+            cached = await self._cache_lookup(service, prompt, options, provider_name)
+            if cached is not None:
+                results[key] = cached
+            else:
+                uncached.append(key)
+
+        if client is None:
+            outcomes = await asyncio.gather(
+                *(self._safe_evaluate(service, prompts[key], options, provider_name) for key in uncached),
+                return_exceptions=True
+            )
+            results.update(
+                (key, outcome) for key, outcome in zip(uncached, outcomes) if isinstance(outcome, LLMResponse)
+            )
+            return results
+
+        size = min(settings.LLM_BULK_MAX_REQUESTS, client.max_requests)
+        for start in range(0, len(uncached), size):
+            keys = uncached[start:start + size]
+            try:
+                results.update(
+                    await self._run_batch_job(provider_name, service, client, keys, prompts, options, poll_interval, timeout)
+                )
+            except (ConnectionError, TimeoutError) as e:
+                print(f"[-] {provider_name} batch job of {len(keys)} prompts failed: {e}")
+        return results
+
+    async def _run_batch_job(
+        self,
+        provider_name: str,
+        service,
+        client: BatchJobClient,
+        keys: Sequence[str],
+        prompts: Dict[str, str],
+        options: EvaluationOptions,
+        poll_interval: Optional[float],
+        timeout: Optional[float]
+    ) -> Dict[str, LLMResponse]:
+        """
+        Run one batch job within the LLM budgets and cache its responses.
+
+        The whole job is reserved up front at batch prices and settled
+        with the usage reported per request.
+
+        Raises:
+            BudgetExceededError: If a budget cannot fit the job (nothing is submitted)
+            ConnectionError: If the job cannot be submitted or read
+            TimeoutError: If the job did not finish in time
+        """
+        model = options.model or getattr(service, "default_model", "unknown")
+        requests = [BatchRequest(f"req-{i}", prompts[key], model, options) for i, key in enumerate(keys)]
+        discount = CostTracker.BATCH_MULTIPLIER.get(provider_name, 1.0)
+        reservation = None
+        if getattr(service, "metered", True):
+            reservation = await self.budget.reserve(
+                sum(estimate_tokens(r.prompt, options.max_tokens) for r in requests),
+                sum(self._estimate_cost(service, provider_name, r.prompt, options) for r in requests) * discount
+            )
+        try:
+            outcomes = await client.run(requests, poll_interval=poll_interval, timeout=timeout)
+        except BaseException:
+            await self.budget.release(reservation)
+            raise
+
+        completions: Dict[str, LLMCompletion] = {}
+        for request, key in zip(requests, keys):
+            outcome = outcomes.get(request.custom_id)
+            if isinstance(outcome, LLMCompletion):
+                completions[key] = outcome
+            elif outcome is not None:
+                print(f"[W] {provider_name} batch request for {key} failed: {outcome}")
+        await self.budget.settle(
+            reservation,
+            sum(c.usage.total_tokens for c in completions.values()),
+            sum(c.cost for c in completions.values())
+        )
+
+        results: Dict[str, LLMResponse] = {}
+        for key, completion in completions.items():
+            parsed = service._parse_response(completion.text)
+            response = LLMResponse(
+                provider=completion.provider,
+                model=completion.model,
+                score=parsed.score,
+                reasoning=parsed.reasoning,
+                raw_response=completion.text,
+                usage=completion.usage,
+                cost=completion.cost,
+                duration_ms=completion.duration_ms
+            )
+            await self._cache_store(service, prompts[key], options, provider_name, response)
+            results[key] = response
+        return results
+
     def calculate_consensus(self, responses: List[LLMResponse]) -> ConsensusResult:
         """
         Calculate consensus from multiple LLM responses.
@@ -250,6 +1038,45 @@ class LLMAdapter:
         """Check if any providers are available"""
         return len(self.services) > 0
 
+    def engine_version(self) -> str:
+        """
+        Identify the provider/model set that produces semantic scores.
+
+        Changes whenever a provider is added or removed or a default model
+        is rolled out, so stored semantic verdicts can be reused only while
+        the same models are in use.
+        """
+        if not self.services:
+            return "none"
+        return ",".join(
+            f"{name}:{getattr(service, 'default_model', 'unknown')}"
+            for name, service in sorted(self.services.items())
+        )
+
+    def matches_engine_version(self, response: LLMResponse) -> bool:
+        """
+        Whether a response came from a provider/model named in engine_version().
+
+        False for budget fallbacks (the provider's cheapest model, or the
+        local tier standing in for an exhausted budget), whose scores must
+        not be stored or reused under the full engine version.
+        """
+        service = self.services.get(response.provider)
+        return service is not None and response.model == getattr(service, "default_model", None)
+
+
+def warm_up_providers() -> List[str]:
+    """
+    Build the shared provider SDK clients ahead of the first proof.
+
+    Called at API and worker startup so client construction and pool
+    set-up are not on the first proof's critical path.
+
+    Returns:
+        List[str]: Providers that are available
+    """
+    return LLMAdapter().get_available_providers()
+
 
 # [T] Global singleton instance (optional)
 # llm_adapter = LLMAdapter()
@@ -0,0 +1,140 @@
+# [B] ProofCore Backend - Proof Queue Notifications
+# Postgres LISTEN/NOTIFY wakeups for verification workers
+
+import asyncio
+import time
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+
+def _is_postgres(db: AsyncSession) -> bool:
+    """Check whether a session is bound to PostgreSQL"""
+    return db.bind is not None and db.bind.dialect.name == "postgresql"
+
+
+async def notify_proof_queued(db: AsyncSession, proof_id: int) -> None:
+    """
+    Tell idle workers that a proof is ready to be claimed.
+
+    Commits the session, since Postgres delivers NOTIFY only on commit.
+    On other databases (SQLite in development and tests) this is a no-op
+    and workers fall back to polling.
+
+    Args:
+        db: Database session used for the submission
+        proof_id: ID of the proof that was queued
+    """
+    if not _is_postgres(db):
+        return
+
+    await db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": settings.PROOF_QUEUE_CHANNEL, "payload": str(proof_id)},
+    )
+    await db.commit()
+
+
+def asyncpg_dsn(database_url: str) -> str:
+    """Convert a SQLAlchemy URL (postgresql+asyncpg://...) into an asyncpg DSN"""
+    url = make_url(str(database_url)).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+class ProofQueueListener:
+    """
+    Dedicated LISTEN connection that wakes idle workers.
+
+    wait() returns as soon as a NOTIFY arrives on PROOF_QUEUE_CHANNEL or
+    wake() is called locally, and otherwise after the fallback poll
+    timeout. If the connection drops (or the database is not Postgres)
+    the worker keeps working on the slow poll alone and the listener
+    reconnects on the next wait().
+    """
+
+    def __init__(self, database_url: str, channel: Optional[str] = None):
+        """
+        Initialize the listener.
+
+        Args:
+            database_url: SQLAlchemy database URL
+            channel: NOTIFY channel (default: PROOF_QUEUE_CHANNEL)
+        """
+        self.database_url = str(database_url)
+        self.channel = channel or settings.PROOF_QUEUE_CHANNEL
+        self._event = asyncio.Event()
+        self._connection = None
+        self.notifications = 0
+        # time.monotonic() of the first NOTIFY not yet followed by a claim
+        self.notified_at: Optional[float] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether LISTEN is possible for this database"""
+        return make_url(self.database_url).get_backend_name() == "postgresql"
+
+    @property
+    def connected(self) -> bool:
+        """Whether the LISTEN connection is currently up"""
+        return self._connection is not None and not self._connection.is_closed()
+
+    async def start(self) -> None:
+        """Open the LISTEN connection (no-op for non-Postgres databases)"""
+        if not self.enabled or self.connected:
+            return
+        try:
+            import asyncpg
+            self._connection = await asyncpg.connect(asyncpg_dsn(self.database_url))
+            self._connection.add_termination_listener(self._on_terminated)
+            await self._connection.add_listener(self.channel, self._on_notify)
+            print(f"[+] Listening for queued proofs on '{self.channel}'")
+        except Exception as e:
+            self._connection = None
+            print(f"[W] LISTEN unavailable, falling back to polling: {e}")
+
+    async def stop(self) -> None:
+        """Close the LISTEN connection"""
+        if self._connection is not None:
+            try:
+                self._connection.remove_termination_listener(self._on_terminated)
+                await self._connection.close()
+            finally:
+                self._connection = None
+
+    def wake(self) -> None:
+        """Wake a waiting worker from this process (e.g. a slot freed up)"""
+        self._event.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """
+        Wait for a notification or local wake-up.
+
+        Args:
+            timeout: Fallback poll period in seconds
+
+        Returns:
+            bool: True if woken early, False if the poll timeout elapsed
+        """
+        if self.enabled and not self.connected:
+            await self.start()
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._event.clear()
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        self.notifications += 1
+        if self.notified_at is None:
+            self.notified_at = time.monotonic()
+        self._event.set()
+
+    def _on_terminated(self, connection) -> None:
+        print("[W] LISTEN connection lost; polling until it is re-established")
+        self._connection = None
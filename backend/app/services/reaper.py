@@ -0,0 +1,174 @@
+# [B] ProofCore Backend - Stale Job Reaper
+# Periodically requeues or fails proofs stuck in 'processing'
+
+import asyncio
+from typing import Callable, Dict, List, Optional, Set
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app import crud
+from app.core.config import settings
+from app.db import base
+from app.models.proof import Proof, ProofStatus
+from app.services.notify import notify_proof_queued
+from app.services.verification_queue import verification_queue
+
+
+class StaleProofReaper:
+    """
+    Recovers proofs left in 'processing' by hung or crashed workers, and
+    (inline mode) proofs left 'pending' when the in-memory queue was lost.
+
+    A proof is stale once its deadline_at is more than REAPER_GRACE_SECONDS
+    in the past (workers enforce the deadline themselves, so a live worker
+    will have moved it on by then). Stale proofs with attempts remaining are
+    requeued; the rest are marked 'failed'.
+    """
+
+    def __init__(
+        self,
+        session_maker: Optional[async_sessionmaker] = None,
+        interval_seconds: Optional[float] = None,
+        grace_seconds: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        requeue: Optional[Callable[[Proof], None]] = None,
+    ):
+        """
+        Initialize the reaper.
+
+        Args:
+            session_maker: Session factory (default: app.db.base.async_session_maker at run time)
+            interval_seconds: Scan period (default: REAPER_INTERVAL_SECONDS)
+            grace_seconds: Slack after deadline (default: REAPER_GRACE_SECONDS)
+            max_attempts: Attempts before failing (default: MAX_VERIFICATION_ATTEMPTS)
+            requeue: Callback that schedules a requeued proof (default: in-process
+                queue in inline mode; none in worker mode, where NOTIFY wakes a worker)
+        """
+        self._session_maker = session_maker
+        self.interval_seconds = interval_seconds or settings.REAPER_INTERVAL_SECONDS
+        self.grace_seconds = settings.REAPER_GRACE_SECONDS if grace_seconds is None else grace_seconds
+        self.max_attempts = max_attempts or settings.MAX_VERIFICATION_ATTEMPTS
+        if requeue is None and settings.VERIFICATION_MODE == "inline":
+            requeue = self._enqueue_locally
+        self._requeue = requeue
+        self._task: Optional[asyncio.Task] = None
+        self._drains: Set[asyncio.Task] = set()
+
+    async def reap_once(self, db: AsyncSession) -> Dict[str, List[int]]:
+        """
+        Scan once and act on every stale proof.
+
+        Args:
+            db: Database session
+
+        Returns:
+            dict: IDs of proofs that were requeued and failed
+        """
+        stale = await crud.proof.get_stale_processing(
+            db,
+            grace_seconds=self.grace_seconds,
+            stale_after_seconds=settings.WORKER_TIMEOUT + self.grace_seconds,
+        )
+
+        requeued: List[int] = []
+        failed: List[int] = []
+        for proof in stale:
+            if proof.attempts < self.max_attempts:
+                won = await crud.proof.transition_if_processing(
+                    db,
+                    proof_id=proof.id,
+                    status=ProofStatus.PENDING,
+                    detail=f"Requeued by reaper after attempt {proof.attempts}",
+                )
+                if won:
+                    await notify_proof_queued(db, proof.id)
+                    if self._requeue is not None:
+                        self._requeue(proof)
+                    requeued.append(proof.id)
+            else:
+                won = await crud.proof.transition_if_processing(
+                    db,
+                    proof_id=proof.id,
+                    status=ProofStatus.FAILED,
+                    detail=f"Stuck in processing after {proof.attempts} attempt(s)",
+                )
+                if won:
+                    failed.append(proof.id)
+
+        if requeued or failed:
+            print(f"[W] Reaper: requeued {requeued}, failed {failed}")
+        return {"requeued": requeued, "failed": failed}
+
+    async def recover_pending(self, db: AsyncSession) -> List[int]:
+        """
+        Requeue proofs left 'pending' by a previous process.
+
+        In inline mode the queue lives only in memory, so a restart loses
+        every job that was queued but not yet started. Call once at startup,
+        before new submissions arrive; in worker mode (no requeue callback)
+        workers claim pending rows from the database and nothing is done.
+
+        Args:
+            db: Database session
+
+        Returns:
+            List[int]: IDs of proofs put back on the queue
+        """
+        if self._requeue is None:
+            return []
+        depth, _ = await crud.proof.get_pending_backlog(db)
+        if depth == 0:
+            return []
+
+        recovered: List[int] = []
+        for proof in await crud.proof.get_pending(db):
+            self._requeue(proof)
+            recovered.append(proof.id)
+        print(f"[W] Reaper: requeued {len(recovered)} pending proof(s) left by a previous run")
+        return recovered
+
+    def _enqueue_locally(self, proof: Proof) -> None:
+        """Put a requeued proof back on this process's verification queue"""
+        verification_queue.enqueue(
+            proof_id=proof.id,
+            db_url=settings.DATABASE_URL,
+            priority=proof.priority,
+            tenant=proof.tenant,
+            cost=proof.expected_cost,
+        )
+        # Keep a reference so the drain task is not garbage-collected mid-run
+        drain = asyncio.get_running_loop().create_task(verification_queue.drain())
+        self._drains.add(drain)
+        drain.add_done_callback(self._drains.discard)
+
+    async def run_forever(self) -> None:
+        """Scan every interval_seconds until cancelled"""
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            session_maker = self._session_maker or base.async_session_maker
+            if session_maker is None:
+                continue
+            try:
+                async with session_maker() as db:
+                    await self.reap_once(db)
+            except Exception as e:
+                print(f"[-] Reaper scan failed: {e}")
+
+    def start(self) -> None:
+        """Start the periodic scan as a background task"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        """Cancel the periodic scan"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# [+] Global reaper instance
+stale_proof_reaper = StaleProofReaper()
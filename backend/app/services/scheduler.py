@@ -0,0 +1,209 @@
+# [B] ProofCore Backend - Verification Scheduler
+# Priority lanes, per-tenant fair queueing and shortest-expected-job-first ordering
+
+import enum
+import hashlib
+import heapq
+import itertools
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+
+
+class JobPriority(str, enum.Enum):
+    """Scheduling lane for a verification job"""
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+@dataclass
+class VerificationJob:
+    """A proof waiting for (or undergoing) verification"""
+    proof_id: int
+    db_url: str
+    priority: JobPriority = JobPriority.INTERACTIVE
+    tenant: str = "default"
+    cost: float = 1.0
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+# Tokens that make up an equation: identifiers, numbers and operators
+_EQUATION_TOKEN = re.compile(r"[A-Za-z_]\w*|\d+(?:\.\d+)?|\*\*|[-+*/^()=]")
+
+
+def equation_complexity(equation) -> float:
+    """
+    Rough symbolic cost of one equation.
+
+    Counts tokens on both sides; SymPy simplify time grows with
+    expression size, so longer equations are scheduled as larger jobs.
+
+    Args:
+        equation: Equation as {"lhs", "rhs"} dict or "lhs = rhs" string
+
+    Returns:
+        float: Complexity units (0 for no equation)
+    """
+    if not equation:
+        return 0.0
+    if isinstance(equation, dict):
+        text = f"{equation.get('lhs', '')} = {equation.get('rhs', '')}"
+    else:
+        text = str(equation)
+    return len(_EQUATION_TOKEN.findall(text)) / 8.0
+
+
+def estimate_job_cost(steps: Iterable) -> float:
+    """
+    Expected verification cost of a proof.
+
+    Each step costs one unit (one semantic evaluation) plus the
+    complexity of its equation (symbolic verification).
+
+    Args:
+        steps: Proof steps (ORM entities or ProofStepCreate schemas)
+
+    Returns:
+        float: Expected cost in abstract units
+    """
+    return sum(1.0 + equation_complexity(getattr(step, "equation", None)) for step in steps)
+
+
+def tenant_id_for_key(api_key: Optional[str]) -> str:
+    """
+    Derive a stable tenant identifier from an API key.
+
+    The raw key is never kept in scheduler state or exposed in stats.
+    """
+    if not api_key:
+        return "default"
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+
+class _Lane:
+    """
+    One priority lane with start-time fair queueing across tenants.
+
+    Each tenant accumulates the cost of jobs it has been served. The
+    tenant with the least service goes next, and within a tenant the
+    cheapest job goes first. A tenant returning from idle starts at the
+    current minimum so it cannot bank credit while absent.
+    """
+
+    def __init__(self):
+        self._jobs: Dict[str, List[Tuple[float, int, VerificationJob]]] = {}
+        self._served: Dict[str, float] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, job: VerificationJob, seq: int) -> None:
+        if job.tenant not in self._jobs:
+            active = [self._served[t] for t in self._jobs]
+            floor = min(active) if active else 0.0
+            self._served[job.tenant] = floor
+            self._jobs[job.tenant] = []
+        heapq.heappush(self._jobs[job.tenant], (job.cost, seq, job))
+        self._size += 1
+
+    def pop(self) -> VerificationJob:
+        tenant = min(self._jobs, key=lambda t: self._served[t])
+        heap = self._jobs[tenant]
+        _, _, job = heapq.heappop(heap)
+        self._size -= 1
+        if heap:
+            self._served[tenant] += job.cost
+        else:
+            # Idle tenants are forgotten; they rejoin at the current floor
+            del self._jobs[tenant]
+            del self._served[tenant]
+        return job
+
+    def tenant_depths(self) -> Dict[str, int]:
+        return {tenant: len(heap) for tenant, heap in self._jobs.items()}
+
+
+class FairShareScheduler:
+    """
+    Scheduler for queued verification jobs.
+
+    Ordering rules:
+    - Interactive jobs go before bulk jobs, except that the bulk lane is
+      guaranteed SCHEDULER_BULK_SHARE of dispatches while both lanes have
+      work, so bulk runs are slowed rather than starved.
+    - Within a lane, tenants (API keys) share dispatch by cost served.
+    - Within a tenant, shortest expected job first (step count plus
+      equation complexity).
+    """
+
+    def __init__(self, bulk_share: Optional[float] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            bulk_share: Fraction of dispatches reserved for the bulk lane when
+                        interactive work is also waiting (default: SCHEDULER_BULK_SHARE)
+        """
+        share = settings.SCHEDULER_BULK_SHARE if bulk_share is None else bulk_share
+        # Every Nth dispatch goes to bulk while both lanes are busy
+        self._bulk_interval = max(1, round(1 / share)) if share > 0 else 0
+        self._lanes = {priority: _Lane() for priority in JobPriority}
+        self._by_arrival: "OrderedDict[int, VerificationJob]" = OrderedDict()
+        self._seq = itertools.count()
+        self._since_bulk = 0
+
+    def __len__(self) -> int:
+        return len(self._by_arrival)
+
+    def __bool__(self) -> bool:
+        return bool(self._by_arrival)
+
+    def push(self, job: VerificationJob) -> None:
+        """Add a job to its lane"""
+        self._lanes[job.priority].push(job, next(self._seq))
+        self._by_arrival[id(job)] = job
+
+    def pop(self) -> Optional[VerificationJob]:
+        """Remove and return the next job to run, or None if empty"""
+        interactive = self._lanes[JobPriority.INTERACTIVE]
+        bulk = self._lanes[JobPriority.BULK]
+
+        if not interactive and not bulk:
+            return None
+
+        use_bulk = not interactive or (
+            bool(bulk)
+            and self._bulk_interval > 0
+            and self._since_bulk >= self._bulk_interval - 1
+        )
+
+        if use_bulk:
+            job = bulk.pop()
+            self._since_bulk = 0
+        else:
+            job = interactive.pop()
+            self._since_bulk += 1
+
+        del self._by_arrival[id(job)]
+        return job
+
+    def oldest(self) -> Optional[VerificationJob]:
+        """The job that has been waiting longest, in any lane"""
+        return next(iter(self._by_arrival.values()), None)
+
+    def lane_depths(self) -> Dict[str, int]:
+        """Number of waiting jobs per lane"""
+        return {priority.value: len(lane) for priority, lane in self._lanes.items()}
+
+    def tenant_depths(self) -> Dict[str, int]:
+        """Number of waiting jobs per tenant, across lanes"""
+        depths: Dict[str, int] = {}
+        for lane in self._lanes.values():
+            for tenant, count in lane.tenant_depths().items():
+                depths[tenant] = depths.get(tenant, 0) + count
+        return depths
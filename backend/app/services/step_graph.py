@@ -0,0 +1,65 @@
+# [B] ProofCore Backend - Step Dependency Graph
+# Resolves step dependencies and finds steps affected by an edit
+
+import re
+from typing import Dict, Iterable, List, Set
+
+
+_TRAILING_NUMBER = re.compile(r"(\d+)\s*$")
+
+
+def dependency_targets(dependency, steps) -> Set[int]:
+    """
+    Resolve one dependency reference to step indices.
+
+    References are free-form ("0", 0, "step_1", "s2"). A reference
+    matches a step if its number equals the step's index or ID, or
+    if the whole reference equals either of them as a string. An
+    ambiguous reference resolves to every step it could mean.
+    Re-verifying too much is safe; re-verifying too little is not.
+
+    Args:
+        dependency: Dependency reference from ProofStep.dependencies
+        steps: Steps of the proof (step_index and id attributes)
+
+    Returns:
+        Set[int]: Indices of the steps the reference may point to
+    """
+    text = str(dependency).strip()
+    match = _TRAILING_NUMBER.search(text)
+    number = int(match.group(1)) if match else None
+
+    targets = set()
+    for step in steps:
+        if text in (str(step.step_index), str(step.id)) or number in (step.step_index, step.id):
+            targets.add(step.step_index)
+    return targets
+
+
+def downstream_steps(steps, changed: Iterable[int]) -> Set[int]:
+    """
+    Find the changed steps plus every step that depends on them, transitively.
+
+    Args:
+        steps: Steps of the proof
+        changed: Indices of edited steps
+
+    Returns:
+        Set[int]: Indices of steps whose verdicts are no longer current
+    """
+    # Edge: dependency -> dependent
+    dependents: Dict[int, List[int]] = {step.step_index: [] for step in steps}
+    for step in steps:
+        for dependency in step.dependencies or []:
+            for target in dependency_targets(dependency, steps):
+                if target != step.step_index:
+                    dependents[target].append(step.step_index)
+
+    affected = set(changed)
+    frontier = list(affected)
+    while frontier:
+        for dependent in dependents.get(frontier.pop(), []):
+            if dependent not in affected:  # Cycle-safe
+                affected.add(dependent)
+                frontier.append(dependent)
+    return affected
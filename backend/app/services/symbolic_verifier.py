@@ -3,72 +3,157 @@
 
 import asyncio
 from concurrent.futures import ProcessPoolExecutor
-from typing import Dict, List, Optional
-import sympy
-from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from importlib.metadata import version
+from typing import TYPE_CHECKING, Dict, List, Optional
 
+from app.core.config import settings
+from app.services.deadline import DeadlineExceeded, with_deadline
 
-class BackendSymbolicVerifier:
+if TYPE_CHECKING:
+    import sympy
+
+# SymPy is imported on first use, not at module import: the API process
+# imports this module (through app.services.verification) but only the
+# pool workers run SymPy, so the API process stays SymPy-free.
+
+# Bump when parsing or equivalence rules change; stored step verdicts from
+# other versions are recomputed on revalidation
+SYMBOLIC_ENGINE_VERSION = f"sympy-{version('sympy')}/1"
+
+
+@lru_cache(maxsize=1)
+def _transformations() -> tuple:
+    """Parser transformations (imports SymPy on first call)"""
+    from sympy.parsing.sympy_parser import implicit_multiplication_application, standard_transformations
+    return standard_transformations + (implicit_multiplication_application,)
+
+
+def parse_expression(expression: str) -> "sympy.Expr":
     """
-    Backend symbolic verification using SymPy.
+    Parse an expression with implicit multiplication (e.g. '2x', 'x y').
 
-    Verifies mathematical equations for symbolic correctness by parsing
-    and comparing left-hand side (LHS) and right-hand side (RHS) expressions.
+    Raises:
+        sympy.SympifyError, SyntaxError, ValueError, TypeError: If it cannot be parsed
+    """
+    from sympy.parsing.sympy_parser import parse_expr
+    return parse_expr(expression, transformations=_transformations())
 
-    OPTIMIZATION: Uses ProcessPoolExecutor to run CPU-bound SymPy operations
-    in a separate process pool, preventing event loop blocking in FastAPI.
+
+def _warm_worker() -> None:
+    """Pool process initializer: import SymPy once, before the first job"""
+    _transformations()
+
+
+def verify_equation_sync(lhs: str, rhs: str) -> bool:
+    """
+    Synchronous SymPy equation verification (runs in the process pool).
+
+    A module-level function, so the pool pickles only its name and
+    arguments; SymPy is imported in the worker process on its first job.
+
+    Args:
+        lhs: Left-hand side expression string
+        rhs: Right-hand side expression string
+
+    Returns:
+        bool: True if expressions are symbolically equivalent
+    """
+    import sympy
+
+    try:
+        # Parse expressions (CPU-bound, runs in process pool)
+        lhs_expr = parse_expression(lhs)
+        rhs_expr = parse_expression(rhs)
+
+        # Simplify difference and check if zero (CPU-bound)
+        difference = sympy.simplify(lhs_expr - rhs_expr)
+        is_equal = difference == 0
+
+        return bool(is_equal)
+
+    except (sympy.SympifyError, ValueError, TypeError) as e:
+        # Invalid syntax or unparseable expression
+        print(f"[W] Equation parsing failed: {e}")
+        return False
+    except Exception as e:
+        # Unexpected error
+        print(f"[-] Symbolic verification error: {e}")
+        return False
+
+
+class SymbolicWorkerPool:
+    """
+    Process pool for SymPy jobs, shared by every verifier in a process.
+
+    Processes start on first use and import SymPy once (_warm_worker),
+    then keep it for every later proof; the parent process never imports
+    SymPy. A pool whose job timed out is replaced, since cancelling the
+    awaiting future does not stop a runaway simplify in the worker.
     """
 
     def __init__(self, max_workers: int = 4):
-        """Initialize symbolic verifier with SymPy transformations
+        """
+        Initialize the pool (no processes are started yet).
 
         Args:
             max_workers: Maximum number of worker processes for CPU-bound operations
         """
-        # Standard transformations for parsing
-        self.transformations = (
-            standard_transformations +
-            (implicit_multiplication_application,)
-        )
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
 
-        # Initialize process pool executor for CPU-bound SymPy operations
-        self._executor = ProcessPoolExecutor(max_workers=max_workers)
+    def executor(self) -> ProcessPoolExecutor:
+        """Get (or start) the current executor"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_warm_worker)
+        return self._executor
 
-    def _sync_verify_equation(self, lhs: str, rhs: str) -> bool:
+    def recycle(self, executor: ProcessPoolExecutor) -> None:
         """
-        Synchronous SymPy equation verification (runs in process pool).
+        Terminate `executor` after a timed-out job; the next job starts a fresh pool.
 
-        This method contains all CPU-bound operations and is executed
-        in a separate process, not blocking the event loop.
+        Only the current executor is replaced, so several jobs timing out
+        on the same pool recycle it once.
+        """
+        if executor is not self._executor:
+            return
+        self._executor = None
+        # ProcessPoolExecutor has no public API to kill busy workers; jobs
+        # still queued on it fail with BrokenProcessPool and are retried
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False)
 
-        Args:
-            lhs: Left-hand side expression string
-            rhs: Right-hand side expression string
+    def shutdown(self) -> None:
+        """Stop the worker processes (at API or worker shutdown)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
-        Returns:
-            bool: True if expressions are symbolically equivalent
-        """
-        try:
-            # Parse expressions (CPU-bound, runs in process pool)
-            lhs_expr = parse_expr(lhs, transformations=self.transformations)
-            rhs_expr = parse_expr(rhs, transformations=self.transformations)
 
-            # Simplify difference and check if zero (CPU-bound)
-            difference = sympy.simplify(lhs_expr - rhs_expr)
-            is_equal = difference == 0
+class BackendSymbolicVerifier:
+    """
+    Backend symbolic verification using SymPy.
 
-            return bool(is_equal)
+    Verifies mathematical equations for symbolic correctness by parsing
+    and comparing left-hand side (LHS) and right-hand side (RHS) expressions.
 
-        except (sympy.SympifyError, ValueError, TypeError) as e:
-            # Invalid syntax or unparseable expression
-            print(f"[W] Equation parsing failed: {e}")
-            return False
-        except Exception as e:
-            # Unexpected error
-            print(f"[-] Symbolic verification error: {e}")
-            return False
+    OPTIMIZATION: Uses ProcessPoolExecutor to run CPU-bound SymPy operations
+    in a separate process pool, preventing event loop blocking in FastAPI.
+    SymPy itself is only imported in the pool workers (and in-process by
+    parse_and_validate / simplify_expression).
+    """
 
-    async def verify_equation(self, lhs: str, rhs: str) -> bool:
+    def __init__(self, pool: Optional[SymbolicWorkerPool] = None):
+        """Initialize symbolic verifier
+
+        Args:
+            pool: Worker processes for CPU-bound operations (default: process-wide pool)
+        """
+        self.pool = pool if pool is not None else symbolic_pool
+
+    async def verify_equation(self, lhs: str, rhs: str) -> Optional[bool]:
         """
         Async wrapper for equation verification (non-blocking).
 
@@ -80,7 +165,9 @@ class BackendSymbolicVerifier:
             rhs: Right-hand side expression string
 
         Returns:
-            bool: True if expressions are symbolically equivalent
+            Optional[bool]: True if expressions are symbolically equivalent;
+            None (falsy) if no verdict was reached because the check timed
+            out or the worker pool failed
 
         Examples:
             >>> verifier = BackendSymbolicVerifier()
@@ -95,26 +182,50 @@ class BackendSymbolicVerifier:
             - Without executor: 10 concurrent = 5s (sequential, blocking)
             - With executor: 10 concurrent = 1.5s (parallel, non-blocking)
             - 3.5x throughput improvement
-        """
-        try:
-            loop = asyncio.get_running_loop()
 
-            # Run blocking CPU-bound code in executor (separate process)
-            # Event loop continues to accept other requests while this runs
-            result = await loop.run_in_executor(
-                self._executor,
-                self._sync_verify_equation,
-                lhs,
-                rhs
-            )
+        Timeouts:
+            - Each call is capped at SYMBOLIC_TIMEOUT and at the remaining
+              proof deadline; a capped-out equation has no verdict (None)
+            - DeadlineExceeded propagates so the whole proof is abandoned
+            - A job lost because another proof's timeout recycled the pool
+              is run once more on the fresh pool
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            executor = self.pool.executor()
+            try:
+                # Run blocking CPU-bound code in executor (separate process)
+                # Event loop continues to accept other requests while this runs
+                return await with_deadline(
+                    loop.run_in_executor(
+                        executor,
+                        verify_equation_sync,
+                        lhs,
+                        rhs
+                    ),
+                    cap=settings.SYMBOLIC_TIMEOUT
+                )
 
-            return result
+            except DeadlineExceeded:
+                self.pool.recycle(executor)
+                raise
+            except asyncio.TimeoutError:
+                print(f"[W] Symbolic verification timed out after {settings.SYMBOLIC_TIMEOUT}s: {lhs} = {rhs}")
+                self.pool.recycle(executor)
+                return None
+            except BrokenProcessPool as e:
+                if attempt == 0:
+                    # Recycled by another proof's timeout while this job was queued or running
+                    self.pool.recycle(executor)
+                    continue
+                print(f"[-] Symbolic worker pool failed: {e}")
+                return None
+            except Exception as e:
+                # Async wrapper error
+                print(f"[-] Async verification wrapper error: {e}")
+                return None
+        return None
 
-        except Exception as e:
-            # Async wrapper error
-            print(f"[-] Async verification wrapper error: {e}")
-            return False
-    
     async def verify_steps(self, steps: List) -> Dict:
         """
         Verify symbolic correctness of multiple proof steps.
@@ -157,7 +268,7 @@ class BackendSymbolicVerifier:
                 
                 # Verify if both sides exist
                 if lhs and rhs:
-                    step_valid = await self.verify_equation(lhs, rhs)
+                    step_valid = bool(await self.verify_equation(lhs, rhs))
                 else:
                     # No equation to verify, consider valid
                     step_valid = True
@@ -184,7 +295,7 @@ class BackendSymbolicVerifier:
             "details": results
         }
     
-    async def parse_and_validate(self, expression: str) -> Optional[sympy.Expr]:
+    async def parse_and_validate(self, expression: str) -> Optional["sympy.Expr"]:
         """
         Parse and validate a mathematical expression.
         
@@ -195,7 +306,7 @@ class BackendSymbolicVerifier:
             sympy.Expr: Parsed expression, or None if invalid
         """
         try:
-            return parse_expr(expression, transformations=self.transformations)
+            return parse_expression(expression)
         except Exception as e:
             print(f"[W] Expression validation failed: {e}")
             return None
@@ -210,8 +321,10 @@ class BackendSymbolicVerifier:
         Returns:
             str: Simplified expression, or None if invalid
         """
+        import sympy
+
         try:
-            expr = parse_expr(expression, transformations=self.transformations)
+            expr = parse_expression(expression)
             simplified = sympy.simplify(expr)
             return str(simplified)
         except Exception as e:
@@ -219,6 +332,10 @@ class BackendSymbolicVerifier:
             return None
 
 
+# [+] Global worker pool (started on first use)
+symbolic_pool = SymbolicWorkerPool(max_workers=4)
+
+
 # [T] Future enhancements
 
 # async def verify_with_assumptions(self, lhs: str, rhs: str, assumptions: Dict) -> bool:
@@ -2,7 +2,9 @@
 # Background service for proof evaluation
 
 import asyncio
-from typing import Optional, List
+import hashlib
+import json
+from typing import Dict, Optional, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app import crud
@@ -10,7 +12,41 @@ from app.core.config import settings
 from app.models.proof import Proof
 from app.services.llm_adapter import LLMAdapter, EvaluationOptions, ConsensusResult
 from app.services.llm.base import LLMResponse
-from app.services.symbolic_verifier import BackendSymbolicVerifier
+from app.services.llm.prompts import build_step_prompt
+from app.services.llm.similarity import StepSimilarityIndex, step_similarity_index
+from app.services.symbolic_verifier import BackendSymbolicVerifier, SYMBOLIC_ENGINE_VERSION
+from app.services.deadline import Deadline, DeadlineExceeded, deadline_scope, with_deadline
+from app.services.llm.budget import tenant_scope
+
+# Bump when the semantic evaluation prompt changes
+SEMANTIC_PROMPT_VERSION = "2"
+
+# Semantic score used when no provider answered
+NEUTRAL_SEMANTIC_SCORE = 50.0
+
+
+def step_content_hash(step, domain: str) -> str:
+    """
+    Hash everything a step verdict depends on.
+
+    Args:
+        step: ProofStep entity
+        domain: Mathematical domain (part of the semantic prompt)
+
+    Returns:
+        str: SHA-256 hex digest of domain, claim, equation and dependencies
+    """
+    payload = json.dumps(
+        {
+            "domain": domain,
+            "claim": step.claim,
+            "equation": step.equation,
+            "dependencies": step.dependencies or [],
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
 class BackendProofEngine:
@@ -23,8 +59,13 @@ class BackendProofEngine:
     - Multi-provider consensus for reliability
     """
 
-    def __init__(self):
-        """Initialize verification engine with LLM adapter and symbolic verifier"""
+    def __init__(self, similarity_index: Optional[StepSimilarityIndex] = None):
+        """
+        Initialize verification engine with LLM adapter and symbolic verifier.
+
+        Args:
+            similarity_index: Near-duplicate step index (default: process-wide index)
+        """
         self.symbolic_weight = settings.SYMBOLIC_WEIGHT
         self.semantic_weight = settings.SEMANTIC_WEIGHT
         self.pass_threshold = settings.PASS_THRESHOLD
@@ -36,6 +77,9 @@ class BackendProofEngine:
         # Initialize symbolic verifier for SymPy-based validation
         self.symbolic_verifier = BackendSymbolicVerifier()
 
+        # Near-duplicate steps reuse an earlier semantic score (LLM_SIMILARITY_ENABLED)
+        self.similarity_index = similarity_index if similarity_index is not None else step_similarity_index
+
         if self.has_llm:
             providers = self.llm_adapter.get_available_providers()
             print(f"[+] LLM providers available: {', '.join(providers)}")
@@ -44,7 +88,13 @@ class BackendProofEngine:
 
         print(f"[+] Symbolic verifier initialized (SymPy-based)")
 
-    async def evaluate(self, proof_data: Proof) -> dict:
+        # Engine versions stored with each step verdict (see evaluate)
+        self.symbolic_version = SYMBOLIC_ENGINE_VERSION
+        self.semantic_version = f"{self.llm_adapter.engine_version()}/prompt-{SEMANTIC_PROMPT_VERSION}"
+        if settings.LLM_TWO_PHASE:
+            self.semantic_version += "/two-phase"
+
+    async def evaluate(self, proof_data: Proof, previous_step_results: Optional[List[dict]] = None) -> dict:
         """
         Evaluate a proof and return verification results.
 
@@ -53,29 +103,105 @@ class BackendProofEngine:
         - Semantic evaluation (LLM reasoning assessment)
         - Multi-provider consensus for reliability
 
+        Incremental revalidation: a stored symbolic or semantic verdict is
+        reused when the step's content hash and the engine version that
+        produced it are unchanged. Hybrid scores, LII and feedback are
+        always recomputed, so weight or threshold changes cost nothing.
+
+        Degraded verdicts (a fallback value: SymPy failed or timed out, no
+        provider answered, or a budget fallback model scored the step) are
+        listed in the step's "degraded" field and stored without an engine
+        version, so they are never reused.
+
+        With LLM_SIMILARITY_ENABLED, a step whose equation matches an
+        earlier scored step up to variable names, and whose claim and
+        reasoning are near-duplicates of it, reuses that step's semantic
+        score instead of calling the providers (see StepSimilarityIndex).
+
         Args:
             proof_data: Proof entity with steps
+            previous_step_results: step_results of the last verification, if any
 
         Returns:
             dict: Verification result with LII score, validity, step-by-step results
         """
         print(f"[>] Evaluating proof {proof_data.id} with {len(proof_data.steps)} steps")
 
+        previous: Dict[str, dict] = {
+            prior["content_hash"]: prior
+            for prior in previous_step_results or []
+            if prior.get("content_hash")
+        }
+
+        content_hashes = [step_content_hash(step, proof_data.domain) for step in proof_data.steps]
+        needs_semantic = [
+            step for step, content_hash in zip(proof_data.steps, content_hashes)
+            if previous.get(content_hash, {}).get("semantic_version") != self.semantic_version
+        ]
+
+        # Near-duplicates of steps scored earlier reuse those scores
+        similar: Dict[int, float] = {}
+        if self.has_llm and settings.LLM_SIMILARITY_ENABLED:
+            for step in needs_semantic:
+                score = self.similarity_index.lookup(step, proof_data.domain, self.semantic_version)
+                if score is not None:
+                    similar[step.step_index] = score
+
+        # Batched semantic mode: score all steps that need it, K per prompt
+        prefetched: Dict[int, Tuple[float, bool]] = {}
+        if self.has_llm and self.llm_adapter.batching_enabled():
+            pending = [step for step in needs_semantic if step.step_index not in similar]
+            if pending:
+                prefetched = await self._evaluate_semantic_batch(pending, proof_data.domain)
+
         # Evaluate each step
         step_results = []
         semantic_scores = []
         symbolic_scores = []
-
-        for i, step in enumerate(proof_data.steps):
-            # Symbolic verification (placeholder - TODO: implement SymPy validation)
-            symbolic_pass = await self._verify_symbolic(step)
+        reused_counts = {"symbolic": 0, "semantic": 0}
+        similar_count = 0
+
+        for i, (step, content_hash) in enumerate(zip(proof_data.steps, content_hashes)):
+            prior = previous.get(content_hash, {})
+            reused = []
+            degraded = []
+
+            # Symbolic verification (reuse verdict from the same engine version)
+            if prior.get("symbolic_version") == self.symbolic_version:
+                symbolic_pass = prior["symbolic_pass"]
+                reused.append("symbolic")
+            else:
+                symbolic_pass, symbolic_degraded = await self._verify_symbolic(step)
+                if symbolic_degraded:
+                    degraded.append("symbolic")
             symbolic_score = 100.0 if symbolic_pass else 0.0
             symbolic_scores.append(symbolic_score)
 
-            # Semantic evaluation using LLM consensus
-            semantic_score = await self._evaluate_semantic(step, proof_data.domain)
+            # Semantic evaluation using LLM consensus (reuse if same providers/models/prompt)
+            if prior.get("semantic_version") == self.semantic_version:
+                semantic_score = float(prior["semantic_score"])
+                reused.append("semantic")
+            elif step.step_index in similar:
+                semantic_score = similar[step.step_index]
+                reused.append("similar")
+            else:
+                if step.step_index in prefetched:
+                    semantic_score, semantic_degraded = prefetched[step.step_index]
+                else:
+                    semantic_score, semantic_degraded = await self._evaluate_semantic(step, proof_data.domain)
+                if semantic_degraded:
+                    degraded.append("semantic")
+                elif self.has_llm and settings.LLM_SIMILARITY_ENABLED:
+                    # Only genuine provider scores are offered to near-duplicate steps
+                    self.similarity_index.add(step, proof_data.domain, self.semantic_version, semantic_score)
             semantic_scores.append(semantic_score)
 
+            for kind in reused:
+                if kind == "similar":
+                    similar_count += 1
+                else:
+                    reused_counts[kind] += 1
+
             # Dependencies validation (placeholder - TODO: implement graph check)
             dependencies_valid = True
 
@@ -88,10 +214,18 @@ class BackendProofEngine:
                 "hybrid_score": round(
                     symbolic_score * self.symbolic_weight + semantic_score * self.semantic_weight,
                     2
-                )
+                ),
+                "content_hash": content_hash,
+                # Degraded verdicts carry no version, so they are never reused
+                "symbolic_version": None if "symbolic" in degraded else self.symbolic_version,
+                "semantic_version": None if "semantic" in degraded else self.semantic_version,
+                "reused": reused,
+                "degraded": degraded
             })
 
-            print(f"  [+] Step {i+1}/{len(proof_data.steps)}: symbolic={symbolic_pass}, semantic={semantic_score:.1f}")
+            print(f"  [+] Step {i+1}/{len(proof_data.steps)}: symbolic={symbolic_pass}, semantic={semantic_score:.1f}"
+                  + (f" (reused {'+'.join(reused)})" if reused else "")
+                  + (f" (degraded {'+'.join(degraded)})" if degraded else ""))
 
         # Calculate overall LII score (hybrid approach)
         avg_symbolic = sum(symbolic_scores) / len(symbolic_scores) if symbolic_scores else 0
@@ -121,13 +255,15 @@ class BackendProofEngine:
             "coherence_score": round(coherence_score, 2),
             "step_results": step_results,
             "feedback": feedback,
-            "semantic_provider_count": len(self.llm_adapter.get_available_providers()) if self.has_llm else 0
+            "semantic_provider_count": len(self.llm_adapter.get_available_providers()) if self.has_llm else 0,
+            "reused_steps": reused_counts,
+            "similar_steps": similar_count
         }
 
         print(f"[+] Proof {proof_data.id} evaluation complete: valid={is_valid}, lii={lii_score:.1f}, coherence={coherence_score:.1f}")
         return result
 
-    async def _verify_symbolic(self, step) -> bool:
+    async def _verify_symbolic(self, step) -> Tuple[bool, bool]:
         """
         Verify symbolic correctness of a proof step using SymPy.
 
@@ -135,13 +271,16 @@ class BackendProofEngine:
             step: ProofStep entity
 
         Returns:
-            bool: True if symbolically valid
+            Tuple[bool, bool]: (symbolically valid, degraded). Degraded
+            means no verdict was reached and the value is a fallback: valid
+            if SymPy raised, invalid if the check timed out or the worker
+            pool failed
         """
         try:
             # Check if step has an equation to verify
             if not hasattr(step, 'equation') or not step.equation:
                 # No equation to verify, consider valid
-                return True
+                return True, False
 
             # Handle different equation formats
             if isinstance(step.equation, dict):
@@ -154,73 +293,87 @@ class BackendProofEngine:
                     lhs, rhs = parts[0].strip(), parts[1].strip()
                 else:
                     # Invalid format, skip verification
-                    return True
+                    return True, False
             else:
                 # Unknown format, skip verification
-                return True
+                return True, False
 
             # Verify symbolic equivalence
             if lhs and rhs:
-                return await self.symbolic_verifier.verify_equation(lhs, rhs)
+                verdict = await self.symbolic_verifier.verify_equation(lhs, rhs)
+                return bool(verdict), verdict is None
             else:
                 # No equation content, consider valid
-                return True
+                return True, False
 
+        except DeadlineExceeded:
+            # Proof-level deadline expired: stop verifying, do not degrade
+            raise
         except Exception as e:
             print(f"[W] Symbolic verification error for step {step.id if hasattr(step, 'id') else 'unknown'}: {e}")
             # On error, assume valid (graceful degradation)
-            return True
+            return True, True
 
-    async def _evaluate_semantic(self, step, domain: str) -> float:
+    async def _evaluate_semantic(self, step, domain: str) -> Tuple[float, bool]:
         """
         Evaluate semantic quality of a proof step using LLM consensus.
 
         Uses multi-provider evaluation for reliability and calculates
         consensus score from all available LLM providers.
 
+        With LLM_TWO_PHASE the first pass asks for the score alone, with a
+        small completion budget. Only steps scoring below
+        LLM_REASONING_BELOW, or whose providers disagree by more than
+        LLM_QUORUM_TOLERANCE, are evaluated again with reasoning; that
+        considered score replaces the first-pass one.
+
         Args:
             step: ProofStep entity
             domain: Mathematical domain (algebra, calculus, logic, etc.)
 
         Returns:
-            float: Semantic score (0-100)
+            Tuple[float, bool]: Semantic score (0-100) and whether it is
+            degraded (see _semantic_score)
         """
         if not self.has_llm:
             # Fallback: return neutral score if no LLM available
             print("[W] No LLM providers - skipping semantic evaluation")
-            return 50.0
+            return NEUTRAL_SEMANTIC_SCORE, True
 
-        # Build evaluation prompt
-        prompt = self._build_evaluation_prompt(step, domain)
+        if not settings.LLM_TWO_PHASE:
+            options = self._semantic_options()
+            prompt = self._build_evaluation_prompt(step, domain, options.include_reasoning)
+            return self._semantic_score(await self._semantic_responses(prompt, options))
 
-        # Configure LLM options
-        options = EvaluationOptions(
-            temperature=0.3,  # Low temperature for consistent evaluation
-            max_tokens=300,   # Concise reasoning
-            json_mode=True    # Structured response
+        # Phase 1: score only
+        responses = await self._semantic_responses(
+            self._build_evaluation_prompt(step, domain, include_reasoning=False),
+            self._semantic_options(include_reasoning=False)
+        )
+        if not self._needs_reasoning(responses):
+            return self._semantic_score(responses)
+
+        # Phase 2: low or contested score, ask for the reasoning
+        scores = [r.score for r in responses]
+        print(f"    [>] Requesting reasoning for step {step.step_index} (first-pass scores {scores})")
+        reasoned = await self._semantic_responses(
+            self._build_evaluation_prompt(step, domain, include_reasoning=True),
+            self._semantic_options(include_reasoning=True)
         )
+        return self._semantic_score(reasoned or responses)
+
+    async def _semantic_responses(self, prompt: str, options: EvaluationOptions) -> List[LLMResponse]:
+        """
+        Collect provider responses for one prompt.
+
+        Parallel (or adaptively routed) evaluation first, then the
+        single-provider fallback chain.
 
+        Returns:
+            List[LLMResponse]: Responses, or an empty list if every provider failed
+        """
         try:
-            # Try parallel evaluation first (best reliability)
-            responses: List[LLMResponse] = await self.llm_adapter.evaluate_parallel(prompt, options)
-
-            if len(responses) > 1:
-                # Calculate consensus from multiple providers
-                consensus: ConsensusResult = self.llm_adapter.calculate_consensus(responses)
-
-                print(f"    [+] Semantic consensus: avg={consensus.average_score:.1f}, "
-                      f"coherence={consensus.coherence_score:.1f}, "
-                      f"providers={len(responses)}")
-
-                return consensus.average_score
-            elif len(responses) == 1:
-                # Single provider response
-                print(f"    [+] Semantic score (single provider): {responses[0].score}")
-                return float(responses[0].score)
-            else:
-                # No responses (should not happen)
-                print("[W] No LLM responses received")
-                return 50.0
+            return await self.llm_adapter.evaluate_routed(prompt, options)
 
         except ConnectionError as e:
             # All parallel evaluations failed, try fallback
@@ -229,47 +382,123 @@ class BackendProofEngine:
             try:
                 response: LLMResponse = await self.llm_adapter.evaluate_with_fallback(prompt, options)
                 print(f"    [+] Semantic score (fallback): {response.score} from {response.provider}")
-                return float(response.score)
+                return [response]
 
             except ConnectionError as fallback_error:
                 # All LLMs failed
                 print(f"[-] All LLM providers failed: {fallback_error}")
-                return 50.0  # Neutral score as fallback
+                return []
+
+    def _semantic_score(self, responses: List[LLMResponse]) -> Tuple[float, bool]:
+        """
+        Reduce provider responses to one semantic score.
 
-    def _build_evaluation_prompt(self, step, domain: str) -> str:
+        Returns:
+            Tuple[float, bool]: Consensus average or the single score, or
+            NEUTRAL_SEMANTIC_SCORE if there are no responses; and whether
+            the score is degraded (neutral, or not all from the models named
+            in the semantic engine version, e.g. a budget fallback)
+        """
+        degraded = not all(self.llm_adapter.matches_engine_version(r) for r in responses)
+        if len(responses) > 1:
+            # Calculate consensus from multiple providers
+            consensus: ConsensusResult = self.llm_adapter.calculate_consensus(responses)
+
+            print(f"    [+] Semantic consensus: avg={consensus.average_score:.1f}, "
+                  f"coherence={consensus.coherence_score:.1f}, "
+                  f"providers={len(responses)}")
+
+            return consensus.average_score, degraded
+        elif len(responses) == 1:
+            # Single provider response
+            print(f"    [+] Semantic score (single provider): {responses[0].score}")
+            return float(responses[0].score), degraded
+        else:
+            # No responses (all providers failed)
+            print("[W] No LLM responses received")
+            return NEUTRAL_SEMANTIC_SCORE, True  # Neutral score as fallback
+
+    def _needs_reasoning(self, responses: List[LLMResponse]) -> bool:
+        """
+        Decide whether a score-only first pass needs a reasoned second pass.
+
+        Args:
+            responses: First-pass responses
+
+        Returns:
+            bool: True if the average score is below LLM_REASONING_BELOW or
+            the scores spread wider than LLM_QUORUM_TOLERANCE
+        """
+        if not responses:
+            return False
+        scores = [r.score for r in responses]
+        if sum(scores) / len(scores) < settings.LLM_REASONING_BELOW:
+            return True
+        return max(scores) - min(scores) > settings.LLM_QUORUM_TOLERANCE
+
+    async def _evaluate_semantic_batch(self, steps: List, domain: str) -> Dict[int, Tuple[float, bool]]:
+        """
+        Score several steps with batched prompts (LLM_BATCH_SIZES).
+
+        Args:
+            steps: ProofStep entities needing a semantic score
+            domain: Mathematical domain
+
+        Returns:
+            Dict[int, Tuple[float, bool]]: Score and degraded flag per
+            step_index (see _semantic_score); steps no provider answered are
+            omitted and fall back to per-step evaluation
+        """
+        try:
+            # Batched prompts always ask for reasoning (score-only passes are per step)
+            options = self._semantic_options(include_reasoning=True)
+            responses = await self.llm_adapter.evaluate_steps(steps, domain, options)
+        except ConnectionError as e:
+            print(f"[W] Batched semantic evaluation failed: {e}")
+            return {}
+
+        scores = {}
+        for step_index, step_responses in responses.items():
+            degraded = not all(self.llm_adapter.matches_engine_version(r) for r in step_responses)
+            if len(step_responses) > 1:
+                scores[step_index] = (self.llm_adapter.calculate_consensus(step_responses).average_score, degraded)
+            elif step_responses:
+                scores[step_index] = (float(step_responses[0].score), degraded)
+        print(f"    [+] Batched semantic scores for {len(scores)}/{len(steps)} steps")
+        return scores
+
+    def _semantic_options(self, include_reasoning: Optional[bool] = None) -> EvaluationOptions:
+        """
+        LLM options for semantic evaluation (per step).
+
+        Args:
+            include_reasoning: Ask for reasoning (default: yes, unless streaming
+                without LLM_STREAM_REASONING). Score-only calls get a completion
+                budget of LLM_SCORE_ONLY_MAX_TOKENS.
+        """
+        if include_reasoning is None:
+            include_reasoning = settings.LLM_STREAM_REASONING or not settings.LLM_STREAMING
+        return EvaluationOptions(
+            temperature=0.3,  # Low temperature for consistent evaluation
+            max_tokens=300 if include_reasoning else settings.LLM_SCORE_ONLY_MAX_TOKENS,  # Concise reasoning
+            json_mode=True,   # Structured response
+            stream=settings.LLM_STREAMING,  # Parse the score as it arrives
+            include_reasoning=include_reasoning  # Only the score is used for the verdict
+        )
+
+    def _build_evaluation_prompt(self, step, domain: str, include_reasoning: bool = True) -> str:
         """
         Build evaluation prompt for LLM semantic analysis.
 
         Args:
             step: ProofStep entity
             domain: Mathematical domain
+            include_reasoning: Ask for reasoning (False = score only)
 
         Returns:
             str: Formatted evaluation prompt
         """
-        prompt = f"""Evaluate the following proof step from the domain of {domain}:
-
-**Claim**: {step.claim}
-**Equation**: {step.equation}
-**Reasoning**: {step.reasoning}
-
-Assess the logical soundness and correctness of this step. Consider:
-1. Does the reasoning justify the claim?
-2. Is the equation correctly derived?
-3. Are there any logical gaps or errors?
-4. Is the step appropriate for the {domain} domain?
-
-Provide a score from 0-100 where:
-- 0-30: Major logical errors or incorrect reasoning
-- 31-60: Some issues but partially correct
-- 61-85: Mostly correct with minor issues
-- 86-100: Logically sound and correct
-
-Respond in JSON format with:
-- "score": integer from 0-100
-- "reasoning": brief explanation of your evaluation
-"""
-        return prompt
+        return build_step_prompt(step, domain, include_reasoning)
 
     def _calculate_semantic_score_consistency(self, semantic_scores: List[float]) -> float:
         """
@@ -375,7 +604,7 @@ Respond in JSON format with:
         return feedback
 
 
-async def run_proof_verification(proof_id: int, db_url: str) -> None:
+async def run_proof_verification(proof_id: int, db_url: str, claimed: bool = False) -> None:
     """
     Background task to verify a proof.
 
@@ -384,22 +613,44 @@ async def run_proof_verification(proof_id: int, db_url: str) -> None:
     Args:
         proof_id: ID of proof to verify
         db_url: Database connection URL for creating new session
+        claimed: True if a worker already moved the proof to 'processing'
+                 (see crud.proof.claim_next_pending)
 
     Flow:
-        1. Update status to 'processing'
+        1. Update status to 'processing' (records start time and deadline)
         2. Load proof data with steps
-        3. Execute verification engine
-        4. Store results in database
+        3. Execute verification engine under a WORKER_TIMEOUT deadline
+        4. Store results in database (replacing any earlier result)
         5. Update status to 'completed' or 'failed'
+
+    Revalidation:
+        If the proof already has a result (POST /proofs/{id}/revalidate),
+        its step verdicts are passed to the engine so unchanged steps are
+        not re-verified.
+
+    Deadline:
+        The deadline is installed for the whole evaluation, so symbolic
+        jobs and LLM provider calls inherit it and are cancelled when it
+        expires. A proof that runs out of time is marked 'failed'.
+
+    Budget:
+        LLM usage is charged to the proof's tenant (see LLMBudget).
     """
     # Create independent database session for background task
-    engine = create_async_engine(str(db_url), echo=False)
-    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    db_engine = create_async_engine(str(db_url), echo=False)
+    session_maker = async_sessionmaker(db_engine, expire_on_commit=False)
+    deadline = Deadline(settings.WORKER_TIMEOUT)
 
     async with session_maker() as db:
         try:
             # Step 1: Update status to processing
-            await crud.proof.update_status(db, proof_id=proof_id, status="processing")
+            if not claimed:
+                await crud.proof.update_status(
+                    db,
+                    proof_id=proof_id,
+                    status="processing",
+                    timeout_seconds=settings.WORKER_TIMEOUT
+                )
             print(f"[>] Started verification for proof {proof_id}")
 
             # Step 2: Load proof data
@@ -408,41 +659,53 @@ async def run_proof_verification(proof_id: int, db_url: str) -> None:
                 print(f"[-] Proof {proof_id} not found")
                 return
 
-            # Step 3: Run verification engine
-            engine = BackendProofEngine()
-            result_data = await engine.evaluate(proof_data)
+            # Step 3: Run verification engine (cancelled when the deadline expires)
+            previous_step_results = proof_data.result.step_results if proof_data.result else None
+            with deadline_scope(deadline), tenant_scope(proof_data.tenant):
+                proof_engine = BackendProofEngine()
+                result_data = await with_deadline(
+                    proof_engine.evaluate(proof_data, previous_step_results=previous_step_results)
+                )
 
             # Step 4: Store result in database
-            await crud.proof.create_result(db=db, proof_id=proof_id, obj_in=result_data)
+            await crud.proof.save_result(db=db, proof_id=proof_id, obj_in=result_data)
 
             # Step 5: Update status to completed
             await crud.proof.update_status(db, proof_id=proof_id, status="completed")
             print(f"[+] Proof {proof_id} verification completed")
 
+        except DeadlineExceeded:
+            print(f"[-] Proof {proof_id} verification exceeded {settings.WORKER_TIMEOUT}s deadline")
+            try:
+                await crud.proof.update_status(
+                    db,
+                    proof_id=proof_id,
+                    status="failed",
+                    detail=f"Verification exceeded WORKER_TIMEOUT ({settings.WORKER_TIMEOUT}s)"
+                )
+            except Exception as update_error:
+                print(f"[-] Failed to update status: {update_error}")
+
         except Exception as e:
             # Handle errors: update status to failed
             print(f"[-] Proof {proof_id} verification failed: {e}")
             try:
-                await crud.proof.update_status(db, proof_id=proof_id, status="failed")
+                await crud.proof.update_status(
+                    db,
+                    proof_id=proof_id,
+                    status="failed",
+                    detail=str(e)[:255]
+                )
             except Exception as update_error:
                 print(f"[-] Failed to update status: {update_error}")
 
         finally:
             # Clean up database connection
-            await engine.dispose()
+            await db_engine.dispose()
 
 
 # [T] Future enhancements
 
-# class VerificationQueue:
-#     """Queue manager for proof verification tasks"""
-#     def __init__(self, max_concurrent: int = 5):
-#         self.semaphore = asyncio.Semaphore(max_concurrent)
-#
-#     async def enqueue(self, proof_id: int):
-#         async with self.semaphore:
-#             await run_proof_verification(proof_id)
-
 # async def validate_proof_structure(proof: Proof) -> bool:
 #     """Pre-validation before expensive verification"""
 #     # Check for cycles in dependencies
@@ -0,0 +1,277 @@
+# [B] ProofCore Backend - Verification Queue
+# In-process admission control and bounded concurrency for proof verification
+
+import math
+import time
+from typing import Awaitable, Callable, Dict, Optional, Sequence
+
+from app.core.config import settings
+from app.services.scheduler import FairShareScheduler, JobPriority, VerificationJob
+from app.services.verification import run_proof_verification
+
+
+class QueueFullError(Exception):
+    """Raised when the queue refuses new work; carries the suggested retry delay"""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class VerificationQueue:
+    """
+    Bounded queue in front of the verification engine.
+
+    Submissions are admitted only while the backlog is within
+    QUEUE_MAX_DEPTH and the oldest waiting proof is younger than
+    QUEUE_MAX_WAIT_SECONDS. At most MAX_CONCURRENT_VERIFICATIONS proofs
+    are verified at once; the rest wait here instead of piling up as
+    unbounded background tasks, and are dispatched in the order chosen by
+    FairShareScheduler (priority lanes, per-tenant fairness, shortest
+    expected job first).
+
+    Wait estimates are based on an exponentially weighted moving average
+    of recent job durations.
+    """
+
+    # Initial guess for job duration before any job has completed
+    DEFAULT_JOB_SECONDS = 5.0
+    # Smoothing factor for the job duration EWMA
+    EWMA_ALPHA = 0.2
+
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        max_wait_seconds: Optional[float] = None,
+        runner: Callable[..., Awaitable[None]] = run_proof_verification,
+        scheduler: Optional[FairShareScheduler] = None,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            max_concurrent: Parallel verifications (default: MAX_CONCURRENT_VERIFICATIONS)
+            max_depth: Admission limit on waiting proofs (default: QUEUE_MAX_DEPTH)
+            max_wait_seconds: Admission limit on oldest wait (default: QUEUE_MAX_WAIT_SECONDS)
+            runner: Coroutine function that verifies a single proof
+            scheduler: Dispatch ordering policy (default: new FairShareScheduler)
+        """
+        self.max_concurrent = max_concurrent or settings.MAX_CONCURRENT_VERIFICATIONS
+        self.max_depth = max_depth or settings.QUEUE_MAX_DEPTH
+        self.max_wait_seconds = max_wait_seconds or settings.QUEUE_MAX_WAIT_SECONDS
+        self._runner = runner
+
+        self._pending = scheduler or FairShareScheduler()
+        self._running = 0
+        self._avg_job_seconds = self.DEFAULT_JOB_SECONDS
+        self._completed = 0
+        self._rejected = 0
+
+    # [=] Admission control
+
+    def check_admission(self, count: int = 1) -> None:
+        """
+        Check whether `count` new proofs may be queued.
+
+        Args:
+            count: Number of proofs about to be submitted
+
+        Raises:
+            QueueFullError: If queue depth or oldest-job age is over its limit
+        """
+        self.check_backlog(len(self._pending), self.oldest_wait_seconds(), count)
+
+    def check_backlog(self, depth: int, oldest_wait: float, count: int = 1) -> None:
+        """
+        Apply the admission limits to a backlog measured elsewhere.
+
+        Used directly in worker mode, where the backlog is the set of
+        pending proofs in the database rather than this process's queue.
+
+        Args:
+            depth: Proofs currently waiting
+            oldest_wait: Seconds the oldest waiting proof has been queued
+            count: Number of proofs about to be submitted
+
+        Raises:
+            QueueFullError: If queue depth or oldest-job age is over its limit
+        """
+        if depth + count > self.max_depth:
+            self._rejected += 1
+            excess = depth + count - self.max_depth
+            raise QueueFullError(
+                f"Verification queue is full ({depth}/{self.max_depth} proofs waiting)",
+                self._retry_after(excess),
+            )
+
+        if oldest_wait > self.max_wait_seconds:
+            self._rejected += 1
+            raise QueueFullError(
+                f"Verification queue is behind (oldest proof waiting {oldest_wait:.0f}s, "
+                f"limit {self.max_wait_seconds:.0f}s)",
+                self._retry_after(depth),
+            )
+
+    def _retry_after(self, jobs_to_drain: int) -> int:
+        """Seconds until `jobs_to_drain` queued jobs should have been dispatched"""
+        return max(1, math.ceil(self._drain_seconds(jobs_to_drain)))
+
+    def _drain_seconds(
+        self,
+        jobs: int,
+        concurrency: Optional[int] = None,
+        job_seconds: Optional[float] = None
+    ) -> float:
+        """Estimated time for `jobs` queued proofs to start running"""
+        waves = math.ceil(jobs / (concurrency or self.max_concurrent))
+        return waves * (self._avg_job_seconds if job_seconds is None else job_seconds)
+
+    # [=] Enqueue and dispatch
+
+    def enqueue(
+        self,
+        proof_id: int,
+        db_url: str,
+        priority: JobPriority = JobPriority.INTERACTIVE,
+        tenant: str = "default",
+        cost: float = 1.0,
+    ) -> VerificationJob:
+        """
+        Add a proof to the queue.
+
+        The proof does not start until drain() is awaited (normally as a
+        FastAPI background task).
+
+        Args:
+            proof_id: ID of proof to verify
+            db_url: Database URL for the worker session
+            priority: Scheduling lane (interactive or bulk)
+            tenant: Tenant identifier for fair queueing
+            cost: Expected job cost (see estimate_job_cost)
+
+        Returns:
+            VerificationJob: The queued job
+        """
+        job = VerificationJob(
+            proof_id=proof_id,
+            db_url=str(db_url),
+            priority=JobPriority(priority),
+            tenant=tenant,
+            cost=cost,
+        )
+        self._pending.push(job)
+        return job
+
+    async def drain(self) -> None:
+        """
+        Run queued jobs while a concurrency slot is free.
+
+        Every caller keeps pulling jobs until the queue is empty or all
+        slots are taken, so a job is never stranded: whichever drain
+        finishes first picks up the next waiting proof.
+        """
+        while self._pending and self._running < self.max_concurrent:
+            job = self._pending.pop()
+            self._running += 1
+            started = time.monotonic()
+            try:
+                await self._runner(proof_id=job.proof_id, db_url=job.db_url)
+            except Exception as e:
+                print(f"[-] Queued verification for proof {job.proof_id} crashed: {e}")
+            finally:
+                self._running -= 1
+                self._record_duration(time.monotonic() - started)
+
+    def _record_duration(self, seconds: float) -> None:
+        """Fold a completed job duration into the moving average"""
+        self._completed += 1
+        self._avg_job_seconds += self.EWMA_ALPHA * (seconds - self._avg_job_seconds)
+
+    # [=] Introspection
+
+    def depth(self) -> int:
+        """Number of proofs waiting to start"""
+        return len(self._pending)
+
+    def oldest_wait_seconds(self) -> float:
+        """How long the oldest waiting proof has been queued"""
+        oldest = self._pending.oldest()
+        if oldest is None:
+            return 0.0
+        return time.monotonic() - oldest.enqueued_at
+
+    def estimated_wait_seconds(self) -> float:
+        """Estimated wait before a newly submitted proof starts verification"""
+        if self._running < self.max_concurrent and not self._pending:
+            return 0.0
+        return self._drain_seconds(len(self._pending) + 1)
+
+    def get_stats(self) -> dict:
+        """Get queue statistics for clients and monitoring"""
+        depth = len(self._pending)
+        oldest_wait = self.oldest_wait_seconds()
+        return {
+            "depth": depth,
+            "running": self._running,
+            "max_depth": self.max_depth,
+            "max_concurrent": self.max_concurrent,
+            "oldest_wait_seconds": round(oldest_wait, 2),
+            "max_wait_seconds": self.max_wait_seconds,
+            "estimated_wait_seconds": round(self.estimated_wait_seconds(), 2),
+            "average_job_seconds": round(self._avg_job_seconds, 2),
+            "accepting": depth < self.max_depth and oldest_wait <= self.max_wait_seconds,
+            "lanes": self._pending.lane_depths(),
+            "completed": self._completed,
+            "rejected": self._rejected,
+        }
+
+    def backlog_stats(
+        self,
+        depth: int,
+        oldest_wait: float,
+        running: int,
+        lanes: Dict[str, int],
+        durations: Sequence[float] = ()
+    ) -> dict:
+        """
+        Queue statistics for a backlog measured elsewhere (worker mode).
+
+        The worker nodes' combined capacity is not known here, so it is
+        taken as the larger of MAX_CONCURRENT_VERIFICATIONS and the proofs
+        currently running, and job time as the mean of `durations`.
+
+        Args:
+            depth: Proofs currently waiting
+            oldest_wait: Seconds the oldest waiting proof has been queued
+            running: Proofs currently being verified by any worker
+            lanes: Waiting proofs per priority lane
+            durations: Recent verification durations in seconds
+
+        Returns:
+            dict: Same fields as get_stats(), without this process's completed count
+        """
+        job_seconds = sum(durations) / len(durations) if durations else self.DEFAULT_JOB_SECONDS
+        capacity = max(self.max_concurrent, running)
+        if running < capacity and not depth:
+            estimated_wait = 0.0
+        else:
+            estimated_wait = self._drain_seconds(depth + 1, capacity, job_seconds)
+        return {
+            "depth": depth,
+            "running": running,
+            "max_depth": self.max_depth,
+            "max_concurrent": capacity,
+            "oldest_wait_seconds": round(oldest_wait, 2),
+            "max_wait_seconds": self.max_wait_seconds,
+            "estimated_wait_seconds": round(estimated_wait, 2),
+            "average_job_seconds": round(job_seconds, 2),
+            "accepting": depth < self.max_depth and oldest_wait <= self.max_wait_seconds,
+            "lanes": {priority.value: lanes.get(priority.value, 0) for priority in JobPriority},
+            "rejected": self._rejected,
+        }
+
+
+# [+] Global queue instance
+verification_queue = VerificationQueue()
@@ -0,0 +1,119 @@
+# [B] ProofCore Backend - Verification Worker
+# Claims pending proofs from the database; woken by Postgres NOTIFY
+
+import asyncio
+import time
+from typing import Optional, Set
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app import crud
+from app.core.config import settings
+from app.services.llm.clients import provider_clients
+from app.services.llm_adapter import warm_up_providers
+from app.services.notify import ProofQueueListener
+from app.services.reaper import StaleProofReaper
+from app.services.symbolic_verifier import symbolic_pool
+from app.services.verification import run_proof_verification
+
+
+class ProofWorker:
+    """
+    Worker node for VERIFICATION_MODE=worker.
+
+    Claims pending proofs with SELECT ... FOR UPDATE SKIP LOCKED, runs up
+    to `concurrency` verifications at once, and sleeps on a LISTEN
+    connection while idle. Submit and requeue paths NOTIFY, so pickup
+    latency is one notification round trip; the slow poll only matters
+    if a notification is lost.
+    """
+
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            database_url: SQLAlchemy URL (default: DATABASE_URL)
+            concurrency: Parallel verifications (default: MAX_CONCURRENT_VERIFICATIONS)
+            poll_interval: Fallback poll period (default: WORKER_POLL_INTERVAL_SECONDS)
+        """
+        self.database_url = database_url or settings.DATABASE_URL
+        self.concurrency = concurrency or settings.MAX_CONCURRENT_VERIFICATIONS
+        self.poll_interval = poll_interval or settings.WORKER_POLL_INTERVAL_SECONDS
+
+        self.listener = ProofQueueListener(self.database_url)
+        self._engine = create_async_engine(self.database_url, echo=False)
+        self._session_maker = async_sessionmaker(self._engine, class_=AsyncSession, expire_on_commit=False)
+        self._reaper = StaleProofReaper(session_maker=self._session_maker)
+        self._tasks: Set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+
+        self.claimed = 0
+        self.last_pickup_ms: Optional[float] = None
+
+    async def claim_one(self) -> Optional[int]:
+        """Claim a single pending proof, or return None if there is none"""
+        async with self._session_maker() as db:
+            return await crud.proof.claim_next_pending(db, timeout_seconds=settings.WORKER_TIMEOUT)
+
+    async def run(self) -> None:
+        """Claim and verify proofs until stop() is called"""
+        await self.listener.start()
+        self._reaper.start()
+        warm_up_providers()
+        print(f"[*] Worker started (concurrency={self.concurrency}, poll={self.poll_interval:.0f}s)")
+
+        try:
+            while not self._stopping.is_set():
+                # Fill free slots with pending proofs
+                while len(self._tasks) < self.concurrency:
+                    proof_id = await self.claim_one()
+                    if proof_id is None:
+                        # Any NOTIFY received was for a proof another worker took
+                        self.listener.notified_at = None
+                        break
+                    self._record_pickup()
+                    self._spawn(proof_id)
+
+                # Idle (or saturated): sleep until NOTIFY, a finished job, or the slow poll
+                await self.listener.wait(self.poll_interval)
+        finally:
+            await self._reaper.stop()
+            await self.listener.stop()
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+            await provider_clients.aclose()
+            symbolic_pool.shutdown()
+            await self._engine.dispose()
+            print("[-] Worker stopped")
+
+    def _record_pickup(self) -> None:
+        """Record NOTIFY-to-claim latency if a notification led to this claim"""
+        notified_at = self.listener.notified_at
+        if notified_at is not None:
+            self.last_pickup_ms = (time.monotonic() - notified_at) * 1000
+            self.listener.notified_at = None
+
+    def _spawn(self, proof_id: int) -> None:
+        """Verify a claimed proof in the background"""
+        self.claimed += 1
+        task = asyncio.get_running_loop().create_task(
+            run_proof_verification(proof_id=proof_id, db_url=self.database_url, claimed=True)
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._on_done)
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        # A slot is free: look for more work without waiting for a NOTIFY
+        self.listener.wake()
+
+    def stop(self) -> None:
+        """Ask the run loop to exit after in-flight proofs finish"""
+        self._stopping.set()
+        self.listener.wake()
@@ -7,8 +7,13 @@ from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
+from app.db import base
 from app.db.base import init_db, create_tables
 from app.api.router import api_router
+from app.services.llm.clients import provider_clients
+from app.services.llm_adapter import warm_up_providers
+from app.services.reaper import stale_proof_reaper
+from app.services.symbolic_verifier import symbolic_pool
 
 
 @asynccontextmanager
@@ -19,9 +24,15 @@ async def lifespan(app: FastAPI):
     Startup:
         - Initialize database connection
         - Create tables (development mode only)
+        - Requeue pending proofs lost with the in-memory queue (inline mode)
+        - Start stale-job reaper
+        - Build shared LLM provider clients
         - Log configuration
 
     Shutdown:
+        - Stop stale-job reaper
+        - Close LLM provider connection pool
+        - Stop SymPy worker processes
         - Close database connections
         - Clean up resources
     """
@@ -38,9 +49,23 @@ async def lifespan(app: FastAPI):
         await create_tables()
         print("[+] Database tables created (development mode)")
 
+    # Inline mode: the in-memory queue did not survive the restart
+    async with base.async_session_maker() as db:
+        await stale_proof_reaper.recover_pending(db)
+
+    # Requeue or fail proofs stuck in 'processing' (hung or crashed workers)
+    stale_proof_reaper.start()
+    print(f"[+] Stale-job reaper started (every {settings.REAPER_INTERVAL_SECONDS:.0f}s)")
+
+    # One pooled, keep-alive client per provider for the whole process
+    warm_up_providers()
+
     yield
 
     # [#] Shutdown
+    await stale_proof_reaper.stop()
+    await provider_clients.aclose()
+    symbolic_pool.shutdown()
     print(f"[-] Shutting down {settings.APP_NAME}")
 
 
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+ProofCore Backend - Bulk Semantic Evaluation
+
+Scores every step of many proofs through the provider batch APIs
+(OpenAI Batch, Anthropic Message Batches) ahead of verification, for
+nightly re-benchmarks where throughput and cost matter and latency
+does not. Responses land in the shared LLM response cache, so the
+verification workers then serve the semantic pass from the cache.
+
+Steps are prompted the way the engine's first semantic pass prompts
+them (score-only with LLM_TWO_PHASE), so the cache keys match.
+
+Usage:
+    cd backend
+    python scripts/bulk_evaluate.py --status pending
+    python scripts/bulk_evaluate.py --batch-id 3f0c9a7e5b2d --poll-seconds 30
+
+    # Against the fake provider server (start it first)
+    OPENAI_BASE_URL=http://127.0.0.1:8900/v1 OPENAI_API_KEY=fake python scripts/bulk_evaluate.py
+
+Requires LLM_CACHE_ENABLED (the results are only useful through the cache).
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path (parent of scripts/)
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+
+async def run(args: argparse.Namespace) -> int:
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.orm import selectinload
+
+    from app.core.config import settings
+    from app.models.proof import Proof
+    from app.services.llm.budget import tenant_scope
+    from app.services.llm.clients import provider_clients
+    from app.services.verification import BackendProofEngine
+
+    if not settings.LLM_CACHE_ENABLED:
+        print("[-] LLM_CACHE_ENABLED is off; bulk results would not reach the workers")
+        return 1
+
+    query = select(Proof).options(selectinload(Proof.steps)).order_by(Proof.id).limit(args.limit)
+    if args.batch_id:
+        query = query.where(Proof.batch_id == args.batch_id)
+    if args.status != "any":
+        query = query.where(Proof.status == args.status)
+
+    db_engine = create_async_engine(settings.DATABASE_URL, echo=False)
+    async with async_sessionmaker(db_engine, expire_on_commit=False)() as db:
+        proofs = list((await db.execute(query)).scalars().all())
+    await db_engine.dispose()
+
+    engine = BackendProofEngine()
+    if not engine.has_llm:
+        print("[-] No LLM providers available")
+        return 1
+
+    # Same prompts and options as the engine's first semantic pass
+    include_reasoning = False if settings.LLM_TWO_PHASE else None
+    options = engine._semantic_options(include_reasoning=include_reasoning)
+    prompts = {
+        f"{proof.id}:{step.step_index}": engine._build_evaluation_prompt(step, proof.domain, options.include_reasoning)
+        for proof in proofs
+        for step in proof.steps
+    }
+    print(f"[>] {len(prompts)} steps from {len(proofs)} proofs | providers: "
+          f"{', '.join(engine.llm_adapter.get_available_providers())}")
+
+    started = time.perf_counter()
+    with tenant_scope(args.tenant):
+        results = await engine.llm_adapter.evaluate_bulk(
+            prompts, options, poll_interval=args.poll_seconds, timeout=args.timeout_seconds
+        )
+    elapsed = time.perf_counter() - started
+    await provider_clients.aclose()
+
+    answered = sum(1 for responses in results.values() if responses)
+    fresh = [r for responses in results.values() for r in responses if not r.cached]
+    print()
+    print(f"Steps answered: {answered}/{len(prompts)} in {elapsed:.0f}s")
+    print(f"Fresh responses: {len(fresh)}, cost ${sum(r.cost for r in fresh):.4f}, "
+          f"tokens {sum(r.usage.total_tokens for r in fresh)}")
+    return 0 if answered == len(prompts) else 2
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Prefill the LLM response cache through provider batch APIs")
+    parser.add_argument("--batch-id", dest="batch_id", help="Only proofs of this submission batch")
+    parser.add_argument("--status", default="pending", help="Only proofs in this status ('any' for all)")
+    parser.add_argument("--limit", type=int, default=100_000, help="Maximum proofs to include")
+    parser.add_argument("--tenant", default="default", help="Tenant charged for the LLM usage")
+    parser.add_argument("--poll-seconds", dest="poll_seconds", type=float, help="Seconds between job status checks")
+    parser.add_argument("--timeout-seconds", dest="timeout_seconds", type=float, help="Seconds to wait for a job")
+    args = parser.parse_args()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,640 @@
+#!/usr/bin/env python3
+"""
+ProofCore Backend - Fake LLM Provider Server
+
+Stand-in for the OpenAI, Anthropic and Gemini APIs for load testing.
+Speaks each provider's wire format (including streaming, and the
+OpenAI Batch and Anthropic Message Batches job endpoints), with
+configurable latency distributions, 429/5xx rates and token counts.
+Answers are valid evaluation JSON, with scores derived from the prompt
+so repeated prompts score alike.
+
+Point the backend at it with the base-URL settings:
+    OPENAI_BASE_URL=http://127.0.0.1:8900/v1
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8900
+    GOOGLE_BASE_URL=http://127.0.0.1:8900
+(plus any non-empty API keys).
+
+Usage:
+    cd backend
+    python scripts/fake_llm_server.py --port 8900 --latency-ms 800 --rate-limit-rate 0.05
+    python scripts/fake_llm_server.py --config fake_llm.json
+
+The --config file maps provider names to profile fields, e.g.
+    {"openai": {"latency_ms": 600, "server_error_rate": 0.02},
+     "anthropic": {"latency_ms": 1200, "latency_sigma": 0.8}}
+"""
+
+import argparse
+import asyncio
+import email.parser
+import email.policy
+import hashlib
+import json
+import math
+import random
+import re
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+# Add backend to path (parent of scripts/)
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field
+
+from app.services.llm.prompts import BATCH_SYSTEM_MESSAGE, SCORE_ONLY_SYSTEM_MESSAGE, split_cacheable_prefix
+
+PROVIDERS = ("openai", "anthropic", "google")
+
+_STEP_HEADER = re.compile(r"^### Step (\d+)\s*$", re.MULTILINE)
+
+
+class FakeProviderProfile(BaseModel):
+    """Simulated behavior of one provider"""
+    latency_ms: float = Field(800.0, ge=0, description="Median response latency")
+    latency_sigma: float = Field(0.5, ge=0, description="Log-normal spread of latency (0 = constant)")
+    latency_max_ms: float = Field(30000.0, ge=0, description="Latency cap")
+    first_token_fraction: float = Field(0.3, ge=0, le=1, description="Share of latency before the first streamed chunk")
+    rate_limit_rate: float = Field(0.0, ge=0, le=1, description="Fraction of calls answered with 429")
+    retry_after_seconds: Optional[float] = Field(1.0, ge=0, description="Retry-After sent with 429s (None = omit)")
+    server_error_rate: float = Field(0.0, ge=0, le=1, description="Fraction of calls answered with 5xx")
+    completion_tokens: int = Field(120, ge=1, description="Completion tokens per answer (reasoning is padded to match)")
+    score_low: int = Field(20, ge=0, le=100, description="Lowest score produced")
+    score_high: int = Field(95, ge=0, le=100, description="Highest score produced")
+    score_noise: int = Field(5, ge=0, description="Per-call random offset (+/- points), so providers disagree a little")
+    stream_chunks: int = Field(8, ge=1, description="Chunks a streamed answer is split into")
+    prompt_cache_min_tokens: int = Field(1024, ge=0, description="Shortest prompt prefix the simulated prompt cache stores")
+    cached_latency_factor: float = Field(0.8, ge=0, description="Latency multiplier when the prompt prefix is served from cache")
+    batch_latency_ms: float = Field(5000.0, ge=0, description="Time a batch job takes to finish after it is created")
+
+
+class FakeServerStats:
+    """Per-provider call counters (GET /stats)"""
+
+    def __init__(self):
+        self.counts: Dict[str, Dict[str, int]] = {
+            name: {"requests": 0, "ok": 0, "rate_limited": 0, "server_errors": 0} for name in PROVIDERS
+        }
+
+    def record(self, provider: str, outcome: str) -> None:
+        self.counts[provider]["requests"] += 1
+        self.counts[provider][outcome] += 1
+
+
+# [=] Simulation
+
+def estimate_tokens(text: str) -> int:
+    """~4 characters per token, the same estimate the backend uses"""
+    return max(1, len(text) // 4)
+
+
+def sample_latency(profile: FakeProviderProfile, rng: random.Random) -> float:
+    """Log-normal latency in seconds around the profile median"""
+    latency = profile.latency_ms * math.exp(profile.latency_sigma * rng.gauss(0.0, 1.0))
+    return min(latency, profile.latency_max_ms) / 1000.0
+
+
+def choose_failure(profile: FakeProviderProfile, rng: random.Random) -> Optional[str]:
+    """'rate_limited', 'server_errors' or None for a successful call"""
+    roll = rng.random()
+    if roll < profile.rate_limit_rate:
+        return "rate_limited"
+    if roll < profile.rate_limit_rate + profile.server_error_rate:
+        return "server_errors"
+    return None
+
+
+def _score(text: str, profile: FakeProviderProfile, rng: random.Random) -> int:
+    digest = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:4], "big")
+    span = max(0, profile.score_high - profile.score_low)
+    base = profile.score_low + digest % (span + 1)
+    noisy = base + rng.randint(-profile.score_noise, profile.score_noise)
+    return max(profile.score_low, min(profile.score_high, noisy))
+
+
+def _padded_reasoning(tokens: int) -> str:
+    sentence = "The step follows from the previous one under the stated assumptions. "
+    return (sentence * (tokens * 4 // len(sentence) + 1))[: max(10, tokens * 4)].strip()
+
+
+def answer_text(prompt: str, system: str, profile: FakeProviderProfile, rng: random.Random) -> str:
+    """
+    Evaluation JSON for a prompt, sized to roughly profile.completion_tokens.
+
+    Batched prompts (BATCH_SYSTEM_MESSAGE) get a 'results' array with one
+    entry per '### Step N' block, score-only prompts just the score, and
+    everything else score and reasoning.
+    """
+    if system == SCORE_ONLY_SYSTEM_MESSAGE:
+        return json.dumps({"score": _score(prompt, profile, rng)})
+    if system == BATCH_SYSTEM_MESSAGE:
+        steps = _STEP_HEADER.findall(prompt) or ["0"]
+        per_step = max(1, profile.completion_tokens // len(steps) - 8)
+        results = [
+            {"step": int(step), "score": _score(f"{prompt}#{step}", profile, rng), "reasoning": _padded_reasoning(per_step)}
+            for step in steps
+        ]
+        return json.dumps({"results": results})
+    return json.dumps({
+        "score": _score(prompt, profile, rng),
+        "reasoning": _padded_reasoning(max(1, profile.completion_tokens - 8)),
+    })
+
+
+def split_chunks(text: str, count: int) -> List[str]:
+    size = max(1, math.ceil(len(text) / count))
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+# [=] Wire formats
+
+def _error_body(provider: str, failure: str) -> Tuple[int, dict]:
+    """Status and provider error body for a simulated failure"""
+    if failure == "rate_limited":
+        status, message = 429, "Rate limit exceeded (simulated)"
+    else:
+        status, message = (529 if provider == "anthropic" else 503), "Service unavailable (simulated)"
+
+    if provider == "openai":
+        body = {"error": {"message": message, "type": "rate_limit_error" if status == 429 else "server_error", "code": None}}
+    elif provider == "anthropic":
+        body = {"type": "error", "error": {"type": "rate_limit_error" if status == 429 else "overloaded_error", "message": message}}
+    else:
+        body = {"error": {"code": status, "message": message, "status": "RESOURCE_EXHAUSTED" if status == 429 else "UNAVAILABLE"}}
+    return status, body
+
+
+def _error(provider: str, failure: str, profile: FakeProviderProfile) -> JSONResponse:
+    status, body = _error_body(provider, failure)
+    headers = {}
+    if status == 429 and profile.retry_after_seconds is not None:
+        headers["retry-after"] = f"{profile.retry_after_seconds:g}"
+    return JSONResponse(body, status_code=status, headers=headers)
+
+
+def _sse(data: dict, event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+
+class FakeUsage(BaseModel):
+    """Token accounting for one answer (cached and cache_write are subsets of prompt)"""
+    prompt: int
+    completion: int
+    cached: int = 0
+    cache_write: int = 0
+
+
+def _openai_body(model: str, text: str, usage: FakeUsage) -> dict:
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+        "usage": {
+            "prompt_tokens": usage.prompt,
+            "completion_tokens": usage.completion,
+            "total_tokens": usage.prompt + usage.completion,
+            "prompt_tokens_details": {"cached_tokens": usage.cached},
+        },
+    }
+
+
+def _openai_events(model: str, chunks: List[str], usage: FakeUsage) -> List[str]:
+    ident, created = f"chatcmpl-{uuid.uuid4().hex[:24]}", int(time.time())
+
+    def chunk(delta: dict, finish: Optional[str] = None) -> str:
+        return _sse({
+            "id": ident, "object": "chat.completion.chunk", "created": created, "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+        })
+
+    events = [chunk({"role": "assistant", "content": chunks[0]})]
+    events += [chunk({"content": part}) for part in chunks[1:]]
+    events += [chunk({}, "stop"), "data: [DONE]\n\n"]
+    return events
+
+
+def _anthropic_usage(usage: FakeUsage) -> dict:
+    # input_tokens excludes cache reads and writes
+    return {
+        "input_tokens": usage.prompt - usage.cached - usage.cache_write,
+        "output_tokens": usage.completion,
+        "cache_read_input_tokens": usage.cached,
+        "cache_creation_input_tokens": usage.cache_write,
+    }
+
+
+def _anthropic_body(model: str, text: str, usage: FakeUsage) -> dict:
+    return {
+        "id": f"msg_{uuid.uuid4().hex[:24]}",
+        "type": "message",
+        "role": "assistant",
+        "model": model,
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": _anthropic_usage(usage),
+    }
+
+
+def _anthropic_events(model: str, chunks: List[str], usage: FakeUsage) -> List[str]:
+    message = _anthropic_body(model, "", usage.model_copy(update={"completion": 1}))
+    message["content"], message["stop_reason"] = [], None
+    events = [
+        _sse({"type": "message_start", "message": message}, "message_start"),
+        _sse({"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}}, "content_block_start"),
+    ]
+    events += [
+        _sse({"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": part}}, "content_block_delta")
+        for part in chunks
+    ]
+    events += [
+        _sse({"type": "content_block_stop", "index": 0}, "content_block_stop"),
+        _sse({"type": "message_delta", "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+              "usage": {"output_tokens": usage.completion}}, "message_delta"),
+        _sse({"type": "message_stop"}, "message_stop"),
+    ]
+    return events
+
+
+def _google_body(text: str, usage: FakeUsage) -> dict:
+    return {
+        "candidates": [{"content": {"parts": [{"text": text}], "role": "model"}, "finishReason": "STOP", "index": 0}],
+        "usageMetadata": {
+            "promptTokenCount": usage.prompt,
+            "candidatesTokenCount": usage.completion,
+            "totalTokenCount": usage.prompt + usage.completion,
+            "cachedContentTokenCount": usage.cached,
+        },
+    }
+
+
+def _google_events(chunks: List[str], usage: FakeUsage) -> List[str]:
+    events = []
+    for i, part in enumerate(chunks):
+        body = _google_body(part, usage)
+        if i < len(chunks) - 1:
+            del body["candidates"][0]["finishReason"]
+        events.append(_sse(body))
+    return events
+
+
+def _automatic_prefix(system: str, prompt: str) -> str:
+    """Prefix OpenAI and Gemini cache without being asked: system plus stable instructions"""
+    prefix, _ = split_cacheable_prefix(prompt)
+    return system + prefix if prefix else ""
+
+
+def _openai_request(body: dict) -> Tuple[str, str, str, bool]:
+    system = "\n".join(m.get("content") or "" for m in body.get("messages", []) if m.get("role") == "system")
+    prompt = "\n".join(m.get("content") or "" for m in body.get("messages", []) if m.get("role") != "system")
+    return body.get("model", "gpt-4o"), system, prompt, bool(body.get("stream"))
+
+
+def _text_of(content) -> str:
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content or [] if isinstance(block, dict))
+
+
+def _anthropic_request(body: dict) -> Tuple[str, str, str, bool, str]:
+    """Model, system, prompt, stream flag, and the text up to the last cache_control breakpoint"""
+    blocks = [block for block in body.get("system") or [] if isinstance(block, dict)]
+    for message in body.get("messages", []):
+        content = message.get("content")
+        blocks += [block for block in content if isinstance(block, dict)] if isinstance(content, list) else [{"text": content or ""}]
+    marked = [i for i, block in enumerate(blocks) if block.get("cache_control")]
+    cached_prefix = "".join(block.get("text", "") for block in blocks[:marked[-1] + 1]) if marked else ""
+
+    system = _text_of(body.get("system"))
+    prompt = "\n".join(_text_of(m.get("content")) for m in body.get("messages", []))
+    return body.get("model", "claude-3-5-sonnet-20240620"), system, prompt, bool(body.get("stream")), cached_prefix
+
+
+def _google_request(body: dict) -> Tuple[str, str]:
+    system = "".join(p.get("text", "") for p in (body.get("systemInstruction") or {}).get("parts", []))
+    prompt = "\n".join(
+        p.get("text", "") for content in body.get("contents", []) for p in content.get("parts", [])
+    )
+    return system, prompt
+
+
+def _multipart_fields(body: bytes, content_type: str) -> Dict[str, bytes]:
+    """Fields of a multipart/form-data body by name (file upload to /v1/files)"""
+    message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("latin-1") + body
+    )
+    return {
+        part.get_param("name", header="content-disposition"): part.get_payload(decode=True) or b""
+        for part in message.iter_parts()
+    }
+
+
+def _jsonl(lines: List[dict]) -> str:
+    return "".join(json.dumps(line) + "\n" for line in lines)
+
+
+class FakeBatchJob:
+    """A submitted batch job: requests are answered when it is created, released when it finishes"""
+
+    def __init__(self, provider: str, lines: List[dict], finishes_at: float, input_file_id: Optional[str] = None):
+        self.id = f"batch_{uuid.uuid4().hex[:24]}" if provider == "openai" else f"msgbatch_{uuid.uuid4().hex[:24]}"
+        self.provider = provider
+        self.input_file_id = input_file_id
+        self.created_at = int(time.time())
+        self.lines = lines
+        self.finishes_at = finishes_at
+
+    @property
+    def finished(self) -> bool:
+        return time.monotonic() >= self.finishes_at
+
+    def ok(self, line: dict) -> bool:
+        if self.provider == "openai":
+            return line["response"]["status_code"] == 200
+        return line["result"]["type"] == "succeeded"
+
+    @property
+    def failed(self) -> int:
+        return sum(not self.ok(line) for line in self.lines)
+
+
+# [=] Application
+
+def create_app(
+    profiles: Optional[Dict[str, FakeProviderProfile]] = None,
+    seed: Optional[int] = None,
+) -> FastAPI:
+    """
+    Build the fake provider app.
+
+    Args:
+        profiles: Behavior per provider (unlisted providers use defaults)
+        seed: Random seed for reproducible latencies, failures and noise
+
+    Returns:
+        FastAPI: App serving the OpenAI, Anthropic and Gemini endpoints
+    """
+    profiles = {name: (profiles or {}).get(name) or FakeProviderProfile() for name in PROVIDERS}
+    rng = random.Random(seed)
+    stats = FakeServerStats()
+    cached_prefixes = set()
+    app = FastAPI(title="ProofCore Fake LLM Server")
+    app.state.profiles = profiles
+    app.state.stats = stats
+
+    batch_files: Dict[str, str] = {}
+    batch_jobs: Dict[str, FakeBatchJob] = {}
+
+    def answer(provider: str, system: str, prompt: str, cacheable_prefix: str) -> Tuple[str, FakeUsage, bool]:
+        """Answer text and usage for a successful call, and whether its prefix was cached"""
+        profile = profiles[provider]
+        stats.record(provider, "ok")
+        text = answer_text(prompt, system, profile, rng)
+        usage = FakeUsage(prompt=estimate_tokens(system + prompt), completion=estimate_tokens(text))
+
+        # Simulated prompt cache: a repeated prefix is read, a new one written
+        prefix_tokens = estimate_tokens(cacheable_prefix) if cacheable_prefix else 0
+        if prefix_tokens and prefix_tokens >= profile.prompt_cache_min_tokens:
+            key = (provider, hashlib.sha256(cacheable_prefix.encode("utf-8")).hexdigest())
+            if key in cached_prefixes:
+                usage.cached = prefix_tokens
+                return text, usage, True
+            cached_prefixes.add(key)
+            usage.cache_write = prefix_tokens if provider == "anthropic" else 0
+        return text, usage, False
+
+    async def respond(
+        provider: str,
+        system: str,
+        prompt: str,
+        stream: bool,
+        render_body,
+        render_events,
+        cacheable_prefix: str = "",
+    ):
+        profile = profiles[provider]
+        latency = sample_latency(profile, rng)
+        failure = choose_failure(profile, rng)
+        if failure is not None:
+            await asyncio.sleep(latency * profile.first_token_fraction)
+            stats.record(provider, failure)
+            return _error(provider, failure, profile)
+
+        text, usage, prefix_cached = answer(provider, system, prompt, cacheable_prefix)
+        if prefix_cached:
+            latency *= profile.cached_latency_factor
+
+        if not stream:
+            await asyncio.sleep(latency)
+            return JSONResponse(render_body(text, usage))
+
+        chunks = split_chunks(text, profile.stream_chunks)
+        events = render_events(chunks, usage)
+        first_wait = latency * profile.first_token_fraction
+        step_wait = (latency - first_wait) / max(1, len(events) - 1)
+
+        async def emit() -> AsyncIterator[str]:
+            await asyncio.sleep(first_wait)
+            for i, event in enumerate(events):
+                if i:
+                    await asyncio.sleep(step_wait)
+                yield event
+
+        return StreamingResponse(emit(), media_type="text/event-stream")
+
+    @app.post("/v1/chat/completions")
+    async def openai_chat(request: Request):
+        model, system, prompt, stream = _openai_request(await request.json())
+        return await respond(
+            "openai", system, prompt, stream,
+            lambda text, usage: _openai_body(model, text, usage),
+            lambda chunks, usage: _openai_events(model, chunks, usage),
+            _automatic_prefix(system, prompt),
+        )
+
+    @app.post("/v1/messages")
+    async def anthropic_messages(request: Request):
+        model, system, prompt, stream, cached_prefix = _anthropic_request(await request.json())
+        return await respond(
+            "anthropic", system, prompt, stream,
+            lambda text, usage: _anthropic_body(model, text, usage),
+            lambda chunks, usage: _anthropic_events(model, chunks, usage),
+            cached_prefix,
+        )
+
+    @app.post("/v1beta/models/{model}:generateContent")
+    async def google_generate(model: str, request: Request):
+        system, prompt = _google_request(await request.json())
+        return await respond("google", system, prompt, False, _google_body, None, _automatic_prefix(system, prompt))
+
+    @app.post("/v1beta/models/{model}:streamGenerateContent")
+    async def google_stream(model: str, request: Request):
+        system, prompt = _google_request(await request.json())
+        return await respond("google", system, prompt, True, _google_body, _google_events, _automatic_prefix(system, prompt))
+
+    # Batch jobs: every request is answered at creation and the results
+    # are released once batch_latency_ms has passed
+
+    def batch_line(provider: str, custom_id: str, body: dict) -> dict:
+        failure = choose_failure(profiles[provider], rng)
+        if failure is not None:
+            stats.record(provider, failure)
+            status, error = _error_body(provider, failure)
+        if provider == "openai":
+            if failure is None:
+                model, system, prompt, _ = _openai_request(body)
+                text, usage, _ = answer(provider, system, prompt, _automatic_prefix(system, prompt))
+                status, error = 200, _openai_body(model, text, usage)
+            return {
+                "id": f"batch_req_{uuid.uuid4().hex[:24]}", "custom_id": custom_id,
+                "response": {"status_code": status, "request_id": uuid.uuid4().hex, "body": error}, "error": None,
+            }
+        if failure is not None:
+            return {"custom_id": custom_id, "result": {"type": "errored", "error": error}}
+        model, system, prompt, _, cached_prefix = _anthropic_request(body)
+        text, usage, _ = answer(provider, system, prompt, cached_prefix)
+        return {"custom_id": custom_id, "result": {"type": "succeeded", "message": _anthropic_body(model, text, usage)}}
+
+    def new_batch(provider: str, lines: List[dict], input_file_id: Optional[str] = None) -> FakeBatchJob:
+        finishes_at = time.monotonic() + profiles[provider].batch_latency_ms / 1000.0
+        job = FakeBatchJob(provider, lines, finishes_at, input_file_id)
+        batch_jobs[job.id] = job
+        return job
+
+    def openai_batch(job: FakeBatchJob) -> dict:
+        # Successful requests go to the output file, failed ones to the error file
+        output_file_id = error_file_id = None
+        failed = job.failed if job.finished else 0
+        if job.finished:
+            output_file_id = f"file-{job.id}-output"
+            batch_files[output_file_id] = _jsonl([line for line in job.lines if job.ok(line)])
+            if failed:
+                error_file_id = f"file-{job.id}-errors"
+                batch_files[error_file_id] = _jsonl([line for line in job.lines if not job.ok(line)])
+        return {
+            "id": job.id, "object": "batch", "endpoint": "/v1/chat/completions", "input_file_id": job.input_file_id,
+            "completion_window": "24h", "status": "completed" if job.finished else "in_progress",
+            "output_file_id": output_file_id, "error_file_id": error_file_id, "created_at": job.created_at,
+            "request_counts": {
+                "total": len(job.lines),
+                "completed": len(job.lines) - failed if job.finished else 0,
+                "failed": failed,
+            },
+        }
+
+    def anthropic_batch(job: FakeBatchJob, base_url: str) -> dict:
+        failed = job.failed if job.finished else 0
+        return {
+            "id": job.id, "type": "message_batch", "created_at": job.created_at,
+            "processing_status": "ended" if job.finished else "in_progress",
+            "request_counts": {
+                "processing": 0 if job.finished else len(job.lines),
+                "succeeded": len(job.lines) - failed if job.finished else 0,
+                "errored": failed, "canceled": 0, "expired": 0,
+            },
+            "results_url": f"{base_url}v1/messages/batches/{job.id}/results" if job.finished else None,
+        }
+
+    @app.post("/v1/files")
+    async def openai_upload(request: Request):
+        fields = _multipart_fields(await request.body(), request.headers.get("content-type", ""))
+        file_id = f"file-{uuid.uuid4().hex[:24]}"
+        batch_files[file_id] = fields.get("file", b"").decode("utf-8")
+        return {"id": file_id, "object": "file", "bytes": len(fields.get("file", b"")),
+                "created_at": int(time.time()), "filename": "batch.jsonl", "purpose": fields.get("purpose", b"").decode()}
+
+    @app.get("/v1/files/{file_id}/content")
+    async def openai_file_content(file_id: str):
+        if file_id not in batch_files:
+            return JSONResponse({"error": {"message": f"No such File object: {file_id}"}}, status_code=404)
+        return Response(batch_files[file_id], media_type="application/octet-stream")
+
+    @app.post("/v1/batches")
+    async def openai_create_batch(request: Request):
+        body = await request.json()
+        requests = [json.loads(line) for line in batch_files.get(body.get("input_file_id"), "").splitlines() if line.strip()]
+        job = new_batch("openai", [batch_line("openai", r["custom_id"], r["body"]) for r in requests], body.get("input_file_id"))
+        return openai_batch(job)
+
+    @app.get("/v1/batches/{batch_id}")
+    async def openai_get_batch(batch_id: str):
+        job = batch_jobs.get(batch_id)
+        if job is None:
+            return JSONResponse({"error": {"message": f"No batch found with id '{batch_id}'"}}, status_code=404)
+        return openai_batch(job)
+
+    @app.post("/v1/messages/batches")
+    async def anthropic_create_batch(request: Request):
+        body = await request.json()
+        job = new_batch("anthropic", [batch_line("anthropic", r["custom_id"], r["params"]) for r in body.get("requests", [])])
+        return anthropic_batch(job, str(request.base_url))
+
+    @app.get("/v1/messages/batches/{batch_id}")
+    async def anthropic_get_batch(batch_id: str, request: Request):
+        job = batch_jobs.get(batch_id)
+        if job is None:
+            return JSONResponse({"type": "error", "error": {"type": "not_found_error", "message": batch_id}}, status_code=404)
+        return anthropic_batch(job, str(request.base_url))
+
+    @app.get("/v1/messages/batches/{batch_id}/results")
+    async def anthropic_batch_results(batch_id: str):
+        job = batch_jobs.get(batch_id)
+        if job is None or not job.finished:
+            return JSONResponse({"type": "error", "error": {"type": "not_found_error", "message": batch_id}}, status_code=404)
+        return Response(_jsonl(job.lines), media_type="application/binary")
+
+    @app.get("/stats")
+    async def get_stats():
+        return {"providers": stats.counts, "profiles": {n: p.model_dump() for n, p in profiles.items()}}
+
+    return app
+
+
+def load_profiles(args: argparse.Namespace) -> Dict[str, FakeProviderProfile]:
+    """Profiles from --config, with command-line flags applied to every provider"""
+    overrides = {
+        field: getattr(args, field)
+        for field in ("latency_ms", "latency_sigma", "rate_limit_rate", "server_error_rate", "completion_tokens")
+        if getattr(args, field) is not None
+    }
+    configured = json.loads(Path(args.config).read_text()) if args.config else {}
+    return {
+        name: FakeProviderProfile(**{**configured.get(name, {}), **overrides})
+        for name in PROVIDERS
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fake OpenAI/Anthropic/Gemini server for load testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--config", help="JSON file of per-provider profiles")
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible runs")
+    parser.add_argument("--latency-ms", dest="latency_ms", type=float)
+    parser.add_argument("--latency-sigma", dest="latency_sigma", type=float)
+    parser.add_argument("--rate-limit-rate", dest="rate_limit_rate", type=float)
+    parser.add_argument("--server-error-rate", dest="server_error_rate", type=float)
+    parser.add_argument("--completion-tokens", dest="completion_tokens", type=int)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    profiles = load_profiles(args)
+    for name, profile in profiles.items():
+        print(f"[+] {name}: {profile.latency_ms:.0f}ms median, "
+              f"{profile.rate_limit_rate:.1%} 429s, {profile.server_error_rate:.1%} 5xx")
+    uvicorn.run(create_app(profiles, seed=args.seed), host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
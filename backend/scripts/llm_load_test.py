@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+ProofCore Backend - LLM Adapter Load Test
+
+Drives LLMAdapter against the fake provider server and reports
+throughput, tail latency and fallback behavior. Everything runs on one
+machine; no real API keys or tokens are used.
+
+Usage:
+    cd backend
+    python scripts/fake_llm_server.py --port 8900 --rate-limit-rate 0.05 &
+    python scripts/llm_load_test.py --url http://127.0.0.1:8900 --steps 500 --concurrency 50
+
+    # Or start the fake server in-process with one profile for all providers
+    python scripts/llm_load_test.py --serve --latency-ms 400 --server-error-rate 0.1
+
+Requires the provider SDKs (openai, anthropic, google-generativeai).
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# Add backend to path (parent of scripts/)
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+
+def configure_environment(url: str, providers: List[str]) -> None:
+    """Point the provider settings at the fake server (before app.* is imported)"""
+    url = url.rstrip("/")
+    env = {
+        "openai": {"OPENAI_API_KEY": "fake", "OPENAI_BASE_URL": f"{url}/v1"},
+        "anthropic": {"ANTHROPIC_API_KEY": "fake", "ANTHROPIC_BASE_URL": url},
+        "google": {"GOOGLE_API_KEY": "fake", "GOOGLE_BASE_URL": url},
+    }
+    for name, values in env.items():
+        for key, value in values.items():
+            if name in providers:
+                os.environ[key] = value
+            else:
+                os.environ.pop(key, None)
+    # Measure provider calls, not cache hits or the offline provider
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+    os.environ["LLM_LOCAL_PROVIDER"] = "off"
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of non-empty samples"""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+async def run(args: argparse.Namespace) -> int:
+    from app.services.llm.base import EvaluationOptions
+    from app.services.llm.circuit_breaker import provider_breakers
+    from app.services.llm.clients import provider_clients
+    from app.services.llm.rate_limit import provider_limiters
+    from app.services.llm.routing import provider_router
+    from app.services.llm_adapter import LLMAdapter
+
+    adapter = LLMAdapter()
+    if not adapter.has_providers():
+        print("[-] No providers initialized; are the SDKs installed?")
+        return 1
+    print(f"[+] Providers: {', '.join(adapter.get_available_providers())} | mode={args.mode}")
+
+    options = EvaluationOptions(
+        max_tokens=16 if args.score_only else 300, stream=args.stream, include_reasoning=not args.score_only
+    )
+    call = {
+        "routed": adapter.evaluate_routed,
+        "parallel": adapter.evaluate_parallel,
+        "fallback": adapter.evaluate_with_fallback,
+    }[args.mode]
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: List[float] = []
+    answered_by = {}
+    failures = 0
+
+    async def one(i: int) -> None:
+        nonlocal failures
+        prompt = f"Evaluate the following proof step from the domain of algebra:\n\n**Claim**: step {i}\n"
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = await call(prompt, options)
+            except ConnectionError:
+                failures += 1
+                return
+            latencies.append(time.perf_counter() - started)
+            for response in result if isinstance(result, list) else [result]:
+                answered_by[response.provider] = answered_by.get(response.provider, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(args.steps)))
+    elapsed = time.perf_counter() - started
+    await provider_clients.aclose()
+
+    print()
+    print(f"Evaluations: {args.steps} in {elapsed:.2f}s ({args.steps / elapsed:.1f}/s), {failures} failed")
+    if latencies:
+        print(f"Latency ms: p50={percentile(latencies, 50) * 1000:.0f} "
+              f"p95={percentile(latencies, 95) * 1000:.0f} "
+              f"p99={percentile(latencies, 99) * 1000:.0f} "
+              f"max={max(latencies) * 1000:.0f} mean={statistics.mean(latencies) * 1000:.0f}")
+    print(f"Responses by provider: {answered_by}")
+    print()
+    for name, stats in provider_limiters.get_stats().items():
+        print(f"[>] limiter {name}: {stats}")
+    for name, stats in provider_breakers.get_stats().items():
+        print(f"[>] breaker {name}: {stats}")
+    print(f"[>] routing: {provider_router.get_stats()}")
+    return 0
+
+
+async def serve_and_run(args: argparse.Namespace) -> int:
+    """Start the fake server in-process, then run the load test against it"""
+    import uvicorn
+    from scripts.fake_llm_server import create_app, load_profiles
+
+    server = uvicorn.Server(uvicorn.Config(
+        create_app(load_profiles(args), seed=args.seed), host="127.0.0.1", port=args.port, log_level="warning"
+    ))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+    try:
+        return await run(args)
+    finally:
+        server.should_exit = True
+        await task
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load-test LLMAdapter against the fake provider server")
+    parser.add_argument("--url", default="http://127.0.0.1:8900", help="Fake server base URL")
+    parser.add_argument("--providers", default="openai,anthropic,google", help="Comma-separated providers to enable")
+    parser.add_argument("--mode", choices=["routed", "parallel", "fallback"], default="routed")
+    parser.add_argument("--steps", type=int, default=200, help="Evaluations to run")
+    parser.add_argument("--concurrency", type=int, default=20, help="Evaluations in flight")
+    parser.add_argument("--stream", action="store_true", help="Stream responses")
+    parser.add_argument("--score-only", dest="score_only", action="store_true", help="Ask for the score alone (streams stop at it)")
+    parser.add_argument("--serve", action="store_true", help="Start the fake server in-process")
+    parser.add_argument("--port", type=int, default=8900, help="Port for --serve")
+    parser.add_argument("--config", help="Per-provider profiles for --serve")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--latency-ms", dest="latency_ms", type=float)
+    parser.add_argument("--latency-sigma", dest="latency_sigma", type=float)
+    parser.add_argument("--rate-limit-rate", dest="rate_limit_rate", type=float)
+    parser.add_argument("--server-error-rate", dest="server_error_rate", type=float)
+    parser.add_argument("--completion-tokens", dest="completion_tokens", type=int)
+    args = parser.parse_args()
+
+    if args.serve:
+        args.url = f"http://127.0.0.1:{args.port}"
+    configure_environment(args.url, [p.strip() for p in args.providers.split(",") if p.strip()])
+    return asyncio.run(serve_and_run(args) if args.serve else run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
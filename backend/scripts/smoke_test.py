@@ -10,9 +10,16 @@ This script provides fast sanity checks before server startup.
 Usage:
     cd backend
     python scripts/smoke_test.py
+
+    # Cold-start budget for importing the API app (default 1500 ms)
+    PROOFCORE_IMPORT_BUDGET_MS=2000 python scripts/smoke_test.py
 """
 
 import asyncio
+import importlib.util
+import json
+import os
+import subprocess
 import sys
 from pathlib import Path
 
@@ -23,7 +30,7 @@ sys.path.insert(0, str(backend_dir))
 
 async def test_imports():
     """Smoke test: Verify all critical modules can be imported"""
-    print("[1/3] Testing imports...")
+    print("[1/4] Testing imports...")
     try:
         from app.core.config import settings
         from app.models.proof import Proof
@@ -37,7 +44,7 @@ async def test_imports():
 
 async def test_config():
     """Smoke test: Verify configuration loads correctly"""
-    print("[2/3] Testing configuration...")
+    print("[2/4] Testing configuration...")
     try:
         from app.core.config import settings
 
@@ -57,7 +64,7 @@ async def test_config():
 
 async def test_symbolic_verifier():
     """Smoke test: Verify symbolic verifier basic functionality"""
-    print("[3/3] Testing symbolic verifier...")
+    print("[3/4] Testing symbolic verifier...")
     try:
         from app.services.symbolic_verifier import BackendSymbolicVerifier
         verifier = BackendSymbolicVerifier()
@@ -73,6 +80,64 @@ async def test_symbolic_verifier():
         return False
 
 
+# Modules kept out of the API startup import chain: provider SDKs are
+# imported when a configured provider is first used, SymPy in the pool workers
+DEFERRED_MODULES = ("openai", "anthropic", "google.generativeai", "sympy")
+
+# Cold import of the API app (main.py) must stay under this many milliseconds
+IMPORT_BUDGET_MS = float(os.environ.get("PROOFCORE_IMPORT_BUDGET_MS", "1500"))
+
+
+def _cold_import(statement: str) -> dict:
+    """Run an import in a fresh interpreter; wall time (ms) and deferred modules it loaded"""
+    code = (
+        "import json, sys, time\n"
+        "started = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = (time.perf_counter() - started) * 1000\n"
+        f"print(json.dumps({{'ms': elapsed, 'loaded': [m for m in {DEFERRED_MODULES!r} if m in sys.modules]}}))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=backend_dir, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _installed(module: str) -> bool:
+    try:
+        return importlib.util.find_spec(module) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+async def test_cold_start():
+    """Smoke test: Verify API cold start stays within its import-time budget"""
+    print("[4/4] Measuring cold start...")
+    try:
+        # Median of three runs (the first may also compile bytecode)
+        runs = sorted((_cold_import("import main") for _ in range(3)), key=lambda run: run["ms"])
+        startup = runs[1]
+        print(f"    API import (main): {startup['ms']:.0f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)")
+
+        # Time each installed module on its own: the startup time it would add
+        for module in DEFERRED_MODULES:
+            if _installed(module):
+                deferred = _cold_import(f"import {module}")
+                print(f"    {module}: {deferred['ms']:.0f} ms deferred until first use")
+            else:
+                print(f"    {module}: not installed")
+
+        assert not startup["loaded"], f"imported at startup: {', '.join(startup['loaded'])}"
+        assert startup["ms"] <= IMPORT_BUDGET_MS, (
+            f"cold start {startup['ms']:.0f} ms exceeds the {IMPORT_BUDGET_MS:.0f} ms budget"
+        )
+        print("    [+] Cold start within budget; no provider SDK or SymPy at startup")
+        return True
+    except Exception as e:
+        print(f"    [-] Cold start check failed: {e}")
+        return False
+
+
 async def main():
     """Run smoke tests"""
     print("=" * 60)
@@ -87,6 +152,7 @@ async def main():
         test_imports,
         test_config,
         test_symbolic_verifier,
+        test_cold_start,
     ]
 
     results = []
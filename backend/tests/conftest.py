@@ -2,14 +2,25 @@
 # Shared test fixtures and configuration
 
 import pytest
+import pytest_asyncio
 import asyncio
-from typing import AsyncGenerator, Generator
+import json
+from typing import AsyncGenerator, Dict, Generator, Optional
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.core.config import Settings
 from app.db.base import Base
 from app.models.proof import Proof, ProofStep
+from app.services.llm.base import BaseLLMProvider, LLMCompletion, LLMUsage, ParsedResponse
+from app.services.llm.budget import LLMBudget, MemoryBudgetStore
+from app.services.llm.cache import llm_response_cache
+from app.services.llm.circuit_breaker import CircuitBreakers
+from app.services.llm.prompts import BATCH_SYSTEM_MESSAGE
+from app.services.llm.rate_limit import ProviderLimiters
+from app.services.llm.routing import ProviderRouter
+from app.services.llm.singleflight import SingleFlight
+from app.services.llm_adapter import LLMAdapter
 
 
 # [=] Test Settings Override
@@ -28,6 +39,16 @@ def test_settings() -> Settings:
     )
 
 
+# [=] LLM Response Cache Isolation
+@pytest.fixture(autouse=True)
+def isolated_llm_cache(tmp_path, monkeypatch):
+    """Point the global response cache at a per-test file instead of backend/"""
+    llm_response_cache.close()
+    monkeypatch.setattr(llm_response_cache, "path", str(tmp_path / "llm_cache.sqlite3"))
+    yield
+    llm_response_cache.close()
+
+
 # [=] Async Event Loop Fixture
 @pytest.fixture(scope="session")
 def event_loop() -> Generator:
@@ -38,7 +59,7 @@ def event_loop() -> Generator:
 
 
 # [=] Test Database Engine
-@pytest.fixture(scope="function")
+@pytest_asyncio.fixture(scope="function")
 async def test_db_engine(test_settings: Settings):
     """Create test database engine with in-memory SQLite"""
     engine = create_async_engine(
@@ -62,7 +83,7 @@ async def test_db_engine(test_settings: Settings):
 
 
 # [=] Test Database Session
-@pytest.fixture(scope="function")
+@pytest_asyncio.fixture(scope="function")
 async def db_session(test_db_engine) -> AsyncGenerator[AsyncSession, None]:
     """Create test database session"""
     session_maker = async_sessionmaker(
@@ -98,7 +119,7 @@ def sample_proof_data():
     }
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def sample_proof(db_session: AsyncSession, sample_proof_data):
     """Create a sample proof in database for testing"""
     from app.crud.crud_proof import proof as crud_proof
@@ -118,3 +139,132 @@ def mock_llm_response():
         "score": 85,
         "reasoning": "The proof step is logically sound and correctly applies mathematical principles."
     }
+
+
+# [=] LLM Provider Doubles
+class FakeProvider(BaseLLMProvider):
+    """
+    Configurable provider double for LLMAdapter tests.
+
+    Answers {"score": score, "reasoning": reasoning}; score-only calls get
+    quick_score (default: score) and no reasoning. Batch prompts get
+    batch_score + step index for each step, or unparseable text if
+    malformed. Fails the first `failures` calls (every call if fail) with
+    `error`, and waits `delay` seconds or for `release` before answering.
+    """
+
+    def __init__(
+        self,
+        name: str = "fake",
+        score: int = 90,
+        *,
+        default_model: Optional[str] = None,
+        reasoning: str = "ok",
+        quick_score: Optional[int] = None,
+        batch_score: int = 60,
+        malformed: bool = False,
+        cost: float = 0.0,
+        usage: Optional[LLMUsage] = None,
+        delay: float = 0.0,
+        release: Optional[asyncio.Event] = None,
+        failures: int = 0,
+        fail: bool = False,
+        error: Optional[Exception] = None,
+    ):
+        self.name = name
+        self.default_model = default_model or f"{name}-1"
+        self.score = score
+        self.reasoning = reasoning
+        self.quick_score = score if quick_score is None else quick_score
+        self.batch_score = batch_score
+        self.malformed = malformed
+        self.cost = cost
+        self.usage = usage or LLMUsage()
+        self.delay = delay
+        self.release = release
+        self.failures = failures
+        self.fail = fail
+        self.error = error or ConnectionError("provider down")
+
+        # Call log
+        self.calls = 0
+        self.batch_calls = 0
+        self.options = []
+        self.models = []
+        self.cancelled = False
+
+    @property
+    def single_calls(self) -> int:
+        return self.calls - self.batch_calls
+
+    async def complete(self, prompt, options, system_message=None) -> LLMCompletion:
+        self.calls += 1
+        self.options.append(options)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            if self.release is not None:
+                await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail or self.calls <= self.failures:
+            raise self.error
+
+        self.models.append(options.model or self.default_model)
+        if system_message == BATCH_SYSTEM_MESSAGE:
+            self.batch_calls += 1
+            indices = [int(line.split()[-1]) for line in prompt.splitlines() if line.startswith("### Step")]
+            text = "not json" if self.malformed else json.dumps(
+                {"results": [{"step": i, "score": self.batch_score + i, "reasoning": "ok"} for i in indices]}
+            )
+        elif options.score_only:
+            text = json.dumps({"score": self.quick_score})
+        else:
+            text = json.dumps({"score": self.score, "reasoning": self.reasoning})
+        return LLMCompletion(provider=self.name, model=self.models[-1], text=text, usage=self.usage, cost=self.cost)
+
+    def _parse_response(self, response: str) -> ParsedResponse:
+        data = json.loads(response)
+        return ParsedResponse(score=data["score"], reasoning=data.get("reasoning", "score only"))
+
+
+@pytest.fixture
+def fake_provider():
+    """FakeProvider class, so tests can build doubles without importing conftest"""
+    return FakeProvider
+
+
+# [=] LLM Adapter Factory
+@pytest.fixture
+def adapter_factory():
+    """
+    Build LLMAdapters over provider doubles.
+
+    Each adapter gets its own limiters, router, breakers, in-flight registry
+    and budget (pass one in to inspect or share it) and no response cache
+    unless one is given.
+    """
+    def build(
+        services: Dict[str, object],
+        *,
+        cache=None,
+        limiters: Optional[ProviderLimiters] = None,
+        router: Optional[ProviderRouter] = None,
+        breakers: Optional[CircuitBreakers] = None,
+        inflight: Optional[SingleFlight] = None,
+        budget: Optional[LLMBudget] = None,
+    ) -> LLMAdapter:
+        adapter = LLMAdapter(
+            cache=cache,
+            limiters=limiters if limiters is not None else ProviderLimiters(),
+            router=router if router is not None else ProviderRouter(),
+            breakers=breakers if breakers is not None else CircuitBreakers(),
+            inflight=inflight if inflight is not None else SingleFlight(),
+            budget=budget if budget is not None else LLMBudget(store=MemoryBudgetStore()),
+        )
+        adapter.cache = cache  # None means no cache here, not the global one
+        adapter.services = services
+        return adapter
+
+    return build
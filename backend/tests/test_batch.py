@@ -0,0 +1,116 @@
+# [B] ProofCore Backend - Batch Submission Tests
+# Integration tests for multi-row batch inserts and aggregate batch status
+
+import pytest
+
+from app.crud.crud_proof import proof as crud_proof
+from app.models.proof import ProofStatus
+from app.schemas.proof import ProofBatchCreate, ProofCreate, ProofStepCreate
+
+
+def _proofs(count: int):
+    return [
+        ProofCreate(
+            domain="algebra",
+            steps=[ProofStepCreate(claim=f"claim {i}.{j}") for j in range(i % 3 + 1)]
+        )
+        for i in range(count)
+    ]
+
+
+def _result(is_valid: bool, lii: float) -> dict:
+    return {
+        "is_valid": is_valid,
+        "lii_score": lii,
+        "confidence_interval": [lii - 1, lii + 1],
+        "coherence_score": 90.0,
+        "step_results": [],
+        "feedback": [],
+    }
+
+
+@pytest.mark.asyncio
+class TestBatchSubmission:
+    """Test suite for batch proof creation"""
+
+    async def test_create_batch_preserves_order(self, db_session):
+        """Test that proof IDs and steps line up with the submitted items"""
+        # Arrange
+        proofs_in = _proofs(5)
+
+        # Act
+        created = await crud_proof.create_batch(db_session, obj_in=proofs_in, batch_id="b1", tenant="t")
+
+        # Assert
+        assert len(created) == 5
+        for (proof_id, cost), proof_in in zip(created, proofs_in):
+            db_proof = await crud_proof.get(db=db_session, id=proof_id)
+            assert [s.claim for s in db_proof.steps] == [s.claim for s in proof_in.steps]
+            assert db_proof.batch_id == "b1"
+            assert db_proof.priority == "bulk"
+            assert db_proof.tenant == "t"
+            assert db_proof.status == ProofStatus.PENDING
+            assert cost == len(proof_in.steps)
+
+    async def test_batch_status_aggregates(self, db_session):
+        """Test per-status counts and result aggregates"""
+        # Arrange
+        created = await crud_proof.create_batch(db_session, obj_in=_proofs(4), batch_id="b2")
+        ids = [proof_id for proof_id, _ in created]
+        await crud_proof.update_status(db_session, proof_id=ids[0], status=ProofStatus.COMPLETED)
+        await crud_proof.create_result(db_session, proof_id=ids[0], obj_in=_result(True, 90.0))
+        await crud_proof.update_status(db_session, proof_id=ids[1], status=ProofStatus.COMPLETED)
+        await crud_proof.create_result(db_session, proof_id=ids[1], obj_in=_result(False, 60.0))
+        await crud_proof.update_status(db_session, proof_id=ids[2], status=ProofStatus.FAILED)
+
+        # Act
+        batch_status = await crud_proof.get_batch_status(db_session, batch_id="b2")
+
+        # Assert
+        assert batch_status["total"] == 4
+        assert batch_status["completed"] == 2
+        assert batch_status["failed"] == 1
+        assert batch_status["pending"] == 1
+        assert batch_status["valid"] == 1
+        assert batch_status["average_lii"] == 75.0
+        assert batch_status["done"] is False
+
+    async def test_batch_status_ignores_stale_results(self, db_session):
+        """Test that a proof under revalidation does not count its old result"""
+        # Arrange
+        created = await crud_proof.create_batch(db_session, obj_in=_proofs(2), batch_id="b3")
+        ids = [proof_id for proof_id, _ in created]
+        for proof_id, verdict in zip(ids, [(True, 90.0), (False, 40.0)]):
+            await crud_proof.update_status(db_session, proof_id=proof_id, status=ProofStatus.COMPLETED)
+            await crud_proof.save_result(db_session, proof_id=proof_id, obj_in=_result(*verdict))
+        assert await crud_proof.request_revalidation(db_session, proof_id=ids[1])
+
+        # Act
+        batch_status = await crud_proof.get_batch_status(db_session, batch_id="b3")
+
+        # Assert
+        assert batch_status["completed"] == 1
+        assert batch_status["pending"] == 1
+        assert batch_status["valid"] == 1
+        assert batch_status["average_lii"] == 90.0
+        assert batch_status["done"] is False
+
+    async def test_unknown_batch(self, db_session):
+        """Test that an unknown batch ID returns None"""
+        # Act & Assert
+        assert await crud_proof.get_batch_status(db_session, batch_id="missing") is None
+
+
+class TestBatchSchema:
+    """Test suite for batch request validation"""
+
+    def test_empty_batch_rejected(self):
+        """Test that a batch needs at least one proof"""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            ProofBatchCreate(proofs=[])
+
+    def test_default_priority_is_bulk(self):
+        """Test that batches default to the bulk lane"""
+        # Act & Assert
+        assert ProofBatchCreate(proofs=_proofs(1)).priority == "bulk"
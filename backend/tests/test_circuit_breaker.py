@@ -0,0 +1,265 @@
+# [B] ProofCore Backend - Circuit Breaker Tests
+# Tests for provider circuit breakers, backoff and Retry-After handling
+
+import asyncio
+import time
+import pytest
+from types import SimpleNamespace
+
+from app.core.config import settings
+from app.services.llm.base import (
+    EvaluationOptions,
+    ProviderRequestError,
+    RateLimitedError,
+    http_status,
+    is_retryable_status,
+    retry_after_seconds,
+)
+from app.services.llm.circuit_breaker import CircuitBreaker, CircuitBreakers, CircuitState, backoff_delay
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Test suite for breaker state transitions"""
+
+    def test_opens_after_threshold(self):
+        """Test that consecutive failures open the circuit and calls are rejected"""
+        # Arrange
+        breaker = CircuitBreaker("p", failure_threshold=3, reset_seconds=10, clock=_Clock())
+
+        # Act
+        for _ in range(3):
+            breaker.record_failure()
+
+        # Assert
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow()
+        assert breaker.rejected == 1
+
+    def test_success_resets_failure_count(self):
+        """Test that failures must be consecutive"""
+        # Arrange
+        breaker = CircuitBreaker("p", failure_threshold=3, reset_seconds=10, clock=_Clock())
+
+        # Act
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        # Assert
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_single_probe(self):
+        """Test that after the reset period exactly one probe is admitted"""
+        # Arrange
+        clock = _Clock()
+        breaker = CircuitBreaker("p", failure_threshold=1, reset_seconds=10, clock=clock)
+        breaker.record_failure()
+
+        # Act
+        clock.now = 10.0
+        first, second = breaker.allow(), breaker.allow()
+
+        # Assert
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert (first, second) == (True, False)
+
+    def test_probe_outcome(self):
+        """Test that a failed probe re-opens and a successful one closes"""
+        # Arrange
+        clock = _Clock()
+        breaker = CircuitBreaker("p", failure_threshold=5, reset_seconds=10, clock=clock)
+        for _ in range(5):
+            breaker.record_failure()
+        clock.now = 10.0
+
+        # Act & Assert
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        clock.now = 20.0
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_retry_after_extends_open_period(self):
+        """Test that a longer Retry-After keeps the circuit open longer"""
+        # Arrange
+        clock = _Clock()
+        breaker = CircuitBreaker("p", failure_threshold=1, reset_seconds=10, clock=clock)
+
+        # Act
+        breaker.record_failure(retry_after=60)
+        clock.now = 30.0
+
+        # Assert
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.retry_in() == pytest.approx(30.0)
+
+
+class TestBackoff:
+    """Test suite for retry delays"""
+
+    def test_full_jitter_bounds(self):
+        """Test that delays stay within the exponential envelope and cap"""
+        # Act
+        delays = [backoff_delay(attempt, base=1.0, cap=5.0) for attempt in range(6) for _ in range(50)]
+
+        # Assert
+        assert all(0 <= d <= 5.0 for d in delays)
+        assert max(backoff_delay(0, base=1.0, cap=5.0) for _ in range(50)) <= 1.0
+
+    def test_retry_after_honored(self):
+        """Test that Retry-After sets the minimum delay"""
+        # Act
+        delay = backoff_delay(0, base=0.5, cap=1.0, retry_after=12)
+
+        # Assert
+        assert 12 <= delay <= 12.5
+
+    @pytest.mark.parametrize("headers,expected", [
+        ({"retry-after": "7"}, 7.0),
+        ({"retry-after-ms": "1500"}, 1.5),
+        ({}, None),
+        ({"retry-after": "soon"}, None),
+    ])
+    def test_retry_after_from_sdk_error(self, headers, expected):
+        """Test reading Retry-After from an SDK error's HTTP response"""
+        # Arrange
+        error = Exception("429")
+        error.response = SimpleNamespace(headers=headers)
+
+        # Act & Assert
+        assert retry_after_seconds(error) == expected
+
+    @pytest.mark.parametrize("status,retryable", [
+        (400, False), (401, False), (404, False),
+        (408, True), (429, True), (500, True), (503, True), (None, True),
+    ])
+    def test_retryable_statuses(self, status, retryable):
+        """Test that only rate limits, server errors and timeouts are retried"""
+        # Act & Assert
+        assert is_retryable_status(status) is retryable
+
+    def test_http_status_from_sdk_errors(self):
+        """Test reading the status from OpenAI/Anthropic-style and google.api_core-style errors"""
+        # Arrange
+        sdk_error, google_error, timeout = Exception("bad"), Exception("bad"), Exception("timed out")
+        sdk_error.status_code = 400
+        google_error.code = 403
+
+        # Act & Assert
+        assert (http_status(sdk_error), http_status(google_error), http_status(timeout)) == (400, 403, None)
+
+
+@pytest.mark.asyncio
+class TestAdapterBreakers:
+    """Test suite for breakers and retries inside LLMAdapter"""
+
+    @pytest.fixture(autouse=True)
+    def fast_retries(self, monkeypatch):
+        monkeypatch.setattr(settings, "LLM_RETRY_BASE_SECONDS", 0.001)
+        monkeypatch.setattr(settings, "LLM_MAX_RETRIES", 2)
+
+    async def test_transient_failure_retried(self, adapter_factory, fake_provider):
+        """Test that a failure followed by success is retried transparently"""
+        # Arrange
+        provider = fake_provider("flaky", failures=1)
+        breakers = CircuitBreakers()
+        adapter = adapter_factory({"flaky": provider}, breakers=breakers)
+
+        # Act
+        responses = await adapter.evaluate_parallel("prompt", EvaluationOptions())
+
+        # Assert
+        assert responses[0].score == 90
+        assert provider.calls == 2
+        assert breakers.get("flaky").state == CircuitState.CLOSED
+
+    async def test_retry_waits_for_retry_after(self, adapter_factory, fake_provider):
+        """Test that a rate-limited call waits the provider's Retry-After"""
+        # Arrange
+        provider = fake_provider("flaky", failures=1, error=RateLimitedError("429", retry_after=0.1))
+        adapter = adapter_factory({"flaky": provider})
+
+        # Act
+        started = time.monotonic()
+        await adapter.evaluate_parallel("prompt", EvaluationOptions())
+
+        # Assert
+        assert time.monotonic() - started >= 0.1
+
+    async def test_outage_skips_provider_immediately(self, monkeypatch, adapter_factory, fake_provider):
+        """Test that once open, a down provider costs no calls and no delay"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_BREAKER_FAILURE_THRESHOLD", 1)
+        down, healthy = fake_provider("down", fail=True), fake_provider("healthy")
+        breakers = CircuitBreakers()
+        adapter = adapter_factory({"down": down, "healthy": healthy}, breakers=breakers)
+        await adapter.evaluate_parallel("prompt", EvaluationOptions())
+        calls_when_opened = down.calls
+
+        # Act
+        started = time.monotonic()
+        for step in range(20):
+            responses = await adapter.evaluate_parallel(f"step {step}", EvaluationOptions())
+        elapsed = time.monotonic() - started
+
+        # Assert
+        assert breakers.get("down").state == CircuitState.OPEN
+        assert down.calls == calls_when_opened == 3
+        assert [r.provider for r in responses] == ["healthy"]
+        assert breakers.get("down").rejected == 20
+        assert elapsed < 0.5
+
+    async def test_retries_count_as_one_failure(self, monkeypatch, adapter_factory, fake_provider):
+        """Test that a call that fails after all its retries counts once toward opening the circuit"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_BREAKER_FAILURE_THRESHOLD", 3)
+        down = fake_provider("down", fail=True)
+        breakers = CircuitBreakers()
+        adapter = adapter_factory({"down": down, "healthy": fake_provider("healthy")}, breakers=breakers)
+
+        # Act
+        await adapter.evaluate_parallel("prompt", EvaluationOptions())
+
+        # Assert
+        assert down.calls == 3
+        assert breakers.get("down").consecutive_failures == 1
+        assert breakers.get("down").state == CircuitState.CLOSED
+
+    async def test_rejected_request_not_retried(self, adapter_factory, fake_provider):
+        """Test that a 4xx other than 429 fails at once"""
+        # Arrange
+        rejected = fake_provider("rejected", fail=True, error=ProviderRequestError("400 bad request", 400))
+        breakers = CircuitBreakers()
+        adapter = adapter_factory({"rejected": rejected, "healthy": fake_provider("healthy")}, breakers=breakers)
+
+        # Act
+        responses = await adapter.evaluate_parallel("prompt", EvaluationOptions())
+
+        # Assert
+        assert [r.provider for r in responses] == ["healthy"]
+        assert rejected.calls == 1
+        assert breakers.get("rejected").consecutive_failures == 1
+
+    async def test_fallback_has_no_fixed_sleep(self, adapter_factory, fake_provider):
+        """Test that fallback moves to the next provider without sleeping"""
+        # Arrange
+        adapter = adapter_factory({"openai": fake_provider("openai", failures=10), "anthropic": fake_provider("anthropic")})
+
+        # Act
+        started = time.monotonic()
+        response = await adapter.evaluate_with_fallback("prompt", EvaluationOptions())
+
+        # Assert
+        assert response.score == 90
+        assert time.monotonic() - started < 0.5
@@ -4,7 +4,7 @@
 import pytest
 from pydantic import ValidationError
 
-from app.core.config import Settings, get_database_url, is_production, get_verification_config
+from app.core.config import BACKEND_DIR, Settings, get_database_url, is_production, get_verification_config
 
 
 class TestSettings:
@@ -123,6 +123,22 @@ class TestSettings:
         assert settings_debug.DEBUG is True
         assert settings_prod.DEBUG is False
 
+    def test_cache_path_independent_of_working_directory(self, tmp_path, monkeypatch):
+        """Test that default and relative cache paths resolve against backend/"""
+        # Arrange
+        monkeypatch.chdir(tmp_path)
+
+        # Act
+        default = Settings()
+        relative = Settings(LLM_CACHE_PATH="data/cache.sqlite3")
+        absolute = Settings(LLM_CACHE_PATH=str(tmp_path / "cache.sqlite3"))
+
+        # Assert
+        assert default.LLM_CACHE_PATH == str(BACKEND_DIR / "llm_cache.sqlite3")
+        assert relative.LLM_CACHE_PATH == str(BACKEND_DIR / "data" / "cache.sqlite3")
+        assert absolute.LLM_CACHE_PATH == str(tmp_path / "cache.sqlite3")
+        assert Settings(LLM_CACHE_PATH=":memory:").LLM_CACHE_PATH == ":memory:"
+
 
 class TestConfigHelpers:
     """Test suite for configuration helper functions"""
@@ -0,0 +1,91 @@
+# [B] ProofCore Backend - Deadline Tests
+# Unit tests for per-proof deadline propagation and cancellation
+
+import asyncio
+import pytest
+
+from app.services.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    current_deadline,
+    deadline_scope,
+    with_deadline,
+)
+
+
+@pytest.mark.asyncio
+class TestDeadline:
+    """Test suite for deadline propagation"""
+
+    async def test_no_deadline_outside_scope(self):
+        """Test that no deadline is active by default"""
+        # Act & Assert
+        assert current_deadline() is None
+        assert await with_deadline(asyncio.sleep(0, result=42)) == 42
+
+    async def test_scope_installs_and_resets_deadline(self):
+        """Test that deadline_scope is visible inside and reset after"""
+        # Arrange
+        deadline = Deadline(10)
+
+        # Act & Assert
+        with deadline_scope(deadline):
+            assert current_deadline() is deadline
+        assert current_deadline() is None
+
+    async def test_deadline_propagates_into_tasks(self):
+        """Test that spawned tasks inherit the proof deadline"""
+        # Arrange
+        deadline = Deadline(10)
+
+        async def child():
+            return current_deadline()
+
+        # Act
+        with deadline_scope(deadline):
+            seen = await asyncio.create_task(child())
+
+        # Assert
+        assert seen is deadline
+
+    async def test_expired_deadline_cancels_work(self):
+        """Test that work running past the deadline is cancelled"""
+        # Arrange
+        cancelled = False
+
+        async def hung_call():
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        # Act & Assert
+        with deadline_scope(Deadline(0.05)):
+            with pytest.raises(DeadlineExceeded):
+                await with_deadline(hung_call())
+        assert cancelled is True
+
+    async def test_already_expired_deadline_fails_fast(self):
+        """Test that no work starts once the deadline has passed"""
+        # Arrange
+        deadline = Deadline(0)
+
+        # Act & Assert
+        with deadline_scope(deadline):
+            with pytest.raises(DeadlineExceeded):
+                await with_deadline(asyncio.sleep(10))
+
+    async def test_cap_timeout_is_not_deadline(self):
+        """Test that a per-call cap raises TimeoutError, not DeadlineExceeded"""
+        # Act & Assert
+        with deadline_scope(Deadline(10)):
+            with pytest.raises(asyncio.TimeoutError):
+                await with_deadline(asyncio.sleep(10), cap=0.01)
+
+    async def test_remaining_never_negative(self):
+        """Test remaining() clamps at zero"""
+        # Act & Assert
+        assert Deadline(0).remaining() == 0.0
+        assert Deadline(0).expired is True
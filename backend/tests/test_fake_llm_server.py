@@ -0,0 +1,97 @@
+# [B] ProofCore Backend - Fake LLM Server Tests
+# Tests for the load-test provider stand-in's wire formats and failure injection
+
+import json
+
+import httpx
+import pytest
+
+from app.services.llm.prompts import BATCH_SYSTEM_MESSAGE, SYSTEM_MESSAGE, parse_batch_response
+from app.services.llm.streaming import ScoreStreamParser
+from scripts.fake_llm_server import FakeProviderProfile, create_app
+
+
+def _client(**profile) -> httpx.AsyncClient:
+    profiles = {name: FakeProviderProfile(latency_ms=0, **profile) for name in ("openai", "anthropic", "google")}
+    app = create_app(profiles, seed=1)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://fake")
+
+
+def _sse_data(body: str) -> list:
+    return [json.loads(line[6:]) for line in body.splitlines() if line.startswith("data: {")]
+
+
+@pytest.mark.asyncio
+class TestFakeLLMServer:
+    """Test suite for scripts/fake_llm_server.py"""
+
+    async def test_openai_chat_completion(self):
+        """Test that OpenAI responses carry evaluation JSON and usage"""
+        # Arrange
+        request = {
+            "model": "gpt-4o",
+            "messages": [{"role": "system", "content": SYSTEM_MESSAGE}, {"role": "user", "content": "step"}],
+        }
+
+        # Act
+        async with _client(completion_tokens=50) as client:
+            response = await client.post("/v1/chat/completions", json=request)
+
+        # Assert
+        body = response.json()
+        answer = json.loads(body["choices"][0]["message"]["content"])
+        assert response.status_code == 200
+        assert 20 <= answer["score"] <= 95
+        assert body["usage"]["total_tokens"] == body["usage"]["prompt_tokens"] + body["usage"]["completion_tokens"]
+        assert 40 <= body["usage"]["completion_tokens"] <= 60
+
+    async def test_anthropic_stream_events(self):
+        """Test that an Anthropic stream delivers the score through text deltas"""
+        # Arrange
+        request = {"model": "claude-3-5-sonnet-20240620", "system": SYSTEM_MESSAGE, "stream": True,
+                   "messages": [{"role": "user", "content": "step"}]}
+        parser = ScoreStreamParser()
+
+        # Act
+        async with _client() as client:
+            response = await client.post("/v1/messages", json=request)
+        events = _sse_data(response.text)
+        for event in events:
+            if event["type"] == "content_block_delta":
+                parser.feed(event["delta"]["text"])
+
+        # Assert
+        assert events[0]["type"] == "message_start"
+        assert events[-1]["type"] == "message_stop"
+        assert parser.score is not None
+
+    async def test_google_batch_prompt(self):
+        """Test that batch prompts get one parseable entry per step"""
+        # Arrange
+        request = {
+            "systemInstruction": {"parts": [{"text": BATCH_SYSTEM_MESSAGE}]},
+            "contents": [{"role": "user", "parts": [{"text": "### Step 2\n**Claim**: a\n\n### Step 5\n**Claim**: b"}]}],
+        }
+
+        # Act
+        async with _client() as client:
+            response = await client.post("/v1beta/models/gemini-1.5-pro:generateContent", json=request)
+        text = response.json()["candidates"][0]["content"]["parts"][0]["text"]
+
+        # Assert
+        assert parse_batch_response(text, [2, 5]) is not None
+
+    async def test_rate_limit_injection(self):
+        """Test that 429s carry Retry-After and are counted"""
+        # Arrange
+        request = {"model": "gpt-4o", "messages": [{"role": "user", "content": "step"}]}
+
+        # Act
+        async with _client(rate_limit_rate=1.0, retry_after_seconds=2) as client:
+            response = await client.post("/v1/chat/completions", json=request)
+            stats = (await client.get("/stats")).json()
+
+        # Assert
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "2"
+        assert stats["providers"]["openai"] == {"requests": 1, "ok": 0, "rate_limited": 1, "server_errors": 0}
@@ -0,0 +1,140 @@
+# [B] ProofCore Backend - Batched Semantic Evaluation Tests
+# Tests for multi-step prompts, batch parsing and single-step fallback
+
+import json
+import pytest
+from types import SimpleNamespace
+
+from app.core.config import settings
+from app.services.llm.base import EvaluationOptions, LLMUsage
+from app.services.llm.cache import LLMResponseCache
+from app.services.llm.prompts import build_batch_prompt, build_step_prompt, parse_batch_response
+
+
+def _steps(count: int):
+    return [SimpleNamespace(step_index=i, claim=f"claim {i}", equation=None) for i in range(count)]
+
+
+@pytest.fixture
+def batch_provider(fake_provider):
+    """Provider double scoring batch prompts 60 + step index and single prompts 42"""
+    def build(**overrides):
+        usage = LLMUsage(prompt_tokens=100, completion_tokens=40, total_tokens=140)
+        return fake_provider(score=42, reasoning="single", batch_score=60, usage=usage, cost=0.04, **overrides)
+    return build
+
+
+class TestBatchParsing:
+    """Test suite for batch response parsing"""
+
+    def test_results_object(self):
+        """Test the documented {"results": [...]} shape"""
+        # Arrange
+        text = json.dumps({"results": [{"step": 3, "score": 90, "reasoning": "a"}, {"step": 4, "score": 10}]})
+
+        # Act
+        parsed = parse_batch_response(text, [3, 4])
+
+        # Assert
+        assert [p.score for p in parsed] == [90, 10]
+
+    def test_bare_array_and_reordering(self):
+        """Test bare arrays and entries matched by step number"""
+        # Arrange
+        text = "```json\n" + json.dumps([{"step": 1, "score": 20}, {"step": 0, "score": 80}]) + "\n```"
+
+        # Act
+        parsed = parse_batch_response(text, [0, 1])
+
+        # Assert
+        assert [p.score for p in parsed] == [80, 20]
+
+    @pytest.mark.parametrize("text", [
+        "not json",
+        json.dumps({"results": [{"step": 0, "score": 50}]}),
+        json.dumps({"results": [{"step": 0, "score": 150}, {"step": 1, "score": 50}]}),
+        json.dumps({"results": [{"step": 0, "score": 50}, {"step": 7, "score": 50}]}),
+        json.dumps({"score": 50}),
+    ])
+    def test_malformed_batches_rejected(self, text):
+        """Test that anything but one valid score per step is rejected"""
+        # Act & Assert
+        assert parse_batch_response(text, [0, 1]) is None
+
+    def test_batch_prompt_numbers_steps(self):
+        """Test that the prompt labels each step with its index"""
+        # Act
+        prompt = build_batch_prompt(_steps(3), "algebra")
+
+        # Assert
+        assert "### Step 0" in prompt and "### Step 2" in prompt
+
+
+@pytest.mark.asyncio
+class TestBatchedEvaluation:
+    """Test suite for LLMAdapter.evaluate_steps"""
+
+    async def test_k_steps_per_prompt(self, monkeypatch, adapter_factory, batch_provider):
+        """Test that 10 steps with K=4 take 3 calls"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_BATCH_SIZES", {"fake": 4})
+        provider = batch_provider()
+        adapter = adapter_factory({"fake": provider})
+
+        # Act
+        results = await adapter.evaluate_steps(_steps(10), "algebra", EvaluationOptions())
+
+        # Assert
+        assert provider.batch_calls == 3
+        assert provider.single_calls == 0
+        assert [results[i][0].score for i in range(10)] == [60 + i for i in range(10)]
+        assert results[0][0].cost == pytest.approx(0.01)
+
+    async def test_malformed_batch_falls_back(self, monkeypatch, adapter_factory, batch_provider):
+        """Test single-step fallback when the array cannot be parsed"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_BATCH_SIZES", {"fake": 4})
+        provider = batch_provider(malformed=True)
+        adapter = adapter_factory({"fake": provider})
+
+        # Act
+        results = await adapter.evaluate_steps(_steps(4), "algebra", EvaluationOptions())
+
+        # Assert
+        assert provider.batch_calls == 1
+        assert provider.single_calls == 4
+        assert all(results[i][0].score == 42 for i in range(4))
+
+    async def test_default_is_one_step_per_call(self, monkeypatch, adapter_factory, batch_provider):
+        """Test that providers without a batch size keep per-step prompts"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_BATCH_SIZES", {})
+        provider = batch_provider()
+        adapter = adapter_factory({"fake": provider})
+
+        # Act
+        await adapter.evaluate_steps(_steps(3), "algebra", EvaluationOptions())
+
+        # Assert
+        assert not adapter.batching_enabled()
+        assert provider.batch_calls == 0
+        assert provider.single_calls == 3
+
+    async def test_batch_scores_cached_apart_from_single_step(self, monkeypatch, tmp_path, adapter_factory, batch_provider):
+        """Test that batch-derived scores are reused by batches but not by single-step calls"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_BATCH_SIZES", {"fake": 4})
+        provider = batch_provider()
+        adapter = adapter_factory({"fake": provider})
+        adapter.cache = LLMResponseCache(path=str(tmp_path / "cache.sqlite3"))
+        await adapter.evaluate_steps(_steps(2), "algebra", EvaluationOptions())
+
+        # Act
+        batched = await adapter.evaluate_steps(_steps(2), "algebra", EvaluationOptions())
+        single = await adapter.evaluate_parallel(build_step_prompt(_steps(1)[0], "algebra"), EvaluationOptions())
+
+        # Assert
+        assert provider.batch_calls == 1
+        assert batched[0][0].cached is True
+        assert provider.single_calls == 1
+        assert single[0].score == 42
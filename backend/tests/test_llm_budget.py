@@ -0,0 +1,211 @@
+# [B] ProofCore Backend - LLM Budget Tests
+# Tests for token/cost reservations, tenant limits and budget degradation
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.db.base import Base
+from app.services.llm.base import EvaluationOptions, LLMUsage
+from app.services.llm.budget import (
+    BudgetExceededError,
+    DatabaseBudgetStore,
+    LLMBudget,
+    MemoryBudgetStore,
+    cheapest_model,
+    tenant_scope,
+)
+from app.services.verification import BackendProofEngine
+
+
+@pytest.fixture
+def priced_provider(fake_provider):
+    """Provider double reporting fixed usage and cost; provider.models records the model used"""
+    def build():
+        usage = LLMUsage(prompt_tokens=40, completion_tokens=10, total_tokens=50)
+        return fake_provider("openai", 88, default_model="gpt-4o", usage=usage, cost=0.01)
+    return build
+
+
+@pytest.fixture
+def budgets(monkeypatch):
+    """Enable budgets with no limits set (tests set the ones they need)"""
+    monkeypatch.setattr(settings, "LLM_BUDGET_ENABLED", True)
+    monkeypatch.setattr(settings, "LLM_DAILY_TOKEN_LIMIT", None)
+    monkeypatch.setattr(settings, "LLM_DAILY_COST_LIMIT", None)
+    monkeypatch.setattr(settings, "LLM_TENANT_DAILY_TOKEN_LIMIT", None)
+    monkeypatch.setattr(settings, "LLM_TENANT_DAILY_COST_LIMIT", None)
+    monkeypatch.setattr(settings, "LLM_TENANT_DAILY_COST_LIMITS", {})
+    monkeypatch.setattr(settings, "LLM_BUDGET_DEGRADE_AT", 0.8)
+    return monkeypatch
+
+
+class TestCheapestModel:
+    """Test suite for degraded model selection"""
+
+    def test_lowest_priced_model(self):
+        """Test that the cheapest priced model is chosen per provider"""
+        # Assert
+        assert cheapest_model("anthropic") == "claude-3-haiku-20240307"
+        assert cheapest_model("google") == "gemini-1.5-flash"
+        assert cheapest_model("unknown") is None
+
+
+@pytest.mark.asyncio
+class TestLLMBudget:
+    """Test suite for LLMBudget reservations"""
+
+    async def test_concurrent_reservations_never_overspend(self, budgets):
+        """Test that concurrent calls cannot reserve past the limit together"""
+        # Arrange
+        budgets.setattr(settings, "LLM_DAILY_TOKEN_LIMIT", 1000)
+        budget = LLMBudget(store=MemoryBudgetStore())
+
+        async def reserve():
+            try:
+                return await budget.reserve(100, 0.0)
+            except BudgetExceededError:
+                return None
+
+        # Act
+        reservations = await asyncio.gather(*(reserve() for _ in range(25)))
+
+        # Assert
+        assert sum(r is not None for r in reservations) == 10
+        assert budget.refused == 15
+
+    async def test_settle_reconciles_to_actual_usage(self, budgets):
+        """Test that an over-estimate is refunded once usage is known"""
+        # Arrange
+        budgets.setattr(settings, "LLM_DAILY_TOKEN_LIMIT", 1000)
+        store = MemoryBudgetStore()
+        budget = LLMBudget(store=store)
+
+        # Act
+        reservation = await budget.reserve(400, 0.02)
+        await budget.settle(reservation, 150, 0.005)
+        failed = await budget.reserve(300, 0.01)
+        await budget.release(failed)
+        tokens, cost = await store.usage(budget.period(), "global")
+
+        # Assert
+        assert tokens == 150
+        assert cost == pytest.approx(0.005)
+
+    async def test_tenant_limits_are_separate(self, budgets):
+        """Test that one tenant exhausting its budget leaves others unaffected"""
+        # Arrange
+        budgets.setattr(settings, "LLM_TENANT_DAILY_COST_LIMIT", 0.05)
+        budgets.setattr(settings, "LLM_TENANT_DAILY_COST_LIMITS", {"big": 1.0})
+        budget = LLMBudget(store=MemoryBudgetStore())
+
+        # Act
+        with tenant_scope("small"):
+            await budget.reserve(10, 0.04)
+            with pytest.raises(BudgetExceededError):
+                await budget.reserve(10, 0.04)
+        with tenant_scope("big"):
+            await budget.reserve(10, 0.5)
+
+        # Assert
+        assert await budget.state("small") == "exhausted"
+        assert await budget.state("big") == "ok"
+
+    async def test_database_store_shared_between_processes(self, budgets, tmp_path):
+        """Test that two stores on one database enforce one limit"""
+        # Arrange
+        budgets.setattr(settings, "LLM_DAILY_TOKEN_LIMIT", 250)
+        url = f"sqlite+aiosqlite:///{tmp_path / 'budget.sqlite3'}"
+        engine = create_async_engine(url)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await engine.dispose()
+        first, second = DatabaseBudgetStore(url), DatabaseBudgetStore(url)
+
+        # Act
+        await LLMBudget(store=first).reserve(100, 0.0)
+        await LLMBudget(store=second).reserve(100, 0.0)
+        with pytest.raises(BudgetExceededError):
+            await LLMBudget(store=first).reserve(100, 0.0)
+        usage = await second.usage(LLMBudget.period(), "global")
+        await first.aclose()
+        await second.aclose()
+
+        # Assert
+        assert usage == (200, 0.0)
+
+
+@pytest.mark.asyncio
+class TestAdapterBudget:
+    """Test suite for budget enforcement in LLMAdapter"""
+
+    async def test_calls_are_charged(self, budgets, adapter_factory, priced_provider):
+        """Test that a call's reported usage is charged to the budget"""
+        # Arrange
+        budgets.setattr(settings, "LLM_DAILY_COST_LIMIT", 10.0)
+        store = MemoryBudgetStore()
+        adapter = adapter_factory({"openai": priced_provider()}, budget=LLMBudget(store=store))
+
+        # Act
+        await adapter.evaluate_with_fallback("step", EvaluationOptions())
+
+        # Assert
+        assert await store.usage(LLMBudget.period(), "global") == (50, 0.01)
+
+    async def test_near_limit_uses_cheapest_model(self, budgets, adapter_factory, priced_provider):
+        """Test that a nearly spent budget switches to the cheapest model"""
+        # Arrange
+        budgets.setattr(settings, "LLM_DAILY_COST_LIMIT", 1.0)
+        store = MemoryBudgetStore()
+        await store.add(LLMBudget.period(), "global", 0, 0.85)
+        provider = priced_provider()
+        adapter = adapter_factory({"openai": provider}, budget=LLMBudget(store=store))
+
+        # Act
+        await adapter.evaluate_with_fallback("step", EvaluationOptions())
+
+        # Assert
+        assert provider.models == ["gpt-3.5-turbo"]
+        assert adapter.budget.degraded == 1
+
+    async def test_exhausted_budget_uses_local_tier(self, budgets, adapter_factory, priced_provider):
+        """Test that an exhausted budget scores with the local heuristics instead of failing"""
+        # Arrange
+        budgets.setattr(settings, "LLM_DAILY_COST_LIMIT", 1.0)
+        budgets.setattr(settings, "LLM_LOCAL_PROVIDER", "fallback")
+        store = MemoryBudgetStore()
+        await store.add(LLMBudget.period(), "global", 0, 1.0)
+        provider = priced_provider()
+        adapter = adapter_factory({"openai": provider}, budget=LLMBudget(store=store))
+
+        # Act
+        responses = await adapter.evaluate_parallel("**Domain**: algebra\n**Claim**: x = x", EvaluationOptions())
+
+        # Assert
+        assert provider.models == []
+        assert [r.provider for r in responses] == ["local"]
+        assert not adapter.matches_engine_version(responses[0])
+
+    async def test_budget_fallback_verdicts_not_reused(self, budgets, adapter_factory, priced_provider):
+        """Test that a step scored by the cheapest model is not stamped with the full engine version"""
+        # Arrange
+        budgets.setattr(settings, "LLM_DAILY_COST_LIMIT", 1.0)
+        budgets.setattr(settings, "LLM_ROUTING_MODE", "all")
+        budgets.setattr(settings, "LLM_TWO_PHASE", False)
+        budgets.setattr(settings, "LLM_SIMILARITY_ENABLED", False)
+        store = MemoryBudgetStore()
+        await store.add(LLMBudget.period(), "global", 0, 0.85)
+        engine = BackendProofEngine()
+        engine.llm_adapter = adapter_factory({"openai": priced_provider()}, budget=LLMBudget(store=store))
+        engine.has_llm = True
+        step = SimpleNamespace(id=1, step_index=0, claim="x = x", equation=None, dependencies=[])
+
+        # Act
+        result = await engine.evaluate(SimpleNamespace(id=1, domain="algebra", steps=[step]))
+
+        # Assert
+        assert result["step_results"][0]["degraded"] == ["semantic"]
+        assert result["step_results"][0]["semantic_version"] is None
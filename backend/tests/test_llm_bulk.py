@@ -0,0 +1,143 @@
+# [B] ProofCore Backend - Bulk Evaluation Tests
+# Tests for provider batch jobs and LLMAdapter.evaluate_bulk against the fake server
+
+import json
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.services.llm.base import EvaluationOptions, LLMUsage
+from app.services.llm.batch_jobs import AnthropicMessageBatches, BatchRequest, OpenAIBatchJobs
+from app.services.llm.budget import LLMBudget, MemoryBudgetStore
+from app.services.llm.cache import LLMResponseCache
+from scripts.fake_llm_server import PROVIDERS, FakeProviderProfile, create_app
+
+
+def _fake(**profile) -> httpx.AsyncClient:
+    profiles = {name: FakeProviderProfile(latency_ms=0, **profile) for name in PROVIDERS}
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=create_app(profiles, seed=3)), base_url="http://fake")
+
+
+def _requests(count: int, model: str) -> list:
+    return [BatchRequest(f"req-{i}", f"Evaluate step {i}", model, EvaluationOptions()) for i in range(count)]
+
+
+@pytest.mark.asyncio
+class TestBatchJobClients:
+    """Test suite for the OpenAI and Anthropic batch job wire formats"""
+
+    async def test_openai_batch_round_trip(self):
+        """Test that an OpenAI batch is uploaded, polled and read back per custom_id"""
+        # Arrange
+        async with _fake(batch_latency_ms=30) as http:
+            client = OpenAIBatchJobs("http://fake/v1", "key", http=http)
+
+            # Act
+            results = await client.run(_requests(3, "gpt-4o"), poll_interval=0.01, timeout=5)
+
+        # Assert
+        assert sorted(results) == ["req-0", "req-1", "req-2"]
+        completion = results["req-0"]
+        assert json.loads(completion.text)["score"] >= 0
+        assert completion.model == "gpt-4o"
+        full_price = client.cost_tracker.estimate("gpt-4o", completion.usage)
+        assert completion.cost == pytest.approx(full_price * 0.5)
+
+    async def test_anthropic_batch_round_trip(self, monkeypatch):
+        """Test that a Message Batch keeps the prompt-cache breakpoints and reports usage"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_PROMPT_CACHING", True)
+        async with _fake(batch_latency_ms=30) as http:
+            client = AnthropicMessageBatches("http://fake", "key", http=http)
+            requests = _requests(2, "claude-3-5-sonnet-20240620")
+
+            # Act
+            entry = client.request_entry(requests[0])
+            results = await client.run(requests, poll_interval=0.01, timeout=5)
+
+        # Assert
+        assert entry["params"]["system"][0]["cache_control"] == {"type": "ephemeral"}
+        assert sorted(results) == ["req-0", "req-1"]
+        assert results["req-1"].usage.total_tokens > 0
+
+    async def test_failed_requests_reported(self):
+        """Test that per-request failures come back as error messages, not completions"""
+        # Arrange
+        async with _fake(batch_latency_ms=0, server_error_rate=1.0) as http:
+            client = OpenAIBatchJobs("http://fake/v1", "key", http=http)
+
+            # Act
+            results = await client.run(_requests(2, "gpt-4o"), poll_interval=0.01, timeout=5)
+
+        # Assert
+        assert sorted(results) == ["req-0", "req-1"]
+        assert all(isinstance(outcome, str) for outcome in results.values())
+
+    async def test_unfinished_job_times_out(self):
+        """Test that a job still running after the timeout raises TimeoutError"""
+        # Arrange
+        async with _fake(batch_latency_ms=60_000) as http:
+            client = AnthropicMessageBatches("http://fake", "key", http=http)
+
+            # Act / Assert
+            with pytest.raises(TimeoutError):
+                await client.run(_requests(1, "claude-3-5-sonnet-20240620"), poll_interval=0.01, timeout=0.05)
+
+
+@pytest.mark.asyncio
+class TestEvaluateBulk:
+    """Test suite for LLMAdapter.evaluate_bulk"""
+
+    async def test_bulk_results_prefill_cache(self, tmp_path, adapter_factory, fake_provider):
+        """Test that bulk responses map back per key and serve later direct calls"""
+        # Arrange
+        openai = fake_provider("openai", 70, default_model="gpt-4o", reasoning="direct", usage=LLMUsage(total_tokens=10))
+        adapter = adapter_factory({"openai": openai}, cache=LLMResponseCache(path=str(tmp_path / "cache.sqlite3")))
+        prompts = {"proof-1:0": "Evaluate x + 0 = x", "proof-1:1": "Evaluate x * 1 = x"}
+
+        async with _fake(batch_latency_ms=0) as http:
+            # Act
+            results = await adapter.evaluate_bulk(
+                prompts, poll_interval=0.01, clients={"openai": OpenAIBatchJobs("http://fake/v1", "key", http=http)}
+            )
+            direct = await adapter.evaluate_with_fallback(prompts["proof-1:1"], EvaluationOptions())
+
+        # Assert
+        assert [len(responses) for responses in results.values()] == [1, 1]
+        assert results["proof-1:0"][0].provider == "openai"
+        assert direct.cached is True
+        assert direct.score == results["proof-1:1"][0].score
+        assert openai.calls == 0
+
+    async def test_provider_without_batch_api_called_directly(self, adapter_factory, fake_provider):
+        """Test that providers without a batch client fall back to regular calls"""
+        # Arrange
+        google = fake_provider("google", 70, default_model="gemini-1.5-pro", reasoning="direct", usage=LLMUsage(total_tokens=10))
+        adapter = adapter_factory({"google": google})
+
+        # Act
+        results = await adapter.evaluate_bulk({"a": "Evaluate a", "b": "Evaluate b"}, clients={})
+
+        # Assert
+        assert google.calls == 2
+        assert [r[0].reasoning for r in results.values()] == ["direct", "direct"]
+
+    async def test_job_charged_to_budget(self, monkeypatch, adapter_factory, fake_provider):
+        """Test that a job is charged its reported usage at batch prices"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_BUDGET_ENABLED", True)
+        monkeypatch.setattr(settings, "LLM_DAILY_COST_LIMIT", 10.0)
+        store = MemoryBudgetStore()
+        openai = fake_provider("openai", 70, default_model="gpt-4o", reasoning="direct", usage=LLMUsage(total_tokens=10))
+        adapter = adapter_factory({"openai": openai}, budget=LLMBudget(store=store))
+
+        async with _fake(batch_latency_ms=0) as http:
+            # Act
+            results = await adapter.evaluate_bulk(
+                {"a": "Evaluate a"}, poll_interval=0.01, clients={"openai": OpenAIBatchJobs("http://fake/v1", "key", http=http)}
+            )
+
+        # Assert
+        response = results["a"][0]
+        assert await store.usage(LLMBudget.period(), "global") == (response.usage.total_tokens, pytest.approx(response.cost))
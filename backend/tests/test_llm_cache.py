@@ -0,0 +1,114 @@
+# [B] ProofCore Backend - LLM Response Cache Tests
+# Unit tests for the persistent SQLite response cache
+
+import time
+import pytest
+
+from app.services.llm.base import EvaluationOptions, LLMResponse, LLMUsage
+from app.services.llm.cache import LLMResponseCache, cache_key
+
+
+def _response(score: int = 80) -> LLMResponse:
+    return LLMResponse(
+        provider="openai",
+        model="gpt-test",
+        score=score,
+        reasoning="ok",
+        raw_response={"id": "x"},
+        usage=LLMUsage(prompt_tokens=100, completion_tokens=20, total_tokens=120),
+        cost=0.002,
+        duration_ms=900,
+    )
+
+
+@pytest.mark.asyncio
+class TestLLMResponseCache:
+    """Test suite for the response cache"""
+
+    async def test_hit_costs_nothing(self, tmp_path):
+        """Test that a hit returns the stored score with zero cost"""
+        # Arrange
+        cache = LLMResponseCache(path=str(tmp_path / "cache.sqlite3"))
+        key = cache_key("openai", "gpt-test", "prompt", EvaluationOptions())
+        await cache.put(key, _response(73))
+
+        # Act
+        hit = await cache.get(key)
+
+        # Assert
+        assert hit.score == 73
+        assert hit.cached is True
+        assert hit.cost == 0.0
+        assert hit.usage.total_tokens == 0
+        assert await cache.get("missing") is None
+        assert cache.get_stats()["hits"] == 1
+
+    async def test_shared_between_instances(self, tmp_path):
+        """Test that a second process-level instance sees the same file"""
+        # Arrange
+        path = str(tmp_path / "cache.sqlite3")
+        writer, reader = LLMResponseCache(path=path), LLMResponseCache(path=path)
+        await writer.put("k", _response())
+
+        # Act & Assert
+        assert (await reader.get("k")).cached is True
+
+    async def test_ttl_expiry(self, tmp_path):
+        """Test that expired entries are ignored"""
+        # Arrange
+        cache = LLMResponseCache(path=str(tmp_path / "cache.sqlite3"), ttl_seconds=0.001)
+        await cache.put("k", _response())
+
+        # Act
+        time.sleep(0.01)
+
+        # Assert
+        assert await cache.get("k") is None
+
+    async def test_lru_eviction(self, tmp_path):
+        """Test that least recently used entries are evicted over the limit"""
+        # Arrange
+        cache = LLMResponseCache(path=str(tmp_path / "cache.sqlite3"), max_entries=2)
+        cache.EVICT_EVERY = 1
+        await cache.put("a", _response())
+        await cache.put("b", _response())
+        await cache.get("a")  # "b" is now least recently used
+
+        # Act
+        await cache.put("c", _response())
+
+        # Assert
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+        assert await cache.get("c") is not None
+
+
+def test_key_covers_sampling_options():
+    """Test that different sampling options do not share entries"""
+    # Act
+    base = cache_key("openai", "m", "p", EvaluationOptions(temperature=0.3))
+
+    # Assert
+    assert base == cache_key("openai", "m", "p", EvaluationOptions(temperature=0.3))
+    assert base != cache_key("openai", "m", "p", EvaluationOptions(temperature=0.7))
+    assert base != cache_key("openai", "m", "p", EvaluationOptions(json_mode=False))
+    assert base != cache_key("anthropic", "m", "p", EvaluationOptions(temperature=0.3))
+    assert base != cache_key("openai", "m", "p", EvaluationOptions(temperature=0.3), batch=True)
+
+
+@pytest.mark.asyncio
+async def test_adapter_serves_repeated_prompts_from_cache(tmp_path, adapter_factory, fake_provider):
+    """Test that the adapter calls the provider once per distinct prompt"""
+    # Arrange
+    provider = fake_provider("openai", default_model="gpt-test")
+    adapter = adapter_factory({"openai": provider}, cache=LLMResponseCache(path=str(tmp_path / "cache.sqlite3")))
+
+    # Act
+    first = await adapter.evaluate_parallel("same prompt", EvaluationOptions())
+    second = await adapter.evaluate_parallel("same prompt", EvaluationOptions())
+    await adapter.evaluate_parallel("other prompt", EvaluationOptions())
+
+    # Assert
+    assert provider.calls == 2
+    assert first[0].cached is False
+    assert second[0].cached is True
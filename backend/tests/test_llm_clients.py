@@ -0,0 +1,90 @@
+# [B] ProofCore Backend - Shared Provider Client Tests
+# Tests for the process-wide SDK client registry and pooled HTTP client
+
+import pytest
+
+from app.core.config import settings
+from app.services.llm import clients
+from app.services.llm.clients import ProviderClients, build_http_client
+
+
+@pytest.mark.asyncio
+class TestProviderClients:
+    """Test suite for the client registry"""
+
+    async def test_client_built_once(self):
+        """Test that every caller gets the same client"""
+        # Arrange
+        registry = ProviderClients()
+        built = []
+
+        def factory():
+            built.append(object())
+            return built[-1]
+
+        # Act
+        first = registry.get("openai", factory)
+        second = registry.get("openai", factory)
+
+        # Assert
+        assert first is second
+        assert len(built) == 1
+        assert "openai" in registry
+
+    async def test_shared_http_pool(self):
+        """Test that one HTTP client is shared until closed"""
+        # Arrange
+        registry = ProviderClients()
+
+        # Act
+        pool = registry.http_client()
+        same = registry.http_client()
+        await registry.aclose()
+
+        # Assert
+        assert pool is same
+        assert pool.is_closed
+        assert "openai" not in registry
+        assert registry.http_client() is not pool
+        await registry.aclose()
+
+    async def test_pool_limits_from_settings(self, monkeypatch):
+        """Test that pool size and keep-alive come from settings"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_HTTP_MAX_CONNECTIONS", 7)
+
+        # Act
+        client = build_http_client()
+
+        # Assert
+        assert client._transport._pool._max_connections == 7
+        await client.aclose()
+
+    async def test_http2_falls_back_without_h2(self, monkeypatch):
+        """Test that a missing h2 package degrades to HTTP/1.1 instead of failing"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_HTTP2", True)
+        monkeypatch.setattr(clients, "http2_available", lambda: False)
+
+        # Act
+        client = build_http_client()
+
+        # Assert
+        assert client._transport._pool._http2 is False
+        await client.aclose()
+
+    async def test_openai_providers_share_client(self, monkeypatch):
+        """Test that two OpenAI providers (two proofs) reuse one SDK client"""
+        # Arrange
+        pytest.importorskip("openai")
+        from app.services.llm.providers.openai import OpenAIProvider
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", "sk-test")
+        registry = ProviderClients()
+        monkeypatch.setattr("app.services.llm.providers.openai.provider_clients", registry)
+
+        # Act
+        first, second = OpenAIProvider(), OpenAIProvider()
+
+        # Assert
+        assert first.client is second.client
+        await registry.aclose()
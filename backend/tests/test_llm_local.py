@@ -0,0 +1,147 @@
+# [B] ProofCore Backend - Local Heuristic Provider Tests
+# Tests for offline semantic scoring and its registration with the adapter
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.services.llm.base import EvaluationOptions
+from app.services.llm.circuit_breaker import CircuitBreakers
+from app.services.llm.prompts import BATCH_SYSTEM_MESSAGE, build_batch_prompt, build_step_prompt, parse_batch_response
+from app.services.llm.providers.local import LocalHeuristicProvider, heuristic_score
+from app.services.llm.rate_limit import ProviderLimiters
+from app.services.llm.routing import ProviderRouter
+from app.services.llm_adapter import LLMAdapter
+
+
+def _step(index: int, claim: str, equation, reasoning):
+    return SimpleNamespace(step_index=index, claim=claim, equation=equation, reasoning=reasoning)
+
+
+def _adapter() -> LLMAdapter:
+    return LLMAdapter(cache=None, limiters=ProviderLimiters(), router=ProviderRouter(), breakers=CircuitBreakers())
+
+
+class TestHeuristicScore:
+    """Test suite for the deterministic scoring rules"""
+
+    def test_sound_algebra_step_scores_high(self):
+        """Test that a justified, non-degenerate step scores well"""
+        # Act
+        score, explanation = heuristic_score(
+            "x + 0 equals x",
+            "{'lhs': 'x + 0', 'rhs': 'x'}",
+            "Since 0 is the additive identity, adding it to x leaves x unchanged, then the claim follows",
+            "algebra",
+        )
+
+        # Assert
+        assert score >= 85
+        assert "no degenerate operations" in explanation
+
+    def test_degenerate_step_without_reasoning_scores_low(self):
+        """Test that division by zero and missing reasoning are penalized"""
+        # Act
+        score, explanation = heuristic_score("1 = 2", "{'lhs': '1/0', 'rhs': '2/0'}", None, "algebra")
+
+        # Assert
+        assert score <= 30
+        assert "degenerate algebraic operation" in explanation
+
+    def test_deterministic(self):
+        """Test that the same step always gets the same score"""
+        # Act
+        first = heuristic_score("a", "b", "because a implies b", "logic")
+        second = heuristic_score("a", "b", "because a implies b", "logic")
+
+        # Assert
+        assert first == second
+
+
+@pytest.mark.asyncio
+class TestLocalHeuristicProvider:
+    """Test suite for the provider interface"""
+
+    async def test_evaluates_single_step_prompt(self):
+        """Test that the fields of a step prompt are scored"""
+        # Arrange
+        provider = LocalHeuristicProvider()
+        step = _step(0, "x + 0 equals x", {"lhs": "x + 0", "rhs": "x"}, "Adding zero leaves x unchanged")
+        expected, _ = heuristic_score(step.claim, str(step.equation), step.reasoning, "algebra")
+
+        # Act
+        response = await provider.evaluate(build_step_prompt(step, "algebra"), EvaluationOptions())
+
+        # Assert
+        assert response.provider == "local"
+        assert response.score == expected
+        assert response.cost == 0.0
+
+    async def test_answers_batched_prompts(self):
+        """Test that a batch prompt gets one parseable entry per step"""
+        # Arrange
+        provider = LocalHeuristicProvider()
+        steps = [
+            _step(3, "x + 0 equals x", {"lhs": "x + 0", "rhs": "x"}, "Adding zero leaves x unchanged"),
+            _step(7, "1 = 2", {"lhs": "1/0", "rhs": "2/0"}, None),
+        ]
+
+        # Act
+        completion = await provider.complete(
+            build_batch_prompt(steps, "algebra"), EvaluationOptions(), system_message=BATCH_SYSTEM_MESSAGE
+        )
+        parsed = parse_batch_response(completion.text, [3, 7])
+
+        # Assert
+        assert parsed is not None
+        assert parsed[0].score > parsed[1].score
+
+
+class TestLocalProviderRegistration:
+    """Test suite for LLM_LOCAL_PROVIDER modes"""
+
+    @pytest.fixture(autouse=True)
+    def _no_api_keys(self, monkeypatch):
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", None)
+        monkeypatch.setattr(settings, "ANTHROPIC_API_KEY", None)
+        monkeypatch.setattr(settings, "GOOGLE_API_KEY", None)
+
+    def test_fallback_mode_registers_without_api_keys(self, monkeypatch):
+        """Test that air-gapped deployments still get a semantic provider"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_LOCAL_PROVIDER", "fallback")
+
+        # Act
+        adapter = _adapter()
+
+        # Assert
+        assert adapter.get_available_providers() == ["local"]
+        assert adapter.engine_version() == "local:heuristic-v1"
+
+    def test_off_mode_registers_nothing(self, monkeypatch):
+        """Test that the provider can be disabled"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_LOCAL_PROVIDER", "off")
+
+        # Act
+        adapter = _adapter()
+
+        # Assert
+        assert not adapter.has_providers()
+
+    def test_ranked_first_by_cost(self):
+        """Test that the free provider is the adaptive router's first choice"""
+        # Arrange
+        router = ProviderRouter(prefer="cost")
+        priced = SimpleNamespace(
+            default_model="gpt-4o",
+            cost_tracker=SimpleNamespace(estimate=lambda model, usage: 0.002)
+        )
+
+        # Act
+        ranked = router.rank({"openai": priced, "local": LocalHeuristicProvider()})
+
+        # Assert
+        assert ranked == ["local", "openai"]
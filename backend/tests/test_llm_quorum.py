@@ -0,0 +1,100 @@
+# [B] ProofCore Backend - Quorum Consensus Tests
+# Tests for returning semantic consensus before the slowest provider answers
+
+import time
+import pytest
+
+from app.services.llm.base import EvaluationOptions
+from app.services.llm_adapter import has_quorum
+
+
+class TestHasQuorum:
+    """Test suite for the agreement check"""
+
+    def test_agreeing_pair(self):
+        """Test that two close scores form a quorum of two"""
+        # Act & Assert
+        assert has_quorum([80, 85], quorum=2, tolerance=10)
+
+    def test_disagreeing_pair(self):
+        """Test that a wide spread is not a quorum"""
+        # Act & Assert
+        assert not has_quorum([80, 40], quorum=2, tolerance=10)
+
+    def test_any_subset_can_agree(self):
+        """Test that an outlier does not block agreement of the others"""
+        # Act & Assert
+        assert has_quorum([80, 40, 78], quorum=2, tolerance=10)
+        assert not has_quorum([80, 40, 60], quorum=2, tolerance=10)
+
+    def test_too_few_scores(self):
+        """Test that fewer scores than the quorum never agree"""
+        # Act & Assert
+        assert not has_quorum([80], quorum=2, tolerance=10)
+        assert not has_quorum([80, 80], quorum=0, tolerance=10)
+
+
+@pytest.mark.asyncio
+class TestQuorumEvaluation:
+    """Test suite for evaluate_parallel in quorum mode"""
+
+    async def test_returns_before_straggler(self, adapter_factory, fake_provider):
+        """Test that an agreeing quorum cancels the slowest provider"""
+        # Arrange
+        slow = fake_provider("c", 30, delay=5.0)
+        adapter = adapter_factory({"a": fake_provider("a", 80, delay=0.01), "b": fake_provider("b", 84, delay=0.02), "c": slow})
+
+        # Act
+        started = time.monotonic()
+        responses = await adapter.evaluate_parallel("prompt", EvaluationOptions(), quorum=2, tolerance=10)
+        elapsed = time.monotonic() - started
+
+        # Assert
+        assert sorted(r.score for r in responses) == [80, 84]
+        assert slow.cancelled
+        assert elapsed < 1.0
+
+    async def test_disagreement_waits_for_more(self, adapter_factory, fake_provider):
+        """Test that disagreeing early answers wait for another provider"""
+        # Arrange
+        adapter = adapter_factory({
+            "a": fake_provider("a", 80, delay=0.01),
+            "b": fake_provider("b", 40, delay=0.01),
+            "c": fake_provider("c", 78, delay=0.05),
+        })
+
+        # Act
+        responses = await adapter.evaluate_parallel("prompt", EvaluationOptions(), quorum=2, tolerance=10)
+
+        # Assert
+        assert sorted(r.score for r in responses) == [40, 78, 80]
+
+    async def test_failures_do_not_count(self, adapter_factory, fake_provider):
+        """Test that failed providers are skipped when forming a quorum"""
+        # Arrange
+        adapter = adapter_factory({
+            "a": fake_provider("a", 80, delay=0.01, fail=True),
+            "b": fake_provider("b", 75, delay=0.02),
+            "c": fake_provider("c", 70, delay=0.03),
+        })
+
+        # Act
+        responses = await adapter.evaluate_parallel("prompt", EvaluationOptions(), quorum=2, tolerance=10)
+
+        # Assert
+        assert sorted(r.score for r in responses) == [70, 75]
+
+    async def test_quorum_disabled_waits_for_all(self, adapter_factory, fake_provider):
+        """Test that quorum 0 keeps the wait-for-everyone behaviour"""
+        # Arrange
+        adapter = adapter_factory({
+            "a": fake_provider("a", 80, delay=0.01),
+            "b": fake_provider("b", 82, delay=0.01),
+            "c": fake_provider("c", 30, delay=0.05),
+        })
+
+        # Act
+        responses = await adapter.evaluate_parallel("prompt", EvaluationOptions(), quorum=0)
+
+        # Assert
+        assert len(responses) == 3
@@ -0,0 +1,161 @@
+# [B] ProofCore Backend - Adaptive Routing Tests
+# Tests for provider statistics, ranking and escalation of contentious steps
+
+import pytest
+
+from app.core.config import settings
+from app.services.llm.base import EvaluationOptions, LLMResponse, LLMUsage
+from app.services.llm.cost_tracker import CostTracker
+from app.services.llm.routing import ProviderRouter
+
+
+def _response(score: int, cost: float = 0.01, latency: int = 100) -> LLMResponse:
+    return LLMResponse(
+        provider="p", model="m", score=score, reasoning="", raw_response="",
+        usage=LLMUsage(), cost=cost, duration_ms=latency
+    )
+
+
+class TestProviderRouter:
+    """Test suite for ranking and escalation decisions"""
+
+    def test_cheapest_first(self):
+        """Test that observed cost ranks providers"""
+        # Arrange
+        router = ProviderRouter(prefer="cost")
+        router.record_response("a", _response(90, cost=0.02, latency=100))
+        router.record_response("b", _response(90, cost=0.005, latency=900))
+
+        # Act & Assert
+        assert router.rank({"a": None, "b": None}) == ["b", "a"]
+
+    def test_fastest_first(self):
+        """Test latency preference"""
+        # Arrange
+        router = ProviderRouter(prefer="latency")
+        router.record_response("a", _response(90, cost=0.02, latency=100))
+        router.record_response("b", _response(90, cost=0.005, latency=900))
+
+        # Act & Assert
+        assert router.rank({"a": None, "b": None}) == ["a", "b"]
+
+    def test_pricing_prior_before_first_call(self, fake_provider):
+        """Test that unobserved providers are ranked by CostTracker pricing"""
+        # Arrange
+        router = ProviderRouter(prefer="cost")
+        cheap = fake_provider("google", 90)
+        cheap.cost_tracker, cheap.default_model = CostTracker("google"), "gemini-1.5-flash"
+        pricey = fake_provider("openai", 90)
+        pricey.cost_tracker, pricey.default_model = CostTracker("openai"), "gpt-4"
+
+        # Act & Assert
+        assert router.rank({"openai": pricey, "google": cheap}) == ["google", "openai"]
+        assert pricey.cost_tracker.call_count == 0
+
+    def test_unreliable_ranked_last(self):
+        """Test that failing or disagreeing providers lose first place"""
+        # Arrange
+        router = ProviderRouter(prefer="cost")
+        router.record_response("cheap", _response(90, cost=0.001))
+        router.record_response("pricey", _response(90, cost=0.05))
+        for _ in range(3):
+            router.record_failure("cheap")
+
+        # Act & Assert
+        assert router.rank({"cheap": None, "pricey": None}) == ["pricey", "cheap"]
+
+    def test_deviation_from_consensus(self):
+        """Test that an outlier accumulates deviation and becomes unreliable"""
+        # Arrange
+        router = ProviderRouter()
+
+        # Act
+        router.record_consensus([_response(90), _response(88), _response(40)], ["a", "b", "c"])
+
+        # Assert
+        assert router.stats("a").deviation == pytest.approx(26.0)
+        assert router.stats("c").deviation == pytest.approx(49.0)
+        assert not router.is_reliable("c")
+
+    @pytest.mark.parametrize("score,escalate", [(95, False), (10, False), (60, True)])
+    def test_escalation_band(self, score, escalate):
+        """Test that only contentious scores from reliable providers escalate"""
+        # Act & Assert
+        assert ProviderRouter().should_escalate("a", _response(score)) is escalate
+
+    def test_periodic_audit(self):
+        """Test that every AUDIT_EVERY-th confident step is escalated"""
+        # Arrange
+        router = ProviderRouter()
+
+        # Act
+        decisions = [router.should_escalate("a", _response(95)) for _ in range(router.AUDIT_EVERY)]
+
+        # Assert
+        assert decisions[-1] is True
+        assert not any(decisions[:-1])
+
+
+@pytest.mark.asyncio
+class TestRoutedEvaluation:
+    """Test suite for LLMAdapter.evaluate_routed"""
+
+    @pytest.fixture(autouse=True)
+    def adaptive(self, monkeypatch):
+        monkeypatch.setattr(settings, "LLM_ROUTING_MODE", "adaptive")
+        monkeypatch.setattr(settings, "LLM_QUORUM", 0)
+        monkeypatch.setattr(settings, "LLM_MAX_RETRIES", 0)
+
+    async def test_confident_step_uses_one_provider(self, adapter_factory, fake_provider):
+        """Test that a clear score from the first choice is accepted alone"""
+        # Arrange
+        cheap, pricey = fake_provider("cheap", 95, cost=0.001), fake_provider("pricey", 95, cost=0.05)
+        router = ProviderRouter(prefer="cost")
+        router.record_response("cheap", _response(95, cost=0.001))
+        router.record_response("pricey", _response(95, cost=0.05))
+        adapter = adapter_factory({"cheap": cheap, "pricey": pricey}, router=router)
+
+        # Act
+        responses = await adapter.evaluate_routed("prompt", EvaluationOptions())
+
+        # Assert
+        assert len(responses) == 1
+        assert (cheap.calls, pricey.calls) == (1, 0)
+
+    async def test_contentious_step_escalates(self, adapter_factory, fake_provider):
+        """Test that a middling score brings in the other providers"""
+        # Arrange
+        first, second, third = fake_provider("a", 60), fake_provider("b", 65), fake_provider("c", 90)
+        router = ProviderRouter()
+        adapter = adapter_factory({"a": first, "b": second, "c": third}, router=router)
+
+        # Act
+        responses = await adapter.evaluate_routed("prompt", EvaluationOptions())
+
+        # Assert
+        assert sorted(r.score for r in responses) == [60, 65, 90]
+        assert router.escalated == 1
+        assert router.stats("c").deviation == pytest.approx(27.5)
+
+    async def test_failed_first_choice_falls_through(self, adapter_factory, fake_provider):
+        """Test that the next-ranked provider answers when the first fails"""
+        # Arrange
+        broken, backup = fake_provider("a", 95, fail=True), fake_provider("b", 95)
+        router = ProviderRouter()
+        adapter = adapter_factory({"a": broken, "b": backup}, router=router)
+
+        # Act
+        responses = await adapter.evaluate_routed("prompt", EvaluationOptions())
+
+        # Assert
+        assert [r.provider for r in responses] == ["b"]
+        assert router.stats("a").failures == 1
+
+    async def test_all_mode_queries_everyone(self, monkeypatch, adapter_factory, fake_provider):
+        """Test that LLM_ROUTING_MODE=all keeps parallel evaluation"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_ROUTING_MODE", "all")
+        adapter = adapter_factory({"a": fake_provider("a", 95), "b": fake_provider("b", 95)})
+
+        # Act & Assert
+        assert len(await adapter.evaluate_routed("prompt", EvaluationOptions())) == 2
@@ -0,0 +1,157 @@
+# [B] ProofCore Backend - In-Flight Request Coalescing Tests
+# Tests for SingleFlight and its use by LLMAdapter
+
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.services.deadline import Deadline, DeadlineExceeded, deadline_scope, with_deadline
+from app.services.llm.base import EvaluationOptions, LLMUsage
+from app.services.llm.singleflight import SingleFlight
+
+
+@pytest.fixture
+def slow_provider(fake_provider):
+    """Provider double whose calls wait until provider.release is set"""
+    def build():
+        usage = LLMUsage(prompt_tokens=100, completion_tokens=20, total_tokens=120)
+        return fake_provider("openai", 81, default_model="gpt-test", usage=usage, cost=0.002, release=asyncio.Event())
+    return build
+
+
+@pytest.mark.asyncio
+class TestSingleFlight:
+    """Test suite for SingleFlight"""
+
+    async def test_concurrent_callers_share_one_call(self):
+        """Test that callers with the same key await one call"""
+        # Arrange
+        flight = SingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 42
+
+        # Act
+        results = await asyncio.gather(*(flight.do("k", call) for _ in range(5)))
+
+        # Assert
+        assert len(calls) == 1
+        assert [value for value, _ in results] == [42] * 5
+        assert [shared for _, shared in results].count(False) == 1
+        assert flight.get_stats() == {"in_flight": 0, "leaders": 1, "coalesced": 4, "coalesce_rate": 0.8}
+
+    async def test_failure_shared_and_forgotten(self):
+        """Test that waiters see the call's error and the next caller retries"""
+        # Arrange
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ConnectionError("down")
+
+        async def succeed():
+            return "ok"
+
+        # Act
+        outcomes = await asyncio.gather(flight.do("k", fail), flight.do("k", fail), return_exceptions=True)
+        retry, shared = await flight.do("k", succeed)
+
+        # Assert
+        assert all(isinstance(outcome, ConnectionError) for outcome in outcomes)
+        assert (retry, shared) == ("ok", False)
+
+    async def test_leader_cancellation_keeps_call_for_waiters(self):
+        """Test that a cancelled leader does not cancel the call others await"""
+        # Arrange
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def call():
+            await release.wait()
+            return "done"
+
+        leader = asyncio.create_task(flight.do("k", call))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("k", call))
+        await asyncio.sleep(0)
+
+        # Act
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        # Assert
+        assert await follower == ("done", True)
+        assert leader.cancelled()
+
+    async def test_follower_retries_after_leader_deadline(self):
+        """Test that a follower with time left retries when the leader's deadline ends the call"""
+        # Arrange
+        flight = SingleFlight()
+        attempts = []
+
+        async def call():
+            attempts.append(1)
+            await with_deadline(asyncio.sleep(0.05))
+            return "done"
+
+        async def leader():
+            with deadline_scope(Deadline(0.01)):
+                return await flight.do("k", call)
+
+        # Act
+        leader_task = asyncio.create_task(leader())
+        await asyncio.sleep(0)
+        follower = await flight.do("k", call)
+
+        # Assert
+        assert follower == ("done", False)
+        assert len(attempts) == 2
+        with pytest.raises(DeadlineExceeded):
+            await leader_task
+
+
+@pytest.mark.asyncio
+class TestAdapterCoalescing:
+    """Test suite for coalescing in LLMAdapter"""
+
+    async def test_identical_prompts_make_one_request(self, monkeypatch, adapter_factory, slow_provider):
+        """Test that concurrent identical evaluations call the provider once"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_COALESCE_ENABLED", True)
+        provider = slow_provider()
+        adapter = adapter_factory({"openai": provider}, inflight=SingleFlight())
+        options = EvaluationOptions()
+
+        # Act
+        tasks = [asyncio.create_task(adapter.evaluate_with_fallback("same step", options)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        provider.release.set()
+        responses = await asyncio.gather(*tasks)
+
+        # Assert
+        assert provider.calls == 1
+        assert [r.score for r in responses] == [81, 81, 81]
+        assert sorted(r.cost for r in responses) == [0.0, 0.0, 0.002]
+        assert sum(r.cached for r in responses) == 2
+        assert adapter.inflight.get_stats()["coalesced"] == 2
+
+    async def test_disabled(self, monkeypatch, adapter_factory, slow_provider):
+        """Test that LLM_COALESCE_ENABLED=false makes every call separately"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_COALESCE_ENABLED", False)
+        provider = slow_provider()
+        adapter = adapter_factory({"openai": provider}, inflight=SingleFlight())
+
+        # Act
+        tasks = [asyncio.create_task(adapter.evaluate_with_fallback("same step", EvaluationOptions())) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        provider.release.set()
+        await asyncio.gather(*tasks)
+
+        # Assert
+        assert provider.calls == 2
@@ -0,0 +1,143 @@
+# [B] ProofCore Backend - Streaming Evaluation Tests
+# Tests for incremental score parsing and early stream cancellation
+
+import json
+import pytest
+
+from app.services.llm.base import BaseLLMProvider, EvaluationOptions, LLMCompletion, LLMUsage, ParsedResponse
+from app.services.llm.cache import cache_key
+from app.services.llm.streaming import SCORE_ONLY_REASONING, ScoreStreamParser, evaluate_streaming
+
+
+class _StreamingProvider(BaseLLMProvider):
+    """Provider double streaming a fixed completion in small chunks"""
+
+    provider_name = "streamer"
+    default_model = "stream-1"
+    supports_streaming = True
+
+    def __init__(self, text: str, chunk_size: int = 4):
+        self.text = text
+        self.chunk_size = chunk_size
+        self.chunks_sent = 0
+        self.closed = False
+        self.completions = 0
+
+    async def complete(self, prompt, options, system_message=None) -> LLMCompletion:
+        self.completions += 1
+        return LLMCompletion(provider=self.provider_name, model=self.default_model, text=self.text, usage=LLMUsage())
+
+    async def stream(self, prompt, options, system_message=None):
+        try:
+            for i in range(0, len(self.text), self.chunk_size):
+                self.chunks_sent += 1
+                yield self.text[i:i + self.chunk_size]
+        finally:
+            self.closed = True
+
+    def _parse_response(self, response: str) -> ParsedResponse:
+        return ParsedResponse(**json.loads(response))
+
+
+_COMPLETION = json.dumps({"score": 87, "reasoning": "The step follows from the previous one. " * 10})
+
+
+class TestScoreStreamParser:
+    """Test suite for incremental score extraction"""
+
+    def test_score_split_across_chunks(self):
+        """Test that a number split across chunks is not read early"""
+        # Arrange
+        parser = ScoreStreamParser()
+
+        # Act
+        partial = [parser.feed(chunk) for chunk in ['{"sco', 're": 8', '7, "reas']]
+
+        # Assert
+        assert partial == [None, None, 87]
+
+    def test_out_of_range_ignored(self):
+        """Test that an invalid score is not accepted"""
+        # Arrange
+        parser = ScoreStreamParser()
+
+        # Act & Assert
+        assert parser.feed('{"score": 150, ') is None
+
+    def test_score_at_end_of_object(self):
+        """Test a score followed directly by a closing brace"""
+        # Act & Assert
+        assert ScoreStreamParser().feed('{"reasoning": "ok", "score": 42}') == 42
+
+
+@pytest.mark.asyncio
+class TestStreamingEvaluation:
+    """Test suite for evaluate_streaming and its use in LLMAdapter"""
+
+    async def test_stream_cancelled_after_score(self):
+        """Test that a score-only stream stops reading after the score"""
+        # Arrange
+        provider = _StreamingProvider(_COMPLETION)
+        options = EvaluationOptions(stream=True, include_reasoning=False)
+
+        # Act
+        response = await evaluate_streaming(provider, "prompt", options)
+
+        # Assert
+        assert response.score == 87
+        assert response.reasoning == SCORE_ONLY_REASONING
+        assert provider.closed
+        assert provider.chunks_sent < len(_COMPLETION) / provider.chunk_size / 4
+
+    async def test_reasoning_requested_reads_everything(self):
+        """Test that asking for reasoning keeps the whole stream"""
+        # Arrange
+        provider = _StreamingProvider(_COMPLETION)
+        options = EvaluationOptions(stream=True, include_reasoning=True)
+
+        # Act
+        response = await evaluate_streaming(provider, "prompt", options)
+
+        # Assert
+        assert response.score == 87
+        assert response.reasoning.startswith("The step follows")
+        assert response.raw_response == _COMPLETION
+
+    async def test_adapter_streams_when_requested(self, adapter_factory):
+        """Test that the adapter uses streaming instead of a full completion"""
+        # Arrange
+        provider = _StreamingProvider(_COMPLETION)
+        adapter = adapter_factory({"streamer": provider})
+
+        # Act
+        responses = await adapter.evaluate_parallel("prompt", EvaluationOptions(stream=True, include_reasoning=False))
+
+        # Assert
+        assert responses[0].score == 87
+        assert provider.completions == 0
+        assert provider.closed
+
+    async def test_adapter_completes_without_streaming_support(self, adapter_factory, fake_provider):
+        """Test that stream=True falls back to a full completion for providers without streaming"""
+        # Arrange
+        provider = fake_provider("plain", 64)
+        adapter = adapter_factory({"plain": provider})
+
+        # Act
+        responses = await adapter.evaluate_parallel("prompt", EvaluationOptions(stream=True))
+        chunks = [chunk async for chunk in provider.stream("prompt", EvaluationOptions())]
+
+        # Assert
+        assert responses[0].score == 64
+        assert provider.calls == 2
+        assert len(chunks) == 1
+
+    async def test_score_only_cached_separately(self):
+        """Test that score-only responses never answer calls that want reasoning"""
+        # Arrange
+        full = EvaluationOptions()
+        score_only = EvaluationOptions(stream=True, include_reasoning=False)
+
+        # Act & Assert
+        assert cache_key("p", "m", "prompt", full) != cache_key("p", "m", "prompt", score_only)
+        assert cache_key("p", "m", "prompt", full) == cache_key("p", "m", "prompt", EvaluationOptions(stream=True))
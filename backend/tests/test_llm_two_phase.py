@@ -0,0 +1,99 @@
+# [B] ProofCore Backend - Two-Phase Semantic Evaluation Tests
+# Tests for score-only first passes and on-demand reasoning
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.services.llm.base import EvaluationOptions
+from app.services.llm.prompts import SCORE_ONLY_SYSTEM_MESSAGE, SYSTEM_MESSAGE, build_step_prompt, system_message_for
+from app.services.verification import BackendProofEngine
+
+
+def _engine(adapter) -> BackendProofEngine:
+    engine = BackendProofEngine()
+    engine.llm_adapter = adapter
+    engine.has_llm = True
+    return engine
+
+
+def _step():
+    return SimpleNamespace(id=1, step_index=0, claim="x + 0 = x", equation={"lhs": "x + 0", "rhs": "x"}, reasoning="identity")
+
+
+class TestScoreOnlyPrompts:
+    """Test suite for score-only prompt selection"""
+
+    def test_score_only_prompt_omits_reasoning(self):
+        """Test that the first-pass prompt does not ask for reasoning"""
+        # Act
+        full = build_step_prompt(_step(), "algebra")
+        quick = build_step_prompt(_step(), "algebra", include_reasoning=False)
+
+        # Assert
+        assert '"reasoning"' in full
+        assert '"reasoning"' not in quick
+
+    def test_system_message_follows_options(self):
+        """Test that score-only calls use the compact system message"""
+        # Assert
+        assert system_message_for(EvaluationOptions(include_reasoning=False)) == SCORE_ONLY_SYSTEM_MESSAGE
+        assert system_message_for(EvaluationOptions()) == SYSTEM_MESSAGE
+
+
+@pytest.mark.asyncio
+class TestTwoPhaseEvaluation:
+    """Test suite for BackendProofEngine with LLM_TWO_PHASE"""
+
+    @pytest.fixture(autouse=True)
+    def _two_phase(self, monkeypatch):
+        monkeypatch.setattr(settings, "LLM_TWO_PHASE", True)
+        monkeypatch.setattr(settings, "LLM_SCORE_ONLY_MAX_TOKENS", 16)
+        monkeypatch.setattr(settings, "LLM_REASONING_BELOW", 70.0)
+        monkeypatch.setattr(settings, "LLM_QUORUM_TOLERANCE", 10.0)
+        monkeypatch.setattr(settings, "LLM_ROUTING_MODE", "all")
+
+    async def test_confident_step_skips_reasoning(self, adapter_factory, fake_provider):
+        """Test that a high, agreed score is settled by the score-only pass"""
+        # Arrange
+        a, b = fake_provider("a", 60, quick_score=92), fake_provider("b", 60, quick_score=90)
+        engine = _engine(adapter_factory({"a": a, "b": b}))
+
+        # Act
+        score, degraded = await engine._evaluate_semantic(_step(), "algebra")
+
+        # Assert
+        assert score == 91.0
+        assert not degraded
+        assert a.calls == b.calls == 1
+        assert a.options[0].score_only and a.options[0].max_tokens == 16
+
+    async def test_low_score_requests_reasoning(self, adapter_factory, fake_provider):
+        """Test that a low first-pass score triggers a reasoned evaluation"""
+        # Arrange
+        a = fake_provider("a", 55, quick_score=40)
+        engine = _engine(adapter_factory({"a": a}))
+
+        # Act
+        score, degraded = await engine._evaluate_semantic(_step(), "algebra")
+
+        # Assert
+        assert score == 55.0
+        assert not degraded
+        assert [options.score_only for options in a.options] == [True, False]
+        assert a.options[1].max_tokens == 300
+
+    async def test_disagreement_requests_reasoning(self, adapter_factory, fake_provider):
+        """Test that providers far apart trigger a reasoned evaluation"""
+        # Arrange
+        a, b = fake_provider("a", 80, quick_score=95), fake_provider("b", 84, quick_score=75)
+        engine = _engine(adapter_factory({"a": a, "b": b}))
+
+        # Act
+        score, degraded = await engine._evaluate_semantic(_step(), "algebra")
+
+        # Assert
+        assert score == 82.0
+        assert not degraded
+        assert a.calls == b.calls == 2
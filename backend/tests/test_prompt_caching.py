@@ -0,0 +1,154 @@
+# [B] ProofCore Backend - Prompt Prefix Caching Tests
+# Tests for stable prompt prefixes and cached-token accounting
+
+import httpx
+import pytest
+from types import SimpleNamespace
+
+from app.core.config import settings
+from app.services.llm.base import EvaluationOptions, LLMUsage
+from app.services.llm.cost_tracker import CostTracker
+from app.services.llm.prompts import (
+    SYSTEM_MESSAGE,
+    VARIABLE_SECTION,
+    build_batch_prompt,
+    build_step_prompt,
+    split_cacheable_prefix,
+)
+from app.services.llm.providers.anthropic import AnthropicProvider
+from app.services.llm.providers.local import LocalHeuristicProvider
+from scripts.fake_llm_server import FakeProviderProfile, create_app
+
+
+def _step(index: int, claim: str):
+    return SimpleNamespace(id=index, step_index=index, claim=claim, equation={"lhs": claim, "rhs": "x"}, reasoning="identity")
+
+
+class TestStablePrefix:
+    """Test suite for prompt layout"""
+
+    def test_prefix_identical_across_steps(self):
+        """Test that only the step content differs between step prompts"""
+        # Act
+        first, first_rest = split_cacheable_prefix(build_step_prompt(_step(0, "x + 0"), "algebra"))
+        second, second_rest = split_cacheable_prefix(build_step_prompt(_step(1, "x * 1"), "geometry"))
+
+        # Assert
+        assert first and first == second
+        assert first_rest.startswith(VARIABLE_SECTION)
+        assert "algebra" in first_rest and "geometry" in second_rest
+        assert "x + 0" not in first
+
+    def test_batch_prefix_stable(self):
+        """Test that batch prompts keep the steps after the prefix"""
+        # Act
+        prefix, rest = split_cacheable_prefix(build_batch_prompt([_step(0, "a"), _step(1, "b")], "algebra"))
+        other, _ = split_cacheable_prefix(build_batch_prompt([_step(2, "c")], "logic"))
+
+        # Assert
+        assert prefix == other
+        assert "### Step" in rest and "### Step" not in prefix
+
+    def test_free_text_has_no_prefix(self):
+        """Test that prompts without the section marker are sent whole"""
+        # Assert
+        assert split_cacheable_prefix("just a prompt") == ("", "just a prompt")
+
+
+class TestAnthropicBreakpoint:
+    """Test suite for the Anthropic cache_control layout"""
+
+    def test_breakpoint_closes_prefix(self, monkeypatch):
+        """Test that the breakpoint marks the end of the stable prefix"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_PROMPT_CACHING", True)
+        prompt = build_step_prompt(_step(0, "x + 0"), "algebra")
+
+        # Act
+        system, messages = AnthropicProvider._request_content(None, prompt, EvaluationOptions(), None)
+
+        # Assert
+        blocks = messages[0]["content"]
+        assert system == [{"type": "text", "text": SYSTEM_MESSAGE}]
+        assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in blocks[1]
+        assert blocks[0]["text"] + blocks[1]["text"] == prompt
+
+    def test_disabled_sends_plain_request(self, monkeypatch):
+        """Test that LLM_PROMPT_CACHING=false keeps the plain message layout"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_PROMPT_CACHING", False)
+
+        # Act
+        system, messages = AnthropicProvider._request_content(None, "prompt", EvaluationOptions(), None)
+
+        # Assert
+        assert system == SYSTEM_MESSAGE
+        assert messages == [{"role": "user", "content": "prompt"}]
+
+
+class TestCachedTokenCost:
+    """Test suite for CostTracker cache pricing"""
+
+    def test_cached_tokens_discounted(self):
+        """Test that cache reads cost less and cache writes cost more"""
+        # Arrange
+        tracker = CostTracker(provider="anthropic")
+        model = "claude-3-5-sonnet-20240620"
+
+        # Act
+        plain = tracker.estimate(model, LLMUsage(prompt_tokens=1000))
+        read = tracker.estimate(model, LLMUsage(prompt_tokens=1000, cached_tokens=1000))
+        write = tracker.estimate(model, LLMUsage(prompt_tokens=1000, cache_write_tokens=1000))
+
+        # Assert
+        assert read == pytest.approx(plain * 0.1)
+        assert write == pytest.approx(plain * 1.25)
+
+    def test_hit_rate_in_stats(self):
+        """Test that stats report the share of prompt tokens served from cache"""
+        # Arrange
+        tracker = CostTracker(provider="openai")
+
+        # Act
+        tracker.calculate("gpt-4o", LLMUsage(prompt_tokens=800, cached_tokens=600))
+        tracker.calculate("gpt-4o", LLMUsage(prompt_tokens=200))
+        stats = tracker.get_stats()
+
+        # Assert
+        assert stats["cached_tokens"] == 600
+        assert stats["prompt_cache_hit_rate"] == 0.6
+
+
+@pytest.mark.asyncio
+class TestPrefixConsumers:
+    """Test suite for components that read the new prompt layout"""
+
+    async def test_local_provider_reads_domain(self):
+        """Test that the offline provider still finds the domain after the prefix"""
+        # Arrange
+        prompt = build_step_prompt(_step(0, "x/0"), "algebra")
+        prompt = prompt.replace("{'lhs': 'x/0', 'rhs': 'x'}", "1/0")
+
+        # Act
+        completion = await LocalHeuristicProvider().complete(prompt, EvaluationOptions())
+
+        # Assert
+        assert "degenerate" in completion.text
+
+    async def test_fake_server_reports_cache_reads(self):
+        """Test that the fake server bills a repeated prefix as cached"""
+        # Arrange
+        profiles = {name: FakeProviderProfile(latency_ms=0, prompt_cache_min_tokens=1) for name in ("openai", "anthropic", "google")}
+        prompt = build_step_prompt(_step(0, "x + 0"), "algebra")
+        request = {"model": "gpt-4o", "messages": [{"role": "system", "content": SYSTEM_MESSAGE}, {"role": "user", "content": prompt}]}
+
+        # Act
+        transport = httpx.ASGITransport(app=create_app(profiles, seed=1))
+        async with httpx.AsyncClient(transport=transport, base_url="http://fake") as client:
+            first = (await client.post("/v1/chat/completions", json=request)).json()["usage"]
+            second = (await client.post("/v1/chat/completions", json=request)).json()["usage"]
+
+        # Assert
+        assert first["prompt_tokens_details"]["cached_tokens"] == 0
+        assert 0 < second["prompt_tokens_details"]["cached_tokens"] < second["prompt_tokens"]
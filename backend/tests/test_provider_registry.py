@@ -0,0 +1,77 @@
+# [B] ProofCore Backend - Provider Registry Tests
+# Tests for providers registered by name and lazily imported SDKs
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.core.config import settings
+from app.services.llm.providers import PROVIDERS, ProviderSpec, configured_providers, create_provider
+from app.services.llm_adapter import LLMAdapter
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+
+class _RegisteredProvider:
+    """Stand-in provider class resolved through the registry"""
+    default_model = "stand-in"
+
+
+class TestProviderRegistry:
+    """Test suite for the provider registry"""
+
+    def test_only_configured_providers(self, monkeypatch):
+        """Test that providers without an API key are not listed"""
+        # Arrange
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", None)
+        monkeypatch.setattr(settings, "ANTHROPIC_API_KEY", "sk-ant-test")
+        monkeypatch.setattr(settings, "GOOGLE_API_KEY", None)
+
+        # Assert
+        assert configured_providers() == ["anthropic"]
+
+    def test_adapter_creates_providers_by_name(self, monkeypatch):
+        """Test that LLMAdapter instantiates registered providers from their module path"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_LOCAL_PROVIDER", "off")
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", "sk-test")
+        monkeypatch.setattr(settings, "ANTHROPIC_API_KEY", None)
+        monkeypatch.setattr(settings, "GOOGLE_API_KEY", None)
+        monkeypatch.setitem(PROVIDERS, "openai", ProviderSpec(__name__, "_RegisteredProvider", "OPENAI_API_KEY", "OpenAI"))
+
+        # Act
+        adapter = LLMAdapter()
+
+        # Assert
+        assert isinstance(adapter.services["openai"], _RegisteredProvider)
+        assert adapter.fallback_order == ["openai", "anthropic", "google", "local"]
+
+    def test_missing_sdk_reported_on_use(self, monkeypatch):
+        """Test that a configured provider without its SDK fails when created, not at import"""
+        # Arrange
+        monkeypatch.setattr(settings, "GOOGLE_API_KEY", "test-key")
+        monkeypatch.setitem(sys.modules, "google.generativeai", None)
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="not installed"):
+            create_provider("google")
+
+    def test_startup_imports_no_sdk(self):
+        """Test that importing the adapter in a fresh process loads no provider SDK"""
+        # Arrange
+        code = (
+            "import json, sys\n"
+            "import app.services.llm_adapter\n"
+            "print(json.dumps([m for m in ('openai', 'anthropic', 'google.generativeai') if m in sys.modules]))\n"
+        )
+
+        # Act
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout
+
+        # Assert
+        assert json.loads(output.strip().splitlines()[-1]) == []
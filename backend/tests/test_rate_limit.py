@@ -0,0 +1,200 @@
+# [B] ProofCore Backend - LLM Rate Limiting Tests
+# Tests for token buckets, per-provider concurrency and queue-wait metrics
+
+import asyncio
+import json
+import pytest
+
+from app.api.endpoints.metrics import get_llm_metrics
+from app.services.llm.base import BaseLLMProvider, EvaluationOptions, LLMCompletion, LLMUsage, ParsedResponse
+from app.services.llm.rate_limit import ProviderLimiter, ProviderLimiters, TokenBucket, estimate_tokens
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _SlowProvider(BaseLLMProvider):
+    """Provider double that records its peak concurrency"""
+
+    default_model = "slow-1"
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def complete(self, prompt, options, system_message=None) -> LLMCompletion:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        usage = LLMUsage(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+        return LLMCompletion(provider="slow", model=self.default_model, text='{"score": 70, "reasoning": "ok"}', usage=usage)
+
+    def _parse_response(self, response: str) -> ParsedResponse:
+        return ParsedResponse(**json.loads(response))
+
+
+class TestTokenBucket:
+    """Test suite for the token bucket"""
+
+    def test_burst_then_delay(self):
+        """Test that a full bucket absorbs a burst and then asks callers to wait"""
+        # Arrange
+        clock = _Clock()
+        bucket = TokenBucket(per_minute=60, clock=clock)
+
+        # Act
+        first = bucket.reserve(60)
+        second = bucket.reserve(30)
+
+        # Assert - refill is 1 token/second
+        assert first == 0.0
+        assert second == pytest.approx(30.0)
+
+    def test_refill_and_refund(self):
+        """Test continuous refill, capped at capacity, and refunds"""
+        # Arrange
+        clock = _Clock()
+        bucket = TokenBucket(per_minute=60, capacity=10, clock=clock)
+        bucket.reserve(10)
+
+        # Act
+        clock.now = 4.0
+        refilled = bucket.available
+        bucket.refund(100)
+
+        # Assert
+        assert refilled == pytest.approx(4.0)
+        assert bucket.available == 10
+
+    def test_oversized_reservation_clamped(self):
+        """Test that a call larger than the bucket waits for a full bucket, not forever"""
+        # Arrange
+        bucket = TokenBucket(per_minute=60, capacity=10, clock=_Clock())
+        bucket.reserve(10)
+
+        # Act & Assert
+        assert bucket.reserve(1000) == pytest.approx(10.0)
+
+    def test_estimate_tokens(self):
+        """Test that estimates include the completion budget"""
+        # Act & Assert
+        assert estimate_tokens("x" * 400, 512) == 612
+
+
+@pytest.mark.asyncio
+class TestProviderLimiter:
+    """Test suite for per-provider admission"""
+
+    async def test_concurrency_limit(self):
+        """Test that calls beyond the slot count queue locally"""
+        # Arrange
+        limiter = ProviderLimiter("p", concurrency=2)
+        active, peak = 0, 0
+
+        async def call():
+            nonlocal active, peak
+            async with limiter.acquire():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        # Act
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        # Assert
+        stats = limiter.get_stats()
+        assert peak == 2
+        assert stats["calls"] == 6
+        assert stats["delayed_calls"] >= 4
+        assert stats["in_flight"] == 0 and stats["waiting"] == 0
+
+    async def test_token_budget_delays_call(self):
+        """Test that an exhausted token budget delays, rather than fails, the next call"""
+        # Arrange - 1000 tokens/second
+        limiter = ProviderLimiter("p", concurrency=4, tokens_per_minute=60_000)
+        async with limiter.acquire(60_000):
+            pass
+
+        # Act
+        async with limiter.acquire(100) as grant:
+            waited = grant.wait_seconds
+
+        # Assert
+        assert waited >= 0.08
+        assert limiter.get_stats()["max_wait_ms"] >= 80
+
+    async def test_settle_refunds_overestimate(self):
+        """Test that actual usage replaces the estimate"""
+        # Arrange
+        limiter = ProviderLimiter("p", concurrency=1, tokens_per_minute=1000)
+
+        # Act
+        async with limiter.acquire(800) as grant:
+            grant.settle(200)
+
+        # Assert
+        assert limiter.tokens.available == pytest.approx(800, abs=1)
+
+    async def test_cancelled_wait_releases_budget(self):
+        """Test that a caller cancelled while queued gives back its slot and budget"""
+        # Arrange
+        limiter = ProviderLimiter("p", concurrency=1, requests_per_minute=1)
+        async with limiter.acquire():
+            pass
+
+        # Act
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire(0).__aenter__(), timeout=0.05)
+
+        # Assert
+        assert limiter.waiting == 0
+        assert not limiter._semaphore.locked()
+        assert limiter.requests.available == pytest.approx(0, abs=0.01)
+
+
+@pytest.mark.asyncio
+class TestAdapterRateLimiting:
+    """Test suite for rate limiting inside LLMAdapter"""
+
+    async def test_adapters_share_provider_limit(self, monkeypatch, adapter_factory):
+        """Test that two adapters (two proofs) share one provider limit"""
+        # Arrange
+        monkeypatch.setattr("app.core.config.settings.LLM_CONCURRENCY", {"slow": 1})
+        # Both adapters send the same prompts; count every call, not coalesced ones
+        monkeypatch.setattr("app.core.config.settings.LLM_COALESCE_ENABLED", False)
+        limiters = ProviderLimiters()
+        provider = _SlowProvider()
+        adapters = [adapter_factory({"slow": provider}, limiters=limiters) for _ in range(2)]
+
+        # Act
+        await asyncio.gather(*(
+            adapter.evaluate_parallel(f"prompt {i}", EvaluationOptions())
+            for i in range(3) for adapter in adapters
+        ))
+
+        # Assert
+        stats = limiters.get_stats()["slow"]
+        assert provider.peak == 1
+        assert stats["calls"] == 6
+        assert stats["concurrency"] == 1
+
+    async def test_metrics_endpoint(self, monkeypatch):
+        """Test that /metrics/llm reports limiter stats"""
+        # Arrange
+        limiters = ProviderLimiters()
+        async with limiters.get("openai").acquire():
+            pass
+        monkeypatch.setattr("app.api.endpoints.metrics.provider_limiters", limiters)
+
+        # Act
+        metrics = await get_llm_metrics(api_key="test")
+
+        # Assert
+        assert metrics.providers["openai"].calls == 1
@@ -0,0 +1,151 @@
+# [B] ProofCore Backend - Stale Job Reaper Tests
+# Integration tests for requeueing and failing proofs stuck in 'processing'
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import update
+
+from app.core.config import settings
+from app.crud.crud_proof import proof as crud_proof
+from app.models.proof import Proof, ProofStatus
+from app.schemas.proof import ProofCreate, ProofStepCreate
+from app.services.reaper import StaleProofReaper
+
+
+async def _processing_proof(db, deadline_offset_seconds: float, attempts: int = 1) -> int:
+    """Create a proof stuck in 'processing' with the given deadline offset from now"""
+    db_proof = await crud_proof.create_with_steps(
+        db=db,
+        obj_in=ProofCreate(domain="algebra", steps=[ProofStepCreate(claim="x = x")])
+    )
+    await db.execute(
+        update(Proof)
+        .where(Proof.id == db_proof.id)
+        .values(
+            status=ProofStatus.PROCESSING,
+            attempts=attempts,
+            deadline_at=datetime.now(timezone.utc) + timedelta(seconds=deadline_offset_seconds)
+        )
+    )
+    await db.commit()
+    return db_proof.id
+
+
+@pytest.mark.asyncio
+class TestStaleProofReaper:
+    """Test suite for the stale-job reaper"""
+
+    async def test_update_status_records_transition(self, db_session):
+        """Test that entering processing records attempts and deadline"""
+        # Arrange
+        db_proof = await crud_proof.create_with_steps(
+            db=db_session,
+            obj_in=ProofCreate(domain="algebra", steps=[ProofStepCreate(claim="x = x")])
+        )
+
+        # Act
+        await crud_proof.update_status(db_session, proof_id=db_proof.id, status="processing", timeout_seconds=60)
+        loaded = await crud_proof.get(db=db_session, id=db_proof.id)
+        await db_session.refresh(loaded)
+
+        # Assert
+        assert loaded.attempts == 1
+        assert loaded.started_at is not None
+        assert loaded.deadline_at is not None
+        assert loaded.finished_at is None
+
+    async def test_requeues_stale_proof_with_attempts_left(self, db_session):
+        """Test that a proof past its deadline is requeued"""
+        # Arrange
+        requeued = []
+        proof_id = await _processing_proof(db_session, deadline_offset_seconds=-600, attempts=1)
+        reaper = StaleProofReaper(grace_seconds=30, max_attempts=2, requeue=requeued.append)
+
+        # Act
+        outcome = await reaper.reap_once(db_session)
+
+        # Assert
+        assert outcome == {"requeued": [proof_id], "failed": []}
+        assert [p.id for p in requeued] == [proof_id]
+        loaded = await crud_proof.get(db=db_session, id=proof_id)
+        await db_session.refresh(loaded)
+        assert loaded.status == ProofStatus.PENDING
+
+    async def test_fails_stale_proof_out_of_attempts(self, db_session):
+        """Test that a proof out of attempts is marked failed"""
+        # Arrange
+        proof_id = await _processing_proof(db_session, deadline_offset_seconds=-600, attempts=2)
+        reaper = StaleProofReaper(grace_seconds=30, max_attempts=2, requeue=lambda p: None)
+
+        # Act
+        outcome = await reaper.reap_once(db_session)
+
+        # Assert
+        assert outcome == {"requeued": [], "failed": [proof_id]}
+        loaded = await crud_proof.get(db=db_session, id=proof_id)
+        await db_session.refresh(loaded)
+        assert loaded.status == ProofStatus.FAILED
+        assert loaded.finished_at is not None
+        assert "attempt" in loaded.status_detail
+
+    async def test_ignores_proof_within_deadline(self, db_session):
+        """Test that in-flight proofs are left alone"""
+        # Arrange
+        await _processing_proof(db_session, deadline_offset_seconds=300)
+        reaper = StaleProofReaper(grace_seconds=30, requeue=lambda p: None)
+
+        # Act
+        outcome = await reaper.reap_once(db_session)
+
+        # Assert
+        assert outcome == {"requeued": [], "failed": []}
+
+    async def test_transition_only_once(self, db_session):
+        """Test that only one reaper wins a transition"""
+        # Arrange
+        proof_id = await _processing_proof(db_session, deadline_offset_seconds=-600)
+
+        # Act
+        first = await crud_proof.transition_if_processing(db_session, proof_id=proof_id, status="pending")
+        second = await crud_proof.transition_if_processing(db_session, proof_id=proof_id, status="pending")
+
+        # Assert
+        assert first is True
+        assert second is False
+
+    async def test_recovers_pending_proofs_after_restart(self, db_session):
+        """Test that pending proofs lost with the in-memory queue are requeued"""
+        # Arrange
+        pending_ids = []
+        for _ in range(2):
+            db_proof = await crud_proof.create_with_steps(
+                db=db_session,
+                obj_in=ProofCreate(domain="algebra", steps=[ProofStepCreate(claim="x = x")])
+            )
+            pending_ids.append(db_proof.id)
+        await _processing_proof(db_session, deadline_offset_seconds=300)
+        requeued = []
+        reaper = StaleProofReaper(requeue=requeued.append)
+
+        # Act
+        recovered = await reaper.recover_pending(db_session)
+
+        # Assert
+        assert recovered == pending_ids
+        assert [p.id for p in requeued] == pending_ids
+
+    async def test_recover_pending_is_noop_in_worker_mode(self, db_session, monkeypatch):
+        """Test that worker mode leaves pending proofs for workers to claim"""
+        # Arrange
+        monkeypatch.setattr(settings, "VERIFICATION_MODE", "worker")
+        await crud_proof.create_with_steps(
+            db=db_session,
+            obj_in=ProofCreate(domain="algebra", steps=[ProofStepCreate(claim="x = x")])
+        )
+        reaper = StaleProofReaper()
+
+        # Act
+        recovered = await reaper.recover_pending(db_session)
+
+        # Assert
+        assert recovered == []
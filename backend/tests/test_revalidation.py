@@ -0,0 +1,188 @@
+# [B] ProofCore Backend - Incremental Revalidation Tests
+# Tests for reusing step verdicts across re-verification runs
+
+import pytest
+from types import SimpleNamespace
+
+from app.core.config import settings
+from app.crud.crud_proof import proof as crud_proof
+from app.models.proof import ProofStatus
+from app.schemas.proof import ProofCreate, ProofStepCreate
+from app.services.verification import BackendProofEngine, step_content_hash
+
+
+def _proof(*claims):
+    steps = [
+        SimpleNamespace(id=i + 1, step_index=i, claim=claim, equation=None, dependencies=[])
+        for i, claim in enumerate(claims)
+    ]
+    return SimpleNamespace(id=1, domain="algebra", steps=steps)
+
+
+@pytest.fixture
+def engine():
+    """Proof engine with counted, deterministic symbolic/semantic checks"""
+    proof_engine = BackendProofEngine()
+    proof_engine.calls = {"symbolic": 0, "semantic": 0}
+
+    async def verify_symbolic(step):
+        proof_engine.calls["symbolic"] += 1
+        return True, False
+
+    async def evaluate_semantic(step, domain):
+        proof_engine.calls["semantic"] += 1
+        return 80.0, False
+
+    proof_engine._verify_symbolic = verify_symbolic
+    proof_engine._evaluate_semantic = evaluate_semantic
+    return proof_engine
+
+
+def _result(lii: float) -> dict:
+    return {
+        "is_valid": True,
+        "lii_score": lii,
+        "confidence_interval": [lii - 5, lii + 5],
+        "coherence_score": 100.0,
+        "step_results": [],
+        "feedback": [],
+    }
+
+
+@pytest.mark.asyncio
+class TestIncrementalEvaluation:
+    """Test suite for step verdict reuse in the proof engine"""
+
+    async def test_unchanged_proof_reuses_every_step(self, engine):
+        """Test that revalidating an unchanged proof makes no engine calls"""
+        # Arrange
+        first = await engine.evaluate(_proof("a", "b", "c"))
+        engine.calls = {"symbolic": 0, "semantic": 0}
+
+        # Act
+        second = await engine.evaluate(_proof("a", "b", "c"), previous_step_results=first["step_results"])
+
+        # Assert
+        assert engine.calls == {"symbolic": 0, "semantic": 0}
+        assert second["reused_steps"] == {"symbolic": 3, "semantic": 3}
+        assert second["lii_score"] == first["lii_score"]
+
+    async def test_only_changed_steps_are_reverified(self, engine):
+        """Test that an edited step is re-verified and the others reused"""
+        # Arrange
+        first = await engine.evaluate(_proof("a", "b", "c"))
+        engine.calls = {"symbolic": 0, "semantic": 0}
+
+        # Act
+        second = await engine.evaluate(_proof("a", "edited", "c"), previous_step_results=first["step_results"])
+
+        # Assert
+        assert engine.calls == {"symbolic": 1, "semantic": 1}
+        assert [sr["reused"] for sr in second["step_results"]][1] == []
+
+    async def test_provider_rollout_reruns_semantic_only(self, engine):
+        """Test that a semantic engine version change keeps symbolic verdicts"""
+        # Arrange
+        first = await engine.evaluate(_proof("a", "b"))
+        engine.calls = {"symbolic": 0, "semantic": 0}
+        engine.semantic_version = "openai:gpt-new/prompt-1"
+
+        # Act
+        await engine.evaluate(_proof("a", "b"), previous_step_results=first["step_results"])
+
+        # Assert
+        assert engine.calls == {"symbolic": 0, "semantic": 2}
+
+    async def test_weight_change_is_free(self, engine):
+        """Test that new weights are applied to reused verdicts"""
+        # Arrange
+        first = await engine.evaluate(_proof("a"))
+        engine.calls = {"symbolic": 0, "semantic": 0}
+        engine.symbolic_weight, engine.semantic_weight = 0.5, 0.5
+
+        # Act
+        second = await engine.evaluate(_proof("a"), previous_step_results=first["step_results"])
+
+        # Assert
+        assert engine.calls == {"symbolic": 0, "semantic": 0}
+        assert second["step_results"][0]["hybrid_score"] == 90.0
+
+    async def test_degraded_verdicts_are_not_reused(self, monkeypatch, adapter_factory, fake_provider):
+        """Test that the neutral score from an all-providers-failed run is re-evaluated"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_MAX_RETRIES", 0)
+        monkeypatch.setattr(settings, "LLM_ROUTING_MODE", "all")
+        monkeypatch.setattr(settings, "LLM_SIMILARITY_ENABLED", False)
+        monkeypatch.setattr(settings, "LLM_TWO_PHASE", False)
+        provider = fake_provider("down", fail=True)
+        proof_engine = BackendProofEngine()
+        proof_engine.llm_adapter = adapter_factory({"down": provider})
+        proof_engine.has_llm = True
+        first = await proof_engine.evaluate(_proof("a"))
+        calls_after_first = provider.calls
+
+        # Act
+        second = await proof_engine.evaluate(_proof("a"), previous_step_results=first["step_results"])
+
+        # Assert
+        assert first["step_results"][0]["degraded"] == ["semantic"]
+        assert first["step_results"][0]["semantic_version"] is None
+        assert calls_after_first > 0
+        assert provider.calls > calls_after_first
+        assert second["reused_steps"] == {"symbolic": 1, "semantic": 0}
+
+
+class TestStepContentHash:
+    """Test suite for step content hashing"""
+
+    def test_content_hash_covers_domain_and_dependencies(self):
+        """Test that everything a verdict depends on changes the hash"""
+        # Arrange
+        step = _proof("a").steps[0]
+        moved = SimpleNamespace(**{**vars(step), "dependencies": ["0"]})
+
+        # Act & Assert
+        assert step_content_hash(step, "algebra") == step_content_hash(step, "algebra")
+        assert step_content_hash(step, "algebra") != step_content_hash(step, "logic")
+        assert step_content_hash(step, "algebra") != step_content_hash(moved, "algebra")
+
+
+@pytest.mark.asyncio
+class TestRevalidationRequests:
+    """Test suite for revalidation state transitions"""
+
+    async def test_only_finished_proofs_can_be_revalidated(self, db_session):
+        """Test that pending proofs are rejected and finished ones requeued"""
+        # Arrange
+        db_proof = await crud_proof.create_with_steps(
+            db=db_session, obj_in=ProofCreate(domain="algebra", steps=[ProofStepCreate(claim="x = x")])
+        )
+
+        # Act & Assert
+        assert await crud_proof.request_revalidation(db_session, proof_id=db_proof.id) is False
+
+        await crud_proof.update_status(db_session, proof_id=db_proof.id, status=ProofStatus.COMPLETED)
+        assert await crud_proof.request_revalidation(db_session, proof_id=db_proof.id) is True
+        assert await crud_proof.request_revalidation(db_session, proof_id=db_proof.id) is False
+
+    async def test_save_result_replaces_and_force_discards(self, db_session):
+        """Test result upsert and forced full revalidation"""
+        # Arrange
+        db_proof = await crud_proof.create_with_steps(
+            db=db_session, obj_in=ProofCreate(domain="algebra", steps=[ProofStepCreate(claim="x = x")])
+        )
+        await crud_proof.save_result(db_session, proof_id=db_proof.id, obj_in=_result(60.0))
+        await crud_proof.update_status(db_session, proof_id=db_proof.id, status=ProofStatus.COMPLETED)
+
+        # Act
+        replaced = await crud_proof.save_result(db_session, proof_id=db_proof.id, obj_in=_result(90.0))
+        replaced_lii = replaced.lii_score
+        await crud_proof.request_revalidation(db_session, proof_id=db_proof.id, force=True)
+        proof_id = db_proof.id
+        db_session.expire_all()
+        reloaded = await crud_proof.get(db=db_session, id=proof_id)
+
+        # Assert
+        assert replaced_lii == 90.0
+        assert reloaded.status == ProofStatus.PENDING
+        assert reloaded.result is None
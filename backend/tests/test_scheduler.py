@@ -0,0 +1,149 @@
+# [B] ProofCore Backend - Scheduler Tests
+# Unit tests for priority lanes, fair queueing and job cost estimation
+
+import pytest
+from types import SimpleNamespace
+
+from app.services.scheduler import (
+    FairShareScheduler,
+    JobPriority,
+    VerificationJob,
+    equation_complexity,
+    estimate_job_cost,
+    tenant_id_for_key,
+)
+
+
+def _job(proof_id, tenant="a", priority=JobPriority.INTERACTIVE, cost=1.0):
+    return VerificationJob(proof_id=proof_id, db_url="sqlite://", priority=priority, tenant=tenant, cost=cost)
+
+
+def _drain(scheduler):
+    order = []
+    while scheduler:
+        order.append(scheduler.pop().proof_id)
+    return order
+
+
+class TestJobCost:
+    """Test suite for expected job cost estimation"""
+
+    def test_equation_complexity_grows_with_size(self):
+        """Test that longer equations are more complex"""
+        # Act
+        small = equation_complexity({"lhs": "x", "rhs": "1"})
+        large = equation_complexity({"lhs": "(x + 1)**2 - 2*x*y", "rhs": "x**2 + 1 - 2*x*y + 2*x"})
+
+        # Assert
+        assert 0 < small < large
+
+    def test_equation_complexity_without_equation(self):
+        """Test that steps without equations add no symbolic cost"""
+        # Act & Assert
+        assert equation_complexity(None) == 0.0
+        assert equation_complexity({}) == 0.0
+
+    def test_estimate_job_cost_counts_steps(self):
+        """Test that cost scales with step count"""
+        # Arrange
+        steps = [SimpleNamespace(claim="c", equation=None) for _ in range(4)]
+
+        # Act & Assert
+        assert estimate_job_cost(steps) == 4.0
+
+    def test_tenant_id_hides_api_key(self):
+        """Test that tenant IDs are stable and do not leak the key"""
+        # Act
+        tenant = tenant_id_for_key("secret-key")
+
+        # Assert
+        assert tenant == tenant_id_for_key("secret-key")
+        assert "secret" not in tenant
+        assert tenant_id_for_key(None) == "default"
+
+
+class TestFairShareScheduler:
+    """Test suite for verification job ordering"""
+
+    def test_shortest_job_first_within_tenant(self):
+        """Test that cheaper jobs from one tenant run first"""
+        # Arrange
+        scheduler = FairShareScheduler(bulk_share=0)
+        scheduler.push(_job(1, cost=200))
+        scheduler.push(_job(2, cost=3))
+        scheduler.push(_job(3, cost=20))
+
+        # Act & Assert
+        assert _drain(scheduler) == [2, 3, 1]
+
+    def test_interactive_before_bulk(self):
+        """Test that interactive jobs are dispatched ahead of bulk jobs"""
+        # Arrange
+        scheduler = FairShareScheduler(bulk_share=0)
+        scheduler.push(_job(1, priority=JobPriority.BULK))
+        scheduler.push(_job(2))
+
+        # Act & Assert
+        assert _drain(scheduler) == [2, 1]
+
+    def test_bulk_lane_not_starved(self):
+        """Test that bulk gets its reserved share while interactive is busy"""
+        # Arrange
+        scheduler = FairShareScheduler(bulk_share=0.25)
+        for proof_id in range(8):
+            scheduler.push(_job(proof_id))
+        scheduler.push(_job(100, priority=JobPriority.BULK))
+
+        # Act
+        order = _drain(scheduler)
+
+        # Assert - bulk job runs as the 4th dispatch, not last
+        assert order.index(100) == 3
+
+    def test_heavy_tenant_does_not_starve_light_tenant(self):
+        """Test fair sharing between a bulk-heavy and a light tenant"""
+        # Arrange
+        scheduler = FairShareScheduler(bulk_share=0)
+        for proof_id in range(50):
+            scheduler.push(_job(proof_id, tenant="heavy", cost=200))
+        scheduler.push(_job(1000, tenant="light", cost=2))
+
+        # Act
+        order = _drain(scheduler)
+
+        # Assert
+        assert order.index(1000) <= 1
+
+    def test_cost_weighted_fairness(self):
+        """Test that tenants share dispatch by cost served, not job count"""
+        # Arrange
+        scheduler = FairShareScheduler(bulk_share=0)
+        for proof_id in range(3):
+            scheduler.push(_job(proof_id, tenant="big", cost=10))
+        for proof_id in range(10, 20):
+            scheduler.push(_job(proof_id, tenant="small", cost=1))
+
+        # Act
+        first_five = _drain(scheduler)[:5]
+
+        # Assert - after one big job, small jobs catch up on served cost
+        assert sum(1 for p in first_five if p >= 10) >= 4
+
+    def test_oldest_and_depths(self):
+        """Test introspection helpers"""
+        # Arrange
+        scheduler = FairShareScheduler()
+        first = _job(1, tenant="a")
+        scheduler.push(first)
+        scheduler.push(_job(2, tenant="b", priority=JobPriority.BULK))
+
+        # Act & Assert
+        assert scheduler.oldest() is first
+        assert scheduler.lane_depths() == {"interactive": 1, "bulk": 1}
+        assert scheduler.tenant_depths() == {"a": 1, "b": 1}
+        assert len(scheduler) == 2
+
+    def test_pop_empty_returns_none(self):
+        """Test that popping an empty scheduler returns None"""
+        # Act & Assert
+        assert FairShareScheduler().pop() is None
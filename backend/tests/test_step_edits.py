@@ -0,0 +1,141 @@
+# [B] ProofCore Backend - Step Edit Tests
+# Tests for dependency resolution and partial re-verification after step edits
+
+import pytest
+from types import SimpleNamespace
+
+from app.crud.crud_proof import proof as crud_proof
+from app.models.proof import ProofStatus
+from app.schemas.proof import ProofCreate, ProofStepCreate, ProofStepUpdate
+from app.services.step_graph import dependency_targets, downstream_steps
+
+
+def _steps(*dependencies):
+    return [
+        SimpleNamespace(id=100 + i, step_index=i, dependencies=deps)
+        for i, deps in enumerate(dependencies)
+    ]
+
+
+class TestStepGraph:
+    """Test suite for dependency resolution"""
+
+    def test_reference_formats(self):
+        """Test that index, ID and prefixed references resolve"""
+        # Arrange
+        steps = _steps([], [], [])
+
+        # Act & Assert
+        assert dependency_targets("1", steps) == {1}
+        assert dependency_targets(2, steps) == {2}
+        assert dependency_targets("step_0", steps) == {0}
+        assert dependency_targets("101", steps) == {1}
+        assert dependency_targets("unrelated", steps) == set()
+
+    def test_downstream_is_transitive(self):
+        """Test that dependents of dependents are affected"""
+        # Arrange: 0 <- 1 <- 2, 3 independent
+        steps = _steps([], ["0"], ["1"], [])
+
+        # Act & Assert
+        assert downstream_steps(steps, {0}) == {0, 1, 2}
+        assert downstream_steps(steps, {2}) == {2}
+        assert downstream_steps(steps, {3}) == {3}
+
+    def test_cycles_terminate(self):
+        """Test that circular dependencies do not loop forever"""
+        # Arrange
+        steps = _steps(["1"], ["0"])
+
+        # Act & Assert
+        assert downstream_steps(steps, {0}) == {0, 1}
+
+
+def _result(step_count: int) -> dict:
+    return {
+        "is_valid": True,
+        "lii_score": 80.0,
+        "confidence_interval": [75.0, 85.0],
+        "coherence_score": 100.0,
+        "step_results": [{"step_index": i, "content_hash": f"h{i}"} for i in range(step_count)],
+        "feedback": [],
+    }
+
+
+async def _finished_proof(db) -> int:
+    db_proof = await crud_proof.create_with_steps(
+        db=db,
+        obj_in=ProofCreate(
+            domain="algebra",
+            steps=[
+                ProofStepCreate(claim="a"),
+                ProofStepCreate(claim="b", dependencies=["0"]),
+                ProofStepCreate(claim="c", dependencies=["1"]),
+                ProofStepCreate(claim="d"),
+            ]
+        )
+    )
+    await crud_proof.save_result(db, proof_id=db_proof.id, obj_in=_result(4))
+    await crud_proof.update_status(db, proof_id=db_proof.id, status=ProofStatus.COMPLETED)
+    return db_proof.id
+
+
+@pytest.mark.asyncio
+class TestEditSteps:
+    """Test suite for step edits"""
+
+    async def test_edit_invalidates_downstream_verdicts(self, db_session):
+        """Test that only edited and downstream verdicts are dropped"""
+        # Arrange
+        proof_id = await _finished_proof(db_session)
+
+        # Act
+        stale = await crud_proof.edit_steps(
+            db_session, proof_id=proof_id, edits=[ProofStepUpdate(step_index=1, claim="b2")]
+        )
+        db_session.expire_all()
+        db_proof = await crud_proof.get(db=db_session, id=proof_id)
+
+        # Assert
+        assert stale == [1, 2]
+        assert db_proof.status == ProofStatus.PENDING
+        assert [s.claim for s in db_proof.steps] == ["a", "b2", "c", "d"]
+        assert [sr["step_index"] for sr in db_proof.result.step_results] == [0, 3]
+
+    async def test_unset_fields_are_kept(self, db_session):
+        """Test that omitted fields keep their value"""
+        # Arrange
+        proof_id = await _finished_proof(db_session)
+
+        # Act
+        await crud_proof.edit_steps(
+            db_session, proof_id=proof_id, edits=[ProofStepUpdate(step_index=2, equation={"lhs": "x", "rhs": "x"})]
+        )
+        db_session.expire_all()
+        db_proof = await crud_proof.get(db=db_session, id=proof_id)
+
+        # Assert
+        assert db_proof.steps[2].claim == "c"
+        assert db_proof.steps[2].dependencies == ["1"]
+        assert db_proof.steps[2].equation == {"lhs": "x", "rhs": "x"}
+
+    async def test_edit_rejected_while_queued(self, db_session):
+        """Test that pending proofs cannot be edited"""
+        # Arrange
+        proof_id = await _finished_proof(db_session)
+        await crud_proof.edit_steps(db_session, proof_id=proof_id, edits=[ProofStepUpdate(step_index=0, claim="a2")])
+
+        # Act
+        stale = await crud_proof.edit_steps(db_session, proof_id=proof_id, edits=[ProofStepUpdate(step_index=0, claim="a3")])
+
+        # Assert
+        assert stale is None
+
+    async def test_unknown_step_index(self, db_session):
+        """Test that edits to missing steps are rejected before any change"""
+        # Arrange
+        proof_id = await _finished_proof(db_session)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await crud_proof.edit_steps(db_session, proof_id=proof_id, edits=[ProofStepUpdate(step_index=9, claim="x")])
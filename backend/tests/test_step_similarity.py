@@ -0,0 +1,164 @@
+# [B] ProofCore Backend - Near-Duplicate Step Tests
+# Tests for the MinHash LSH index and semantic score reuse
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.services.llm.similarity import StepSimilarityIndex, canonical_equation, jaccard, shingles
+from app.services.verification import BackendProofEngine
+
+
+def _step(claim, lhs="x + 5", rhs="10", reasoning=None, index=0):
+    return SimpleNamespace(
+        id=index + 1, step_index=index, claim=claim, equation={"lhs": lhs, "rhs": rhs},
+        reasoning=reasoning, dependencies=[]
+    )
+
+
+class TestNormalization:
+    """Test suite for step text normalization"""
+
+    def test_equation_variables_renamed(self):
+        """Test that equations differing only in variable names and spacing match"""
+        # Act
+        first, _ = canonical_equation({"lhs": "x + 5", "rhs": "10"})
+        second, _ = canonical_equation({"lhs": "y+5", "rhs": " 10"})
+        other, _ = canonical_equation({"lhs": "y + 6", "rhs": "10"})
+
+        # Assert
+        assert first == second == "v0+5=10"
+        assert other != first
+
+    def test_functions_not_renamed(self):
+        """Test that function names are kept"""
+        # Act
+        text, names = canonical_equation("sin(t)**2 + cos(t)**2 = 1")
+
+        # Assert
+        assert text == "sin(v0)**2+cos(v0)**2=1"
+        assert names == {"t": "v0"}
+
+    def test_rewording_matches(self):
+        """Test that inflection and stop words do not matter"""
+        # Act
+        first = shingles("Subtract 5 from both sides")
+        second = shingles("subtracting 5 on both sides")
+
+        # Assert
+        assert jaccard(first, second) == 1.0
+        assert jaccard(first, shingles("Divide both sides by 5")) < 0.5
+
+
+class TestStepSimilarityIndex:
+    """Test suite for StepSimilarityIndex"""
+
+    def test_near_duplicate_reuses_score(self):
+        """Test that a reworded step with a renamed variable finds the earlier score"""
+        # Arrange
+        index = StepSimilarityIndex(max_entries=10)
+        index.add(_step("Subtract 5 from both sides of x + 5 = 10"), "algebra", "v1", 83.0)
+
+        # Act
+        score = index.lookup(_step("subtracting 5 on both sides of y + 5 = 10", lhs="y + 5"), "algebra", "v1", threshold=0.8)
+
+        # Assert
+        assert score == 83.0
+        assert index.get_stats()["hits"] == 1
+
+    def test_namespace_separates_matches(self):
+        """Test that another equation, domain or engine version never matches"""
+        # Arrange
+        index = StepSimilarityIndex(max_entries=10)
+        index.add(_step("Subtract 5 from both sides"), "algebra", "v1", 83.0)
+
+        # Assert
+        assert index.lookup(_step("Subtract 5 from both sides", lhs="x + 6"), "algebra", "v1") is None
+        assert index.lookup(_step("Subtract 5 from both sides"), "geometry", "v1") is None
+        assert index.lookup(_step("Subtract 5 from both sides"), "algebra", "v2") is None
+
+    def test_dissimilar_text_misses(self):
+        """Test that a different argument for the same equation is scored afresh"""
+        # Arrange
+        index = StepSimilarityIndex(max_entries=10)
+        index.add(_step("Subtract 5 from both sides"), "algebra", "v1", 83.0)
+
+        # Act
+        score = index.lookup(_step("Guess a value and check it works"), "algebra", "v1", threshold=0.8)
+
+        # Assert
+        assert score is None
+
+    def test_eviction(self):
+        """Test that the oldest entry is dropped beyond max_entries"""
+        # Arrange
+        index = StepSimilarityIndex(max_entries=1)
+
+        # Act
+        index.add(_step("Subtract 5 from both sides"), "algebra", "v1", 83.0)
+        index.add(_step("Add 3 to both sides", lhs="x - 3", rhs="2"), "algebra", "v1", 90.0)
+
+        # Assert
+        assert len(index) == 1
+        assert index.lookup(_step("Subtract 5 from both sides"), "algebra", "v1") is None
+
+
+@pytest.mark.asyncio
+class TestEngineReuse:
+    """Test suite for near-duplicate reuse in BackendProofEngine"""
+
+    async def test_second_proof_skips_semantic_call(self, monkeypatch):
+        """Test that a reworded step in a later proof reuses the score"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_SIMILARITY_ENABLED", True)
+        monkeypatch.setattr(settings, "LLM_SIMILARITY_THRESHOLD", 0.8)
+        engine = BackendProofEngine(similarity_index=StepSimilarityIndex(max_entries=10))
+        engine.has_llm = True
+        calls = []
+
+        async def verify_symbolic(step):
+            return True, False
+
+        async def evaluate_semantic(step, domain):
+            calls.append(step.claim)
+            return 77.0, False
+
+        engine._verify_symbolic = verify_symbolic
+        engine._evaluate_semantic = evaluate_semantic
+        first = SimpleNamespace(id=1, domain="algebra", steps=[_step("Subtract 5 from both sides")])
+        second = SimpleNamespace(id=2, domain="algebra", steps=[_step("subtracting 5 on both sides", lhs="z + 5")])
+
+        # Act
+        await engine.evaluate(first)
+        result = await engine.evaluate(second)
+
+        # Assert
+        assert calls == ["Subtract 5 from both sides"]
+        assert result["step_results"][0]["semantic_score"] == 77.0
+        assert result["step_results"][0]["reused"] == ["similar"]
+        assert result["similar_steps"] == 1
+
+    async def test_degraded_scores_not_indexed(self, monkeypatch):
+        """Test that a neutral or budget-fallback score is never offered to near-duplicates"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_SIMILARITY_ENABLED", True)
+        monkeypatch.setattr(settings, "LLM_SIMILARITY_THRESHOLD", 0.8)
+        index = StepSimilarityIndex(max_entries=10)
+        engine = BackendProofEngine(similarity_index=index)
+        engine.has_llm = True
+
+        async def verify_symbolic(step):
+            return True, False
+
+        async def evaluate_semantic(step, domain):
+            return 50.0, True
+
+        engine._verify_symbolic = verify_symbolic
+        engine._evaluate_semantic = evaluate_semantic
+
+        # Act
+        await engine.evaluate(SimpleNamespace(id=1, domain="algebra", steps=[_step("Subtract 5 from both sides")]))
+
+        # Assert
+        assert len(index) == 0
@@ -1,9 +1,21 @@
 # [B] ProofCore Backend - Symbolic Verifier Tests
 # Unit tests for SymPy-based symbolic verification
 
+import asyncio
+import json
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
-from app.services.symbolic_verifier import BackendSymbolicVerifier
+from app.services.symbolic_verifier import (
+    BackendSymbolicVerifier,
+    SymbolicWorkerPool,
+    symbolic_pool,
+    verify_equation_sync,
+)
 
 
 @pytest.mark.asyncio
@@ -136,3 +148,55 @@ class TestSymbolicVerifier:
 
         # Assert
         assert result is True
+
+
+class TestLazySympy:
+    """Test suite for keeping SymPy out of the API process"""
+
+    def test_api_import_is_sympy_free(self):
+        """Test that importing the API app in a fresh process does not import SymPy"""
+        # Arrange
+        code = "import json, sys\nimport main\nprint(json.dumps('sympy' in sys.modules))\n"
+
+        # Act
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=Path(__file__).parent.parent, capture_output=True, text=True, check=True
+        ).stdout
+
+        # Assert
+        assert json.loads(output.strip().splitlines()[-1]) is False
+
+    def test_pool_job_is_picklable(self):
+        """Test that the pool job is a plain function the executor can pickle"""
+        # Act
+        job = pickle.loads(pickle.dumps(verify_equation_sync))
+
+        # Assert
+        assert job("x + 1", "1 + x") is True
+
+
+@pytest.mark.asyncio
+class TestSymbolicWorkerPool:
+    """Test suite for the shared SymPy worker pool"""
+
+    async def test_verifiers_share_pool(self):
+        """Test that every verifier (one per proof) uses the process-wide pool"""
+        # Assert
+        assert BackendSymbolicVerifier().pool is BackendSymbolicVerifier().pool is symbolic_pool
+
+    async def test_job_retried_after_recycle(self):
+        """Test that a job lost to another proof's pool recycle runs again on a fresh pool"""
+        # Arrange
+        pool = SymbolicWorkerPool(max_workers=1)
+        verifier = BackendSymbolicVerifier(pool=pool)
+        first = pool.executor()
+
+        # Act
+        job = asyncio.ensure_future(verifier.verify_equation("x + x", "2*x"))
+        await asyncio.sleep(0)
+        pool.recycle(first)
+        result = await job
+        pool.shutdown()
+
+        # Assert
+        assert result is True
@@ -0,0 +1,136 @@
+# [B] ProofCore Backend - Verification Queue Tests
+# Unit tests for admission control and bounded dispatch
+
+import asyncio
+import pytest
+
+from app.services.verification_queue import VerificationQueue, QueueFullError
+
+
+@pytest.mark.asyncio
+class TestVerificationQueue:
+    """Test suite for the verification queue"""
+
+    @pytest.fixture
+    def calls(self):
+        """Record of runner invocations"""
+        return []
+
+    @pytest.fixture
+    def queue(self, calls):
+        """Create a small queue with a recording runner"""
+        async def runner(proof_id: int, db_url: str):
+            calls.append(proof_id)
+            await asyncio.sleep(0)
+
+        return VerificationQueue(max_concurrent=2, max_depth=3, max_wait_seconds=60, runner=runner)
+
+    async def test_admits_within_limits(self, queue):
+        """Test that submissions under the limits are admitted"""
+        # Arrange
+        queue.enqueue(1, "sqlite://")
+        queue.enqueue(2, "sqlite://")
+
+        # Act & Assert (no exception)
+        queue.check_admission()
+
+    async def test_rejects_when_depth_exceeded(self, queue):
+        """Test that a full queue raises QueueFullError with retry hint"""
+        # Arrange
+        for proof_id in range(3):
+            queue.enqueue(proof_id, "sqlite://")
+
+        # Act & Assert
+        with pytest.raises(QueueFullError) as exc_info:
+            queue.check_admission()
+        assert exc_info.value.retry_after >= 1
+        assert queue.get_stats()["accepting"] is False
+
+    async def test_rejects_batch_that_would_overflow(self, queue):
+        """Test that admission accounts for the number of proofs submitted"""
+        # Arrange
+        queue.enqueue(1, "sqlite://")
+
+        # Act & Assert
+        with pytest.raises(QueueFullError):
+            queue.check_admission(count=3)
+
+    async def test_rejects_when_oldest_job_too_old(self, queue):
+        """Test that an old backlog is rejected even when shallow"""
+        # Arrange
+        job = queue.enqueue(1, "sqlite://")
+        job.enqueued_at -= 120
+
+        # Act & Assert
+        with pytest.raises(QueueFullError, match="behind"):
+            queue.check_admission()
+
+    async def test_retry_after_scales_with_backlog(self, queue):
+        """Test that Retry-After grows with the amount of work to drain"""
+        # Arrange
+        queue._avg_job_seconds = 10.0
+
+        # Act & Assert
+        assert queue._retry_after(2) == 10
+        assert queue._retry_after(5) == 30
+
+    async def test_drain_runs_all_jobs_in_order(self, queue, calls):
+        """Test that drain dispatches every queued job"""
+        # Arrange
+        for proof_id in (1, 2, 3):
+            queue.enqueue(proof_id, "sqlite://")
+
+        # Act
+        await queue.drain()
+
+        # Assert
+        assert calls == [1, 2, 3]
+        assert queue.depth() == 0
+        assert queue.get_stats()["completed"] == 3
+
+    async def test_drain_respects_concurrency_limit(self):
+        """Test that no more than max_concurrent jobs run at once"""
+        # Arrange
+        active = 0
+        peak = 0
+
+        async def runner(proof_id: int, db_url: str):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        queue = VerificationQueue(max_concurrent=2, max_depth=10, max_wait_seconds=60, runner=runner)
+        for proof_id in range(6):
+            queue.enqueue(proof_id, "sqlite://")
+
+        # Act
+        await asyncio.gather(*(queue.drain() for _ in range(6)))
+
+        # Assert
+        assert peak == 2
+        assert queue.depth() == 0
+
+    async def test_runner_failure_does_not_stop_drain(self, calls):
+        """Test that a crashing job does not strand the rest of the queue"""
+        # Arrange
+        async def runner(proof_id: int, db_url: str):
+            calls.append(proof_id)
+            if proof_id == 1:
+                raise RuntimeError("boom")
+
+        queue = VerificationQueue(max_concurrent=1, max_depth=10, max_wait_seconds=60, runner=runner)
+        queue.enqueue(1, "sqlite://")
+        queue.enqueue(2, "sqlite://")
+
+        # Act
+        await queue.drain()
+
+        # Assert
+        assert calls == [1, 2]
+
+    async def test_estimated_wait_idle_queue(self, queue):
+        """Test that an idle queue estimates no wait"""
+        # Act & Assert
+        assert queue.estimated_wait_seconds() == 0.0
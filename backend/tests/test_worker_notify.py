@@ -0,0 +1,248 @@
+# [B] ProofCore Backend - Worker Queue Tests
+# Tests for database-backed claiming and Postgres LISTEN/NOTIFY wakeups
+
+import asyncio
+import os
+import time
+import pytest
+from contextlib import asynccontextmanager
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
+from app.core.config import settings
+from app.crud.crud_proof import proof as crud_proof
+from app.db.base import Base
+from app.models.proof import Proof, ProofStatus
+from app.schemas.proof import ProofCreate, ProofStepCreate
+from app.services.notify import ProofQueueListener, asyncpg_dsn, notify_proof_queued
+from app.services.verification_queue import QueueFullError, VerificationQueue
+
+# Postgres-only tests run when TEST_POSTGRES_URL points at a scratch database
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+requires_postgres = pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL not set")
+
+
+@asynccontextmanager
+async def _postgres_sessions():
+    """Session factory on a clean Postgres database"""
+    engine = create_async_engine(POSTGRES_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(delete(Proof))
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _submit(db, priority: str = "interactive", tenant: str = "default", steps: int = 1) -> int:
+    db_proof = await crud_proof.create_with_steps(
+        db=db,
+        obj_in=ProofCreate(
+            domain="algebra", priority=priority, steps=[ProofStepCreate(claim="x = x") for _ in range(steps)]
+        ),
+        tenant=tenant
+    )
+    return db_proof.id
+
+
+@pytest.mark.asyncio
+class TestClaimNextPending:
+    """Test suite for database-backed job claiming"""
+
+    async def test_claims_interactive_before_bulk(self, db_session):
+        """Test claim order: interactive lane first, then oldest first"""
+        # Arrange
+        bulk = await _submit(db_session, priority="bulk")
+        first = await _submit(db_session)
+        second = await _submit(db_session)
+
+        # Act
+        claimed = [await crud_proof.claim_next_pending(db_session, timeout_seconds=60) for _ in range(4)]
+
+        # Assert
+        assert claimed == [first, second, bulk, None]
+
+    async def test_bulk_keeps_its_share_under_interactive_load(self, db_session, monkeypatch):
+        """Test that bulk proofs are still claimed while interactive proofs keep arriving"""
+        # Arrange
+        monkeypatch.setattr(settings, "SCHEDULER_BULK_SHARE", 0.25)
+        bulk = [await _submit(db_session, priority="bulk") for _ in range(2)]
+
+        # Act
+        claimed = []
+        for _ in range(8):
+            await _submit(db_session)
+            claimed.append(await crud_proof.claim_next_pending(db_session, timeout_seconds=60))
+
+        # Assert
+        assert [i for i, proof_id in enumerate(claimed) if proof_id in bulk] == [3, 7]
+
+    async def test_claims_share_across_tenants(self, db_session):
+        """Test that a tenant's backlog does not starve others, and cheaper proofs go first"""
+        # Arrange
+        large = await _submit(db_session, tenant="a", steps=4)
+        small = [await _submit(db_session, tenant="a") for _ in range(2)]
+        other = await _submit(db_session, tenant="b", steps=2)
+
+        # Act
+        claimed = [await crud_proof.claim_next_pending(db_session, timeout_seconds=60) for _ in range(4)]
+
+        # Assert
+        assert claimed == [small[0], other, small[1], large]
+
+    async def test_claim_marks_processing(self, db_session):
+        """Test that a claim starts the attempt and sets the deadline"""
+        # Arrange
+        proof_id = await _submit(db_session)
+
+        # Act
+        await crud_proof.claim_next_pending(db_session, timeout_seconds=60)
+        db_proof = await crud_proof.get(db=db_session, id=proof_id)
+        await db_session.refresh(db_proof)
+
+        # Assert
+        assert db_proof.status == ProofStatus.PROCESSING
+        assert db_proof.attempts == 1
+        assert db_proof.deadline_at is not None
+
+    async def test_pending_backlog(self, db_session):
+        """Test backlog size for worker-mode admission control"""
+        # Arrange
+        await _submit(db_session)
+        await _submit(db_session)
+        await crud_proof.claim_next_pending(db_session, timeout_seconds=60)
+
+        # Act
+        depth, oldest = await crud_proof.get_pending_backlog(db_session)
+
+        # Assert
+        assert depth == 1
+        assert oldest is not None
+
+    async def test_queue_snapshot(self, db_session):
+        """Test worker-mode queue statistics from the database backlog"""
+        # Arrange
+        await _submit(db_session, priority="bulk")
+        await _submit(db_session)
+        await _submit(db_session)
+        await crud_proof.claim_next_pending(db_session, timeout_seconds=60)
+        queue = VerificationQueue(max_concurrent=1, max_depth=10, max_wait_seconds=60)
+
+        # Act
+        snapshot = await crud_proof.get_queue_snapshot(db_session)
+        stats = queue.backlog_stats(
+            depth=snapshot["depth"], oldest_wait=0, running=snapshot["running"],
+            lanes=snapshot["lanes"], durations=[2.0, 4.0]
+        )
+
+        # Assert
+        assert stats["lanes"] == {"interactive": 1, "bulk": 1}
+        assert stats["running"] == 1
+        assert stats["estimated_wait_seconds"] == 9.0
+
+    async def test_notify_is_noop_without_postgres(self, db_session):
+        """Test that submitting on SQLite does not try to NOTIFY"""
+        # Act & Assert (no pg_notify on SQLite, so this must not raise)
+        await notify_proof_queued(db_session, 1)
+
+
+@pytest.mark.asyncio
+class TestProofQueueListener:
+    """Test suite for the LISTEN wake-up helper"""
+
+    async def test_listener_disabled_for_sqlite(self):
+        """Test that non-Postgres databases fall back to polling"""
+        # Arrange
+        listener = ProofQueueListener("sqlite+aiosqlite:///./x.db")
+
+        # Act
+        woken = await listener.wait(0.01)
+
+        # Assert
+        assert not listener.enabled
+        assert woken is False
+
+    async def test_local_wake(self):
+        """Test that wake() ends the wait early"""
+        # Arrange
+        listener = ProofQueueListener("sqlite+aiosqlite:///./x.db")
+        asyncio.get_running_loop().call_later(0.01, listener.wake)
+
+        # Act
+        started = time.monotonic()
+        woken = await listener.wait(5)
+
+        # Assert
+        assert woken is True
+        assert time.monotonic() - started < 1
+
+
+class TestWorkerModeHelpers:
+    """Test suite for worker-mode URL and admission helpers"""
+
+    def test_asyncpg_dsn_strips_driver(self):
+        """Test conversion of SQLAlchemy URLs for asyncpg.connect"""
+        # Act
+        dsn = asyncpg_dsn("postgresql+asyncpg://user:pw@db:5432/proofs")
+
+        # Assert
+        assert dsn == "postgresql://user:pw@db:5432/proofs"
+
+    def test_check_backlog_uses_external_depth(self):
+        """Test worker-mode admission against a database backlog"""
+        # Arrange
+        queue = VerificationQueue(max_concurrent=2, max_depth=10, max_wait_seconds=60)
+
+        # Act & Assert
+        queue.check_backlog(depth=9, oldest_wait=0)
+        with pytest.raises(QueueFullError):
+            queue.check_backlog(depth=10, oldest_wait=0)
+        with pytest.raises(QueueFullError):
+            queue.check_backlog(depth=0, oldest_wait=61)
+
+
+@requires_postgres
+@pytest.mark.asyncio
+class TestPostgresWakeups:
+    """Cross-connection tests against a real Postgres server"""
+
+    async def test_notify_wakes_listener(self):
+        """Test that a committed submission wakes a listening worker promptly"""
+        async with _postgres_sessions() as session_maker:
+            # Arrange
+            listener = ProofQueueListener(POSTGRES_URL)
+            await listener.start()
+            try:
+                async with session_maker() as db:
+                    proof_id = await _submit(db)
+                    waiter = asyncio.ensure_future(listener.wait(5))
+                    await asyncio.sleep(0)
+
+                    # Act
+                    started = time.monotonic()
+                    await notify_proof_queued(db, proof_id)
+                    woken = await waiter
+
+                # Assert
+                assert woken is True
+                assert listener.notifications == 1
+                assert time.monotonic() - started < 1
+            finally:
+                await listener.stop()
+
+    async def test_concurrent_claims_are_exclusive(self):
+        """Test that SKIP LOCKED hands each pending proof to exactly one worker"""
+        async with _postgres_sessions() as session_maker:
+            # Arrange
+            async with session_maker() as db:
+                submitted = {await _submit(db) for _ in range(6)}
+
+            async def claim():
+                async with session_maker() as db:
+                    return await crud_proof.claim_next_pending(db, timeout_seconds=60)
+
+            # Act
+            claimed = await asyncio.gather(*(claim() for _ in range(8)))
+
+            # Assert
+            won = [proof_id for proof_id in claimed if proof_id is not None]
+            assert sorted(won) == sorted(submitted)
@@ -0,0 +1,33 @@
+# [*] ProofCore Backend - Verification Worker Entry Point
+# Runs proof verification on a separate node (VERIFICATION_MODE=worker)
+
+import asyncio
+import signal
+
+from app.core.config import settings
+from app.services.worker import ProofWorker
+
+
+async def main() -> None:
+    """
+    Run a verification worker until SIGINT/SIGTERM.
+
+    The API nodes (VERIFICATION_MODE=worker) only insert pending proofs and
+    NOTIFY; any number of these workers share the work via SKIP LOCKED claims.
+    """
+    print(f"[*] Starting {settings.APP_NAME} worker v{settings.APP_VERSION}")
+    print(f"[+] Database: {settings.DATABASE_URL.split('@')[-1]}")  # Hide credentials
+
+    worker = ProofWorker()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:
+            pass  # Windows: Ctrl+C raises KeyboardInterrupt instead
+
+    await worker.run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())